@@ -32,6 +32,8 @@ class SystemHealthSchema(BaseSchema):
     disk_usage = ma_fields.Float(validate=validate.Range(min=0, max=100))
     temperature = ma_fields.Float(validate=validate.Range(min=-50, max=150))
     services = ma_fields.Dict()
+    averages = ma_fields.Dict()
+    sample_age_seconds = ma_fields.Float(validate=validate.Range(min=0))
 
 # Vehicle Detection Schemas
 class BoundingBoxSchema(BaseSchema):
@@ -201,7 +203,9 @@ def get_model_registry() -> Dict[str, Model]:
             'memory_usage': fields.Float(description='Memory usage percentage'),
             'disk_usage': fields.Float(description='Disk usage percentage'),
             'temperature': fields.Float(description='System temperature in Celsius'),
-            'services': fields.Raw(description='Service status details')
+            'services': fields.Raw(description='Service status details'),
+            'averages': fields.Raw(description='Short-window averages (1m, 5m) from the background health sampler'),
+            'sample_age_seconds': fields.Float(description='Age of the health sample in seconds')
         }),
         
         'VehicleDetection': Model('VehicleDetection', {
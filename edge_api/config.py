@@ -20,6 +20,8 @@ class DatabaseConfig:
     redis_port: int = field(default_factory=lambda: int(os.getenv('REDIS_PORT', '6379')))
     redis_db: int = field(default_factory=lambda: int(os.getenv('REDIS_DB', '0')))
     redis_password: Optional[str] = field(default_factory=lambda: os.getenv('REDIS_PASSWORD'))
+    cache_max_entries: int = field(default_factory=lambda: int(os.getenv('CACHE_MAX_ENTRIES', '512')))
+    cache_max_bytes: int = field(default_factory=lambda: int(os.getenv('CACHE_MAX_BYTES', '33554432')))  # 32MB
     
     postgres_host: str = field(default_factory=lambda: os.getenv('POSTGRES_HOST', 'localhost'))
     postgres_port: int = field(default_factory=lambda: int(os.getenv('POSTGRES_PORT', '5432')))
@@ -65,9 +67,12 @@ class RadarConfig:
     stream_name: str = field(default_factory=lambda: os.getenv('RADAR_STREAM', 'radar_data'))
     detection_window_seconds: int = field(default_factory=lambda: int(os.getenv('RADAR_DETECTION_WINDOW', '5')))
     min_pings_per_vehicle: int = field(default_factory=lambda: int(os.getenv('RADAR_MIN_PINGS', '3')))
+    speed_jump_mph: float = field(default_factory=lambda: float(os.getenv('RADAR_SPEED_JUMP', '10.0')))
     max_speed_mph: float = field(default_factory=lambda: float(os.getenv('RADAR_MAX_SPEED', '100.0')))
     min_speed_mph: float = field(default_factory=lambda: float(os.getenv('RADAR_MIN_SPEED', '1.0')))
     speed_limit_mph: float = field(default_factory=lambda: float(os.getenv('SPEED_LIMIT', '25.0')))
+    cache_bucket_seconds: int = field(default_factory=lambda: int(os.getenv('RADAR_CACHE_BUCKET', '60')))
+    cache_max_bytes: int = field(default_factory=lambda: int(os.getenv('RADAR_CACHE_MAX_BYTES', '33554432')))  # 32MB
 
 
 @dataclass
@@ -24,9 +24,14 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 import os
+import sys
 
 from flask import Flask, jsonify, request
 
+# Shared rollup analytics live in edge_processing
+sys.path.insert(0, str(Path(__file__).parent.parent / "edge_processing"))
+from traffic_analytics import load_speed_sketch, speed_percentiles
+
 # Optional CORS support
 try:
     from flask_cors import CORS
@@ -580,7 +585,6 @@ class ConsolidatedDataAPI:
                 AVG(rd.speed_mph) as avg_speed_mph,
                 MIN(rd.speed_mph) as min_speed_mph,
                 MAX(rd.speed_mph) as max_speed_mph,
-                MEDIAN(rd.speed_mph) as median_speed_mph,
                 COUNT(CASE WHEN rd.speed_mph > 25 THEN 1 END) as speed_violations_25,
                 COUNT(CASE WHEN rd.speed_mph > 35 THEN 1 END) as speed_violations_35,
                 
@@ -614,6 +618,9 @@ class ConsolidatedDataAPI:
         
         basic_stats = dict(cursor.fetchone())
         
+        # SQLite has no MEDIAN(); percentiles come from the persisted hourly speed sketches
+        percentiles = speed_percentiles(load_speed_sketch(self.db_connection, cutoff_timestamp, current_time))
+        
         # 2. Hourly distribution analysis
         cursor = self.db_connection.execute("""
             SELECT 
@@ -725,7 +732,9 @@ class ConsolidatedDataAPI:
                 'avg_mph': round(basic_stats['avg_speed_mph'], 1) if basic_stats['avg_speed_mph'] else 0,
                 'min_mph': basic_stats['min_speed_mph'],
                 'max_mph': basic_stats['max_speed_mph'],
-                'median_mph': basic_stats['median_speed_mph'],
+                'median_mph': percentiles['p50'],
+                'p85_mph': percentiles['p85'],
+                'p95_mph': percentiles['p95'],
                 'violations_25mph': basic_stats['speed_violations_25'],
                 'violations_35mph': basic_stats['speed_violations_35'],
                 'distribution': speed_distribution
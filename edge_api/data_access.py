@@ -14,16 +14,25 @@ from datetime import datetime, timedelta
 from functools import wraps
 import redis
 from redis.connection import ConnectionPool
-import threading
 from contextlib import contextmanager
 
 from .config import config
+from .sqlite_pool import get_sqlite_pool
+from .local_cache import BoundedTTLCache
+from .radar_grouping import group_radar_pings
 from .error_handling import (
-    safe_redis_operation, DataSourceError, NotFoundError
+    safe_redis_operation, DataSourceError, NotFoundError, MAX_TIME_PERIOD_SECONDS
 )
 
 logger = logging.getLogger(__name__)
 
+# Closed radar buckets never change, so they only expire to free memory
+RADAR_BUCKET_TTL = 900
+# Allowance for entries still in flight when a bucket's end time passes
+RADAR_BUCKET_GRACE_MS = 2000
+# Upper bound on entries transferred by a single stream read
+RADAR_READ_LIMIT = 10000
+
 
 class RedisDataAccess:
     """Redis data access with connection pooling and caching"""
@@ -52,9 +61,17 @@ class RedisDataAccess:
         self._redis = redis.Redis(connection_pool=self.pool)
         
         # Local cache for frequently accessed data
-        self._cache = {}
-        self._cache_ttl = {}
-        self._cache_lock = threading.RLock()
+        self._cache = BoundedTTLCache(
+            max_entries=config.database.cache_max_entries,
+            max_bytes=config.database.cache_max_bytes
+        )
+        
+        # Closed radar buckets, with room for every bucket of the longest window a request
+        # may ask for; memory is bounded by the byte cap
+        self._radar_cache = BoundedTTLCache(
+            max_entries=MAX_TIME_PERIOD_SECONDS // config.radar.cache_bucket_seconds + 2,
+            max_bytes=config.radar.cache_max_bytes
+        )
         
         logger.info(f"Redis connection pool initialized: {self.host}:{self.port}/{self.db}")
     
@@ -75,21 +92,15 @@ class RedisDataAccess:
     
     def _get_from_cache(self, key: str) -> Optional[Any]:
         """Get value from local cache if not expired"""
-        with self._cache_lock:
-            if key in self._cache:
-                if key in self._cache_ttl and time.time() < self._cache_ttl[key]:
-                    return self._cache[key]
-                else:
-                    # Expired, remove from cache
-                    self._cache.pop(key, None)
-                    self._cache_ttl.pop(key, None)
-        return None
+        return self._cache.get(key)
     
     def _set_cache(self, key: str, value: Any, ttl_seconds: int = 300):
         """Set value in local cache with TTL"""
-        with self._cache_lock:
-            self._cache[key] = value
-            self._cache_ttl[key] = time.time() + ttl_seconds
+        self._cache.set(key, value, ttl_seconds)
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Hit rate, size and approximate memory of the local caches"""
+        return {**self._cache.get_stats(), "radar_buckets": self._radar_cache.get_stats()}
     
     @safe_redis_operation("Redis ping")
     def ping(self) -> bool:
@@ -102,63 +113,118 @@ class RedisDataAccess:
     @safe_redis_operation("Get radar stream data")
     def get_radar_stream_data(self, start_time: datetime, end_time: datetime, 
                              count: int = 1000) -> List[Dict[str, Any]]:
-        """Get radar data from stream within time range"""
+        """Get radar data from stream within time range
+        
+        The window is split into buckets aligned to config.radar.cache_bucket_seconds.
+        Buckets that have closed are cached whole, so overlapping or sliding windows reuse
+        them and only read the buckets not seen yet (normally just the newest, still
+        filling one) from Redis. A run of empty buckets is cached with the bucket before
+        it rather than as an entry per bucket. Returns the first `count` entries in the window.
+        """
         
         # Convert to millisecond timestamps for Redis streams
         start_ts = int(start_time.timestamp() * 1000)
         end_ts = int(end_time.timestamp() * 1000)
+        bucket_ms = config.radar.cache_bucket_seconds * 1000
         
-        # Check cache first
-        cache_key = f"radar_stream:{start_ts}:{end_ts}:{count}"
-        cached_data = self._get_from_cache(cache_key)
-        if cached_data is not None:
-            logger.debug(f"Retrieved radar data from cache: {len(cached_data)} entries")
-            return cached_data
+        radar_entries = []
+        missing_from = None
+        bucket_start = start_ts - start_ts % bucket_ms
+        while bucket_start <= end_ts:
+            cached = self._radar_cache.get(f"radar_bucket:{bucket_ms}:{bucket_start}")
+            if cached is None:
+                if missing_from is None:
+                    missing_from = bucket_start
+                bucket_start += bucket_ms
+                continue
+            if missing_from is not None:
+                # Contiguous uncached buckets are read with a single XRANGE
+                radar_entries.extend(self._read_radar_buckets(missing_from, bucket_start, bucket_ms))
+                missing_from = None
+            entries, span = cached
+            radar_entries.extend(entries)
+            bucket_start += span * bucket_ms
+            if len(radar_entries) >= count + self._entries_before(radar_entries, start_ts):
+                break
+        if missing_from is not None:
+            radar_entries.extend(self._read_radar_buckets(missing_from, bucket_start, bucket_ms))
         
+        window = [entry for entry in radar_entries if start_ts <= entry['timestamp_ms'] <= end_ts][:count]
+        logger.debug(f"Retrieved {len(window)} radar entries for window")
+        return window
+    
+    @staticmethod
+    def _entries_before(entries: List[Dict[str, Any]], start_ts: int) -> int:
+        """Leading entries of the first bucket that fall before the requested window"""
+        before = 0
+        while before < len(entries) and entries[before]['timestamp_ms'] < start_ts:
+            before += 1
+        return before
+    
+    def _read_radar_buckets(self, first_ms: int, end_ms: int, bucket_ms: int) -> List[Dict[str, Any]]:
+        """Read [first_ms, end_ms) from the radar stream and cache every closed bucket in it"""
         try:
-            # Read from Redis stream
             stream_data = self._redis.xrange(
                 config.radar.stream_name, 
-                min=start_ts, 
-                max=end_ts, 
-                count=count
+                min=first_ms, 
+                max=end_ms - 1, 
+                count=RADAR_READ_LIMIT
             )
-            
-            # Convert to structured format
-            radar_entries = []
-            for entry_id, fields in stream_data:
-                try:
-                    timestamp_ms = int(entry_id.split('-')[0])
-                    entry_time = datetime.fromtimestamp(timestamp_ms / 1000)
-                    
-                    # Radar service now only stores actual speed data (no range data)
-                    speed_value = float(fields.get('speed', 0))
-                    
-                    radar_entries.append({
-                        'id': entry_id,
-                        'timestamp': entry_time,
-                        'timestamp_ms': timestamp_ms,
-                        'speed': speed_value,
-                        'unit': fields.get('unit', 'mph'),
-                        'magnitude': fields.get('magnitude', 'unknown'),
-                        'source': fields.get('_source', 'unknown')
-                    })
-                except (ValueError, TypeError) as e:
-                    logger.warning(f"Invalid radar entry {entry_id}: {e}")
-                    continue
-            
-            # Cache the results (5 minute TTL for recent data)
-            cache_ttl = 60 if (datetime.now() - end_time).total_seconds() < 3600 else 300
-            self._set_cache(cache_key, radar_entries, cache_ttl)
-            
-            logger.debug(f"Retrieved {len(radar_entries)} radar entries from stream")
-            return radar_entries
-            
         except redis.ResponseError as e:
             if "no such key" in str(e).lower():
                 logger.warning(f"Radar stream '{config.radar.stream_name}' not found")
                 return []
             raise DataSourceError(f"Redis stream error: {e}", source="Redis")
+        
+        # Convert to structured format
+        radar_entries = []
+        for entry_id, fields in stream_data:
+            try:
+                timestamp_ms = int(entry_id.split('-')[0])
+                entry_time = datetime.fromtimestamp(timestamp_ms / 1000)
+                
+                # Radar service now only stores actual speed data (no range data)
+                speed_value = float(fields.get('speed', 0))
+                
+                radar_entries.append({
+                    'id': entry_id,
+                    'timestamp': entry_time,
+                    'timestamp_ms': timestamp_ms,
+                    'speed': speed_value,
+                    'unit': fields.get('unit', 'mph'),
+                    'magnitude': fields.get('magnitude', 'unknown'),
+                    'source': fields.get('_source', 'unknown')
+                })
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Invalid radar entry {entry_id}: {e}")
+                continue
+        
+        # Only buckets that can no longer receive entries are cached; a truncated read
+        # is complete only up to the bucket holding its last entry
+        closed_before = int(time.time() * 1000) - RADAR_BUCKET_GRACE_MS
+        if len(stream_data) >= RADAR_READ_LIMIT:
+            last_ms = int(stream_data[-1][0].split('-')[0])
+            closed_before = min(closed_before, last_ms - last_ms % bucket_ms)
+        
+        buckets = {}
+        for entry in radar_entries:
+            buckets.setdefault(entry['timestamp_ms'] - entry['timestamp_ms'] % bucket_ms, []).append(entry)
+        
+        # Each cached value is (entries, span): the bucket plus the closed empty buckets after
+        # it, so an idle stretch costs one entry; a read that starts empty anchors on its first bucket
+        anchor = None
+        for bucket_start in range(first_ms, min(end_ms, closed_before - closed_before % bucket_ms), bucket_ms):
+            if anchor is None or bucket_start in buckets:
+                if anchor is not None:
+                    self._radar_cache.set(f"radar_bucket:{bucket_ms}:{anchor[0]}", (anchor[1], anchor[2]),
+                                          RADAR_BUCKET_TTL)
+                anchor = [bucket_start, buckets.get(bucket_start, []), 1]
+            else:
+                anchor[2] += 1
+        if anchor is not None:
+            self._radar_cache.set(f"radar_bucket:{bucket_ms}:{anchor[0]}", (anchor[1], anchor[2]), RADAR_BUCKET_TTL)
+        
+        return radar_entries
     
     @safe_redis_operation("Get radar statistics")
     def get_radar_stats(self) -> Dict[str, Any]:
@@ -206,60 +272,14 @@ class RedisDataAccess:
     
     def group_radar_detections(self, radar_data: List[Dict[str, Any]], 
                              window_seconds: int = None) -> List[Dict[str, Any]]:
-        """Group radar pings into vehicle detection windows"""
+        """Group radar pings into vehicle detections split on time gaps and speed jumps"""
         window_seconds = window_seconds or config.radar.detection_window_seconds
-        min_pings = config.radar.min_pings_per_vehicle
-        
-        if not radar_data:
-            return []
-        
-        # Group by time windows
-        windows = {}
-        
-        for entry in radar_data:
-            # Create window key (group by N-second intervals)
-            window_start = (entry['timestamp_ms'] // (window_seconds * 1000)) * (window_seconds * 1000)
-            
-            if window_start not in windows:
-                windows[window_start] = {
-                    'start_time': datetime.fromtimestamp(window_start / 1000),
-                    'entries': [],
-                    'ping_count': 0,
-                    'avg_range': 0,
-                    'range_variance': 0
-                }
-            
-            windows[window_start]['entries'].append(entry)
-            windows[window_start]['ping_count'] += 1
-        
-        # Convert windows to detections
-        detections = []
-        
-        for window_start, window_data in windows.items():
-            # Only consider windows with sufficient radar activity
-            if window_data['ping_count'] >= min_pings:
-                
-                # Calculate statistics
-                ranges = [entry['range'] for entry in window_data['entries']]
-                avg_range = sum(ranges) / len(ranges)
-                range_variance = sum((r - avg_range) ** 2 for r in ranges) / len(ranges)
-                
-                # Confidence based on ping count and range consistency
-                confidence = min(0.95, 0.5 + (window_data['ping_count'] / 20))
-                confidence *= max(0.5, 1.0 - (range_variance / 10))  # Reduce confidence for erratic ranges
-                
-                detections.append({
-                    'id': f"radar_detection_{window_start}",
-                    'timestamp': window_data['start_time'],
-                    'confidence': round(confidence, 3),
-                    'ping_count': window_data['ping_count'],
-                    'average_range': round(avg_range, 2),
-                    'range_variance': round(range_variance, 3),
-                    'source': 'radar_grouping',
-                    'window_seconds': window_seconds
-                })
-        
-        return sorted(detections, key=lambda x: x['timestamp'])
+        return group_radar_pings(
+            radar_data,
+            window_seconds=window_seconds,
+            min_pings=config.radar.min_pings_per_vehicle,
+            speed_jump_mph=config.radar.speed_jump_mph
+        )
 
 
 class SQLiteDataAccess:
@@ -270,27 +290,48 @@ class SQLiteDataAccess:
         self.db_path = db_path or os.getenv('DATABASE_PATH', '/mnt/storage/data/traffic_data.db')
         logger.info(f"SQLite database initialized: {self.db_path}")
     
+    @contextmanager
     def get_connection(self):
-        """Get SQLite connection"""
+        """Check out a pooled read-only SQLite connection (rows support dict-like access)"""
+        pool = get_sqlite_pool(self.db_path)
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row  # Enable dict-like access
-            return conn
+            conn = pool.acquire()
         except Exception as e:
             logger.error(f"SQLite connection error: {e}")
             raise DataSourceError(f"SQLite connection failed: {e}", source="SQLite")
+        try:
+            yield conn
+        finally:
+            pool.release(conn)
+    
+    @staticmethod
+    def _speed_window_filter(start_time: datetime, end_time: datetime,
+                             min_speed: float = None, max_speed: float = None) -> tuple:
+        """WHERE clause and parameters selecting radar rows in a time window and speed range"""
+        # Convert to Unix timestamps for database query
+        where = "t.timestamp BETWEEN ? AND ?"
+        params = [start_time.timestamp(), end_time.timestamp()]
+        
+        # Add speed filters
+        if min_speed is not None:
+            where += " AND ABS(r.speed_mph) >= ?"
+            params.append(min_speed)
+        
+        if max_speed is not None:
+            where += " AND ABS(r.speed_mph) <= ?"
+            params.append(max_speed)
+        
+        return where, params
     
     def get_speed_measurements(self, start_time: datetime, end_time: datetime, 
                              min_speed: float = None, max_speed: float = None,
                              limit: int = 1000) -> List[Dict[str, Any]]:
         """Get speed measurements from radar_detections table"""
         
-        # Convert to Unix timestamps for database query
-        start_ts = start_time.timestamp()
-        end_ts = end_time.timestamp()
+        where, params = self._speed_window_filter(start_time, end_time, min_speed, max_speed)
         
         # Build SQL query
-        sql = """
+        sql = f"""
         SELECT 
             t.timestamp,
             t.correlation_id,
@@ -301,20 +342,9 @@ class SQLiteDataAccess:
             r.direction
         FROM traffic_detections t
         JOIN radar_detections r ON t.id = r.detection_id
-        WHERE t.timestamp BETWEEN ? AND ?
+        WHERE {where}
         """
         
-        params = [start_ts, end_ts]
-        
-        # Add speed filters
-        if min_speed is not None:
-            sql += " AND ABS(r.speed_mph) >= ?"
-            params.append(min_speed)
-        
-        if max_speed is not None:
-            sql += " AND ABS(r.speed_mph) <= ?"
-            params.append(max_speed)
-        
         sql += " ORDER BY t.timestamp DESC LIMIT ?"
         params.append(limit)
         
@@ -344,6 +374,71 @@ class SQLiteDataAccess:
             logger.error(f"Database query error: {e}")
             raise DataSourceError(f"Speed measurements query failed: {e}", source="SQLite")
 
+    def get_speed_statistics(self, start_time: datetime, end_time: datetime,
+                             speed_limit: float, min_speed: float = None, max_speed: float = None,
+                             percentiles: tuple = (25, 50, 75, 85, 95),
+                             bucket_mph: int = 10) -> Dict[str, Any]:
+        """Aggregate speed statistics for a window, computed inside SQLite
+        
+        A single GROUP BY over 0.1 mph speed steps returns per-step count, sum, min, max and
+        violation count, so at most a few thousand small rows cross into Python however many
+        measurements the window holds. Count, average, min, max, violations and the
+        distribution are exact; percentiles are nearest-rank at int(p/100 * (count - 1)) and
+        exact for radar speeds reported to 0.1 mph (finer values resolve to their step's minimum).
+        Speeds are absolute values (radar reports approaching traffic as negative).
+        
+        Returns:
+            Dict with count, avg, min, max, violations, distribution ({lower_mph: count})
+            and percentiles ({"p50": mph, ...})
+        """
+        where, params = self._speed_window_filter(start_time, end_time, min_speed, max_speed)
+        
+        try:
+            with self.get_connection() as conn:
+                steps = conn.execute(f"""
+                    SELECT
+                        CAST(ABS(r.speed_mph) * 10 AS INTEGER) AS speed_step,
+                        COUNT(*),
+                        SUM(ABS(r.speed_mph)),
+                        MIN(ABS(r.speed_mph)),
+                        MAX(ABS(r.speed_mph)),
+                        COUNT(CASE WHEN ABS(r.speed_mph) > ? THEN 1 END)
+                    FROM traffic_detections t
+                    JOIN radar_detections r ON t.id = r.detection_id
+                    WHERE {where} AND r.speed_mph IS NOT NULL
+                    GROUP BY speed_step
+                    ORDER BY speed_step
+                """, [speed_limit] + params).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Database query error: {e}")
+            raise DataSourceError(f"Speed statistics query failed: {e}", source="SQLite")
+        
+        count = sum(step[1] for step in steps)
+        stats = {
+            'count': count,
+            'avg': sum(step[2] for step in steps) / count if count else 0.0,
+            'min': steps[0][3] if steps else 0.0,
+            'max': steps[-1][4] if steps else 0.0,
+            'violations': sum(step[5] for step in steps),
+            'distribution': {},
+            'percentiles': {}
+        }
+        
+        for step in steps:
+            lower = (step[0] // (bucket_mph * 10)) * bucket_mph
+            stats['distribution'][lower] = stats['distribution'].get(lower, 0) + step[1]
+        
+        if count:
+            ranks = sorted((int((p / 100) * (count - 1)), p) for p in percentiles)
+            seen = 0
+            for step in steps:
+                seen += step[1]
+                while ranks and ranks[0][0] < seen:
+                    stats['percentiles'][f"p{ranks.pop(0)[1]}"] = step[3]
+            stats['percentiles'] = {f"p{p}": stats['percentiles'][f"p{p}"] for p in percentiles}
+        
+        return stats
+
 
 # Global instances
 redis_client = RedisDataAccess()
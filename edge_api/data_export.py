@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Streaming Detection Export
+Chunked export of joined detection data (traffic + radar + camera) for offline analysis
+
+Rows are read from SQLite with keyset pagination over (timestamp, id) so every chunk is a
+short, index-backed query and memory use stays constant regardless of the exported range.
+Supported formats are CSV and NDJSON, plus Parquet and Arrow IPC when pyarrow is installed.
+"""
+
+import csv
+import io
+import json
+import logging
+import sqlite3
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
+
+# Optional columnar formats
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 5000
+
+# Exported columns in output order
+EXPORT_COLUMNS = [
+    'detection_id',
+    'consolidation_id',
+    'correlation_id',
+    'timestamp',
+    'timestamp_utc',
+    'trigger_source',
+    'location_id',
+    'speed_mph',
+    'speed_mps',
+    'radar_confidence',
+    'alert_level',
+    'direction',
+    'vehicle_count',
+    'detection_confidence',
+    'vehicle_types'
+]
+
+EXPORT_FORMATS = {
+    'csv': {'mimetype': 'text/csv', 'extension': 'csv', 'requires_pyarrow': False},
+    'ndjson': {'mimetype': 'application/x-ndjson', 'extension': 'ndjson', 'requires_pyarrow': False},
+    'parquet': {'mimetype': 'application/vnd.apache.parquet', 'extension': 'parquet', 'requires_pyarrow': True},
+    'arrow': {'mimetype': 'application/vnd.apache.arrow.stream', 'extension': 'arrows', 'requires_pyarrow': True}
+}
+
+# First chunk: rows with timestamp inside [start, end]
+_FIRST_CHUNK_SQL = """
+    SELECT
+        td.id, td.consolidation_id, td.correlation_id, td.timestamp,
+        td.trigger_source, td.location_id,
+        rd.speed_mph, rd.speed_mps, rd.confidence, rd.alert_level, rd.direction,
+        cd.vehicle_count, cd.detection_confidence, cd.vehicle_types
+    FROM traffic_detections td
+    LEFT JOIN radar_detections rd ON rd.detection_id = td.id
+    LEFT JOIN camera_detections cd ON cd.detection_id = td.id
+    WHERE td.timestamp >= ? AND td.timestamp <= ?
+    ORDER BY td.timestamp, td.id
+    LIMIT ?
+"""
+
+# Following chunks: resume strictly after the last (timestamp, id) pair seen
+_NEXT_CHUNK_SQL = """
+    SELECT
+        td.id, td.consolidation_id, td.correlation_id, td.timestamp,
+        td.trigger_source, td.location_id,
+        rd.speed_mph, rd.speed_mps, rd.confidence, rd.alert_level, rd.direction,
+        cd.vehicle_count, cd.detection_confidence, cd.vehicle_types
+    FROM traffic_detections td
+    LEFT JOIN radar_detections rd ON rd.detection_id = td.id
+    LEFT JOIN camera_detections cd ON cd.detection_id = td.id
+    WHERE (td.timestamp, td.id) > (?, ?) AND td.timestamp <= ?
+    ORDER BY td.timestamp, td.id
+    LIMIT ?
+"""
+
+
+def parse_time_bound(value: Optional[str], default: float) -> float:
+    """Parse an export time bound given as epoch seconds or ISO 8601 (UTC if no offset)"""
+    if value is None or str(value).strip() == '':
+        return default
+
+    value = str(value).strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def _open_readonly_connection(db_path: str) -> sqlite3.Connection:
+    """Open a read-only connection so long exports never contend for the write lock"""
+    return sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, check_same_thread=False)
+
+
+class DetectionExporter:
+    """Streams joined detection rows over a time range in fixed-size chunks"""
+
+    def __init__(self, db_path: str = None,
+                 connection_factory: Callable[[], sqlite3.Connection] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
+        if db_path is None and connection_factory is None:
+            raise ValueError("db_path or connection_factory is required")
+
+        self.db_path = db_path
+        self.connection_factory = connection_factory or (lambda: _open_readonly_connection(db_path))
+        self.chunk_size = max(1, int(chunk_size))
+
+    def iter_chunks(self, start_ts: float, end_ts: float) -> Iterator[List[Tuple]]:
+        """Yield lists of raw row tuples ordered by (timestamp, id)"""
+        conn = self.connection_factory()
+        try:
+            rows = conn.execute(_FIRST_CHUNK_SQL, (start_ts, end_ts, self.chunk_size)).fetchall()
+            while rows:
+                yield rows
+                if len(rows) < self.chunk_size:
+                    break
+                last = rows[-1]
+                rows = conn.execute(
+                    _NEXT_CHUNK_SQL, (last[3], last[0], end_ts, self.chunk_size)
+                ).fetchall()
+        finally:
+            if self.db_path is not None:
+                conn.close()
+
+    def iter_records(self, start_ts: float, end_ts: float) -> Iterator[List[List[Any]]]:
+        """Yield chunks of export records with columns matching EXPORT_COLUMNS"""
+        for rows in self.iter_chunks(start_ts, end_ts):
+            yield [self._to_record(row) for row in rows]
+
+    @staticmethod
+    def _to_record(row: Sequence[Any]) -> List[Any]:
+        """Convert a raw query row into an export record"""
+        timestamp = row[3]
+        timestamp_utc = None
+        if timestamp is not None:
+            timestamp_utc = datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+        return [
+            row[0], row[1], row[2], timestamp, timestamp_utc, row[4], row[5],
+            row[6], row[7], row[8], row[9], row[10],
+            row[11], row[12], row[13]
+        ]
+
+    def stream(self, fmt: str, start_ts: float, end_ts: float) -> Iterator[bytes]:
+        """Yield encoded export bytes, one piece per chunk"""
+        fmt = (fmt or 'csv').lower()
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format '{fmt}'. Must be one of: {', '.join(EXPORT_FORMATS)}")
+        if EXPORT_FORMATS[fmt]['requires_pyarrow'] and not PYARROW_AVAILABLE:
+            raise ValueError(f"Export format '{fmt}' requires pyarrow, which is not installed")
+
+        chunks = self.iter_records(start_ts, end_ts)
+        if fmt == 'csv':
+            return _encode_csv(chunks)
+        if fmt == 'ndjson':
+            return _encode_ndjson(chunks)
+        return _encode_arrow(chunks, fmt)
+
+
+def available_formats() -> List[str]:
+    """Formats usable with the currently installed libraries"""
+    return [name for name, spec in EXPORT_FORMATS.items()
+            if PYARROW_AVAILABLE or not spec['requires_pyarrow']]
+
+
+def _encode_csv(chunks: Iterator[List[List[Any]]]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    yield buffer.getvalue().encode('utf-8')
+
+    for records in chunks:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(records)
+        yield buffer.getvalue().encode('utf-8')
+
+
+def _encode_ndjson(chunks: Iterator[List[List[Any]]]) -> Iterator[bytes]:
+    for records in chunks:
+        lines = [json.dumps(dict(zip(EXPORT_COLUMNS, record)), ensure_ascii=False) for record in records]
+        lines.append('')
+        yield '\n'.join(lines).encode('utf-8')
+
+
+class _DrainableSink(io.RawIOBase):
+    """Write-only file object whose contents can be drained between chunks"""
+
+    def __init__(self):
+        super().__init__()
+        self._parts = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        data = bytes(data)
+        self._parts.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b''.join(self._parts)
+        self._parts = []
+        return data
+
+
+def _arrow_schema():
+    return pa.schema([
+        ('detection_id', pa.int64()),
+        ('consolidation_id', pa.string()),
+        ('correlation_id', pa.string()),
+        ('timestamp', pa.float64()),
+        ('timestamp_utc', pa.string()),
+        ('trigger_source', pa.string()),
+        ('location_id', pa.string()),
+        ('speed_mph', pa.float64()),
+        ('speed_mps', pa.float64()),
+        ('radar_confidence', pa.float64()),
+        ('alert_level', pa.string()),
+        ('direction', pa.string()),
+        ('vehicle_count', pa.int64()),
+        ('detection_confidence', pa.float64()),
+        ('vehicle_types', pa.string())
+    ])
+
+
+def _encode_arrow(chunks: Iterator[List[List[Any]]], fmt: str) -> Iterator[bytes]:
+    schema = _arrow_schema()
+    sink = _DrainableSink()
+
+    if fmt == 'parquet':
+        writer = pq.ParquetWriter(sink, schema, compression='snappy')
+        write_batch = writer.write_table
+        make_batch = pa.Table.from_arrays
+    else:
+        writer = pa.ipc.new_stream(sink, schema)
+        write_batch = writer.write_batch
+        make_batch = pa.RecordBatch.from_arrays
+
+    try:
+        for records in chunks:
+            columns = [pa.array([record[i] for record in records], type=field.type)
+                       for i, field in enumerate(schema)]
+            write_batch(make_batch(columns, schema=schema))
+            data = sink.drain()
+            if data:
+                yield data
+    finally:
+        writer.close()
+
+    data = sink.drain()
+    if data:
+        yield data
@@ -17,8 +17,13 @@ Architecture:
 HTTP Requests -> Enhanced API Gateway -> ServiceLogger -> Redis/Database -> Centralized Logging
 """
 
-from flask import Flask, jsonify, request, send_file, g, make_response
-from flask_restx import Api, Resource, Namespace, reqparse
+# Cooperative async modes must patch the standard library before anything else imports it
+from socketio_deployment import resolve_async_mode, monkey_patch, socketio_options
+SOCKETIO_ASYNC_MODE = resolve_async_mode()
+monkey_patch(SOCKETIO_ASYNC_MODE)
+
+from flask import Flask, jsonify, request, send_file, g, make_response, Response, stream_with_context
+from flask_restx import Api, Resource, Namespace, reqparse, marshal
 
 from flask_socketio import SocketIO, emit
 from flask_cors import CORS
@@ -33,9 +38,8 @@ import sys
 import uuid
 import psutil
 import sqlite3
-import glob
-import csv
-import io
+import base64
+import binascii
 from datetime import datetime, timezone, timedelta
 try:
     from zoneinfo import ZoneInfo
@@ -50,14 +54,25 @@ except ImportError:
                 self.offset = timezone.utc
         def __call__(self):
             return self.offset
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 from pathlib import Path
 import functools
+from contextlib import contextmanager
 
 # Add edge_processing to path for shared_logging
 current_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(current_dir / "edge_processing"))
 from shared_logging import ServiceLogger, CorrelationContext
+from traffic_rollups import read_row_counts, count_detections_since, SPEED_BIN_COUNT
+from traffic_analytics import (
+    report_timezone, clamp_days, load_hourly_buckets, load_speed_histogram, summarize_buckets, hourly_totals,
+    daily_totals, peak_hour, peak_hours, speed_distribution, load_speed_sketch, speed_percentiles, violation_categories,
+    safety_rating, percent_change, traffic_patterns
+)
+from system_health.health_sampler import HealthSampler
+from latest_image import resolve_latest_image
+from service_metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, MetricsRegistry, merge_expositions, read_published_metrics
+from config import config as api_config
 
 # Import our Swagger configuration and models
 from swagger_config import API_CONFIG, create_api_models, QUERY_PARAMS, RESPONSE_EXAMPLES
@@ -67,6 +82,23 @@ from api_models import (
     tracks_response_schema, error_response_schema, time_range_query_schema,
     analytics_query_schema, weather_history_query_schema
 )
+from data_export import DetectionExporter, EXPORT_FORMATS, available_formats, parse_time_bound
+from sqlite_pool import get_sqlite_pool, close_all_pools
+from image_serving import image_response, preview_response
+from image_thumbnails import ThumbnailCache, thumbnail_width
+from response_cache import DataVersionTracker, ResponseCache
+from event_delivery import EventCoalescer, EVENT_CHANNELS, BATCH_EVENT, classify_event
+from log_streaming import SocketIOLogHandler
+from traffic_reports import RenderedReportCache, iter_violations_csv, month_period
+from local_time import LocalTimeConverter
+from response_compression import ResponseCompressor
+from json_provider import FastJSONProvider, output_json
+import serialization
+from event_stream import (
+    NDJSON_MIMETYPE, DETECTIONS_SQL, wants_ndjson, has_api_json, consolidated_events_query, consolidated_event_record,
+    consolidated_event_json, project_record, json_object_with_array, detection_record, iter_consolidated_events,
+    iter_vehicle_detections, ndjson_stream
+)
 
 # Initialize centralized logging
 logger = ServiceLogger("api_gateway_service")
@@ -142,42 +174,24 @@ def with_correlation_tracking(f):
     return decorated_function
 
 
-import logging
+def encode_event_cursor(event_seq: int) -> str:
+    """Opaque cursor for /vehicles/consolidated?after= (base64 of the consolidated event sequence)"""
+    return base64.urlsafe_b64encode(f"seq:{int(event_seq)}".encode('ascii')).decode('ascii').rstrip('=')
 
 
-class SocketIOLogHandler(logging.Handler):
-    """Custom log handler that broadcasts log messages via Socket.IO"""
-    
-    def __init__(self, socketio_instance):
-        super().__init__()
-        self.socketio = socketio_instance
-        
-    def emit(self, record):
-        try:
-            # Format the log message with proper UTC timestamp
-            log_entry = {
-                'timestamp': datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
-                'level': record.levelname,
-                'service': getattr(record, 'name', record.module),
-                'message': record.getMessage(),
-                'module': record.module,
-                'line': record.lineno
-            }
-            
-            # Add correlation ID if available
-            if hasattr(record, 'correlation_id'):
-                log_entry['correlation_id'] = record.correlation_id
-                
-            # Add business event if available  
-            if hasattr(record, 'business_event'):
-                log_entry['business_event'] = record.business_event
-                
-            # Broadcast to all connected clients
-            self.socketio.emit('system_log', log_entry)
-            
-        except Exception:
-            # Silently ignore errors to prevent logging loops
-            pass
+def decode_event_cursor(cursor: str) -> int:
+    """Inverse of encode_event_cursor; raises ValueError for malformed cursors"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode('ascii')
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError("Malformed cursor") from e
+    prefix, _, value = raw.partition(':')
+    if prefix != 'seq' or not value.isdigit():
+        raise ValueError("Malformed cursor")
+    return int(value)
+
+
+import logging
 
 
 class EnhancedSwaggerAPIGateway:
@@ -211,6 +225,7 @@ class EnhancedSwaggerAPIGateway:
         
         # Initialize Flask app
         self.app = Flask(__name__)
+        self.app.json = FastJSONProvider(self.app)
         self.app.config['SECRET_KEY'] = 'traffic_monitoring_edge_api_enhanced'
         self.app.config['RESTX_MASK_SWAGGER'] = False
         
@@ -229,15 +244,23 @@ class EnhancedSwaggerAPIGateway:
             validate=True,
             prefix='/api'  # Add proper API prefix for industry standard
         )
+        self.api.representations['application/json'] = output_json
         
         # Register models with API
         self._register_models()
         
-        # Initialize SocketIO with correlation tracking
-        self.socketio = SocketIO(self.app, cors_allowed_origins="*")
+        # Initialize SocketIO with correlation tracking; workers share state via the message queue
+        self.socketio = SocketIO(self.app, cors_allowed_origins="*", **socketio_options(SOCKETIO_ASYNC_MODE))
+        
+        # Real-time events are batched per channel and sent only to subscribed clients
+        self.event_delivery = EventCoalescer(
+            self.socketio, window=float(os.environ.get('WEBSOCKET_BATCH_WINDOW', 0.1))
+        )
+        self.event_delivery.start()
         self._setup_socketio_correlation()
         
         # Setup real-time log streaming via Socket.IO
+        self.log_stream_handler = None
         self._setup_log_streaming()
         
         # Service references
@@ -253,10 +276,63 @@ class EnhancedSwaggerAPIGateway:
         self.is_running = False
         self.client_count = 0
         
+        # Conditional GET (ETag) support for polled list endpoints
+        self.response_cache = ResponseCache()
+        self._version_trackers: Dict[str, DataVersionTracker] = {}
+        
+        # gzip/brotli encoding of JSON, HTML and CSV responses for remote dashboards
+        self.compressor = ResponseCompressor()
+        
+        # Batch Central Time conversion; DST offsets are looked up once per segment
+        self.central_time = LocalTimeConverter(ZoneInfo('America/Chicago'))
+        
+        # Same SPEED_LIMIT setting the persistence service counts rollup violations against
+        self.speed_limit_mph = api_config.radar.speed_limit_mph
+        
+        # Prometheus metrics, served at /metrics together with those other services publish
+        self.metrics = MetricsRegistry("api-gateway")
+        self.request_seconds = self.metrics.histogram(
+            "api_request_duration_seconds", "API request handling time", ("method", "route", "status"))
+        self.metrics.gauge("websocket_clients", "Connected WebSocket clients").set_function(lambda: self.client_count)
+        self.metrics_age = self.metrics.gauge(
+            "service_metrics_age_seconds", "Time since a service last published its metrics", ("source",))
+        
+        # Rendered report documents (past months are rendered once)
+        try:
+            self.report_cache = RenderedReportCache()
+        except OSError as e:
+            self.report_cache = None
+            logger.warning("Report cache unavailable", extra={
+                "business_event": "report_cache_unavailable",
+                "error": str(e)
+            })
+        
+        # Reduced-scale previews of camera captures (?size=thumbnail)
+        try:
+            self.thumbnail_cache = ThumbnailCache()
+        except OSError as e:
+            self.thumbnail_cache = None
+            logger.warning("Thumbnail cache unavailable", extra={
+                "business_event": "thumbnail_cache_unavailable",
+                "error": str(e)
+            })
+        
         # Initialize Redis client with enhanced logging
         self.redis_client = None
         self._setup_redis_connection()
         
+        # Background health sampling: /health/system reads the latest sample instead of measuring
+        self._system_info = {
+            "platform": platform.platform(),
+            "python_version": sys.version,
+            "hostname": socket.gethostname()
+        }
+        self.health_sampler = HealthSampler(
+            interval=float(os.environ.get('HEALTH_SAMPLE_INTERVAL', 5.0)),
+            collectors={"redis": self._probe_redis}
+        )
+        self.health_sampler.start()
+        
         # Setup route handlers with correlation tracking
         self._setup_enhanced_routes()
         
@@ -302,6 +378,42 @@ class EnhancedSwaggerAPIGateway:
             print(f"Failed to convert timestamp {timestamp_str}: {e}")
             return timestamp_str
 
+    def convert_to_central_times(self, timestamp_strs):
+        """Convert a list of timestamp strings to Central Time ISO format in one batch
+        
+        Same results as convert_to_central_time per record. Strings are parsed to epoch
+        seconds and converted together; any that fail to parse go through the per-record path.
+        """
+        epochs = {}
+        for index, timestamp_str in enumerate(timestamp_strs):
+            if not timestamp_str or not isinstance(timestamp_str, str):
+                continue
+            try:
+                if timestamp_str.endswith('Z'):
+                    dt = datetime.fromisoformat(timestamp_str[:-1]).replace(tzinfo=timezone.utc)
+                else:
+                    dt = datetime.fromisoformat(timestamp_str)
+                    if dt.tzinfo is None:
+                        if '+' in timestamp_str[-6:] or '-' in timestamp_str[-6:]:
+                            continue
+                        # No timezone info, assume UTC
+                        dt = dt.replace(tzinfo=timezone.utc)
+                epochs[index] = dt.timestamp()
+            except ValueError:
+                continue
+
+        converted = list(timestamp_strs)
+        try:
+            for index, text in zip(epochs, self.central_time.isoformat(list(epochs.values()))):
+                converted[index] = text
+        except Exception as e:
+            logger.warning(f"Batch Central Time conversion failed, converting per record: {e}")
+            epochs = {}
+        for index, value in enumerate(timestamp_strs):
+            if index not in epochs and value:
+                converted[index] = self.convert_to_central_time(value)
+        return converted
+
     def _setup_redis_connection(self):
         """Setup Redis connection with enhanced logging"""
         try:
@@ -379,6 +491,7 @@ class EnhancedSwaggerAPIGateway:
                 
                 # Update legacy client count
                 self.client_count = max(0, self.client_count - 1)
+                self.event_delivery.forget(request.sid)
                 self.stats["active_connections"] = len(self.connection_health["socket_connections"])
                 
                 logger.info("WebSocket client disconnected", extra={
@@ -388,21 +501,54 @@ class EnhancedSwaggerAPIGateway:
                     "active_connections": self.stats["active_connections"]
                 })
         
+        @self.socketio.on('subscribe')
+        def handle_subscribe(data=None):
+            """Subscribe to event channels: {"channels": ["alerts", "consolidated", "radar", "logs"]}"""
+            correlation_id = str(uuid.uuid4())[:8]
+            
+            with CorrelationContext.set_correlation_id(correlation_id):
+                requested = (data or {}).get('channels') or EVENT_CHANNELS
+                channels = self.event_delivery.subscribe(request.sid, requested)
+                
+                logger.info("Client subscribed to event channels", extra={
+                    "business_event": "channel_subscription",
+                    "correlation_id": correlation_id,
+                    "client_id": request.sid,
+                    "channels": channels
+                })
+                
+                status = {
+                    'status': 'subscribed',
+                    'channels': channels,
+                    'correlation_id': correlation_id,
+                    'timestamp': datetime.now().isoformat()
+                }
+                emit('subscription_status', status)
+                return status
+        
+        @self.socketio.on('unsubscribe')
+        def handle_unsubscribe(data=None):
+            """Leave event channels: {"channels": [...]}"""
+            channels = self.event_delivery.unsubscribe(request.sid, (data or {}).get('channels') or [])
+            return {'status': 'unsubscribed', 'channels': channels}
+        
         @self.socketio.on('subscribe_events')
         def handle_subscribe_events():
             correlation_id = str(uuid.uuid4())[:8]
             
             with CorrelationContext.set_correlation_id(correlation_id):
+                self.event_delivery.subscribe(request.sid, EVENT_CHANNELS)
+                
                 logger.info("Client subscribed to events stream", extra={
                     "business_event": "events_subscription",
                     "correlation_id": correlation_id,
                     "client_id": request.sid
                 })
                 
-                # Send recent events from database
+                # Send recent events from database as one batch
                 recent_events = self._get_recent_events(limit=10)
-                for event in recent_events:
-                    emit('real_time_event', event)
+                if recent_events:
+                    emit(BATCH_EVENT, {'channel': 'consolidated', 'events': recent_events, 'dropped': 0})
                 
                 emit('events_status', {
                     'status': 'subscribed',
@@ -442,6 +588,8 @@ class EnhancedSwaggerAPIGateway:
             correlation_id = str(uuid.uuid4())[:8]
             
             with CorrelationContext.set_correlation_id(correlation_id):
+                self.event_delivery.subscribe(request.sid, ['logs'])
+                
                 logger.info("Client subscribed to logs stream", extra={
                     "business_event": "logs_subscription",
                     "correlation_id": correlation_id,
@@ -457,25 +605,22 @@ class EnhancedSwaggerAPIGateway:
     def _setup_log_streaming(self):
         """Setup real-time log streaming via Socket.IO"""
         try:
-            # Create and configure the Socket.IO log handler
-            socketio_handler = SocketIOLogHandler(self.socketio)
-            socketio_handler.setLevel(logging.INFO)  # Stream INFO level and above
-            
-            # Create a formatter for the handler
-            formatter = logging.Formatter('[%(asctime)s] %(levelname)s in %(module)s: %(message)s')
-            socketio_handler.setFormatter(formatter)
-            
-            # Add the handler to the root logger to catch all logs
-            root_logger = logging.getLogger()
-            root_logger.addHandler(socketio_handler)
+            # Queues records without blocking and streams rate-limited batches on a timer
+            self.log_stream_handler = SocketIOLogHandler(
+                self.event_delivery,
+                flush_interval=float(os.environ.get('LOG_STREAM_FLUSH_INTERVAL', 0.5))
+            )
+            self.log_stream_handler.setLevel(logging.INFO)  # Stream INFO level and above
             
-            # Also add to our service logger specifically
-            service_logger = logging.getLogger('api_gateway_service')
-            service_logger.addHandler(socketio_handler)
+            # Add the handler to the root logger to catch all logs (the service logger
+            # propagates to it, so attaching it there too would stream every record twice)
+            logging.getLogger().addHandler(self.log_stream_handler)
+            self.log_stream_handler.start()
             
             logger.info("Real-time log streaming initialized", extra={
                 "business_event": "log_streaming_initialized",
-                "handler_level": "INFO"
+                "handler_level": "INFO",
+                "rate_limits": self.log_stream_handler.rate_limits
             })
             
         except Exception as e:
@@ -497,6 +642,9 @@ class EnhancedSwaggerAPIGateway:
             # Update response time statistics
             if hasattr(g, 'start_time'):
                 duration_ms = (time.time() - g.start_time) * 1000
+                route = request.url_rule.rule if request.url_rule else 'unmatched'
+                self.request_seconds.labels(request.method, route, f"{response.status_code // 100}xx").observe(
+                    duration_ms / 1000)
                 
                 # Update average response time
                 if self.stats["successful_requests"] > 0:
@@ -515,7 +663,7 @@ class EnhancedSwaggerAPIGateway:
             response.headers['X-API-Gateway'] = 'Enhanced-Traffic-Monitor'
             response.headers['X-API-Version'] = API_CONFIG['version']
             
-            return response
+            return self.compressor.compress_response(response, request.headers.get('Accept-Encoding'))
     
     def _register_models(self):
         """Register Swagger models with enhanced logging"""
@@ -557,7 +705,9 @@ class EnhancedSwaggerAPIGateway:
                 
                 # Check if file exists in camera capture directory
                 image_path = f"/app/camera_capture/live/{filename}"
-                if not os.path.exists(image_path):
+                try:
+                    image_stat = os.stat(image_path)
+                except FileNotFoundError:
                     logger.warning("Requested image not found", extra={
                         "business_event": "image_not_found",
                         "image_filename": filename,
@@ -565,12 +715,24 @@ class EnhancedSwaggerAPIGateway:
                     })
                     return {"error": "Image not found"}, 404
                 
+                try:
+                    width = thumbnail_width(request.args.get('size'), request.args.get('width'))
+                except ValueError:
+                    return {"error": "Invalid image size", "sizes": ["full", "thumbnail", "preview"]}, 400
+                
                 logger.info("Serving camera image", extra={
                     "business_event": "image_served",
-                    "image_filename": filename
+                    "image_filename": filename,
+                    "width": width
                 })
                 
-                return send_file(image_path, mimetype='image/jpeg')
+                if width and gateway.thumbnail_cache:
+                    # Capture files are never rewritten under the same name, so previews cache for a day
+                    data, etag = gateway.thumbnail_cache.get(image_path, width, st=image_stat)
+                    return preview_response(data, etag, image_stat, max_age=86400)
+                
+                # ETag/Range aware; unchanged images are answered with 304
+                return image_response(image_path, st=image_stat)
                 
             except Exception as e:
                 logger.error("Failed to serve camera image", extra={
@@ -587,6 +749,11 @@ class EnhancedSwaggerAPIGateway:
             try:
                 camera_dir = "/app/camera_capture/live"
                 
+                try:
+                    width = thumbnail_width(request.args.get('size'), request.args.get('width'))
+                except ValueError:
+                    return {"error": "Invalid image size", "sizes": ["full", "thumbnail", "preview"]}, 400
+                
                 # Check if camera directory exists
                 if not os.path.exists(camera_dir):
                     logger.warning("Camera capture directory not found", extra={
@@ -595,27 +762,20 @@ class EnhancedSwaggerAPIGateway:
                     })
                     return {"error": "Camera directory not found", "path": camera_dir}, 404
                 
-                # Find the most recent image file
-                image_files = []
-                for ext in ['*.jpg', '*.jpeg', '*.png', '*.JPG', '*.JPEG', '*.PNG']:
-                    image_files.extend(glob.glob(os.path.join(camera_dir, ext)))
+                # Newest image from the capture service's latest pointer (directory scan only as fallback)
+                latest_image = resolve_latest_image(camera_dir, gateway.redis_client)
                 
-                if not image_files:
+                if latest_image is None:
                     logger.warning("No camera images found", extra={
                         "business_event": "no_camera_images",
                         "directory": camera_dir
                     })
-                    # List directory contents for debugging
-                    try:
-                        dir_contents = os.listdir(camera_dir)
-                        return {"error": "No camera images available", "directory": camera_dir, "contents": dir_contents}, 404
-                    except:
-                        return {"error": "No camera images available", "directory": camera_dir}, 404
+                    return {"error": "No camera images available", "directory": camera_dir}, 404
                 
-                # Get the most recent file by modification time
-                latest_image = max(image_files, key=os.path.getmtime)
+                latest_image = str(latest_image)
+                latest_stat = os.stat(latest_image)
                 filename = os.path.basename(latest_image)
-                file_age = time.time() - os.path.getmtime(latest_image)
+                file_age = time.time() - latest_stat.st_mtime
                 
                 # More lenient time check - warn but still serve if older than 30 minutes
                 if file_age > 1800:  # 30 minutes
@@ -639,7 +799,11 @@ class EnhancedSwaggerAPIGateway:
                     "path": latest_image
                 })
                 
-                return send_file(latest_image, mimetype='image/jpeg')
+                # Clients revalidate on every refresh and get 304 until a new capture lands
+                if width and gateway.thumbnail_cache:
+                    data, etag = gateway.thumbnail_cache.get(latest_image, width, st=latest_stat)
+                    return preview_response(data, etag, latest_stat)
+                return image_response(latest_image, st=latest_stat)
                 
             except Exception as e:
                 logger.error("Failed to get latest camera snapshot", extra={
@@ -683,6 +847,24 @@ class EnhancedSwaggerAPIGateway:
             """Simple health check endpoint for container monitoring"""
             return {"status": "healthy", "timestamp": datetime.now().isoformat()}, 200
         
+        @self.app.route('/metrics')
+        def prometheus_metrics():
+            """Prometheus text exposition of the gateway's metrics and every service's published to Redis"""
+            published = {}
+            if gateway.redis_client:
+                try:
+                    published = read_published_metrics(gateway.redis_client)
+                except Exception as e:
+                    logger.debug(f"Could not read published service metrics: {e}")
+            
+            now = time.time()
+            gateway.metrics_age.clear()
+            for source, (_, updated_at) in published.items():
+                gateway.metrics_age.labels(source).set(round(now - updated_at, 3))
+            
+            body = merge_expositions([gateway.metrics.render()] + [text for text, _ in published.values()])
+            return Response(body, content_type=METRICS_CONTENT_TYPE)
+        
         # Create namespaces
         health_ns = self.api.namespace('health', description='System health and monitoring')
         vehicle_ns = self.api.namespace('vehicles', description='Vehicle detection and tracking')
@@ -723,9 +905,16 @@ class EnhancedSwaggerAPIGateway:
                 """Get API gateway statistics"""
                 try:
                     stats_data = {
-                        **self.stats,
-                        "uptime_seconds": (datetime.now() - datetime.fromisoformat(self.stats["start_time"])).total_seconds(),
-                        "success_rate": (self.stats["successful_requests"] / max(1, self.stats["total_requests"])) * 100
+                        **gateway.stats,
+                        "uptime_seconds": (datetime.now() - datetime.fromisoformat(gateway.stats["start_time"])).total_seconds(),
+                        "success_rate": (gateway.stats["successful_requests"] / max(1, gateway.stats["total_requests"])) * 100,
+                        "database": gateway._get_database_stats(),
+                        "response_cache": gateway.response_cache.get_stats(),
+                        "compression": gateway.compressor.get_stats(),
+                        "thumbnail_cache": gateway.thumbnail_cache.get_stats() if gateway.thumbnail_cache else None,
+                        "report_cache": gateway.report_cache.get_stats() if gateway.report_cache else None,
+                        "event_delivery": gateway.event_delivery.get_stats(),
+                        "log_streaming": gateway.log_stream_handler.get_stats() if gateway.log_stream_handler else None
                     }
                     
                     logger.debug("API statistics retrieved", extra={
@@ -747,18 +936,29 @@ class EnhancedSwaggerAPIGateway:
         @vehicle_ns.route('/detections')
         class VehicleDetections(Resource):
             @with_correlation_tracking
-            @vehicle_ns.marshal_with(gateway.api.models['VehicleDetectionsResponse'])
+            @vehicle_ns.response(200, 'Success', gateway.api.models['VehicleDetectionsResponse'])
             def get(self):
-                """Get recent vehicle detections"""
+                """Get recent vehicle detections (Accept: application/x-ndjson or ?stream=1 streams one per line)"""
                 try:
-                    detections = gateway._get_vehicle_detections()
+                    limit = max(1, request.args.get('limit', 1000, type=int))
                     
-                    logger.debug("Vehicle detections retrieved", extra={
-                        "business_event": "vehicle_detections_retrieved",
-                        "detection_count": len(detections.get("detections", []))
-                    })
+                    if wants_ndjson(request):
+                        return gateway._ndjson_response(
+                            lambda conn: iter_vehicle_detections(conn, time.time() - 604800, limit)
+                        )
+                    
+                    def build():
+                        detections = gateway._get_vehicle_detections(limit=limit)
+                        
+                        logger.debug("Vehicle detections retrieved", extra={
+                            "business_event": "vehicle_detections_retrieved",
+                            "detection_count": len(detections.get("detections", []))
+                        })
+                        
+                        return marshal(detections, gateway.api.models['VehicleDetectionsResponse'])
                     
-                    return detections
+                    # 7-day window relative to now: let the ETag roll over every minute
+                    return gateway._conditional_json('vehicle_detections', {'limit': limit}, build, window_seconds=60)
                     
                 except Exception as e:
                     logger.error("Failed to retrieve vehicle detections", extra={
@@ -771,25 +971,45 @@ class EnhancedSwaggerAPIGateway:
         class ConsolidatedEvents(Resource):
             @with_correlation_tracking
             def get(self):
-                """Get consolidated vehicle events (JSON format from dual storage)"""
+                """Get consolidated vehicle events (JSON format from dual storage; NDJSON stream on request)"""
                 try:
                     # Parse query parameters
                     parser = reqparse.RequestParser()
                     parser.add_argument('limit', type=int, default=20, help='Number of events to retrieve')
                     parser.add_argument('since', type=str, help='Get events since timestamp (ISO format)')
+                    parser.add_argument('after', type=str, help='Opaque cursor (next_cursor of a previous response): only newer events, oldest first')
+                    parser.add_argument('fields', type=str, help='Comma-separated top-level fields to return for each event')
                     args = parser.parse_args()
+                    fields = [f.strip() for f in args['fields'].split(',') if f.strip()] if args['fields'] else None
                     
-                    consolidated_events = gateway._get_consolidated_events(
-                        limit=args['limit'],
-                        since=args['since']
-                    )
+                    after_seq = None
+                    if args['after']:
+                        try:
+                            after_seq = decode_event_cursor(args['after'])
+                        except ValueError as e:
+                            return {"error": str(e)}, 400
                     
-                    logger.debug("Consolidated events retrieved", extra={
-                        "business_event": "consolidated_events_retrieved",
-                        "event_count": len(consolidated_events.get("events", []))
-                    })
+                    if wants_ndjson(request):
+                        if fields:
+                            return gateway._ndjson_response(
+                                lambda conn: (project_record(record, fields) for record in
+                                              iter_consolidated_events(conn, args['limit'], args['since'], after_seq))
+                            )
+                        return gateway._ndjson_response(
+                            lambda conn: iter_consolidated_events(conn, args['limit'], args['since'], after_seq,
+                                                                  serialized=True)
+                        )
+                    
+                    def build():
+                        # Already-serialized JSON body: stored event records are spliced in unparsed
+                        return gateway._get_consolidated_events(
+                            limit=args['limit'],
+                            since=args['since'],
+                            after_seq=after_seq,
+                            fields=fields
+                        )
                     
-                    return consolidated_events
+                    return gateway._conditional_json('vehicles_consolidated', dict(args), build)
                     
                 except Exception as e:
                     logger.error("Failed to retrieve consolidated events", extra={
@@ -798,6 +1018,64 @@ class EnhancedSwaggerAPIGateway:
                     })
                     return {"error": str(e)}, 500
         
+        @vehicle_ns.route('/export')
+        class DetectionExport(Resource):
+            @with_correlation_tracking
+            def get(self):
+                """Stream joined detection data over a time range (csv, ndjson, parquet, arrow)"""
+                try:
+                    parser = reqparse.RequestParser()
+                    parser.add_argument('start', type=str, help='Range start (epoch seconds or ISO 8601, default: 24 hours ago)')
+                    parser.add_argument('end', type=str, help='Range end (epoch seconds or ISO 8601, default: now)')
+                    parser.add_argument('format', type=str, default='csv', help='Export format: csv, ndjson, parquet or arrow')
+                    parser.add_argument('chunk_size', type=int, default=5000, help='Rows fetched per chunk')
+                    args = parser.parse_args()
+                    
+                    fmt = (args['format'] or 'csv').lower()
+                    if fmt not in available_formats():
+                        return {"error": f"Unsupported export format '{fmt}'", "available_formats": available_formats()}, 400
+                    
+                    now = time.time()
+                    try:
+                        end_ts = parse_time_bound(args['end'], now)
+                        start_ts = parse_time_bound(args['start'], end_ts - 86400)
+                    except ValueError as e:
+                        return {"error": f"Invalid time range: {e}"}, 400
+                    if start_ts > end_ts:
+                        return {"error": "start must not be after end"}, 400
+                    
+                    db_path = os.environ.get('DATABASE_PATH', '/app/data/traffic_data.db')
+                    if not os.path.exists(db_path):
+                        return {"error": "Database not found"}, 404
+                    
+                    chunk_size = min(max(args['chunk_size'], 100), 50000)
+                    # The pooled connection is held until the download finishes or is abandoned
+                    body = get_sqlite_pool(db_path).iterate(
+                        lambda conn: DetectionExporter(connection_factory=lambda: conn,
+                                                       chunk_size=chunk_size).stream(fmt, start_ts, end_ts))
+                    
+                    spec = EXPORT_FORMATS[fmt]
+                    filename = (f"detections_{datetime.fromtimestamp(start_ts, tz=timezone.utc).strftime('%Y%m%dT%H%M%S')}"
+                                f"_{datetime.fromtimestamp(end_ts, tz=timezone.utc).strftime('%Y%m%dT%H%M%S')}.{spec['extension']}")
+                    
+                    logger.info("Detection export started", extra={
+                        "business_event": "detection_export_started",
+                        "export_format": fmt,
+                        "start_ts": start_ts,
+                        "end_ts": end_ts
+                    })
+                    
+                    response = Response(stream_with_context(body), mimetype=spec['mimetype'])
+                    response.headers['Content-Disposition'] = f'attachment; filename={filename}'
+                    return response
+                    
+                except Exception as e:
+                    logger.error("Failed to export detections", extra={
+                        "business_event": "detection_export_failure",
+                        "error": str(e)
+                    })
+                    return {"error": str(e)}, 500
+        
         # Weather endpoints
         @weather_ns.route('/current')
         class CurrentWeather(Resource):
@@ -831,14 +1109,11 @@ class EnhancedSwaggerAPIGateway:
             def get(self):
                 """Get analytics summary data"""
                 try:
-                    # Placeholder analytics data
-                    return {
-                        "total_vehicles": 0,
-                        "avg_speed": 0,
-                        "peak_hours": [],
-                        "vehicle_types": {},
-                        "timestamp": datetime.now().isoformat()
-                    }
+                    hours = request.args.get('hours', 24, type=int)
+                    return gateway._conditional_json(
+                        'analytics_summary', {'hours': hours},
+                        lambda: gateway._get_analytics_summary(hours), window_seconds=60
+                    )
                 except Exception as e:
                     logger.error("Failed to get analytics summary", extra={
                         "business_event": "analytics_summary_failure",
@@ -855,50 +1130,50 @@ class EnhancedSwaggerAPIGateway:
                     # Get query parameters
                     seconds = request.args.get('seconds', 3600, type=int)
                     
-                    # Use the speed service to get real data
-                    # Import with package context to avoid relative import errors
-                    try:
-                        from edge_api.services import get_speed_service  # when running as a package
-                    except Exception:
-                        # Fallback for module-level execution
-                        from .services import get_speed_service  # type: ignore
-                    speed_service = get_speed_service()
-                    result = speed_service.get_speeds(period_seconds=seconds, limit=1000)
-                    
-                    # Extract analytics data - Updated to match SpeedAnalysisService output format
-                    speeds_data = result.get('speeds', [])
-                    
-                    # Convert timestamps to Central Time
-                    converted_speeds = []
-                    for s in speeds_data:
-                        speed_record = {"speed": s.get('speed', 0)}
-                        original_timestamp = s.get('timestamp')
-                        if original_timestamp:
-                            speed_record["timestamp"] = gateway.convert_to_central_time(original_timestamp)
-                        else:
-                            speed_record["timestamp"] = original_timestamp
-                        converted_speeds.append(speed_record)
-                    
-                    analytics_data = {
-                        "speeds": converted_speeds,
-                        "avg_speed": result.get('avg_speed', 0),
-                        "max_speed": result.get('max_speed', 0),
-                        "min_speed": result.get('min_speed', 0),
-                        "violations": result.get('violations', 0),
-                        "violation_rate": result.get('violation_rate', 0),
-                        "total_measurements": result.get('total_measurements', 0),
-                        "speed_limit": result.get('speed_limit', 25),
-                        "timestamp": datetime.now().isoformat()
-                    }
+                    def build():
+                        # Use the speed service to get real data
+                        # Import with package context to avoid relative import errors
+                        try:
+                            from edge_api.services import get_speed_service  # when running as a package
+                        except Exception:
+                            # Fallback for module-level execution
+                            from .services import get_speed_service  # type: ignore
+                        speed_service = get_speed_service()
+                        result = speed_service.get_speeds(period_seconds=seconds, limit=1000)
                     
-                    logger.info("Speed analytics retrieved successfully", extra={
-                        "business_event": "speed_analytics_success",
-                        "total_measurements": analytics_data["total_measurements"],
-                        "violations": analytics_data["violations"],
-                        "avg_speed": analytics_data["avg_speed"]
-                    })
+                        # Extract analytics data - Updated to match SpeedAnalysisService output format
+                        speeds_data = result.get('speeds', [])
+                    
+                        # Convert timestamps to Central Time in one batch
+                        central_timestamps = gateway.convert_to_central_times([s.get('timestamp') for s in speeds_data])
+                        converted_speeds = [
+                            {"speed": s.get('speed', 0), "timestamp": central_timestamp}
+                            for s, central_timestamp in zip(speeds_data, central_timestamps)
+                        ]
+                    
+                        analytics_data = {
+                            "speeds": converted_speeds,
+                            "avg_speed": result.get('avg_speed', 0),
+                            "max_speed": result.get('max_speed', 0),
+                            "min_speed": result.get('min_speed', 0),
+                            "violations": result.get('violations', 0),
+                            "violation_rate": result.get('violation_rate', 0),
+                            "total_measurements": result.get('total_measurements', 0),
+                            "speed_limit": result.get('speed_limit', gateway.speed_limit_mph),
+                            "timestamp": datetime.now().isoformat()
+                        }
                     
-                    return analytics_data
+                        logger.info("Speed analytics retrieved successfully", extra={
+                            "business_event": "speed_analytics_success",
+                            "total_measurements": analytics_data["total_measurements"],
+                            "violations": analytics_data["violations"],
+                            "avg_speed": analytics_data["avg_speed"]
+                        })
+                    
+                        return analytics_data
+                    
+                    # Relative window: let the ETag roll over every minute even without new data
+                    return gateway._conditional_json('analytics_speeds', {'seconds': seconds}, build, window_seconds=60)
                     
                 except Exception as e:
                     logger.error("Failed to get speed analytics", extra={
@@ -913,12 +1188,11 @@ class EnhancedSwaggerAPIGateway:
             def get(self):
                 """Get traffic pattern analytics"""
                 try:
-                    return {
-                        "patterns": [],
-                        "peak_times": [],
-                        "trends": {},
-                        "timestamp": datetime.now().isoformat()
-                    }
+                    days = request.args.get('days', 7, type=int)
+                    return gateway._conditional_json(
+                        'analytics_patterns', {'days': days},
+                        lambda: gateway._get_traffic_patterns(days), window_seconds=60
+                    )
                 except Exception as e:
                     logger.error("Failed to get pattern analytics", extra={
                         "business_event": "pattern_analytics_failure",
@@ -932,12 +1206,11 @@ class EnhancedSwaggerAPIGateway:
             def get(self):
                 """Get safety analytics"""
                 try:
-                    return {
-                        "safety_score": 0,
-                        "violations": [],
-                        "incidents": [],
-                        "timestamp": datetime.now().isoformat()
-                    }
+                    days = request.args.get('days', 7, type=int)
+                    return gateway._conditional_json(
+                        'analytics_safety', {'days': days},
+                        lambda: gateway._get_safety_analytics(days), window_seconds=60
+                    )
                 except Exception as e:
                     logger.error("Failed to get safety analytics", extra={
                         "business_event": "safety_analytics_failure",
@@ -951,11 +1224,9 @@ class EnhancedSwaggerAPIGateway:
             def get(self):
                 """Get reports summary"""
                 try:
-                    return {
-                        "reports": [],
-                        "summary": {},
-                        "timestamp": datetime.now().isoformat()
-                    }
+                    return gateway._conditional_json(
+                        'reports_summary', {}, gateway._get_reports_summary, window_seconds=60
+                    )
                 except Exception as e:
                     logger.error("Failed to get reports summary", extra={
                         "business_event": "reports_summary_failure",
@@ -969,11 +1240,11 @@ class EnhancedSwaggerAPIGateway:
             def get(self):
                 """Get violation reports"""
                 try:
-                    return {
-                        "violations": [],
-                        "count": 0,
-                        "timestamp": datetime.now().isoformat()
-                    }
+                    hours = request.args.get('hours', 24, type=int)
+                    return gateway._conditional_json(
+                        'reports_violations', {'hours': hours},
+                        lambda: gateway._get_violations_report(hours), window_seconds=60
+                    )
                 except Exception as e:
                     logger.error("Failed to get violation reports", extra={
                         "business_event": "violation_reports_failure",
@@ -987,11 +1258,9 @@ class EnhancedSwaggerAPIGateway:
             def get(self):
                 """Get monthly reports"""
                 try:
-                    return {
-                        "monthly_data": [],
-                        "trends": {},
-                        "timestamp": datetime.now().isoformat()
-                    }
+                    return gateway._conditional_json(
+                        'reports_monthly', {}, gateway._get_monthly_report, window_seconds=300
+                    )
                 except Exception as e:
                     logger.error("Failed to get monthly reports", extra={
                         "business_event": "monthly_reports_failure",
@@ -1003,22 +1272,44 @@ class EnhancedSwaggerAPIGateway:
         class MonthlyReportDownload(Resource):
             @with_correlation_tracking
             def get(self):
-                """Download monthly traffic summary report as PDF"""
+                """Download monthly traffic summary report (?month=YYYY-MM, default: current month)"""
                 try:
-                    # Generate PDF report data
-                    report_data = gateway._generate_monthly_report_data()
+                    try:
+                        period = month_period(request.args.get('month'), report_timezone())
+                    except ValueError as e:
+                        return {"error": f"Invalid month: {e}", "expected_format": "YYYY-MM"}, 400
+                    
+                    db_path = os.environ.get('DATABASE_PATH', '/app/data/traffic_data.db')
+                    if not os.path.exists(db_path):
+                        return {"error": "Database not found"}, 404
                     
-                    # Create simple HTML content for PDF-like format
-                    html_content = gateway._generate_monthly_pdf_content(report_data)
+                    def render():
+                        # Create simple HTML content for PDF-like format; query errors propagate
+                        # so a failed render is answered with 500 and never cached
+                        return gateway._generate_monthly_pdf_content(gateway._generate_monthly_report_data(period))
+                    
+                    # Past months render once; the current month re-renders only after new data
+                    if gateway.report_cache:
+                        html_content, etag = gateway.report_cache.get(
+                            'monthly_summary', period, {}, gateway._data_version(), render
+                        )
+                    else:
+                        html_content, etag = render().encode('utf-8'), None
                     
                     # Return as downloadable HTML file (PDF alternative)
                     response = make_response(html_content)
                     response.headers['Content-Type'] = 'text/html'
-                    response.headers['Content-Disposition'] = f'attachment; filename=monthly_traffic_summary_{datetime.now().strftime("%Y-%m")}.html'
+                    response.headers['Content-Disposition'] = f'attachment; filename=monthly_traffic_summary_{period.key}.html'
+                    if etag:
+                        response.set_etag(etag)
+                        response.headers['Cache-Control'] = 'no-cache'
+                        response = response.make_conditional(request)
                     
                     logger.info("Monthly report downloaded", extra={
                         "business_event": "monthly_report_download",
-                        "report_type": "monthly_summary"
+                        "report_type": "monthly_summary",
+                        "period": period.key,
+                        "closed_period": period.closed
                     })
                     
                     return response
@@ -1034,33 +1325,30 @@ class EnhancedSwaggerAPIGateway:
         class ViolationsReportDownload(Resource):
             @with_correlation_tracking
             def get(self):
-                """Download speed violation report as CSV"""
+                """Download speed violation report as CSV (?month=YYYY-MM, default: current month)"""
                 try:
-                    # Generate CSV report data
-                    report_data = gateway._generate_violations_report_data()
-                    
-                    # Create CSV content
-                    output = io.StringIO()
-                    writer = csv.writer(output)
-                    
-                    # Write CSV headers
-                    writer.writerow(['Date', 'Time', 'Vehicle Type', 'Speed (MPH)', 'Speed Limit', 'Violation Amount', 'Location', 'Confidence'])
+                    try:
+                        tz = report_timezone()
+                        period = month_period(request.args.get('month'), tz)
+                    except ValueError as e:
+                        return {"error": f"Invalid month: {e}", "expected_format": "YYYY-MM"}, 400
                     
-                    # Write data rows
-                    for row in report_data:
-                        writer.writerow(row)
+                    db_path = os.environ.get('DATABASE_PATH', '/app/data/traffic_data.db')
+                    if not os.path.exists(db_path):
+                        return {"error": "Database not found"}, 404
                     
-                    # Create response
-                    csv_content = output.getvalue()
-                    output.close()
+                    # Every violation in the month, streamed from the cursor (no row cap)
+                    body = get_sqlite_pool(db_path).iterate(
+                        lambda conn: iter_violations_csv(conn, period.start_ts, period.end_ts, tz,
+                                                         speed_limit=gateway.speed_limit_mph))
                     
-                    response = make_response(csv_content)
-                    response.headers['Content-Type'] = 'text/csv'
-                    response.headers['Content-Disposition'] = f'attachment; filename=speed_violations_{datetime.now().strftime("%Y-%m")}.csv'
+                    response = Response(stream_with_context(body), mimetype='text/csv')
+                    response.headers['Content-Disposition'] = f'attachment; filename=speed_violations_{period.key}.csv'
                     
                     logger.info("Violations report downloaded", extra={
                         "business_event": "violations_report_download", 
-                        "report_type": "speed_violations"
+                        "report_type": "speed_violations",
+                        "period": period.key
                     })
                     
                     return response
@@ -1155,8 +1443,8 @@ class EnhancedSwaggerAPIGateway:
                     if not event_data:
                         return {"error": "No event data provided"}, 400
                     
-                    # Broadcast the event to WebSocket clients
-                    self.broadcast_event(event_data)
+                    # Broadcast the event to WebSocket clients (on every worker via the message queue)
+                    gateway.broadcast_event(event_data)
                     
                     logger.debug("Event broadcast request processed", extra={
                         "business_event": "broadcast_request_processed",
@@ -1178,43 +1466,333 @@ class EnhancedSwaggerAPIGateway:
         
         # Routes registered successfully - no dynamic binding needed
     
+    def _probe_redis(self) -> Dict[str, Any]:
+        """Redis health probe, run on the health sampler thread"""
+        if self.redis_client is None:
+            return {"healthy": False, "error": "not connected"}
+        started = time.perf_counter()
+        try:
+            self.redis_client.ping()
+        except Exception as e:
+            return {"healthy": False, "error": str(e)}
+        return {"healthy": True, "latency_ms": round((time.perf_counter() - started) * 1000, 2)}
+    
     @logger.monitor_performance("system_health_check")
     def _get_system_health(self) -> Dict[str, Any]:
-        """Get comprehensive system health status with monitoring"""
-        # Get system metrics
-        cpu_usage = psutil.cpu_percent(interval=1)
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
-        
-        # Check service health
-        redis_healthy = self.redis_client is not None
-        if redis_healthy:
-            try:
-                self.redis_client.ping()
-            except:
-                redis_healthy = False
+        """Get system health status from the latest background sample (no blocking measurement)"""
+        sample = self.health_sampler.latest()
+        if sample is None:
+            sample = self.health_sampler.sample_now()
+        
+        redis_healthy = sample.services.get("redis", {}).get("healthy", False)
         
         health_status = {
-            "status": "healthy" if cpu_usage < 80 and memory.percent < 85 else "warning",
+            "status": "healthy" if sample.cpu_percent < 80 and sample.memory_percent < 85 else "warning",
             "timestamp": datetime.now().isoformat(),
-            "cpu_usage": cpu_usage,
-            "memory_usage": memory.percent,
-            "disk_usage": disk.percent,
+            "uptime_seconds": round(time.time() - psutil.boot_time(), 1),
+            "cpu_usage": sample.cpu_percent,
+            "memory_usage": sample.memory_percent,
+            "disk_usage": sample.disk_percent,
+            "temperature": sample.temperature,
+            "services": sample.services,
+            "averages": {
+                "1m": self.health_sampler.averages(60),
+                "5m": self.health_sampler.averages(300)
+            },
+            "sample_age_seconds": round(time.time() - sample.timestamp, 2),
             "redis_healthy": redis_healthy,
             "api_stats": self.stats,
-            "system_info": {
-                "platform": platform.platform(),
-                "python_version": sys.version,
-                "hostname": socket.gethostname()
-            },
+            "system_info": self._system_info,
             "metrics_available": True
         }
         
         return health_status
     
+    def _get_database_stats(self) -> Dict[str, Any]:
+        """Get O(1) database statistics from the persistence service's row counters and rollups"""
+        db_path = os.environ.get('DATABASE_PATH', '/app/data/traffic_data.db')
+        if not os.path.exists(db_path):
+            return {"available": False}
+        
+        try:
+            with get_sqlite_pool(db_path).connection() as conn:
+                row_counts = read_row_counts(conn)
+                recent_24h = count_detections_since(conn, time.time() - 86400)
+            
+            return {
+                "available": True,
+                "row_counts": row_counts,
+                "recent_24h_detections": recent_24h,
+                "size_mb": round(os.path.getsize(db_path) / (1024 * 1024), 2),
+                "counts_approximate": True
+            }
+        except Exception as e:
+            logger.warning("Failed to read database statistics", extra={
+                "error": str(e)
+            })
+            return {"available": False, "error": str(e)}
+    
+    @contextmanager
+    def _analytics_connection(self) -> Iterator[Optional[sqlite3.Connection]]:
+        """Pooled read connection for rollup analytics, None when the database is missing"""
+        db_path = os.environ.get('DATABASE_PATH', '/app/data/traffic_data.db')
+        if not os.path.exists(db_path):
+            yield None
+            return
+        with get_sqlite_pool(db_path).connection() as conn:
+            yield conn
+    
+    def _get_analytics_summary(self, hours: int = 24) -> Dict[str, Any]:
+        """Volume and speed summary for the last `hours`, from hourly rollups"""
+        end_ts = time.time()
+        start_ts = end_ts - clamp_days(hours / 24) * 86400
+        tz = report_timezone()
+        
+        with self._analytics_connection() as conn:
+            buckets = load_hourly_buckets(conn, start_ts, end_ts) if conn else []
+            percentiles = speed_percentiles(load_speed_sketch(conn, start_ts, end_ts)) if conn else {}
+        summary = summarize_buckets(buckets)
+        
+        return {
+            "total_vehicles": summary["total_vehicles"],
+            "avg_speed": summary["avg_speed"],
+            "peak_hours": peak_hours(hourly_totals(buckets, tz)),
+            "statistics": {
+                "total_records": summary["radar_measurements"],
+                "total_detections": summary["total_vehicles"],
+                "speed_violations": summary["violations"],
+                "violation_rate": summary["violation_rate"],
+                "avg_speed": summary["avg_speed"],
+                "min_speed": summary["min_speed"],
+                "max_speed": summary["max_speed"],
+                "median_speed": percentiles.get("p50"),
+                "p85_speed": percentiles.get("p85"),
+                "p95_speed": percentiles.get("p95")
+            },
+            "period_hours": hours,
+            "timestamp": datetime.now().isoformat()
+        }
+    
+    def _get_traffic_patterns(self, days: int = 7) -> Dict[str, Any]:
+        """Hourly and day-of-week traffic patterns for the last `days`"""
+        end_ts = time.time()
+        start_ts = end_ts - clamp_days(days) * 86400
+        
+        with self._analytics_connection() as conn:
+            buckets = load_hourly_buckets(conn, start_ts, end_ts) if conn else []
+        patterns = traffic_patterns(buckets, start_ts, end_ts)
+        patterns["analysis_timestamp"] = datetime.now().isoformat()
+        return patterns
+    
+    def _get_safety_analytics(self, days: int = 7) -> Dict[str, Any]:
+        """Speed compliance, violation severity and safety rating for the last `days`"""
+        end_ts = time.time()
+        start_ts = end_ts - clamp_days(days) * 86400
+        tz = report_timezone()
+        
+        with self._analytics_connection() as conn:
+            buckets = load_hourly_buckets(conn, start_ts, end_ts) if conn else []
+            histogram = load_speed_histogram(conn, start_ts, end_ts) if conn else [0] * SPEED_BIN_COUNT
+            percentiles = speed_percentiles(load_speed_sketch(conn, start_ts, end_ts)) if conn else {}
+        summary = summarize_buckets(buckets)
+        score, risk_level = safety_rating(summary["compliance_rate"])
+        
+        return {
+            "safety_score": score,
+            "risk_level": risk_level,
+            "speed_compliance": {
+                "total_measurements": summary["radar_measurements"],
+                "violations": summary["violations"],
+                "compliance_rate": summary["compliance_rate"],
+                "violation_rate": summary["violation_rate"],
+                "p85_speed": percentiles.get("p85"),
+                "speed_limit": self.speed_limit_mph
+            },
+            "violation_categories": violation_categories(histogram, self.speed_limit_mph),
+            "speed_distribution": speed_distribution(histogram),
+            "peak_violation_hours": peak_hours(hourly_totals(buckets, tz, 'violation_count')),
+            "period_days": days,
+            "timestamp": datetime.now().isoformat()
+        }
+    
+    def _get_reports_summary(self) -> Dict[str, Any]:
+        """24-hour vehicle, speed and safety summary for the reports page"""
+        end_ts = time.time()
+        start_ts = end_ts - 86400
+        
+        with self._analytics_connection() as conn:
+            buckets = load_hourly_buckets(conn, start_ts, end_ts) if conn else []
+        summary = summarize_buckets(buckets)
+        score, risk_level = safety_rating(summary["compliance_rate"])
+        
+        return {
+            "report_period": "24 Hours",
+            "generated_at": datetime.now().isoformat(),
+            "vehicle_statistics": {
+                "total_detections": summary["total_vehicles"],
+                "hourly_average": round(summary["total_vehicles"] / 24, 1),
+                "peak_hour": peak_hour(hourly_totals(buckets, report_timezone()))
+            },
+            "speed_statistics": {
+                "total_measurements": summary["radar_measurements"],
+                "average_speed": summary["avg_speed"],
+                "max_speed": summary["max_speed"],
+                "violations": summary["violations"],
+                "compliance_rate": summary["compliance_rate"]
+            },
+            "safety_metrics": {
+                "overall_score": score,
+                "risk_level": risk_level
+            },
+            "speed_limit": self.speed_limit_mph
+        }
+    
+    def _get_violations_report(self, hours: int = 24) -> Dict[str, Any]:
+        """Violation totals, severity categories and hourly breakdown for the last `hours`"""
+        end_ts = time.time()
+        start_ts = end_ts - clamp_days(hours / 24) * 86400
+        
+        with self._analytics_connection() as conn:
+            buckets = load_hourly_buckets(conn, start_ts, end_ts) if conn else []
+            histogram = load_speed_histogram(conn, start_ts, end_ts) if conn else [0] * SPEED_BIN_COUNT
+        summary = summarize_buckets(buckets)
+        categories = violation_categories(histogram, self.speed_limit_mph)
+        hourly_violations = hourly_totals(buckets, report_timezone(), 'violation_count')
+        
+        recommendations = []
+        if categories["severe"]["count"]:
+            recommendations.append("Severe speeding detected - consider increased enforcement")
+        if summary["violation_rate"] > 15:
+            recommendations.append("High violation rate - review speed limit signage")
+        peak = peak_hour(hourly_violations)
+        if peak is not None:
+            recommendations.append(f"Peak violation time: {peak}:00 - focus enforcement efforts")
+        
+        return {
+            "report_type": "Speed Violations",
+            "generated_at": datetime.now().isoformat(),
+            "time_period": f"{hours} Hours",
+            "speed_limit": self.speed_limit_mph,
+            "total_violations": summary["violations"],
+            "violation_rate": summary["violation_rate"],
+            "violation_categories": categories,
+            "hourly_breakdown": {str(hour): count for hour, count in enumerate(hourly_violations) if count},
+            "recommendations": recommendations or ["Current violation levels are within acceptable range"]
+        }
+    
+    def _get_monthly_report(self) -> Dict[str, Any]:
+        """Month-to-date summary compared against the previous calendar month (local time)"""
+        tz = report_timezone()
+        now = datetime.now(tz)
+        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        previous_start = (month_start - timedelta(days=1)).replace(day=1)
+        
+        with self._analytics_connection() as conn:
+            current = load_hourly_buckets(conn, month_start.timestamp(), now.timestamp()) if conn else []
+            previous = load_hourly_buckets(conn, previous_start.timestamp(), month_start.timestamp()) if conn else []
+        current_summary = summarize_buckets(current)
+        previous_summary = summarize_buckets(previous)
+        
+        elapsed_days = now.day
+        previous_days = (month_start - previous_start).days
+        daily = daily_totals(current, tz)
+        daily_violations = daily_totals(current, tz, 'violation_count')
+        
+        weekly_breakdown = {}
+        for day, count in daily.items():
+            week = weekly_breakdown.setdefault(f"week_{(day.day - 1) // 7 + 1}", {"detections": 0, "violations": 0})
+            week["detections"] += count
+            week["violations"] += daily_violations.get(day, 0)
+        
+        current_daily_avg = current_summary["total_vehicles"] / elapsed_days
+        previous_daily_avg = previous_summary["total_vehicles"] / previous_days
+        compliance_delta = current_summary["compliance_rate"] - previous_summary["compliance_rate"]
+        
+        insights = []
+        busiest_hour = peak_hour(hourly_totals(current, tz))
+        if busiest_hour is not None:
+            insights.append(f"Traffic peaks at {busiest_hour}:00 this month")
+        if previous_summary["radar_measurements"] and current_summary["radar_measurements"]:
+            trend = "improved" if compliance_delta >= 0 else "declined"
+            insights.append(f"Speed compliance has {trend} by {abs(compliance_delta):.1f} points compared to previous month")
+        
+        return {
+            "report_type": "Monthly Analysis",
+            "month": now.strftime("%B %Y"),
+            "generated_at": now.isoformat(),
+            "summary_statistics": {
+                "total_detections": current_summary["total_vehicles"],
+                "daily_average": round(current_daily_avg, 1),
+                "peak_day": max(daily, key=daily.get).isoformat() if daily else None,
+                "total_speed_measurements": current_summary["radar_measurements"],
+                "average_speed": current_summary["avg_speed"],
+                "total_violations": current_summary["violations"],
+                "average_compliance_rate": current_summary["compliance_rate"]
+            },
+            "weekly_breakdown": weekly_breakdown,
+            "comparative_analysis": {
+                "vs_previous_month": {
+                    "traffic_change": percent_change(current_daily_avg, previous_daily_avg),
+                    "violations_change": percent_change(current_summary["violations"] / elapsed_days,
+                                                        previous_summary["violations"] / previous_days),
+                    "safety_improvement": (f"{compliance_delta:+.1f} pts"
+                                           if previous_summary["radar_measurements"] else "N/A")
+                }
+            },
+            "insights": insights
+        }
+    
+    def _data_version(self) -> Optional[str]:
+        """Version token of the traffic database; changes whenever new data is stored"""
+        db_path = os.environ.get('DATABASE_PATH', '/app/data/traffic_data.db')
+        tracker = self._version_trackers.get(db_path)
+        if tracker is None:
+            tracker = self._version_trackers[db_path] = DataVersionTracker(db_path)
+        return tracker.current()
+    
+    def _conditional_json(self, endpoint: str, params: Dict[str, Any], build,
+                          window_seconds: Optional[int] = None):
+        """Serve build()'s JSON with an ETag keyed on the newest stored event and the parameters
+        
+        Answers 304 when the client already has the current version and reuses a cached
+        rendered body otherwise; build() only runs when the data or parameters changed.
+        build() signals failure by raising, so a fallback body is never cached under the ETag.
+        """
+        version = self._data_version()
+        if version is None:
+            body = build()
+            return Response(body, mimetype='application/json') if isinstance(body, bytes) else body
+        
+        etag = ResponseCache.make_etag(endpoint, params, version, window_seconds)
+        if request.if_none_match.contains_weak(etag):
+            self.response_cache.record_not_modified()
+            response = Response(status=304)
+        else:
+            body = self.response_cache.get(etag)
+            if body is None:
+                body = build()
+                if not isinstance(body, bytes):
+                    body = serialization.dumpb(body)
+                self.response_cache.put(etag, body)
+            response = Response(body, mimetype='application/json')
+        
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+    
+    def _ndjson_response(self, open_records):
+        """Stream the records yielded by open_records(conn) as NDJSON, one row at a time"""
+        db_path = os.environ.get('DATABASE_PATH', '/app/data/traffic_data.db')
+        if not os.path.exists(db_path):
+            return {"error": "Database not found"}, 404
+        
+        # The pooled connection is held until the stream finishes or the client disconnects
+        records = get_sqlite_pool(db_path).iterate(lambda conn: ndjson_stream(open_records(conn)))
+        return Response(stream_with_context(records), mimetype=NDJSON_MIMETYPE)
+    
     @logger.monitor_performance("vehicle_detections_query")
-    def _get_vehicle_detections(self) -> Dict[str, Any]:
-        """Get recent vehicle detections from SQLite database"""
+    def _get_vehicle_detections(self, limit: int = 1000) -> Dict[str, Any]:
+        """Get recent vehicle detections (last 7 days) from SQLite database"""
         detections = []
         
         try:
@@ -1230,45 +1808,11 @@ class EnhancedSwaggerAPIGateway:
                     "timespan_seconds": None
                 }
             
-            # Connect to SQLite database
-            conn = sqlite3.connect(db_path)
-            conn.row_factory = sqlite3.Row  # Enable row access by column name
-            cursor = conn.cursor()
-            
-            # Query recent vehicle detections with speed data
-            query = """
-            SELECT 
-                td.id,
-                td.timestamp,
-                td.vehicle_count,
-                td.confidence_score,
-                rd.speed_mph,
-                rd.speed_mps,
-                rd.alert_level
-            FROM traffic_detections td
-            LEFT JOIN radar_detections rd ON td.id = rd.detection_id
-            WHERE td.timestamp >= datetime('now', '-7 days')
-            ORDER BY td.timestamp DESC
-            LIMIT 1000
-            """
-            
-            cursor.execute(query)
-            rows = cursor.fetchall()
-            
-            # Convert rows to dictionaries
-            for row in rows:
-                detection = {
-                    "id": row["id"],
-                    "timestamp": row["timestamp"],
-                    "vehicle_count": row["vehicle_count"] or 1,
-                    "confidence_score": row["confidence_score"],
-                    "speed_mph": row["speed_mph"],
-                    "speed_mps": row["speed_mps"],
-                    "alert_level": row["alert_level"]
-                }
-                detections.append(detection)
-            
-            conn.close()
+            # Pooled read-only connection (rows support access by column name)
+            with get_sqlite_pool(db_path).connection() as conn:
+                # Query recent vehicle detections with speed and camera data (timestamps are epoch seconds)
+                rows = conn.execute(DETECTIONS_SQL, (time.time() - 604800, limit)).fetchall()
+            detections = [detection_record(row) for row in rows]
             
             logger.info(f"Retrieved {len(detections)} vehicle detections from database")
             
@@ -1277,6 +1821,8 @@ class EnhancedSwaggerAPIGateway:
                 "error": str(e),
                 "db_path": db_path
             })
+            # Propagate so the request fails instead of an empty list being cached as current
+            raise
         
         return {
             "detections": detections,
@@ -1285,9 +1831,22 @@ class EnhancedSwaggerAPIGateway:
         }
 
     @logger.monitor_performance("consolidated_events_query")
-    def _get_consolidated_events(self, limit: int = 20, since: Optional[str] = None) -> Dict[str, Any]:
-        """Get consolidated vehicle events from dual storage JSON table with monitoring"""
+    def _get_consolidated_events(self, limit: int = 20, since: Optional[str] = None,
+                                 after_seq: Optional[int] = None,
+                                 fields: Optional[List[str]] = None) -> bytes:
+        """Get consolidated vehicle events from dual storage JSON table with monitoring
+        
+        Without after_seq, returns the newest events (optionally since a created_at time),
+        newest first. With after_seq, returns only events inserted after that sequence in
+        ascending order, so incremental polls cost O(new events). Either way next_cursor
+        is the cursor to pass as ?after= on the next poll.
+        
+        Returns the serialized JSON response. Each event's stored api_json is spliced in
+        without parsing; only rows without it, or requests for a subset of fields, are parsed.
+        """
         events = []
+        next_cursor = encode_event_cursor(after_seq) if after_seq is not None else None
+        has_more = False
         
         try:
             # Get database path from environment
@@ -1298,63 +1857,55 @@ class EnhancedSwaggerAPIGateway:
                 logger.warning("Database file not found", extra={
                     "db_path": db_path
                 })
-                return {
+                return serialization.dumpb({
                     "events": [],
                     "total_count": 0,
                     "timestamp": datetime.now().isoformat(),
                     "message": "Database not found"
-                }
-            
-            # Connect to the SQLite database
-            import sqlite3
-            conn = sqlite3.connect(db_path)
-            conn.row_factory = sqlite3.Row  # Enable dict-like access
-            
-            # Build query with optional time filter
-            query = """
-                SELECT consolidation_id, event_json, created_at 
-                FROM consolidated_events 
-            """
-            params = []
-            
-            if since:
-                query += "WHERE created_at >= ? "
-                params.append(since)
-            
-            query += "ORDER BY created_at DESC LIMIT ?"
-            params.append(limit)
-            
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
+                })
             
-            # Process each row
-            for row in rows:
-                try:
-                    # Parse the JSON data
-                    event_data = json.loads(row['event_json'])
-                    
-                    # Add metadata
-                    event_record = {
-                        "consolidation_id": row['consolidation_id'],
-                        "created_at": row['created_at'],
-                        **event_data  # Merge the JSON data
-                    }
-                    events.append(event_record)
+            # Pooled read-only connection (rows support dict-like access)
+            with get_sqlite_pool(db_path).connection() as conn:
+                api_json = fields is None and has_api_json(conn)
+                
+                if after_seq is not None:
+                    # Delta fetch: range scan on idx_consolidated_event_seq, one extra row to detect more pages
+                    rows = conn.execute(*consolidated_events_query(limit + 1, after_seq=after_seq,
+                                                                   api_json=api_json)).fetchall()
+                    has_more = len(rows) > limit
+                    rows = rows[:limit]
+                    next_cursor = encode_event_cursor(rows[-1]['event_seq'] if rows else after_seq)
+                else:
+                    # Read the cursor first: an event stored mid-query is then repeated by the next
+                    # delta poll rather than skipped (clients de-duplicate on consolidation_id)
+                    try:
+                        latest_seq = conn.execute("SELECT MAX(event_seq) FROM consolidated_events").fetchone()[0]
+                        next_cursor = encode_event_cursor(latest_seq or 0)
+                    except sqlite3.OperationalError:
+                        # Persistence service has not added event_seq to this database yet
+                        next_cursor = None
                     
-                except json.JSONDecodeError as e:
-                    logger.warning("Invalid JSON in consolidated event", extra={
-                        "consolidation_id": row['consolidation_id'],
-                        "error": str(e)
-                    })
-            
-            conn.close()
+                    # Newest events, with optional time filter
+                    rows = conn.execute(*consolidated_events_query(limit, since, api_json=api_json)).fetchall()
+                
+                # Serialized record per row (invalid rows are skipped)
+                if fields is None:
+                    for row in rows:
+                        event_json = consolidated_event_json(row, api_json)
+                        if event_json is not None:
+                            events.append(event_json)
+                else:
+                    for row in rows:
+                        event_record = consolidated_event_record(row)
+                        if event_record is not None:
+                            events.append(serialization.dumps(project_record(event_record, fields)))
             
             logger.info("Consolidated events retrieved successfully", extra={
                 "business_event": "consolidated_events_query_success",
                 "event_count": len(events),
                 "limit": limit,
-                "since_filter": since is not None
+                "since_filter": since is not None,
+                "cursor_fetch": after_seq is not None
             })
             
         except Exception as e:
@@ -1363,16 +1914,21 @@ class EnhancedSwaggerAPIGateway:
                 "error": str(e),
                 "db_path": db_path
             })
+            # Propagate so the request fails instead of an empty page being cached as current
+            raise
         
-        return {
-            "events": events,
+        return json_object_with_array("events", events, {
             "total_count": len(events),
+            "next_cursor": next_cursor,
+            "has_more": has_more,
             "timestamp": datetime.now().isoformat(),
             "query_params": {
                 "limit": limit,
-                "since": since
+                "since": since,
+                "after": encode_event_cursor(after_seq) if after_seq is not None else None,
+                "fields": fields
             }
-        }
+        })
     
     @logger.monitor_performance("weather_data_query") 
     def _get_current_weather(self) -> Dict[str, Any]:
@@ -1389,12 +1945,12 @@ class EnhancedSwaggerAPIGateway:
                 # Get airport weather data
                 airport_data = self.redis_client.get("weather:airport:latest")
                 if airport_data:
-                    weather_sources["airport"] = json.loads(airport_data)
+                    weather_sources["airport"] = serialization.loads(airport_data)
                 
                 # Get weather correlation
                 correlation_data = self.redis_client.get("weather:correlation:airport_dht22")
                 if correlation_data:
-                    weather_sources["correlation"] = json.loads(correlation_data)
+                    weather_sources["correlation"] = serialization.loads(correlation_data)
                 
             except Exception as e:
                 logger.warning("Failed to retrieve weather data from Redis", extra={
@@ -1425,32 +1981,26 @@ class EnhancedSwaggerAPIGateway:
             
             for attempt in range(max_retries):
                 try:
-                    conn = sqlite3.connect(db_path, timeout=10.0)
-                    conn.row_factory = sqlite3.Row  # Enable dict-like access
-                    cursor = conn.cursor()
-                    
-                    # Query recent business events for the dashboard
-                    cursor.execute("""
-                        SELECT timestamp, service_name, level, message, 
-                               business_event, correlation_id, extra_data
-                        FROM logs 
-                        WHERE business_event IS NOT NULL 
-                           AND business_event IN (
-                               'vehicle_detection', 'vehicle_detected', 'api_request_success',
-                               'radar_alert', 'system_status', 'health_check'
-                           )
-                        ORDER BY timestamp DESC 
-                        LIMIT ?
-                    """, (limit,))
-                    
-                    rows = cursor.fetchall()
+                    with get_sqlite_pool(db_path).connection() as conn:
+                        rows = conn.execute("""
+                            SELECT timestamp, service_name, level, message, 
+                                   business_event, correlation_id, extra_data
+                            FROM logs 
+                            WHERE business_event IS NOT NULL 
+                               AND business_event IN (
+                                   'vehicle_detection', 'vehicle_detected', 'api_request_success',
+                                   'radar_alert', 'system_status', 'health_check'
+                               )
+                            ORDER BY timestamp DESC 
+                            LIMIT ?
+                        """, (limit,)).fetchall()
                     
                     for row in rows:
                         # Parse extra_data JSON if available
                         extra_data = {}
                         if row['extra_data']:
                             try:
-                                extra_data = json.loads(row['extra_data'])
+                                extra_data = serialization.loads(row['extra_data'])
                             except json.JSONDecodeError:
                                 pass
                         
@@ -1465,7 +2015,6 @@ class EnhancedSwaggerAPIGateway:
                         }
                         events.append(event)
                     
-                    conn.close()
                     break  # Success, exit retry loop
                     
                 except (sqlite3.OperationalError, sqlite3.DatabaseError) as db_err:
@@ -1489,7 +2038,7 @@ class EnhancedSwaggerAPIGateway:
         return events
     
     def broadcast_event(self, event_data):
-        """Broadcast a real-time event to all connected WebSocket clients"""
+        """Queue a real-time event for clients subscribed to its channel"""
         try:
             correlation_id = str(uuid.uuid4())[:8]
             
@@ -1498,13 +2047,15 @@ class EnhancedSwaggerAPIGateway:
                 if 'timestamp' not in event_data:
                     event_data['timestamp'] = datetime.now().isoformat()
                 
-                # Emit to all connected clients
-                self.socketio.emit('real_time_event', event_data)
+                # Sent with the channel's next batch (every worker via the message queue)
+                channel = classify_event(event_data)
+                self.event_delivery.publish(channel, event_data)
                 
-                logger.debug("Event broadcasted to WebSocket clients", extra={
+                logger.debug("Event queued for WebSocket clients", extra={
                     "business_event": "event_broadcast",
                     "correlation_id": correlation_id,
                     "event_type": event_data.get('business_event', 'unknown'),
+                    "channel": channel,
                     "active_connections": self.client_count
                 })
                 
@@ -1514,63 +2065,29 @@ class EnhancedSwaggerAPIGateway:
                 "error": str(e)
             })
 
-    def _generate_monthly_report_data(self):
-        """Generate data for monthly traffic summary report"""
-        try:
-            # Get database path from environment
-            db_path = os.environ.get('DATABASE_PATH', '/app/data/traffic_data.db')
-            
-            if not os.path.exists(db_path):
-                logger.warning(f"Database file not found at {db_path}")
-                return {
-                    "summary": "No data available",
-                    "total_vehicles": 0,
-                    "avg_speed": 0,
-                    "violations": 0,
-                    "period": "Current Month"
-                }
-            
-            # Connect to SQLite database
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-            
-            # Get monthly summary data
-            # Use UNIX timestamp comparison - get start of current month as epoch
-            current_time = time.time()
-            start_of_month = datetime.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0).timestamp()
-            
-            query = """
-            SELECT 
-                COUNT(*) as total_detections,
-                AVG(rd.speed_mph) as avg_speed,
-                COUNT(CASE WHEN rd.speed_mph > 25 THEN 1 END) as violations
-            FROM traffic_detections td
-            LEFT JOIN radar_detections rd ON td.id = rd.detection_id
-            WHERE td.timestamp >= ?
-            """
-            
-            cursor.execute(query, (start_of_month,))
-            row = cursor.fetchone()
-            
-            conn.close()
-            
-            return {
-                "total_vehicles": row[0] if row[0] else 0,
-                "avg_speed": round(row[1], 1) if row[1] else 0,
-                "violations": row[2] if row[2] else 0,
-                "period": datetime.now().strftime("%B %Y"),
-                "generated_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
-            
-        except Exception as e:
-            logger.error("Failed to generate monthly report data", extra={"error": str(e)})
-            return {
-                "summary": "Error generating report",
-                "total_vehicles": 0,
-                "avg_speed": 0,
-                "violations": 0,
-                "period": "Current Month"
-            }
+    def _generate_monthly_report_data(self, period=None):
+        """Generate data for monthly traffic summary report
+        
+        Raises sqlite3.OperationalError when the database is missing or cannot be read, so an
+        empty report is never rendered (and cached) in place of the real one.
+        """
+        period = period or month_period(None, report_timezone())
+        
+        # Get database path from environment
+        db_path = os.environ.get('DATABASE_PATH', '/app/data/traffic_data.db')
+        
+        # Totals for the month from the hourly rollups (local calendar month)
+        with get_sqlite_pool(db_path).connection() as conn:
+            summary = summarize_buckets(load_hourly_buckets(conn, period.start_ts, period.end_ts,
+                                                            missing_ok=False))
+        
+        return {
+            "total_vehicles": summary["total_vehicles"],
+            "avg_speed": summary["avg_speed"],
+            "violations": summary["violations"],
+            "period": period.label,
+            "generated_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
 
     def _generate_monthly_pdf_content(self, report_data):
         """Generate HTML content for monthly PDF report"""
@@ -1621,102 +2138,6 @@ class EnhancedSwaggerAPIGateway:
         """
         return html_content
 
-    def _generate_violations_report_data(self):
-        """Generate data for speed violations CSV report"""
-        try:
-            # Get database path from environment
-            db_path = os.environ.get('DATABASE_PATH', '/app/data/traffic_data.db')
-            
-            if not os.path.exists(db_path):
-                logger.warning(f"Database file not found at {db_path}")
-                return [
-                    [datetime.now().strftime("%Y-%m-%d"), datetime.now().strftime("%H:%M:%S"), 
-                     "No Data", "0", "35", "0", "N/A", "0%"]
-                ]
-            
-            # Connect to SQLite database
-            conn = sqlite3.connect(db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            # Get violations data (speed > 25 mph) - using UNIX timestamp
-            start_of_month = datetime.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0).timestamp()
-            
-            query = """
-            SELECT 
-                td.timestamp,
-                cd.vehicle_types as vehicle_type,
-                rd.speed_mph,
-                25 as speed_limit,
-                (rd.speed_mph - 25) as violation_amount,
-                td.location_id as location,
-                rd.confidence
-            FROM traffic_detections td
-            JOIN radar_detections rd ON td.id = rd.detection_id
-            LEFT JOIN camera_detections cd ON td.id = cd.detection_id
-            WHERE rd.speed_mph > 25
-            AND td.timestamp >= ?
-            ORDER BY td.timestamp DESC
-            LIMIT 1000
-            """
-            
-            cursor.execute(query, (start_of_month,))
-            rows = cursor.fetchall()
-            
-            conn.close()
-            
-            # Convert to CSV rows
-            csv_data = []
-            for row in rows:
-                # Convert UNIX timestamp to Central Time (UTC-6 for CST, UTC-5 for CDT)
-                # Python's timezone handling - create UTC datetime then convert to Central
-                from zoneinfo import ZoneInfo
-                utc_dt = datetime.fromtimestamp(row['timestamp'], tz=timezone.utc)
-                central_dt = utc_dt.astimezone(ZoneInfo('America/Chicago'))
-                
-                # Parse vehicle type if it's JSON
-                vehicle_type = "Vehicle"
-                if row['vehicle_type']:
-                    try:
-                        import json
-                        types = json.loads(row['vehicle_type']) if isinstance(row['vehicle_type'], str) else row['vehicle_type']
-                        vehicle_type = types[0] if isinstance(types, list) and types else str(types)
-                    except:
-                        vehicle_type = str(row['vehicle_type'])
-                
-                csv_data.append([
-                    central_dt.strftime("%Y-%m-%d"),
-                    central_dt.strftime("%H:%M:%S"),
-                    vehicle_type,
-                    f"{row['speed_mph']:.1f}",
-                    str(row['speed_limit']),
-                    f"{row['violation_amount']:.1f}",
-                    row['location'] or "Main Street",
-                    f"{row['confidence']*100:.1f}%" if row['confidence'] else "N/A"
-                ])
-            
-            # If no data, return sample row
-            if not csv_data:
-                csv_data.append([
-                    datetime.now().strftime("%Y-%m-%d"),
-                    datetime.now().strftime("%H:%M:%S"),
-                    "No Violations",
-                    "0.0",
-                    "25",
-                    "0.0", 
-                    "Main Street",
-                    "N/A"
-                ])
-            
-            return csv_data
-            
-        except Exception as e:
-            logger.error("Failed to generate violations report data", extra={"error": str(e)})
-            return [
-                [datetime.now().strftime("%Y-%m-%d"), datetime.now().strftime("%H:%M:%S"), 
-                 "Error", "0", "35", "0", "N/A", "0%"]
-            ]
-    
     def run(self, debug=False):
         """Run the enhanced API gateway with logging"""
         try:
@@ -1724,7 +2145,9 @@ class EnhancedSwaggerAPIGateway:
                 "business_event": "api_gateway_start",
                 "host": self.host,
                 "port": self.port,
-                "debug_mode": debug
+                "debug_mode": debug,
+                "async_mode": SOCKETIO_ASYNC_MODE,
+                "message_queue": bool(os.environ.get('SOCKETIO_MESSAGE_QUEUE'))
             })
             
             self.is_running = True
@@ -1749,6 +2172,12 @@ class EnhancedSwaggerAPIGateway:
             raise
         finally:
             self.is_running = False
+            self.health_sampler.stop()
+            if self.log_stream_handler:
+                logging.getLogger().removeHandler(self.log_stream_handler)
+                self.log_stream_handler.close()
+            self.event_delivery.stop()
+            close_all_pools()
             logger.info("API gateway server stopped", extra={
                 "business_event": "api_gateway_stop",
                 "final_stats": self.stats
@@ -15,6 +15,9 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Longest window validate_time_period() accepts by default (one week)
+MAX_TIME_PERIOD_SECONDS = 604800
+
 
 class APIError(Exception):
     """Base exception class for API errors"""
@@ -185,7 +188,8 @@ def safe_postgres_operation(operation_name: str = "PostgreSQL operation"):
     return decorator
 
 
-def validate_time_period(period: Union[str, int], min_seconds: int = 60, max_seconds: int = 604800) -> int:
+def validate_time_period(period: Union[str, int], min_seconds: int = 60,
+                         max_seconds: int = MAX_TIME_PERIOD_SECONDS) -> int:
     """Validate and convert time period parameter to seconds
     
     Args:
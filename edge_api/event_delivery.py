@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Coalesced WebSocket Event Delivery
+Subscription-filtered, batched delivery of real-time events to Socket.IO clients
+
+Clients subscribe to channels (alerts, consolidated, radar, logs) and each channel is a
+Socket.IO room, so events only reach clients that asked for them, on every worker when a
+message queue is configured. Published events are buffered per channel and flushed every
+window (100 ms by default) as a single `event_batch` frame per channel; Socket.IO encodes
+one emit to a room once, so each batch is serialized once however many clients receive it.
+
+Lower-priority channels are lossy under load. Each channel buffers a bounded number of
+events per window and drops the oldest beyond that, reporting the count in the batch.
+Clients whose outgoing queue has backed up (slow network, stalled tab) are skipped for
+radar and log batches until they drain, and then receive one `event_summary` with the
+number of events they missed. Alerts and consolidated events are always delivered.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# In priority order; alerts and consolidated events are never skipped
+CHANNELS = ('alerts', 'consolidated', 'radar', 'logs')
+LOSSY_CHANNELS = frozenset({'radar', 'logs'})
+# What the legacy subscribe_events request subscribes to
+EVENT_CHANNELS = ('alerts', 'consolidated', 'radar')
+
+BATCH_EVENT = 'event_batch'
+SUMMARY_EVENT = 'event_summary'
+
+DEFAULT_WINDOW = 0.1
+# Events buffered per channel per window before the oldest are dropped
+MAX_PENDING = {'alerts': 1000, 'consolidated': 1000, 'radar': 200, 'logs': 200}
+# Engine.IO packets queued for one client before lossy channels skip it
+DEFAULT_BACKLOG_LIMIT = 32
+
+ALERT_LEVELS = frozenset({'WARNING', 'ERROR', 'CRITICAL'})
+
+
+def classify_event(event: Dict[str, Any]) -> str:
+    """Channel for a broadcast event; an explicit 'channel' field wins"""
+    channel = event.get('channel')
+    if channel in CHANNELS:
+        return channel
+    business_event = str(event.get('business_event') or event.get('event_type') or '')
+    if 'alert' in business_event or str(event.get('level', '')).upper() in ALERT_LEVELS:
+        return 'alerts'
+    if business_event.startswith('radar') or 'radar' in str(event.get('service_name', '')):
+        return 'radar'
+    return 'consolidated'
+
+
+def room_for(channel: str) -> str:
+    return f"events:{channel}"
+
+
+class EventCoalescer:
+    """Buffers events per channel and emits them to subscribed clients in batches"""
+
+    def __init__(self, socketio, window: float = DEFAULT_WINDOW,
+                 backlog_limit: int = DEFAULT_BACKLOG_LIMIT, namespace: str = '/'):
+        self.socketio = socketio
+        self.window = window
+        self.backlog_limit = backlog_limit
+        self.namespace = namespace
+
+        self._pending: Dict[str, deque] = {channel: deque() for channel in CHANNELS}
+        self._dropped: Dict[str, int] = dict.fromkeys(CHANNELS, 0)
+        # sid -> channel -> events skipped while the client was backed up
+        self._missed: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+        self._running = False
+        self._task = None
+        self.stats = {"published": 0, "batches": 0, "events_sent": 0, "dropped": 0, "skipped_deliveries": 0}
+
+    def start(self):
+        if not self._running:
+            self._running = True
+            self._task = self.socketio.start_background_task(self._run)
+
+    def stop(self):
+        self._running = False
+
+    def _run(self):
+        while self._running:
+            self.socketio.sleep(self.window)
+            try:
+                self.flush()
+            except Exception as e:
+                logger.debug(f"Event batch flush failed: {e}")
+
+    def publish(self, channel: str, event: Dict[str, Any]):
+        """Queue an event for the next batch on `channel`"""
+        with self._lock:
+            pending = self._pending[channel]
+            if len(pending) >= MAX_PENDING[channel]:
+                pending.popleft()
+                self._dropped[channel] += 1
+                self.stats["dropped"] += 1
+            pending.append(event)
+            self.stats["published"] += 1
+
+    def subscribe(self, sid: str, channels: Iterable[str]) -> List[str]:
+        """Add a client to the given channels; unknown channel names are ignored"""
+        requested = set(channels)
+        subscribed = [channel for channel in CHANNELS if channel in requested]
+        for channel in subscribed:
+            self.socketio.server.enter_room(sid, room_for(channel), namespace=self.namespace)
+        return subscribed
+
+    def unsubscribe(self, sid: str, channels: Iterable[str]) -> List[str]:
+        requested = set(channels)
+        removed = [channel for channel in CHANNELS if channel in requested]
+        for channel in removed:
+            self.socketio.server.leave_room(sid, room_for(channel), namespace=self.namespace)
+        return removed
+
+    def forget(self, sid: str):
+        """Drop per-client state for a disconnected client"""
+        with self._lock:
+            self._missed.pop(sid, None)
+
+    def flush(self):
+        """Emit one batch per channel with pending events"""
+        with self._lock:
+            batches = []
+            for channel in CHANNELS:
+                if self._pending[channel]:
+                    batches.append((channel, list(self._pending[channel]), self._dropped[channel]))
+                    self._pending[channel].clear()
+                    self._dropped[channel] = 0
+
+        for channel, events, dropped in batches:
+            skip = self._backed_up_clients(channel) if channel in LOSSY_CHANNELS else []
+            self.socketio.emit(BATCH_EVENT, {
+                'channel': channel,
+                'events': events,
+                'dropped': dropped,
+                'server_time': time.time()
+            }, to=room_for(channel), skip_sid=skip or None, namespace=self.namespace)
+            self.stats["batches"] += 1
+            self.stats["events_sent"] += len(events)
+
+            if skip:
+                self.stats["skipped_deliveries"] += len(skip)
+                with self._lock:
+                    for sid in skip:
+                        missed = self._missed.setdefault(sid, {})
+                        missed[channel] = missed.get(channel, 0) + len(events)
+
+        self._send_summaries()
+
+    def _send_summaries(self):
+        """Tell clients that have drained how many lossy events they missed"""
+        with self._lock:
+            waiting = list(self._missed.items())
+        for sid, missed in waiting:
+            if self._queue_depth_for(sid) > self.backlog_limit:
+                continue
+            with self._lock:
+                self._missed.pop(sid, None)
+            self.socketio.emit(SUMMARY_EVENT, {'missed': missed, 'server_time': time.time()},
+                               to=sid, namespace=self.namespace)
+
+    def _backed_up_clients(self, channel: str) -> List[str]:
+        server = self.socketio.server
+        return [sid for sid, eio_sid in server.manager.get_participants(self.namespace, room_for(channel))
+                if self._queue_depth(eio_sid) > self.backlog_limit]
+
+    def _queue_depth_for(self, sid: str) -> int:
+        try:
+            eio_sid = self.socketio.server.manager.eio_sid_from_sid(sid, self.namespace)
+        except Exception:
+            return 0
+        return self._queue_depth(eio_sid) if eio_sid else 0
+
+    def _queue_depth(self, eio_sid: Optional[str]) -> int:
+        """Packets waiting in a local client's Engine.IO send queue (0 when unknown)"""
+        try:
+            return self.socketio.server.eio.sockets[eio_sid].queue.qsize()
+        except (AttributeError, KeyError, NotImplementedError):
+            return 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self.stats, pending={c: len(q) for c, q in self._pending.items()},
+                        clients_behind=len(self._missed), window_seconds=self.window)
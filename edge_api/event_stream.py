@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Streaming Query Helpers for Detection and Event Endpoints
+Shared SQL for the list endpoints plus NDJSON generators for their streaming mode
+
+In streaming mode (Accept: application/x-ndjson or ?stream=1) rows are pulled one at a
+time from the SQLite cursor and written out as one JSON object per line, so memory use and
+time-to-first-byte no longer grow with the requested limit.
+
+The persistence service also stores each consolidated event's serialized API record
+(api_json). Responses splice those strings into the events array as they are; rows stored
+before the column existed, and requests that project fields, are parsed and re-encoded.
+"""
+
+import json
+import logging
+import sqlite3
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import serialization
+
+logger = logging.getLogger(__name__)
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+# Rows written per yielded chunk: keeps per-chunk overhead low without buffering the result
+NDJSON_LINES_PER_CHUNK = 64
+
+DETECTIONS_SQL = """
+    SELECT
+        td.id,
+        td.timestamp,
+        cd.vehicle_count,
+        cd.detection_confidence AS confidence_score,
+        rd.speed_mph,
+        rd.speed_mps,
+        rd.alert_level
+    FROM traffic_detections td
+    LEFT JOIN radar_detections rd ON td.id = rd.detection_id
+    LEFT JOIN camera_detections cd ON td.id = cd.detection_id
+    WHERE td.timestamp >= ?
+    ORDER BY td.timestamp DESC
+    LIMIT ?
+"""
+
+
+def wants_ndjson(request) -> bool:
+    """True when the client asked for a streamed NDJSON response"""
+    if request.args.get('stream', '').lower() in ('1', 'true', 'yes'):
+        return True
+    return request.accept_mimetypes.best_match(['application/json', NDJSON_MIMETYPE]) == NDJSON_MIMETYPE
+
+
+def has_api_json(conn: sqlite3.Connection) -> bool:
+    """True when consolidated_events has the pre-serialized api_json column"""
+    return any(row[1] == 'api_json' for row in conn.execute("PRAGMA table_info(consolidated_events)"))
+
+
+def consolidated_events_query(limit: int, since: Optional[str] = None,
+                              after_seq: Optional[int] = None,
+                              api_json: bool = False) -> Tuple[str, List[Any]]:
+    """SQL and parameters for /vehicles/consolidated
+
+    With after_seq, events stored after that sequence in ascending order; otherwise the
+    newest events (optionally created at or after `since`), newest first. With api_json,
+    rows also carry the stored API record, and event_json only where that is missing.
+    """
+    columns = "consolidation_id, event_json, created_at"
+    if api_json:
+        columns = ("consolidation_id, CASE WHEN api_json IS NULL THEN event_json END AS event_json, "
+                   "created_at, api_json")
+
+    if after_seq is not None:
+        return (f"""
+            SELECT {columns}, event_seq
+            FROM consolidated_events
+            WHERE event_seq > ?
+            ORDER BY event_seq
+            LIMIT ?
+        """, [after_seq, limit])
+
+    query = f"""
+        SELECT {columns}
+        FROM consolidated_events
+    """
+    params: List[Any] = []
+    if since:
+        query += "WHERE created_at >= ? "
+        params.append(since)
+    query += "ORDER BY created_at DESC LIMIT ?"
+    params.append(limit)
+    return query, params
+
+
+def consolidated_event_record(row) -> Optional[Dict[str, Any]]:
+    """API record for a consolidated_events row, or None when its JSON is invalid"""
+    try:
+        event_data = serialization.loads(row['event_json'])
+    except json.JSONDecodeError as e:
+        logger.warning(f"Invalid JSON in consolidated event {row['consolidation_id']}: {e}")
+        return None
+
+    return {
+        "consolidation_id": row['consolidation_id'],
+        "created_at": row['created_at'],
+        **event_data  # Merge the JSON data
+    }
+
+
+def consolidated_event_json(row, api_json: bool = False) -> Optional[str]:
+    """Serialized API record for a row: the stored api_json when present, else re-encoded"""
+    if api_json and row['api_json'] is not None:
+        return row['api_json']
+    record = consolidated_event_record(row)
+    return serialization.dumps(record) if record is not None else None
+
+
+def project_record(record: Dict[str, Any], fields: Iterable[str]) -> Dict[str, Any]:
+    """The requested top-level fields of a record, in the requested order"""
+    return {field: record[field] for field in fields if field in record}
+
+
+def json_object_with_array(key: str, items: Iterable[str], members: Dict[str, Any]) -> bytes:
+    """JSON object whose first member `key` is an array of already-serialized items
+
+    Byte-for-byte what serialization.dumpb gives for the same object with the items decoded.
+    """
+    rest = serialization.dumps(members)
+    head = '{' + serialization.dumps(key) + ':[' + ','.join(items) + ']'
+    return (head + (',' + rest[1:] if members else '}')).encode('utf-8')
+
+
+def detection_record(row) -> Dict[str, Any]:
+    """API record for a row of DETECTIONS_SQL"""
+    return {
+        "id": row["id"],
+        "timestamp": row["timestamp"],
+        "vehicle_count": row["vehicle_count"] or 1,
+        "confidence_score": row["confidence_score"],
+        "speed_mph": row["speed_mph"],
+        "speed_mps": row["speed_mps"],
+        "alert_level": row["alert_level"]
+    }
+
+
+def iter_consolidated_events(conn: sqlite3.Connection, limit: int, since: Optional[str] = None,
+                             after_seq: Optional[int] = None,
+                             serialized: bool = False) -> Iterator[Any]:
+    """Yield consolidated event records straight from the cursor
+
+    With serialized, yields each record's JSON text instead (stored api_json passes
+    through unparsed). The query runs before the first record is requested, so SQL errors
+    surface to the caller rather than part-way through a streamed response.
+    """
+    api_json = serialized and has_api_json(conn)
+    cursor = conn.execute(*consolidated_events_query(limit, since, after_seq, api_json))
+
+    def records():
+        try:
+            for row in cursor:
+                if serialized:
+                    record = consolidated_event_json(row, api_json)
+                else:
+                    record = consolidated_event_record(row)
+                if record is not None:
+                    yield record
+        finally:
+            cursor.close()
+
+    return records()
+
+
+def iter_vehicle_detections(conn: sqlite3.Connection, since_ts: float, limit: int) -> Iterator[Dict[str, Any]]:
+    """Yield detection records straight from the cursor (query runs eagerly, as above)"""
+    cursor = conn.execute(DETECTIONS_SQL, (since_ts, limit))
+
+    def records():
+        try:
+            for row in cursor:
+                yield detection_record(row)
+        finally:
+            cursor.close()
+
+    return records()
+
+
+def ndjson_stream(records: Iterable[Any],
+                  lines_per_chunk: int = NDJSON_LINES_PER_CHUNK) -> Iterator[bytes]:
+    """Encode records as newline-delimited JSON, a few lines per yielded chunk
+
+    Strings are taken as records that are already serialized and written as they are.
+    """
+    lines = []
+    for record in records:
+        lines.append(record if isinstance(record, str) else serialization.dumps(record))
+        if len(lines) >= lines_per_chunk:
+            yield ('\n'.join(lines) + '\n').encode('utf-8')
+            lines = []
+    if lines:
+        yield ('\n'.join(lines) + '\n').encode('utf-8')
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Camera Image Responses
+Cache-friendly, zero-copy responses for images on the shared camera volume
+
+Every response carries a strong ETag built from the file's inode, modification time and
+size, plus Last-Modified, so a dashboard refresh of an unchanged image is answered with
+304 and no body. Range requests get 206 partial content. The body itself is handed to the
+WSGI server's file wrapper (sendfile where the server supports it) rather than read into
+Python.
+
+When a front proxy is configured (IMAGE_ACCEL_REDIRECT_PREFIX), the gateway only answers
+with an X-Accel-Redirect header naming the file under the proxy's internal location, and
+nginx streams the file itself, handling conditional and range requests natively.
+
+Environment:
+    IMAGE_ACCEL_REDIRECT_PREFIX  internal nginx location, e.g. /_protected/camera_capture/
+    IMAGE_ACCEL_ROOT             directory that location aliases (default /app/camera_capture)
+"""
+
+import mimetypes
+import os
+from typing import Optional
+
+from flask import Response, request, send_file
+
+DEFAULT_ACCEL_ROOT = '/app/camera_capture'
+
+
+def file_etag(st: os.stat_result) -> str:
+    """Strong validator for a file version: inode, nanosecond mtime and size"""
+    return f"{st.st_ino:x}-{st.st_mtime_ns:x}-{st.st_size:x}"
+
+
+def _accel_redirect_path(path: str) -> Optional[str]:
+    prefix = os.environ.get('IMAGE_ACCEL_REDIRECT_PREFIX')
+    if not prefix:
+        return None
+
+    root = os.path.realpath(os.environ.get('IMAGE_ACCEL_ROOT', DEFAULT_ACCEL_ROOT))
+    real_path = os.path.realpath(path)
+    if os.path.commonpath([root, real_path]) != root:
+        # Outside the directory the proxy can see; serve it directly
+        return None
+    return prefix.rstrip('/') + '/' + os.path.relpath(real_path, root).replace(os.sep, '/')
+
+
+def image_response(path: str, mimetype: Optional[str] = None, max_age: Optional[int] = None,
+                   st: Optional[os.stat_result] = None) -> Response:
+    """Conditional, range-capable response for an image file
+
+    Args:
+        path: Image file path
+        mimetype: Content type, guessed from the extension when omitted
+        max_age: Cache-Control max-age in seconds; None or 0 means clients revalidate
+            every time (no-cache), which still costs only a 304 when unchanged
+        st: os.stat() result when the caller already has one
+    """
+    st = st or os.stat(path)
+    mimetype = mimetype or mimetypes.guess_type(path)[0] or 'application/octet-stream'
+
+    accel_path = _accel_redirect_path(path)
+    if accel_path:
+        response = Response(mimetype=mimetype)
+        response.headers['X-Accel-Redirect'] = accel_path
+        if max_age:
+            response.cache_control.public = True
+            response.cache_control.max_age = max_age
+        else:
+            response.cache_control.no_cache = True
+        return response
+
+    return send_file(
+        path,
+        mimetype=mimetype,
+        conditional=True,
+        etag=file_etag(st),
+        last_modified=st.st_mtime,
+        max_age=max_age
+    )
+
+
+def preview_response(data: bytes, etag: str, st: os.stat_result,
+                     max_age: Optional[int] = None) -> Response:
+    """Conditional response for an in-memory rendering (e.g. a thumbnail) of an image file"""
+    response = Response(data, mimetype='image/jpeg')
+    response.set_etag(etag)
+    response.last_modified = st.st_mtime
+    if max_age:
+        response.cache_control.public = True
+        response.cache_control.max_age = max_age
+    else:
+        response.cache_control.no_cache = True
+    return response.make_conditional(request)
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Camera Image Thumbnails
+Downscaled previews of camera captures, decoded at reduced scale and cached
+
+The dashboard shows captures as small previews, but the IMX500 writes full-resolution
+JPEGs. Rather than decoding a full frame and shrinking it, the JPEG decoder is asked for
+a 1/2, 1/4 or 1/8 scale image directly (OpenCV IMREAD_REDUCED_*, or Pillow's draft mode),
+which skips most of the inverse DCT work, and only the small remainder is resized.
+
+Rendered previews are kept in a size-bounded in-memory LRU and a size-bounded LRU
+directory on disk, keyed by the source file's version (inode, mtime, size) and the
+requested width, so a replaced image never serves a stale preview and nothing needs
+explicit invalidation.
+
+Environment:
+    THUMBNAIL_CACHE_DIR        disk cache directory (default /tmp/thumbnail_cache)
+    THUMBNAIL_CACHE_MAX_BYTES  disk cache limit (default 64 MiB)
+"""
+
+import importlib.util
+import io
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from local_cache import BoundedTTLCache
+from image_serving import file_etag
+
+# OpenCV (~100 ms and ~45 MB to import) and Pillow are only imported by the first render,
+# so importing the gateway does not load them
+CV2_AVAILABLE = importlib.util.find_spec('cv2') is not None
+PIL_AVAILABLE = importlib.util.find_spec('PIL') is not None
+
+logger = logging.getLogger(__name__)
+
+# Named sizes accepted by the image endpoints (?size=thumbnail)
+THUMBNAIL_SIZES = {'thumbnail': 300, 'preview': 800}
+MIN_WIDTH, MAX_WIDTH = 16, 1920
+JPEG_QUALITY = 80
+REDUCED_SCALES = (8, 4, 2)
+
+DEFAULT_CACHE_DIR = '/tmp/thumbnail_cache'
+DEFAULT_DISK_BYTES = 64 * 1024 * 1024
+DEFAULT_MEMORY_ENTRIES = 256
+DEFAULT_MEMORY_BYTES = 16 * 1024 * 1024
+# Keys embed the source version, so cached previews never go stale
+MEMORY_TTL = 24 * 3600
+
+# Start-of-frame markers carrying the image dimensions (baseline, progressive, ...)
+_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+def thumbnail_width(size: Optional[str] = None, width: Optional[str] = None) -> Optional[int]:
+    """Requested preview width from ?size= or ?width=; None means the full image
+
+    Raises:
+        ValueError: For an unknown size name or a width that is not a number
+    """
+    if width:
+        return max(MIN_WIDTH, min(MAX_WIDTH, int(width)))
+    if not size or size == 'full':
+        return None
+    if size not in THUMBNAIL_SIZES:
+        raise ValueError(f"Unknown image size '{size}'")
+    return THUMBNAIL_SIZES[size]
+
+
+def jpeg_dimensions(path: str) -> Optional[Tuple[int, int]]:
+    """(width, height) from the JPEG frame header, without decoding the image"""
+    with open(path, 'rb') as f:
+        if f.read(2) != b'\xff\xd8':
+            return None
+        while True:
+            marker = f.read(2)
+            if len(marker) < 2 or marker[0] != 0xFF:
+                return None
+            while marker[1] == 0xFF:  # fill bytes
+                marker = marker[1:] + f.read(1)
+            length_bytes = f.read(2)
+            if len(length_bytes) < 2:
+                return None
+            length = int.from_bytes(length_bytes, 'big')
+            if marker[1] in _SOF_MARKERS:
+                header = f.read(5)
+                if len(header) < 5:
+                    return None
+                return int.from_bytes(header[3:5], 'big'), int.from_bytes(header[1:3], 'big')
+            f.seek(length - 2, os.SEEK_CUR)
+
+
+def reduction_factor(source_width: int, target_width: int) -> int:
+    """Largest JPEG decode scale that still yields at least target_width pixels"""
+    for factor in REDUCED_SCALES:
+        if source_width // factor >= target_width:
+            return factor
+    return 1
+
+
+def render_thumbnail(path: str, width: int, quality: int = JPEG_QUALITY) -> bytes:
+    """JPEG bytes of the image scaled to `width` pixels wide (never upscaled)
+
+    Raises:
+        RuntimeError: When neither OpenCV nor Pillow is installed
+        ValueError: When the file cannot be decoded
+    """
+    if CV2_AVAILABLE:
+        import cv2
+        dimensions = jpeg_dimensions(path)
+        factor = reduction_factor(dimensions[0], width) if dimensions else 1
+        flags = {1: cv2.IMREAD_COLOR, 2: cv2.IMREAD_REDUCED_COLOR_2,
+                 4: cv2.IMREAD_REDUCED_COLOR_4, 8: cv2.IMREAD_REDUCED_COLOR_8}
+        image = cv2.imread(path, flags[factor])
+        if image is None:
+            raise ValueError(f"Could not decode image {path}")
+        height, current_width = image.shape[:2]
+        if current_width > width:
+            image = cv2.resize(image, (width, max(1, round(height * width / current_width))),
+                               interpolation=cv2.INTER_AREA)
+        ok, encoded = cv2.imencode('.jpg', image, [cv2.IMWRITE_JPEG_QUALITY, quality])
+        if not ok:
+            raise ValueError(f"Could not encode thumbnail for {path}")
+        return encoded.tobytes()
+
+    if PIL_AVAILABLE:
+        from PIL import Image
+        with Image.open(path) as image:
+            target = (width, max(1, round(image.height * width / image.width)))
+            image.draft('RGB', target)  # JPEG decoder picks the smallest scale >= target
+            image = image.convert('RGB')
+            if image.width > width:
+                image = image.resize(target, Image.LANCZOS)
+            buffer = io.BytesIO()
+            image.save(buffer, 'JPEG', quality=quality)
+            return buffer.getvalue()
+
+    raise RuntimeError("Thumbnails need opencv-python or Pillow")
+
+
+class DiskLRU:
+    """Directory of files bounded by total size, evicting least-recently-used first"""
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_DISK_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Pick up previews from a previous run, oldest access first
+        existing = []
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.is_file() and not entry.name.startswith('.'):
+                    st = entry.stat()
+                    existing.append((st.st_mtime, entry.name, st.st_size))
+        for _, name, size in sorted(existing):
+            self._entries[name] = size
+            self._bytes += size
+        with self._lock:
+            self._evict()
+
+    def get(self, name: str) -> Optional[bytes]:
+        with self._lock:
+            if name not in self._entries:
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(name)
+        try:
+            path = self.directory / name
+            data = path.read_bytes()
+            os.utime(path)  # recency survives a restart
+        except OSError:
+            with self._lock:
+                self._bytes -= self._entries.pop(name, 0)
+                self.stats["misses"] += 1
+            return None
+        with self._lock:
+            self.stats["hits"] += 1
+        return data
+
+    def set(self, name: str, data: bytes):
+        if len(data) > self.max_bytes:
+            return
+        temp_path = self.directory / f".{name}.{threading.get_ident()}.tmp"
+        try:
+            temp_path.write_bytes(data)
+            os.replace(temp_path, self.directory / name)
+        except OSError as e:
+            logger.warning(f"Could not write thumbnail cache file {name}: {e}")
+            temp_path.unlink(missing_ok=True)
+            return
+        with self._lock:
+            self._bytes += len(data) - self._entries.pop(name, 0)
+            self._entries[name] = len(data)
+            self._evict()
+
+    def _evict(self):
+        while self._bytes > self.max_bytes and self._entries:
+            name, size = self._entries.popitem(last=False)
+            self._bytes -= size
+            self.stats["evictions"] += 1
+            try:
+                (self.directory / name).unlink()
+            except OSError:
+                pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self.stats, entries=len(self._entries),
+                        bytes=self._bytes, max_bytes=self.max_bytes)
+
+
+class ThumbnailCache:
+    """Reduced-scale previews of image files, cached in memory and on disk"""
+
+    def __init__(self, cache_dir: Optional[str] = None, max_disk_bytes: Optional[int] = None,
+                 max_memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+                 max_memory_bytes: int = DEFAULT_MEMORY_BYTES,
+                 render: Callable[[str, int], bytes] = render_thumbnail):
+        self.memory = BoundedTTLCache(max_memory_entries, max_memory_bytes)
+        self.disk = DiskLRU(
+            cache_dir or os.environ.get('THUMBNAIL_CACHE_DIR', DEFAULT_CACHE_DIR),
+            max_disk_bytes or int(os.environ.get('THUMBNAIL_CACHE_MAX_BYTES', DEFAULT_DISK_BYTES))
+        )
+        self.render = render
+        self.renders = 0
+
+    def get(self, path: str, width: int, st: Optional[os.stat_result] = None) -> Tuple[bytes, str]:
+        """(JPEG bytes, ETag) of the preview of `path` at `width` pixels"""
+        st = st or os.stat(path)
+        etag = f"{file_etag(st)}-w{width}"
+        name = f"{etag}.jpg"
+
+        data = self.memory.get(name)
+        if data is None:
+            data = self.disk.get(name)
+            if data is None:
+                data = self.render(path, width)
+                self.renders += 1
+                self.disk.set(name, data)
+            self.memory.set(name, data, MEMORY_TTL)
+        return data, etag
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "renders": self.renders,
+            "memory": self.memory.get_stats(),
+            "disk": self.disk.get_stats()
+        }
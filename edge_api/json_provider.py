@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Flask JSON Provider
+Routes jsonify(), request.get_json() and Flask-RESTX responses through the shared
+serialization module (orjson when installed), so the API encodes the same way as the
+services that write the data.
+
+Keys keep their insertion order rather than being sorted, and datetimes are ISO 8601
+instead of Flask's HTTP-date format. Debug mode keeps Flask's indented output.
+"""
+
+from flask import current_app, make_response
+from flask.json.provider import DefaultJSONProvider
+
+import serialization
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by serialization.dumps/loads"""
+
+    default = staticmethod(serialization.default)
+    sort_keys = False
+
+    def dumps(self, obj, **kwargs) -> str:
+        # Indented (debug) or sorted output is rare; leave it to the json module
+        if kwargs.get('indent') is not None or kwargs.get('sort_keys', self.sort_keys):
+            return super().dumps(obj, **kwargs)
+        return serialization.dumps(obj)
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return serialization.loads(s)
+
+
+def output_json(data, code, headers=None):
+    """Flask-RESTX representation for application/json"""
+    if current_app.debug:
+        body = current_app.json.dumps(data, indent=4) + "\n"
+    else:
+        body = serialization.dumpb(data) + b"\n"
+    response = make_response(body, code)
+    response.headers.extend(headers or {})
+    return response
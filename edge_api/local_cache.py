@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Bounded In-Process Cache for Data Access
+LRU cache with per-entry expiry and limits on entry count and approximate memory
+
+Entries are evicted least-recently-used first whenever either limit is exceeded, and
+expired entries are dropped on access or by purge_expired(), so a long-running gateway
+holds at most max_entries values and roughly max_bytes of them however many distinct
+keys its callers produce. Hit, miss and eviction counters are kept for monitoring.
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+def approximate_size(value: Any) -> int:
+    """Approximate memory held by a value built from dicts, lists, tuples and scalars"""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(approximate_size(k) + approximate_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set)):
+        size += sum(approximate_size(item) for item in value)
+    return size
+
+
+class BoundedTTLCache:
+    """Thread-safe LRU cache with per-entry TTL, an entry cap and an approximate byte cap"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # key -> (value, expires_at, approximate size)
+        self._entries: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0}
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached value, or None when missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            if time.monotonic() >= entry[1]:
+                self._remove(key)
+                self.stats["expired"] += 1
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry[0]
+
+    def set(self, key: str, value: Any, ttl_seconds: float):
+        """Store a value for ttl_seconds, evicting least recently used entries over the limits"""
+        size = approximate_size(value)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                # Would evict everything else and still not fit
+                self.stats["evictions"] += 1
+                return
+            self._entries[key] = (value, time.monotonic() + ttl_seconds, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.stats["evictions"] += 1
+
+    def purge_expired(self) -> int:
+        """Drop every expired entry, returning how many were removed"""
+        now = time.monotonic()
+        with self._lock:
+            expired = [key for key, entry in self._entries.items() if now >= entry[1]]
+            for key in expired:
+                self._remove(key)
+            self.stats["expired"] += len(expired)
+            return len(expired)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: str):
+        self._bytes -= self._entries.pop(key)[2]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.stats["hits"] + self.stats["misses"]
+            return {
+                **self.stats,
+                "hit_rate": round(self.stats["hits"] / lookups, 3) if lookups else 0.0,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "approx_bytes": self._bytes,
+                "max_bytes": self.max_bytes
+            }
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Real-Time Log Streaming
+Buffered, rate-limited forwarding of log records to WebSocket clients
+
+The handler sits on the root logger, so it sees every record the gateway writes,
+including per-request logs. Streaming each one as it happens turned busy periods into a
+WebSocket storm, so emit() only checks a per-level rate limit and appends the record to
+an in-memory queue; it never blocks the logging thread on I/O. A background task flushes
+the queue on a timer, collapses repeated messages into one entry with a count, and
+publishes the batch to the `logs` channel of event_delivery. Records over the rate limit
+are dropped and reported as a single summary entry per level.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+DEFAULT_FLUSH_INTERVAL = 0.5
+DEFAULT_MAX_QUEUE = 5000
+# Records per second streamed for each level; anything above is summarized
+DEFAULT_RATE_LIMITS = {'DEBUG': 5, 'INFO': 20, 'WARNING': 50, 'ERROR': 100, 'CRITICAL': 100}
+
+
+class SocketIOLogHandler(logging.Handler):
+    """Streams log records to clients subscribed to the logs channel, in rate-limited batches"""
+
+    def __init__(self, event_delivery, flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+                 rate_limits: Optional[Dict[str, int]] = None, max_queue: int = DEFAULT_MAX_QUEUE):
+        super().__init__()
+        self.event_delivery = event_delivery
+        self.flush_interval = flush_interval
+        self.rate_limits = dict(DEFAULT_RATE_LIMITS, **(rate_limits or {}))
+
+        self._queue: deque = deque(maxlen=max_queue)
+        # level -> [window start (whole second), records admitted in that second]
+        self._windows: Dict[str, list] = {}
+        self._suppressed: Dict[str, int] = {}
+        self._rate_lock = threading.Lock()
+        self._running = False
+        self.stats = {"received": 0, "streamed": 0, "aggregated": 0, "suppressed": 0, "batches": 0}
+
+    def start(self):
+        """Flush on a timer in a Socket.IO background task"""
+        if not self._running:
+            self._running = True
+            self.event_delivery.socketio.start_background_task(self._run)
+
+    def _run(self):
+        while self._running:
+            self.event_delivery.socketio.sleep(self.flush_interval)
+            self.flush()
+
+    def close(self):
+        self._running = False
+        self.flush()
+        super().close()
+
+    def _admit(self, level: str) -> bool:
+        second = int(time.monotonic())
+        with self._rate_lock:
+            self.stats["received"] += 1
+            window = self._windows.get(level)
+            if window is None or window[0] != second:
+                window = self._windows[level] = [second, 0]
+            if window[1] < self.rate_limits.get(level, self.rate_limits['INFO']):
+                window[1] += 1
+                return True
+            self._suppressed[level] = self._suppressed.get(level, 0) + 1
+            self.stats["suppressed"] += 1
+            return False
+
+    def emit(self, record):
+        try:
+            if not self._admit(record.levelname):
+                return
+            self._queue.append((
+                record.created, record.levelname, getattr(record, 'name', record.module),
+                record.getMessage(), record.module, record.lineno,
+                getattr(record, 'correlation_id', None), getattr(record, 'business_event', None)
+            ))
+        except Exception:
+            # Silently ignore errors to prevent logging loops
+            pass
+
+    def flush(self):
+        """Publish queued records, collapsing repeats of the same message"""
+        try:
+            entries: Dict[Any, Dict[str, Any]] = {}
+            while True:
+                try:
+                    created, level, service, message, module, line, correlation_id, business_event = self._queue.popleft()
+                except IndexError:
+                    break
+                key = (level, service, message)
+                entry = entries.get(key)
+                if entry is None:
+                    entry = entries[key] = {
+                        'timestamp': datetime.fromtimestamp(created, tz=timezone.utc).isoformat(),
+                        'level': level,
+                        'service': service,
+                        'message': message,
+                        'module': module,
+                        'line': line,
+                        'count': 1
+                    }
+                    if correlation_id is not None:
+                        entry['correlation_id'] = correlation_id
+                    if business_event is not None:
+                        entry['business_event'] = business_event
+                else:
+                    entry['count'] += 1
+                    entry['last_timestamp'] = datetime.fromtimestamp(created, tz=timezone.utc).isoformat()
+                    self.stats["aggregated"] += 1
+
+            with self._rate_lock:
+                suppressed, self._suppressed = self._suppressed, {}
+
+            now = datetime.now(timezone.utc).isoformat()
+            for level, count in suppressed.items():
+                entries[('suppressed', level)] = {
+                    'timestamp': now,
+                    'level': 'WARNING',
+                    'service': 'log_streaming',
+                    'message': f"{count} {level} log records not streamed (over {self.rate_limits.get(level)}/s)",
+                    'count': count,
+                    'business_event': 'log_stream_rate_limited'
+                }
+
+            for entry in entries.values():
+                self.event_delivery.publish('logs', entry)
+            if entries:
+                self.stats["streamed"] += len(entries)
+                self.stats["batches"] += 1
+        except Exception:
+            pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._rate_lock:
+            return dict(self.stats, queued=len(self._queue), rate_limits=self.rate_limits)
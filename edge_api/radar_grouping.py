@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Radar Ping Grouping
+Groups raw radar stream entries into vehicle detections
+
+Entries are sorted by time and a new group starts wherever the gap to the previous ping
+exceeds the detection window or the (absolute) speed jumps by more than the configured
+threshold, since either means a different vehicle. Groups with fewer than the minimum
+number of pings are dropped as noise.
+
+group_radar_pings does this with NumPy: group boundaries come from vectorized diffs and
+per-group statistics from ufunc.reduceat, so the cost per request is a handful of array
+passes rather than a Python loop over every ping. group_radar_pings_reference is the
+plain Python version; it defines the expected results and is used when NumPy is missing.
+"""
+
+import logging
+from datetime import datetime
+from operator import itemgetter
+from typing import Any, Dict, List
+
+# NumPy is optional for the lightweight API image
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Speed variance (mph^2) at which confidence is halved
+CONFIDENCE_VARIANCE_SCALE = 25.0
+
+
+def _detection(first_ms: int, last_ms: int, count: int, avg: float, variance: float,
+               min_speed: float, max_speed: float, window_seconds: int) -> Dict[str, Any]:
+    # Confidence grows with ping count and drops for erratic speeds
+    confidence = min(0.95, 0.5 + (count / 20))
+    confidence *= max(0.5, 1.0 - (variance / CONFIDENCE_VARIANCE_SCALE))
+
+    return {
+        'id': f"radar_detection_{first_ms}",
+        'timestamp': datetime.fromtimestamp(first_ms / 1000),
+        'confidence': round(confidence, 3),
+        'ping_count': count,
+        'average_speed': round(avg, 2),
+        'speed_variance': round(variance, 3),
+        'min_speed': round(min_speed, 2),
+        'max_speed': round(max_speed, 2),
+        'duration_seconds': round((last_ms - first_ms) / 1000, 3),
+        'source': 'radar_grouping',
+        'window_seconds': window_seconds
+    }
+
+
+def group_radar_pings_reference(radar_data: List[Dict[str, Any]], window_seconds: int,
+                                min_pings: int, speed_jump_mph: float) -> List[Dict[str, Any]]:
+    """Group radar pings into vehicle detections, one ping at a time"""
+    pings = sorted(radar_data, key=lambda entry: entry['timestamp_ms'])
+    gap_ms = window_seconds * 1000
+
+    groups: List[List[Dict[str, Any]]] = []
+    for entry in pings:
+        if groups:
+            previous = groups[-1][-1]
+            if (entry['timestamp_ms'] - previous['timestamp_ms'] <= gap_ms and
+                    abs(abs(entry['speed']) - abs(previous['speed'])) <= speed_jump_mph):
+                groups[-1].append(entry)
+                continue
+        groups.append([entry])
+
+    detections = []
+    for group in groups:
+        if len(group) < min_pings:
+            continue
+        speeds = [abs(entry['speed']) for entry in group]
+        avg = sum(speeds) / len(speeds)
+        variance = sum((s - avg) ** 2 for s in speeds) / len(speeds)
+        detections.append(_detection(group[0]['timestamp_ms'], group[-1]['timestamp_ms'], len(group),
+                                     avg, variance, min(speeds), max(speeds), window_seconds))
+    return detections
+
+
+def group_radar_pings(radar_data: List[Dict[str, Any]], window_seconds: int,
+                      min_pings: int, speed_jump_mph: float) -> List[Dict[str, Any]]:
+    """Group radar pings into vehicle detections with vectorized diffs and reduceat"""
+    if not NUMPY_AVAILABLE:
+        return group_radar_pings_reference(radar_data, window_seconds, min_pings, speed_jump_mph)
+    if not radar_data:
+        return []
+
+    timestamps = np.array(list(map(itemgetter('timestamp_ms'), radar_data)), dtype=np.int64)
+    speeds = np.abs(np.array(list(map(itemgetter('speed'), radar_data)), dtype=np.float64))
+    order = np.argsort(timestamps, kind='stable')
+    timestamps, speeds = timestamps[order], speeds[order]
+
+    # A group starts at the first ping and wherever the time gap or speed jump is too large
+    breaks = (np.diff(timestamps) > window_seconds * 1000) | (np.abs(np.diff(speeds)) > speed_jump_mph)
+    starts = np.concatenate(([0], np.flatnonzero(breaks) + 1))
+    counts = np.diff(np.append(starts, len(timestamps)))
+
+    keep = counts >= min_pings
+    if not keep.any():
+        return []
+
+    sums = np.add.reduceat(speeds, starts)
+    means = sums / counts
+    deviations = (speeds - np.repeat(means, counts)) ** 2
+    variances = np.add.reduceat(deviations, starts) / counts
+    minimums = np.minimum.reduceat(speeds, starts)
+    maximums = np.maximum.reduceat(speeds, starts)
+    firsts = timestamps[starts]
+    lasts = timestamps[starts + counts - 1]
+
+    # Plain Python scalars for the per-detection dicts
+    columns = (firsts, lasts, counts, means, variances, minimums, maximums)
+    return [
+        _detection(*values, window_seconds)
+        for values in zip(*(column[keep].tolist() for column in columns))
+    ]
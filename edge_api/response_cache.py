@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Conditional GET Support for Polled API Endpoints
+ETags derived from the newest stored event plus the request parameters
+
+DataVersionTracker turns the newest consolidated event and detection rowids into a version
+token. It only queries SQLite when the database or WAL file has changed on disk (or after
+max_age_seconds), so a poll that gets answered with 304 normally touches no database at all.
+ResponseCache keeps a small LRU of rendered bodies keyed by ETag, so a client without the
+current ETag still skips the query and JSON rendering when nothing has changed.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from sqlite_pool import get_sqlite_pool
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 64
+DEFAULT_VERSION_MAX_AGE = 5.0
+
+_VERSION_SQL = """
+    SELECT
+        (SELECT MAX(rowid) FROM consolidated_events),
+        (SELECT MAX(id) FROM traffic_detections)
+"""
+
+
+class DataVersionTracker:
+    """Version token for the traffic database, refreshed only when its files change"""
+
+    def __init__(self, db_path: str, max_age_seconds: float = DEFAULT_VERSION_MAX_AGE):
+        self.db_path = db_path
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        self._signature: Optional[Tuple] = None
+        self._version: Optional[str] = None
+        self._checked_at = 0.0
+
+    def _file_signature(self) -> Optional[Tuple]:
+        signature = []
+        for path in (self.db_path, self.db_path + '-wal'):
+            try:
+                st = os.stat(path)
+                signature.append((st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                if path == self.db_path:
+                    return None
+                signature.append(None)
+        return tuple(signature)
+
+    def current(self) -> Optional[str]:
+        """Current version token, or None when the database is unavailable"""
+        signature = self._file_signature()
+        if signature is None:
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            if signature == self._signature and now - self._checked_at < self.max_age_seconds:
+                return self._version
+
+            try:
+                with get_sqlite_pool(self.db_path).connection() as conn:
+                    latest_event, latest_detection = conn.execute(_VERSION_SQL).fetchone()
+                version = f"{latest_event or 0}.{latest_detection or 0}"
+            except sqlite3.Error as e:
+                logger.debug(f"Could not read data version from {self.db_path}: {e}")
+                return None
+
+            self._signature = signature
+            self._version = version
+            self._checked_at = now
+            return version
+
+
+class ResponseCache:
+    """Thread-safe LRU of rendered response bodies keyed by ETag"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "not_modified": 0}
+
+    @staticmethod
+    def make_etag(endpoint: str, params: Dict[str, Any], version: str,
+                  window_seconds: Optional[int] = None) -> str:
+        """ETag for an endpoint response at a data version
+
+        Endpoints reporting a window relative to now (e.g. the last 24 hours) pass
+        window_seconds so the tag also rolls over as time moves, even with no new data.
+        """
+        key = json.dumps([endpoint, params, version], sort_keys=True, default=str)
+        if window_seconds:
+            key += f"|{int(time.time() // window_seconds)}"
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+    def get(self, etag: str) -> Optional[bytes]:
+        with self._lock:
+            body = self._entries.get(etag)
+            if body is None:
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(etag)
+            self.stats["hits"] += 1
+            return body
+
+    def put(self, etag: str, body: bytes):
+        with self._lock:
+            self._entries[etag] = body
+            self._entries.move_to_end(etag)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def record_not_modified(self):
+        with self._lock:
+            self.stats["not_modified"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self.stats, "entries": len(self._entries)}
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+HTTP Response Compression
+Content-negotiated gzip/brotli encoding of text and JSON responses
+
+Consolidated events, analytics and report payloads are highly repetitive JSON, HTML and
+CSV, and remote dashboards reach the Pi over Tailscale or cellular backhaul where the
+link, not the CPU, is the bottleneck. compress_response() picks the best encoding the
+client accepts (brotli when the optional `brotli` package is installed, otherwise gzip)
+and compresses bodies above a minimum size at a level chosen for the Pi's CPU. Streamed
+exports are compressed chunk by chunk with a sync flush, so they keep streaming.
+
+Images, video, archives and Parquet/Arrow exports are already compressed and are left
+alone, as are file responses served from disk or offloaded to a proxy, Server-Sent Events
+and anything that already carries a Content-Encoding. Compressed bodies of responses with
+an ETag are kept in a small LRU, so repeated polls of an unchanged resource are not
+compressed again; their ETag is made weak, as the bytes differ per encoding.
+
+Environment:
+    COMPRESSION_MIN_SIZE       smallest body compressed, in bytes (default 1024)
+    COMPRESSION_LEVEL          gzip level 1-9 (default 5)
+    COMPRESSION_BROTLI_QUALITY brotli quality 0-11 (default 4)
+"""
+
+import gzip
+import os
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+DEFAULT_MIN_SIZE = 1024
+# Levels past these cost the Pi's CPU far more than they save on the wire
+DEFAULT_GZIP_LEVEL = 5
+DEFAULT_BROTLI_QUALITY = 4
+DEFAULT_CACHE_ENTRIES = 32
+
+COMPRESSIBLE_TYPES = frozenset({
+    'application/json', 'application/x-ndjson', 'application/javascript',
+    'application/xml', 'application/problem+json', 'image/svg+xml'
+})
+# Text types that must reach the client unbuffered
+UNCOMPRESSED_TEXT_TYPES = frozenset({'text/event-stream'})
+
+
+def supported_encodings() -> List[str]:
+    """Encodings this gateway can produce, in order of preference"""
+    return ['br', 'gzip'] if BROTLI_AVAILABLE else ['gzip']
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Preferred supported encoding for an Accept-Encoding header, or None for identity
+
+    Honours q-values (q=0 refuses an encoding) and the '*' wildcard; between encodings
+    with the same q-value the server's preference (brotli, then gzip) wins.
+    """
+    if not accept_encoding:
+        return None
+
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(','):
+        coding, _, params = item.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[coding] = q
+
+    best, best_q = None, 0.0
+    for coding in supported_encodings():
+        q = weights.get(coding, weights.get('*', 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def is_compressible(mimetype: Optional[str]) -> bool:
+    if not mimetype:
+        return False
+    if mimetype.startswith('text/'):
+        return mimetype not in UNCOMPRESSED_TEXT_TYPES
+    return mimetype in COMPRESSIBLE_TYPES
+
+
+class ResponseCompressor:
+    """Compresses eligible Flask responses in an after_request hook"""
+
+    def __init__(self, min_size: Optional[int] = None, level: Optional[int] = None,
+                 brotli_quality: Optional[int] = None, cache_entries: int = DEFAULT_CACHE_ENTRIES):
+        self.min_size = min_size if min_size is not None else int(
+            os.environ.get('COMPRESSION_MIN_SIZE', DEFAULT_MIN_SIZE))
+        self.level = level if level is not None else int(
+            os.environ.get('COMPRESSION_LEVEL', DEFAULT_GZIP_LEVEL))
+        self.brotli_quality = brotli_quality if brotli_quality is not None else int(
+            os.environ.get('COMPRESSION_BROTLI_QUALITY', DEFAULT_BROTLI_QUALITY))
+        self.cache_entries = cache_entries
+
+        # (ETag, encoding) -> compressed body
+        self._cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"compressed": 0, "streamed": 0, "cache_hits": 0, "skipped_small": 0,
+                      "bytes_in": 0, "bytes_out": 0, "cpu_seconds": 0.0}
+
+    def compress(self, data: bytes, encoding: str) -> bytes:
+        if encoding == 'br':
+            return brotli.compress(data, quality=self.brotli_quality)
+        return gzip.compress(data, compresslevel=self.level, mtime=0)
+
+    def compress_response(self, response, accept_encoding: Optional[str]):
+        """Encode `response` in place when it is eligible and the client accepts an encoding"""
+        if (response.status_code < 200 or response.status_code in (204, 206, 304)
+                or response.direct_passthrough
+                or 'Content-Encoding' in response.headers
+                or 'X-Accel-Redirect' in response.headers
+                or not is_compressible(response.mimetype)):
+            return response
+
+        response.vary.add('Accept-Encoding')
+        encoding = negotiate_encoding(accept_encoding)
+        if encoding is None:
+            return response
+
+        if response.is_streamed and 'Content-Length' not in response.headers:
+            response.response = self._stream(response.response, encoding)
+            self._mark_encoded(response, encoding)
+            with self._lock:
+                self.stats["streamed"] += 1
+            return response
+
+        data = response.get_data()
+        if len(data) < self.min_size:
+            with self._lock:
+                self.stats["skipped_small"] += 1
+            return response
+
+        etag, weak = response.get_etag()
+        body = self._cached(etag, encoding) if etag and not weak else None
+        if body is None:
+            started = time.process_time()
+            body = self.compress(data, encoding)
+            elapsed = time.process_time() - started
+            with self._lock:
+                self.stats["compressed"] += 1
+                self.stats["bytes_in"] += len(data)
+                self.stats["bytes_out"] += len(body)
+                self.stats["cpu_seconds"] += elapsed
+                if etag and not weak:
+                    self._cache[(etag, encoding)] = body
+                    while len(self._cache) > self.cache_entries:
+                        self._cache.popitem(last=False)
+
+        response.set_data(body)
+        self._mark_encoded(response, encoding)
+        return response
+
+    def _cached(self, etag: str, encoding: str) -> Optional[bytes]:
+        with self._lock:
+            body = self._cache.get((etag, encoding))
+            if body is not None:
+                self._cache.move_to_end((etag, encoding))
+                self.stats["cache_hits"] += 1
+            return body
+
+    @staticmethod
+    def _mark_encoded(response, encoding: str):
+        response.headers['Content-Encoding'] = encoding
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            # The representation's bytes now depend on the encoding
+            response.set_etag(etag, weak=True)
+
+    def _stream(self, chunks: Iterable[Any], encoding: str) -> Iterator[bytes]:
+        """Compress a streamed body, flushing after every chunk so it keeps streaming"""
+        if encoding == 'br':
+            compressor = brotli.Compressor(quality=self.brotli_quality)
+            process, flush, finish = compressor.process, compressor.flush, compressor.finish
+        else:
+            compressor = zlib.compressobj(self.level, zlib.DEFLATED, 31)
+            process = compressor.compress
+            flush = lambda: compressor.flush(zlib.Z_SYNC_FLUSH)
+            finish = compressor.flush
+
+        bytes_in = bytes_out = 0
+        cpu = 0.0
+        try:
+            for chunk in chunks:
+                if isinstance(chunk, str):
+                    chunk = chunk.encode('utf-8')
+                if not chunk:
+                    continue
+                started = time.process_time()
+                out = process(chunk) + flush()
+                cpu += time.process_time() - started
+                bytes_in += len(chunk)
+                bytes_out += len(out)
+                yield out
+            tail = finish()
+            bytes_out += len(tail)
+            yield tail
+        finally:
+            close = getattr(chunks, 'close', None)
+            if close is not None:
+                close()
+            with self._lock:
+                self.stats["bytes_in"] += bytes_in
+                self.stats["bytes_out"] += bytes_out
+                self.stats["cpu_seconds"] += cpu
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats, cached_bodies=len(self._cache), min_size=self.min_size,
+                         gzip_level=self.level, encodings=supported_encodings())
+        if BROTLI_AVAILABLE:
+            stats["brotli_quality"] = self.brotli_quality
+        if stats["bytes_in"]:
+            stats["ratio"] = round(stats["bytes_out"] / stats["bytes_in"], 3)
+        stats["cpu_seconds"] = round(stats["cpu_seconds"], 3)
+        return stats
@@ -106,8 +106,9 @@ class TrafficDetectionService:
                 'source': detection['source'],
                 'metadata': {
                     'ping_count': detection['ping_count'],
-                    'average_range_meters': detection['average_range'],
-                    'range_variance': detection['range_variance'],
+                    'average_speed_mph': detection['average_speed'],
+                    'speed_variance': detection['speed_variance'],
+                    'duration_seconds': detection['duration_seconds'],
                     'detection_window_seconds': detection['window_seconds']
                 }
             })
@@ -160,45 +161,19 @@ class SpeedAnalysisService:
         start_time = end_time - timedelta(seconds=period_seconds)
         
         try:
-            # Get speed measurements from database
+            # Statistics cover the whole window and are aggregated in SQLite; only the
+            # `limit` most recent measurements are transferred for the speeds list
+            statistics = self._calculate_speed_statistics(start_time, end_time, min_speed, max_speed)
             speed_measurements = self.sqlite_client.get_speed_measurements(
                 start_time=start_time,
                 end_time=end_time,
                 min_speed=min_speed,
                 max_speed=max_speed,
                 limit=limit
-            )
+            ) if statistics['count'] else []
             
             if not speed_measurements:
                 logger.info("No speed measurements found in database")
-                return {
-                    'speeds': [],
-                    'avg_speed': 0,
-                    'max_speed': 0,
-                    'min_speed': 0,
-                    'violations': 0,
-                    'violation_rate': 0,
-                    'total_measurements': 0,
-                    'speed_limit': 25,  # Default speed limit
-                    'time_range': {
-                        'start': start_time.isoformat(),
-                        'end': end_time.isoformat(),
-                        'period_seconds': period_seconds
-                    },
-                    'timestamp': datetime.now().isoformat()
-                }
-            
-            # Calculate statistics
-            speeds = [abs(m['speed_mph']) for m in speed_measurements]  # Use absolute values
-            statistics = {
-                'avg_speed': round(sum(speeds) / len(speeds), 1),
-                'max_speed': max(speeds),
-                'min_speed': min(speeds),
-                'violations': sum(1 for s in speeds if s > 25),  # Speed limit 25 mph
-                'violation_rate': round(sum(1 for s in speeds if s > 25) / len(speeds) * 100, 1),
-                'total_measurements': len(speed_measurements),
-                'speed_limit': 25
-            }
             
             # Format for API response  
             formatted_speeds = []
@@ -210,13 +185,14 @@ class SpeedAnalysisService:
             
             return {
                 'speeds': formatted_speeds,
-                'avg_speed': statistics['avg_speed'],
-                'max_speed': statistics['max_speed'],
-                'min_speed': statistics['min_speed'],
+                'avg_speed': round(statistics['average_mph'], 1),
+                'max_speed': statistics['max_mph'],
+                'min_speed': statistics['min_mph'],
                 'violations': statistics['violations'],
-                'violation_rate': statistics['violation_rate'],
-                'total_measurements': statistics['total_measurements'],
-                'speed_limit': statistics['speed_limit'],
+                'violation_rate': round(statistics['violation_rate'] * 100, 1),
+                'total_measurements': statistics['count'],
+                'speed_limit': statistics['speed_limit_mph'],
+                'statistics': statistics,
                 'time_range': {
                     'start': start_time.isoformat(),
                     'end': end_time.isoformat(),
@@ -229,46 +205,26 @@ class SpeedAnalysisService:
             logger.error(f"Speed analysis failed: {e}")
             raise DataSourceError(f"Speed analysis failed: {e}", source="database")
     
-    def _calculate_speed_statistics(self, speed_measurements: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Calculate speed statistics from measurements"""
-        if not speed_measurements:
+    def _calculate_speed_statistics(self, start_time: datetime, end_time: datetime,
+                                    min_speed: float = None, max_speed: float = None) -> Dict[str, Any]:
+        """Calculate speed statistics for a time window (aggregated in SQLite)"""
+        aggregates = self.sqlite_client.get_speed_statistics(
+            start_time, end_time, config.radar.speed_limit_mph, min_speed=min_speed, max_speed=max_speed
+        )
+        count = aggregates['count']
+        if not count:
             return self._empty_speed_stats()
         
-        speeds = [s['speed_mph'] for s in speed_measurements]
-        
-        # Basic statistics
-        count = len(speeds)
-        average_speed = sum(speeds) / count
-        min_speed = min(speeds)
-        max_speed = max(speeds)
-        
-        # Speed limit violations
-        violations = sum(1 for s in speeds if s > config.radar.speed_limit_mph)
-        violation_rate = violations / count if count > 0 else 0
-        
-        # Speed distribution
-        speed_distribution = defaultdict(int)
-        for speed in speeds:
-            bucket = f"{int(speed // 10) * 10}-{int(speed // 10) * 10 + 10}"
-            speed_distribution[bucket] += 1
-        
-        # Percentiles (simple approximation)
-        sorted_speeds = sorted(speeds)
-        percentiles = {}
-        for p in [25, 50, 75, 85, 95]:
-            idx = int((p / 100) * (len(sorted_speeds) - 1))
-            percentiles[f"p{p}"] = sorted_speeds[idx]
-        
         return {
             'count': count,
-            'average_mph': round(average_speed, 2),
-            'min_mph': round(min_speed, 2),
-            'max_mph': round(max_speed, 2),
-            'violations': violations,
-            'violation_rate': round(violation_rate, 3),
+            'average_mph': round(aggregates['avg'], 2),
+            'min_mph': round(aggregates['min'], 2),
+            'max_mph': round(aggregates['max'], 2),
+            'violations': aggregates['violations'],
+            'violation_rate': round(aggregates['violations'] / count, 3),
             'speed_limit_mph': config.radar.speed_limit_mph,
-            'distribution': dict(speed_distribution),
-            'percentiles': percentiles
+            'distribution': {f"{lower}-{lower + 10}": n for lower, n in aggregates['distribution'].items()},
+            'percentiles': aggregates['percentiles']
         }
     
     def _empty_speed_stats(self) -> Dict[str, Any]:
@@ -325,13 +281,14 @@ class TrafficAnalyticsService:
         return {
             'period': period,
             'total_vehicles': detections_data['count'],
-            'speed_measurements': speeds_data['count'],
+            'speed_measurements': speeds_data['total_measurements'],
             'speed_statistics': speeds_data.get('statistics', {}),
             'hourly_distribution': hourly_counts,
             'time_range': detections_data['time_range'],
             'system_health': {
                 'radar_stream_entries': stream_length,
                 'radar_stats': radar_stats,
+                'local_cache': self.redis_client.get_cache_stats(),
                 'data_availability': 'good' if stream_length > 0 else 'limited'
             },
             'metadata': {
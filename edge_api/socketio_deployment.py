@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Socket.IO Deployment Settings
+Async mode and message queue selection for running one or several gateway workers
+
+A single gateway process serves every WebSocket client itself. To run several workers,
+point each one at the same Redis message queue: an emit from any worker (a broadcast
+arriving over HTTP, a streamed log record) is relayed to the clients connected to all of
+them, so a slow report request only occupies the worker that received it. Workers sit
+behind a sticky load balancer (nginx ip_hash) because Socket.IO's polling transport must
+keep reaching the worker that opened the session.
+
+Cooperative async modes (eventlet, gevent) keep many idle sockets open cheaply, but they
+have to patch the standard library before the gateway imports anything else;
+monkey_patch() is called at the top of each entry point for that reason. Under them a
+blocking SQLite query or report render stalls every client of that process, so auto only
+picks one for multi-worker deployments; a single process stays on threading.
+
+Environment:
+    SOCKETIO_ASYNC_MODE     auto (default: threading for a single process; with a message
+                            queue eventlet, then gevent, then threading), eventlet, gevent
+                            or threading
+    SOCKETIO_MESSAGE_QUEUE  e.g. redis://redis:6379/0; required when running several workers
+    SOCKETIO_CHANNEL        message queue channel shared by the workers (default flask-socketio)
+"""
+
+import importlib.util
+import logging
+import os
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+ASYNC_MODES = ('eventlet', 'gevent', 'threading')
+DEFAULT_CHANNEL = 'flask-socketio'
+
+_patched = False
+
+
+def resolve_async_mode(requested: Optional[str] = None) -> str:
+    """Async mode to run under, falling back to threading when the requested one is missing
+
+    auto means threading unless SOCKETIO_MESSAGE_QUEUE is set, so installing eventlet does
+    not change how a single gateway process runs.
+    """
+    requested = (requested or os.environ.get('SOCKETIO_ASYNC_MODE', 'auto')).strip().lower()
+    if requested == 'auto':
+        multi_worker = bool(os.environ.get('SOCKETIO_MESSAGE_QUEUE', '').strip())
+        candidates = ASYNC_MODES if multi_worker else ('threading',)
+    elif requested in ASYNC_MODES:
+        candidates = (requested,)
+    else:
+        raise ValueError(f"Unknown SOCKETIO_ASYNC_MODE '{requested}', expected auto or one of {ASYNC_MODES}")
+
+    for mode in candidates:
+        if mode == 'threading' or importlib.util.find_spec(mode) is not None:
+            return mode
+
+    logger.warning(f"Socket.IO async mode '{requested}' is not installed, using threading")
+    return 'threading'
+
+
+def monkey_patch(async_mode: str):
+    """Make blocking standard library calls cooperative for eventlet/gevent (no-op otherwise)"""
+    global _patched
+    if _patched or async_mode == 'threading':
+        return
+    if async_mode == 'eventlet':
+        import eventlet
+        eventlet.monkey_patch()
+    elif async_mode == 'gevent':
+        from gevent import monkey
+        monkey.patch_all()
+    _patched = True
+
+
+def socketio_options(async_mode: str) -> Dict[str, Any]:
+    """Keyword arguments for SocketIO() in this deployment"""
+    options: Dict[str, Any] = {'async_mode': async_mode}
+
+    message_queue = os.environ.get('SOCKETIO_MESSAGE_QUEUE', '').strip()
+    if message_queue:
+        options['message_queue'] = message_queue
+        options['channel'] = os.environ.get('SOCKETIO_CHANNEL', DEFAULT_CHANNEL)
+    return options
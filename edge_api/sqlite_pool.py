@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Read-Only SQLite Connection Pool
+Bounded pool of long-lived read connections for API query paths
+
+Connections are opened read-only (mode=ro with a query_only fallback) with mmap and page
+cache sizes set, checked out for one query or streamed response and then returned, so the
+schema is parsed once, the page cache stays warm and sqlite3's per-connection statement
+cache lets repeated queries reuse their prepared statements. At most max_connections are
+open per database however many threads the server starts; a checkout waits for a returned
+connection when all of them are in use.
+
+    with get_sqlite_pool(db_path).connection() as conn:
+        rows = conn.execute(...).fetchall()
+
+Streamed responses hold their connection until the stream ends or is closed:
+
+    return Response(pool.iterate(lambda conn: iter_rows(conn)))
+
+Kept free of Flask/Redis imports so the gateway can use it without pulling in the rest
+of the data access layer; it is re-exported from data_access.
+"""
+
+import logging
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_SIZE_KB = int(os.getenv('SQLITE_READ_CACHE_KB', '16384'))        # 16 MB page cache per connection
+DEFAULT_MMAP_SIZE = int(os.getenv('SQLITE_READ_MMAP_BYTES', str(256 * 1024 * 1024)))
+DEFAULT_MAX_CONNECTIONS = int(os.getenv('SQLITE_READ_POOL_SIZE', '8'))
+DEFAULT_CACHED_STATEMENTS = 256
+DEFAULT_BUSY_TIMEOUT = 10.0
+
+
+class PooledIterator:
+    """Iterates a result stream and returns its pooled connection when exhausted or closed
+
+    WSGI servers call close() on response iterables, so an abandoned download gives its
+    connection back as well.
+    """
+
+    def __init__(self, pool: 'SQLiteReadPool', conn: sqlite3.Connection, iterable: Iterable):
+        self._pool = pool
+        self._conn = conn
+        self._iterator = iter(iterable)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return next(self._iterator)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self):
+        if self._conn is None:
+            return
+        try:
+            close = getattr(self._iterator, 'close', None)
+            if close is not None:
+                close()
+        finally:
+            conn, self._conn = self._conn, None
+            self._pool.release(conn)
+
+    def __del__(self):
+        if getattr(self, '_conn', None) is not None:
+            self.close()
+
+
+class SQLiteReadPool:
+    """Bounded pool of read-only connections to a single SQLite database"""
+
+    def __init__(self, db_path: str,
+                 cache_size_kb: int = DEFAULT_CACHE_SIZE_KB,
+                 mmap_size: int = DEFAULT_MMAP_SIZE,
+                 cached_statements: int = DEFAULT_CACHED_STATEMENTS,
+                 timeout: float = DEFAULT_BUSY_TIMEOUT,
+                 max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                 on_connect: Optional[Callable[[sqlite3.Connection], None]] = None):
+        self.db_path = db_path
+        self.cache_size_kb = cache_size_kb
+        self.mmap_size = mmap_size
+        self.cached_statements = cached_statements
+        self.timeout = timeout
+        self.max_connections = max(1, int(max_connections))
+        self.on_connect = on_connect
+
+        # LIFO keeps the most recently used (warmest) connections busy
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._open = 0
+        self._generation = 0
+        self._generations: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self.stats = {"connections_opened": 0, "checkouts": 0, "waits": 0}
+
+    def acquire(self) -> sqlite3.Connection:
+        """Check out a connection, opening one while under max_connections
+
+        Raises sqlite3.OperationalError when none is returned within the busy timeout.
+        """
+        with self._lock:
+            self.stats["checkouts"] += 1
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_open = self._open < self.max_connections
+            if can_open:
+                self._open += 1
+            else:
+                self.stats["waits"] += 1
+        if can_open:
+            try:
+                return self._connect()
+            except BaseException:
+                with self._lock:
+                    self._open -= 1
+                raise
+
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise sqlite3.OperationalError(
+                f"No pooled connection to {self.db_path} became free within {self.timeout}s")
+
+    def release(self, conn: sqlite3.Connection):
+        """Return a checked-out connection; connections from before close_all() are closed"""
+        if conn.in_transaction:
+            conn.rollback()
+        with self._lock:
+            current = self._generations.get(id(conn)) == self._generation
+            if not current:
+                self._generations.pop(id(conn), None)
+                self._open -= 1
+        if current:
+            self._idle.put(conn)
+        else:
+            conn.close()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Check out a connection for the duration of the with-block"""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def iterate(self, open_iterable: Callable[[sqlite3.Connection], Iterable]) -> PooledIterator:
+        """Iterable from open_iterable(conn) that holds the connection until it ends or is closed
+
+        open_iterable runs immediately, so errors it raises surface to the caller.
+        """
+        conn = self.acquire()
+        try:
+            return PooledIterator(self, conn, open_iterable(conn))
+        except BaseException:
+            self.release(conn)
+            raise
+
+    def _connect(self) -> sqlite3.Connection:
+        if not os.path.exists(self.db_path):
+            raise sqlite3.OperationalError(f"Database not found: {self.db_path}")
+
+        try:
+            conn = sqlite3.connect(
+                f"file:{self.db_path}?mode=ro", uri=True, timeout=self.timeout,
+                cached_statements=self.cached_statements, check_same_thread=False
+            )
+            # mode=ro is lazy; touch the schema so WAL/-shm access problems surface here
+            conn.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchall()
+        except sqlite3.OperationalError as e:
+            # A WAL database without a writable -shm cannot be opened with mode=ro
+            logger.debug(f"Read-only open failed for {self.db_path} ({e}); using query_only connection")
+            conn = sqlite3.connect(
+                self.db_path, timeout=self.timeout,
+                cached_statements=self.cached_statements, check_same_thread=False
+            )
+
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA query_only = ON")
+        conn.execute(f"PRAGMA cache_size = -{int(self.cache_size_kb)}")
+        conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        if self.on_connect:
+            self.on_connect(conn)
+
+        with self._lock:
+            self._generations[id(conn)] = self._generation
+            self.stats["connections_opened"] += 1
+
+        logger.debug(f"Opened pooled read connection to {self.db_path}")
+        return conn
+
+    def close_all(self):
+        """Close idle connections now and checked-out ones when they are returned"""
+        with self._lock:
+            self._generation += 1
+            idle = []
+            while True:
+                try:
+                    idle.append(self._idle.get_nowait())
+                except queue.Empty:
+                    break
+            for conn in idle:
+                self._generations.pop(id(conn), None)
+            self._open = len(self._generations)
+        for conn in idle:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self.stats, "open_connections": len(self._generations),
+                    "idle_connections": self._idle.qsize(), "max_connections": self.max_connections}
+
+
+_pools: Dict[str, SQLiteReadPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_sqlite_pool(db_path: str, **kwargs) -> SQLiteReadPool:
+    """Get the shared read pool for a database path, creating it on first use"""
+    key = os.path.abspath(db_path)
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = _pools[key] = SQLiteReadPool(db_path, **kwargs)
+    return pool
+
+
+def close_all_pools():
+    """Close every shared pool (used on shutdown and in tests)"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close_all()
@@ -29,6 +29,11 @@ from .error_handling import (
 from .services import (
     get_detection_service, get_speed_service, get_analytics_service
 )
+from .data_access import get_sqlite_client
+
+# Rollup analytics are shared with the persistence service in edge_processing
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'edge_processing'))
+from traffic_analytics import clamp_days, load_hourly_buckets, traffic_patterns
 
 # Import our Swagger configuration and models  
 from swagger_config import API_CONFIG, create_api_models, QUERY_PARAMS, RESPONSE_EXAMPLES
@@ -803,82 +808,15 @@ class SwaggerAPIGateway:
                 - Day-of-week comparisons
                 """
                 try:
-                    redis_client = current_app.redis_client if hasattr(current_app, 'redis_client') else None
-                    
-                    if not redis_client:
-                        return {
-                            'error': 'Redis service not available',
-                            'status_code': 503,
-                            'timestamp': datetime.now().isoformat()
-                        }, 503
-                    
-                    # Get recent detection data for pattern analysis
-                    detection_keys = redis_client.keys('vehicle:detection:*')
-                    
-                    # Initialize pattern data structure
-                    patterns = {
-                        'weekly_summary': {
-                            'total_detections': len(detection_keys) if detection_keys else 0,
-                            'avg_daily_traffic': 0,
-                            'peak_day': 'Monday',
-                            'lowest_day': 'Sunday'
-                        },
-                        'daily_patterns': {
-                            'Monday': {'total': 0, 'peak_hour': 8, 'avg_count': 0},
-                            'Tuesday': {'total': 0, 'peak_hour': 8, 'avg_count': 0},
-                            'Wednesday': {'total': 0, 'peak_hour': 8, 'avg_count': 0},
-                            'Thursday': {'total': 0, 'peak_hour': 8, 'avg_count': 0},
-                            'Friday': {'total': 0, 'peak_hour': 17, 'avg_count': 0},
-                            'Saturday': {'total': 0, 'peak_hour': 12, 'avg_count': 0},
-                            'Sunday': {'total': 0, 'peak_hour': 14, 'avg_count': 0}
-                        },
-                        'hourly_distribution': {},
-                        'analysis_timestamp': datetime.now().isoformat(),
-                        'data_period_days': 7
-                    }
-                    
-                    # If we have detection data, analyze it
-                    if detection_keys:
-                        daily_counts = {'Monday': 0, 'Tuesday': 0, 'Wednesday': 0, 'Thursday': 0, 'Friday': 0, 'Saturday': 0, 'Sunday': 0}
-                        hourly_counts = {}
-                        
-                        # Process recent detections (limit to prevent timeout)
-                        recent_keys = sorted(detection_keys, reverse=True)[:1000]
-                        
-                        for key in recent_keys:
-                            try:
-                                data = redis_client.get(key)
-                                if data:
-                                    detection = json.loads(data)
-                                    timestamp = detection.get('timestamp')
-                                    if timestamp:
-                                        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                                        day_name = dt.strftime('%A')
-                                        hour = dt.hour
-                                        
-                                        if day_name in daily_counts:
-                                            daily_counts[day_name] += 1
-                                        
-                                        if hour not in hourly_counts:
-                                            hourly_counts[hour] = 0
-                                        hourly_counts[hour] += 1
-                            except Exception as e:
-                                continue
-                        
-                        # Update patterns with real data
-                        total_traffic = sum(daily_counts.values())
-                        if total_traffic > 0:
-                            patterns['weekly_summary']['total_detections'] = total_traffic
-                            patterns['weekly_summary']['avg_daily_traffic'] = total_traffic / 7
-                            patterns['weekly_summary']['peak_day'] = max(daily_counts, key=daily_counts.get)
-                            patterns['weekly_summary']['lowest_day'] = min(daily_counts, key=daily_counts.get)
-                            
-                            for day, count in daily_counts.items():
-                                patterns['daily_patterns'][day]['total'] = count
-                                patterns['daily_patterns'][day]['avg_count'] = count
-                            
-                            patterns['hourly_distribution'] = hourly_counts
-                    
+                    days = request.args.get('days', 7, type=int)
+                    end_ts = time.time()
+                    start_ts = end_ts - clamp_days(days) * 86400
+                    
+                    # Hourly rollups: bounded by the window length, not the detection history
+                    with get_sqlite_client().get_connection() as conn:
+                        buckets = load_hourly_buckets(conn, start_ts, end_ts)
+                    patterns = traffic_patterns(buckets, start_ts, end_ts)
+                    patterns['analysis_timestamp'] = datetime.now().isoformat()
                     return patterns
                     
                 except Exception as e:
@@ -0,0 +1,107 @@
+"""Unit tests for coalesced, subscription-filtered WebSocket delivery"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+flask = pytest.importorskip("flask")
+flask_socketio = pytest.importorskip("flask_socketio")
+
+from flask import request
+from event_delivery import BATCH_EVENT, SUMMARY_EVENT, MAX_PENDING, EventCoalescer, classify_event
+
+
+@pytest.fixture
+def server():
+    app = flask.Flask(__name__)
+    socketio = flask_socketio.SocketIO(app, async_mode='threading')
+    delivery = EventCoalescer(socketio)
+
+    @socketio.on('subscribe')
+    def subscribe(data):
+        return delivery.subscribe(request.sid, data['channels'])
+
+    return app, socketio, delivery
+
+
+def connect(server, channels):
+    app, socketio, _ = server
+    client = socketio.test_client(app)
+    assert sorted(client.emit('subscribe', {'channels': channels}, callback=True)) == sorted(channels)
+    client.get_received()
+    return client
+
+
+def batches(client):
+    return [message['args'][0] for message in client.get_received() if message['name'] == BATCH_EVENT]
+
+
+def test_events_are_classified_into_channels():
+    assert classify_event({'business_event': 'radar_alert'}) == 'alerts'
+    assert classify_event({'business_event': 'health_check', 'level': 'ERROR'}) == 'alerts'
+    assert classify_event({'business_event': 'radar_reading'}) == 'radar'
+    assert classify_event({'business_event': 'vehicle_detected'}) == 'consolidated'
+    assert classify_event({'business_event': 'vehicle_detected', 'channel': 'radar'}) == 'radar'
+
+
+def test_events_in_a_window_arrive_as_one_batch_per_subscribed_channel(server):
+    _, _, delivery = server
+    consolidated_only = connect(server, ['consolidated'])
+    everything = connect(server, ['alerts', 'consolidated', 'radar'])
+
+    for i in range(5):
+        delivery.publish('consolidated', {'event_id': i})
+    delivery.publish('radar', {'speed': 31.0})
+    delivery.publish('logs', {'message': 'nobody subscribed'})
+    delivery.flush()
+
+    received = batches(consolidated_only)
+    assert [(b['channel'], len(b['events'])) for b in received] == [('consolidated', 5)]
+    assert [b['channel'] for b in batches(everything)] == ['consolidated', 'radar']
+    assert delivery.get_stats()['batches'] == 3
+
+    delivery.flush()  # nothing pending, nothing sent
+    assert batches(everything) == []
+
+
+def test_lossy_channel_overflow_drops_oldest_and_reports_it(server):
+    _, _, delivery = server
+    client = connect(server, ['radar', 'alerts'])
+
+    overflow = 25
+    for i in range(MAX_PENDING['radar'] + overflow):
+        delivery.publish('radar', {'seq': i})
+    delivery.publish('alerts', {'business_event': 'radar_alert'})
+    delivery.flush()
+
+    alerts, radar = batches(client)
+    assert alerts['events'] == [{'business_event': 'radar_alert'}]
+    assert radar['dropped'] == overflow
+    assert radar['events'][0] == {'seq': overflow}
+    assert len(radar['events']) == MAX_PENDING['radar']
+
+
+def test_backed_up_client_skips_lossy_batches_then_gets_a_summary(server, monkeypatch):
+    _, _, delivery = server
+    slow = connect(server, ['alerts', 'logs'])
+    fast = connect(server, ['alerts', 'logs'])
+    backed_up = {slow.eio_sid}
+    monkeypatch.setattr(delivery, '_queue_depth',
+                        lambda eio_sid: delivery.backlog_limit + 1 if eio_sid in backed_up else 0)
+
+    delivery.publish('alerts', {'message': 'always delivered'})
+    for i in range(3):
+        delivery.publish('logs', {'message': f'log {i}'})
+    delivery.flush()
+
+    assert [b['channel'] for b in batches(slow)] == ['alerts']
+    assert [b['channel'] for b in batches(fast)] == ['alerts', 'logs']
+
+    backed_up.clear()
+    delivery.flush()
+    summaries = [m['args'][0] for m in slow.get_received() if m['name'] == SUMMARY_EVENT]
+    assert [s['missed'] for s in summaries] == [{'logs': 3}]
+    assert delivery.get_stats()['clients_behind'] == 0
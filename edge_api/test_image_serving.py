@@ -0,0 +1,88 @@
+"""Unit tests for conditional, range and offloaded camera image responses"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+flask = pytest.importorskip("flask")
+
+from image_serving import file_etag, image_response
+
+IMAGE_BYTES = bytes(range(256)) * 2048  # 512 KiB stand-in for a JPEG
+
+
+@pytest.fixture
+def image(tmp_path):
+    path = tmp_path / "live" / "capture_20240101_120000.jpg"
+    path.parent.mkdir()
+    path.write_bytes(IMAGE_BYTES)
+    return path
+
+
+@pytest.fixture
+def client(image):
+    app = flask.Flask(__name__)
+
+    @app.route('/image')
+    def serve():
+        return image_response(str(image))
+
+    return app.test_client()
+
+
+def test_unchanged_image_is_revalidated_with_304_and_no_body(client, image):
+    first = client.get('/image')
+    assert first.status_code == 200
+    assert len(first.data) == len(IMAGE_BYTES)
+    assert first.headers['Content-Type'] == 'image/jpeg'
+    assert first.headers['ETag'] == f'"{file_etag(os.stat(image))}"'
+    assert 'Last-Modified' in first.headers
+    assert 'no-cache' in first.headers['Cache-Control']
+
+    repeat = client.get('/image', headers={'If-None-Match': first.headers['ETag']})
+    assert repeat.status_code == 304
+    assert repeat.data == b''
+
+    by_date = client.get('/image', headers={'If-Modified-Since': first.headers['Last-Modified']})
+    assert by_date.status_code == 304
+
+
+def test_replaced_image_gets_a_new_etag(client, image):
+    etag = client.get('/image').headers['ETag']
+    replacement = image.with_suffix('.tmp')
+    replacement.write_bytes(IMAGE_BYTES[::-1])
+    os.replace(replacement, image)  # how the capture service publishes a new frame
+
+    response = client.get('/image', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert response.data == IMAGE_BYTES[::-1]
+
+
+def test_range_requests_return_only_the_requested_bytes(client):
+    response = client.get('/image', headers={'Range': 'bytes=1000-1999'})
+    assert response.status_code == 206
+    assert response.data == IMAGE_BYTES[1000:2000]
+    assert response.headers['Content-Range'] == f'bytes 1000-1999/{len(IMAGE_BYTES)}'
+    assert response.headers['Accept-Ranges'] == 'bytes'
+
+
+def test_front_proxy_offload_sends_header_instead_of_body(client, image, monkeypatch):
+    monkeypatch.setenv('IMAGE_ACCEL_REDIRECT_PREFIX', '/_protected/camera_capture/')
+    monkeypatch.setenv('IMAGE_ACCEL_ROOT', str(image.parent.parent))
+
+    response = client.get('/image')
+    assert response.status_code == 200
+    assert response.data == b''
+    assert response.headers['X-Accel-Redirect'] == '/_protected/camera_capture/live/capture_20240101_120000.jpg'
+    assert response.headers['Content-Type'] == 'image/jpeg'
+
+    # Files the proxy cannot see are still served directly
+    monkeypatch.setenv('IMAGE_ACCEL_ROOT', str(image.parent / 'elsewhere'))
+    direct = client.get('/image')
+    assert 'X-Accel-Redirect' not in direct.headers
+    assert len(direct.data) == len(IMAGE_BYTES)
@@ -0,0 +1,126 @@
+"""Unit tests for reduced-scale thumbnails and their memory/disk caches"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+flask = pytest.importorskip("flask")
+
+import image_thumbnails
+from image_serving import preview_response
+from image_thumbnails import (DiskLRU, ThumbnailCache, jpeg_dimensions, reduction_factor,
+                              render_thumbnail, thumbnail_width)
+
+
+def write_jpeg(path, width=2028, height=1520):
+    np = pytest.importorskip("numpy")
+    if image_thumbnails.CV2_AVAILABLE:
+        import cv2
+        gradient = np.linspace(0, 255, width, dtype=np.uint8)
+        image = np.dstack([np.tile(gradient, (height, 1))] * 3)
+        cv2.imwrite(str(path), image)
+    elif image_thumbnails.PIL_AVAILABLE:
+        from PIL import Image
+        Image.new('RGB', (width, height), (40, 90, 160)).save(path, 'JPEG')
+    else:
+        pytest.skip("needs opencv-python or Pillow")
+    return path
+
+
+def test_requested_widths():
+    assert thumbnail_width() is None
+    assert thumbnail_width('full') is None
+    assert thumbnail_width('thumbnail') == 300
+    assert thumbnail_width('thumbnail', width='5000') == image_thumbnails.MAX_WIDTH
+    with pytest.raises(ValueError):
+        thumbnail_width('huge')
+    with pytest.raises(ValueError):
+        thumbnail_width(width='wide')
+
+
+def test_reduction_factor_never_undershoots_the_target():
+    assert reduction_factor(4056, 300) == 8
+    assert reduction_factor(2028, 300) == 4
+    assert reduction_factor(2028, 800) == 2
+    assert reduction_factor(640, 600) == 1
+
+
+def test_thumbnail_is_decoded_small_and_sized_to_width(tmp_path):
+    source = write_jpeg(tmp_path / "capture.jpg")
+    assert jpeg_dimensions(str(source)) == (2028, 1520)
+
+    thumbnail = tmp_path / "thumb.jpg"
+    thumbnail.write_bytes(render_thumbnail(str(source), 300))
+    assert jpeg_dimensions(str(thumbnail)) == (300, 225)
+    assert thumbnail.stat().st_size < source.stat().st_size / 4
+
+
+def test_cache_renders_once_and_survives_restart(tmp_path):
+    source = tmp_path / "capture.jpg"
+    source.write_bytes(b"original")
+    calls = []
+
+    def render(path, width):
+        calls.append(width)
+        return Path(path).read_bytes() + f"@{width}".encode()
+
+    cache = ThumbnailCache(cache_dir=str(tmp_path / "cache"), render=render)
+    data, etag = cache.get(str(source), 300)
+    assert data == b"original@300"
+    assert cache.get(str(source), 300) == (data, etag)
+    assert calls == [300]
+
+    # A new process finds the rendering on disk
+    restarted = ThumbnailCache(cache_dir=str(tmp_path / "cache"), render=render)
+    assert restarted.get(str(source), 300) == (data, etag)
+    assert calls == [300]
+
+    # Replacing the source changes its version, so the preview is rendered again
+    replacement = tmp_path / "capture.tmp"
+    replacement.write_bytes(b"replaced")
+    os.replace(replacement, source)
+    new_data, new_etag = restarted.get(str(source), 300)
+    assert new_data == b"replaced@300" and new_etag != etag
+    assert calls == [300, 300]
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    disk = DiskLRU(str(tmp_path), max_bytes=250)
+    disk.set("a.jpg", b"a" * 100)
+    disk.set("b.jpg", b"b" * 100)
+    assert disk.get("a.jpg") == b"a" * 100
+    disk.set("c.jpg", b"c" * 100)
+
+    assert disk.get("b.jpg") is None
+    assert not (tmp_path / "b.jpg").exists()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.jpg", "c.jpg"]
+    assert disk.get_stats()["bytes"] == 200
+
+
+def test_preview_response_is_conditional(tmp_path):
+    source = tmp_path / "capture.jpg"
+    source.write_bytes(b"original")
+    app = flask.Flask(__name__)
+
+    @app.route('/preview')
+    def serve():
+        return preview_response(b"tiny", "abc-w300", os.stat(source), max_age=86400)
+
+    client = app.test_client()
+    first = client.get('/preview')
+    assert first.data == b"tiny"
+    assert first.headers['ETag'] == '"abc-w300"'
+    assert first.headers['Cache-Control'] == 'public, max-age=86400'
+    assert client.get('/preview', headers={'If-None-Match': '"abc-w300"'}).status_code == 304
+
+
+def test_importing_does_not_load_opencv_or_pillow():
+    code = "import sys, image_thumbnails; print(sorted({'cv2', 'PIL'} & set(sys.modules)))"
+    result = subprocess.run([sys.executable, '-c', code], cwd=Path(__file__).parent,
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == '[]'
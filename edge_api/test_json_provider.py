@@ -0,0 +1,49 @@
+"""Unit tests for the Flask JSON provider and Flask-RESTX representation"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "edge_processing"))
+
+flask = pytest.importorskip("flask")
+flask_restx = pytest.importorskip("flask_restx")
+
+from json_provider import FastJSONProvider, output_json
+
+
+@pytest.fixture
+def client():
+    app = flask.Flask(__name__)
+    app.json = FastJSONProvider(app)
+    api = flask_restx.Api(app, prefix='/api')
+    api.representations['application/json'] = output_json
+
+    @app.route('/plain')
+    def plain():
+        return flask.jsonify(zeta=1, alpha=datetime(2024, 3, 10, 8, 0))
+
+    @app.route('/echo', methods=['POST'])
+    def echo():
+        return flask.jsonify(flask.request.get_json())
+
+    @api.route('/resource')
+    class Resource(flask_restx.Resource):
+        def get(self):
+            return {"zeta": 1, "alpha": "é"}, 201
+
+    return app.test_client()
+
+
+def test_jsonify_keeps_key_order_and_iso_datetimes(client):
+    assert client.get('/plain').data == b'{"zeta":1,"alpha":"2024-03-10T08:00:00"}\n'
+    assert client.post('/echo', json={"speed": 31.5}).get_json() == {"speed": 31.5}
+
+
+def test_restx_resources_use_the_provider(client):
+    response = client.get('/api/resource')
+    assert response.status_code == 201
+    assert response.data == '{"zeta":1,"alpha":"é"}\n'.encode('utf-8')
@@ -0,0 +1,136 @@
+"""Unit tests for the bounded local cache and bucketed radar stream reads"""
+
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from edge_api.config import config
+from edge_api.data_access import RedisDataAccess
+from edge_api.local_cache import BoundedTTLCache
+
+BUCKET_MS = config.radar.cache_bucket_seconds * 1000
+
+
+class FakeStream:
+    """Stands in for the Redis client: XRANGE over an in-memory radar stream"""
+
+    def __init__(self, timestamps_ms):
+        self.entries = [(f"{ts}-0", {'speed': '27.5', 'unit': 'mph'}) for ts in sorted(timestamps_ms)]
+        self.reads = []
+
+    def xrange(self, name, min, max, count=None):
+        self.reads.append((min, max))
+        matched = [e for e in self.entries if min <= int(e[0].split('-')[0]) <= max]
+        return matched[:count] if count else matched
+
+
+def _access(timestamps_ms):
+    access = RedisDataAccess()
+    access._redis = FakeStream(timestamps_ms)
+    return access
+
+
+def _window(start_ms, end_ms):
+    return datetime.fromtimestamp(start_ms / 1000), datetime.fromtimestamp(end_ms / 1000)
+
+
+def test_lru_evicts_by_entry_count_and_bytes():
+    cache = BoundedTTLCache(max_entries=3)
+    for key in "abcd":
+        cache.set(key, key * 10, 60)
+    assert cache.get("a") is None and cache.get("d") == "d" * 10
+    assert len(cache) == 3
+
+    cache.get("b")
+    cache.set("e", "e", 60)
+    assert cache.get("b") is not None and cache.get("c") is None
+
+    small = BoundedTTLCache(max_bytes=2000)
+    for i in range(20):
+        small.set(str(i), [i] * 50, 60)
+    stats = small.get_stats()
+    assert stats["approx_bytes"] <= 2000 and stats["evictions"] > 0
+    assert small.get("19") is not None
+
+
+def test_entries_expire_and_stats_report_hit_rate(monkeypatch):
+    cache = BoundedTTLCache()
+    cache.set("k", {"v": 1}, ttl_seconds=10)
+    assert cache.get("k") == {"v": 1}
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+    assert cache.get("k") is None
+
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["expired"], stats["entries"]) == (1, 1, 1, 0)
+    assert stats["hit_rate"] == 0.5
+
+
+def test_sliding_windows_reuse_closed_buckets():
+    now_ms = int(time.time() * 1000)
+    base = now_ms - now_ms % BUCKET_MS - 10 * BUCKET_MS
+    access = _access(range(base, base + 10 * BUCKET_MS, BUCKET_MS // 4))
+
+    first = access.get_radar_stream_data(*_window(base + 1000, base + 6 * BUCKET_MS - 1))
+    assert [e['timestamp_ms'] for e in first] == list(range(base + BUCKET_MS // 4, base + 6 * BUCKET_MS, BUCKET_MS // 4))
+    assert len(access._redis.reads) == 1
+
+    # Shifted by a bucket and a half: only the one bucket never seen before is read
+    second = access.get_radar_stream_data(*_window(base + BUCKET_MS + BUCKET_MS // 2, base + 7 * BUCKET_MS - 1))
+    assert access._redis.reads[1:] == [(base + 6 * BUCKET_MS, base + 7 * BUCKET_MS - 1)]
+    assert second[0]['timestamp_ms'] == base + BUCKET_MS + BUCKET_MS // 2
+    assert second[-1]['timestamp_ms'] == base + 6 * BUCKET_MS + 3 * BUCKET_MS // 4
+
+    access.get_radar_stream_data(*_window(base, base + 7 * BUCKET_MS - 1))
+    assert len(access._redis.reads) == 2
+    assert access.get_cache_stats()["radar_buckets"]["hits"] == 5 + 7
+
+
+def test_empty_buckets_share_one_entry_and_a_week_fits():
+    now_ms = int(time.time() * 1000)
+    base = now_ms - now_ms % BUCKET_MS - 20 * BUCKET_MS
+    # Traffic in buckets 0 and 15 only; 1-14 and 16-19 are empty and closed
+    access = _access([base + 5, base + 15 * BUCKET_MS + 5])
+
+    window = _window(base, base + 20 * BUCKET_MS - 1)
+    assert len(access.get_radar_stream_data(*window)) == 2
+    assert len(access._radar_cache) == 2
+
+    assert len(access.get_radar_stream_data(*window)) == 2
+    assert len(access._redis.reads) == 1
+
+    week_buckets = 604800 // config.radar.cache_bucket_seconds
+    assert access._radar_cache.max_entries > week_buckets
+
+
+def test_open_bucket_is_always_read_from_redis():
+    now_ms = int(time.time() * 1000)
+    open_bucket = now_ms - now_ms % BUCKET_MS
+    access = _access([open_bucket - BUCKET_MS + 5, open_bucket + 1])
+    start, end = _window(open_bucket - BUCKET_MS, now_ms + 60_000)
+
+    for _ in range(3):
+        assert len(access.get_radar_stream_data(start, end)) == 2
+    reads = access._redis.reads
+    assert reads[0][0] == open_bucket - BUCKET_MS
+    if now_ms - open_bucket > 2000:
+        assert all(read[0] == open_bucket for read in reads[1:])
+
+
+def test_count_limits_entries_from_window_start():
+    now_ms = int(time.time() * 1000)
+    base = now_ms - now_ms % BUCKET_MS - 5 * BUCKET_MS
+    access = _access(range(base, base + 5 * BUCKET_MS, 1000))
+
+    entries = access.get_radar_stream_data(*_window(base + 500, base + 5 * BUCKET_MS), count=10)
+    assert [e['timestamp_ms'] for e in entries] == list(range(base + 1000, base + 11000, 1000))
+
+
+def test_empty_stream_returns_no_entries():
+    now_ms = int(time.time() * 1000)
+    access = _access([])
+    assert access.get_radar_stream_data(*_window(now_ms - 3 * BUCKET_MS, now_ms)) == []
@@ -0,0 +1,116 @@
+"""Unit tests for buffered, rate-limited log streaming"""
+
+import logging
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from log_streaming import SocketIOLogHandler
+
+
+class RecordingDelivery:
+    """Collects what the handler publishes instead of sending it to clients"""
+
+    def __init__(self):
+        self.published = []
+
+    def publish(self, channel, entry):
+        self.published.append((channel, entry))
+
+
+@pytest.fixture
+def streamed_logger():
+    delivery = RecordingDelivery()
+    handler = SocketIOLogHandler(delivery, rate_limits={'INFO': 100})
+    log = logging.getLogger('test_log_streaming')
+    log.setLevel(logging.DEBUG)
+    log.propagate = False
+    log.addHandler(handler)
+    yield log, handler, delivery
+    log.removeHandler(handler)
+
+
+def test_records_are_queued_until_flushed_and_repeats_collapse(streamed_logger):
+    log, handler, delivery = streamed_logger
+    for _ in range(5):
+        log.info("Radar reading stored")
+    log.warning("Disk almost full", extra={'business_event': 'disk_warning'})
+    assert delivery.published == []
+
+    handler.flush()
+    entries = [entry for channel, entry in delivery.published if channel == 'logs']
+    assert [(e['message'], e['count']) for e in entries] == [("Radar reading stored", 5), ("Disk almost full", 1)]
+    assert entries[1]['business_event'] == 'disk_warning'
+    assert 'last_timestamp' in entries[0]
+
+
+def test_levels_over_their_rate_limit_are_summarized(streamed_logger):
+    log, handler, delivery = streamed_logger
+    for i in range(1000):
+        log.info("request %d served", i)
+    log.error("still delivered")
+    handler.flush()
+
+    entries = [entry for _, entry in delivery.published]
+    streamed = [e for e in entries if e['service'] == 'test_log_streaming']
+    summary = [e for e in entries if e.get('business_event') == 'log_stream_rate_limited']
+    # Records may straddle a one-second window, admitting up to two windows' worth
+    assert 100 <= sum(e['level'] == 'INFO' for e in streamed) <= 200
+    assert any(e['message'] == "still delivered" for e in streamed)
+    assert summary and summary[0]['count'] == handler.get_stats()['suppressed']
+    assert handler.get_stats()['suppressed'] + sum(e['level'] == 'INFO' for e in streamed) == 1000
+
+
+def test_request_latency_is_unaffected_by_a_log_burst():
+    flask = pytest.importorskip("flask")
+    app = flask.Flask(__name__)
+    log = logging.getLogger('test_log_streaming.burst')
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    handler = SocketIOLogHandler(RecordingDelivery())
+
+    @app.route('/ping')
+    def ping():
+        log.info("ping served")
+        return {'ok': True}
+
+    client = app.test_client()
+
+    def latencies(count=200):
+        samples = []
+        for _ in range(count):
+            started = time.perf_counter()
+            assert client.get('/ping').status_code == 200
+            samples.append(time.perf_counter() - started)
+        return statistics.median(samples)
+
+    log.addHandler(handler)
+    try:
+        baseline = latencies()
+
+        def burst():
+            for i in range(10_000):
+                log.info("burst record %d", i)
+
+        burster = threading.Thread(target=burst)
+        started = time.perf_counter()
+        burster.start()
+        during = latencies()
+        burster.join()
+        burst_seconds = time.perf_counter() - started
+        handler.flush()
+    finally:
+        log.removeHandler(handler)
+
+    stats = handler.get_stats()
+    assert stats['received'] >= 10_000
+    assert stats['streamed'] < 100  # a handful of entries plus one summary, not 10k
+    assert burst_seconds < 5
+    # The request thread only shares the GIL with the burst, never waits on socket I/O
+    assert during < baseline * 3 + 0.002
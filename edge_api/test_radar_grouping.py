@@ -0,0 +1,81 @@
+"""Unit tests for vectorized radar ping grouping against the reference implementation"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from edge_api import radar_grouping
+from edge_api.radar_grouping import group_radar_pings, group_radar_pings_reference
+
+BASE_MS = 1_700_000_000_000
+PARAMS = dict(window_seconds=5, min_pings=3, speed_jump_mph=10.0)
+
+
+def _ping(ms, speed):
+    return {'timestamp_ms': ms, 'speed': speed}
+
+
+def _traffic(vehicles, seed):
+    """Vehicles a few seconds apart, each a burst of 20 Hz pings, plus stray single pings"""
+    rng = random.Random(seed)
+    pings, ms = [], BASE_MS
+    for _ in range(vehicles):
+        speed = rng.uniform(15, 45) * rng.choice([1, -1])
+        for _ in range(rng.randint(1, 40)):
+            pings.append(_ping(ms, round(speed + rng.gauss(0, 1.5), 1)))
+            ms += 50
+        ms += rng.choice([500, 2000, 6000, 30000])
+    rng.shuffle(pings)
+    return pings
+
+
+def _assert_same_detections(actual, expected):
+    """Groups must match exactly; means may differ in the last rounded digit by summation order"""
+    rounded = {'average_speed': 0.011, 'speed_variance': 0.0011, 'confidence': 0.0011}
+    assert len(actual) == len(expected)
+    for got, want in zip(actual, expected):
+        assert {k: v for k, v in got.items() if k not in rounded} == \
+            {k: v for k, v in want.items() if k not in rounded}
+        for key, tolerance in rounded.items():
+            assert got[key] == pytest.approx(want[key], abs=tolerance)
+
+
+def test_known_groups_split_on_gaps_and_speed_jumps():
+    pings = (
+        [_ping(BASE_MS + i * 100, 25.0 + i % 2) for i in range(5)] +            # vehicle A
+        [_ping(BASE_MS + 600 + i * 100, -40.0) for i in range(4)] +              # speed jump: vehicle B
+        [_ping(BASE_MS + 20_000 + i * 100, 41.0) for i in range(2)] +            # gap, too few pings
+        [_ping(BASE_MS + 40_000 + i * 1000, 30.0) for i in range(3)]             # slow pings, one group
+    )
+    detections = group_radar_pings(list(reversed(pings)), **PARAMS)
+
+    assert [d['ping_count'] for d in detections] == [5, 4, 3]
+    assert [d['id'] for d in detections] == [f"radar_detection_{BASE_MS + t}" for t in (0, 600, 40_000)]
+    assert detections[0]['average_speed'] == 25.4
+    assert detections[0]['speed_variance'] == 0.24
+    assert (detections[0]['min_speed'], detections[0]['max_speed']) == (25.0, 26.0)
+    assert detections[1]['average_speed'] == 40.0 and detections[1]['speed_variance'] == 0.0
+    assert detections[2]['duration_seconds'] == 2.0
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_vectorized_grouping_matches_reference(seed):
+    pings = _traffic(vehicles=300, seed=seed)
+    expected = group_radar_pings_reference(pings, **PARAMS)
+    assert len(expected) > 100
+    _assert_same_detections(group_radar_pings(pings, **PARAMS), expected)
+
+
+def test_empty_and_noise_only_input():
+    assert group_radar_pings([], **PARAMS) == []
+    assert group_radar_pings([_ping(BASE_MS + i * 10_000, 30.0) for i in range(5)], **PARAMS) == []
+
+
+def test_falls_back_to_reference_without_numpy(monkeypatch):
+    pings = _traffic(vehicles=20, seed=9)
+    monkeypatch.setattr(radar_grouping, 'NUMPY_AVAILABLE', False)
+    assert group_radar_pings(pings, **PARAMS) == group_radar_pings_reference(pings, **PARAMS)
@@ -0,0 +1,73 @@
+"""Unit tests for ETag versioning and the rendered response cache"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from response_cache import DataVersionTracker, ResponseCache
+from sqlite_pool import get_sqlite_pool, close_all_pools
+
+
+@pytest.fixture
+def writer(tmp_path):
+    path = str(tmp_path / "traffic_data.db")
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE traffic_detections (id INTEGER PRIMARY KEY, timestamp REAL)")
+    conn.execute("CREATE TABLE consolidated_events (consolidation_id TEXT PRIMARY KEY, event_json TEXT, created_at TEXT)")
+    conn.execute("INSERT INTO consolidated_events VALUES ('c1', '{}', '2025-01-01')")
+    yield path, conn
+    conn.close()
+    close_all_pools()
+
+
+def test_version_changes_only_when_data_changes(writer):
+    path, conn = writer
+    tracker = DataVersionTracker(path, max_age_seconds=3600)
+    pool = get_sqlite_pool(path)
+
+    first = tracker.current()
+    assert first == "1.0"
+    checkouts = pool.stats["checkouts"]
+
+    # Unchanged files: answered from the memoized version without querying
+    assert tracker.current() == first
+    assert pool.stats["checkouts"] == checkouts
+
+    conn.execute("INSERT INTO consolidated_events VALUES ('c2', '{}', '2025-01-02')")
+    conn.execute("INSERT INTO traffic_detections (timestamp) VALUES (1.0)")
+    assert tracker.current() == "2.1"
+
+
+def test_missing_database_has_no_version(tmp_path):
+    assert DataVersionTracker(str(tmp_path / "missing.db")).current() is None
+
+
+def test_etag_depends_on_params_version_and_window(monkeypatch):
+    base = ResponseCache.make_etag('consolidated', {'limit': 5}, "1.0")
+    assert base == ResponseCache.make_etag('consolidated', {'limit': 5}, "1.0")
+    assert base != ResponseCache.make_etag('consolidated', {'limit': 6}, "1.0")
+    assert base != ResponseCache.make_etag('consolidated', {'limit': 5}, "2.0")
+
+    import response_cache
+    monkeypatch.setattr(response_cache.time, 'time', lambda: 1000.0)
+    windowed = ResponseCache.make_etag('speeds', {}, "1.0", window_seconds=60)
+    monkeypatch.setattr(response_cache.time, 'time', lambda: 1061.0)
+    assert windowed != ResponseCache.make_etag('speeds', {}, "1.0", window_seconds=60)
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ResponseCache(max_entries=2)
+    cache.put('a', b'1')
+    cache.put('b', b'2')
+    assert cache.get('a') == b'1'
+    cache.put('c', b'3')
+
+    assert cache.get('b') is None
+    assert cache.get('a') == b'1'
+    assert cache.get('c') == b'3'
+    assert cache.get_stats()['entries'] == 2
@@ -0,0 +1,103 @@
+"""Unit tests for content-negotiated response compression"""
+
+import gzip
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from flask import Flask, Response, request, stream_with_context
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import response_compression
+from response_compression import ResponseCompressor, negotiate_encoding
+
+PAYLOAD = {"events": [{"vehicle_type": "car", "speed_mph": 27.5, "location": "Main Street"}] * 200}
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+    compressor = ResponseCompressor(min_size=512, level=5)
+
+    @app.after_request
+    def compress(response):
+        return compressor.compress_response(response, request.headers.get('Accept-Encoding'))
+
+    @app.route('/large')
+    def large():
+        response = Response(json.dumps(PAYLOAD), mimetype='application/json')
+        response.set_etag('v1')
+        return response.make_conditional(request)
+
+    @app.route('/small')
+    def small():
+        return {"status": "ok"}
+
+    @app.route('/image')
+    def image():
+        return Response(b'\xff\xd8' + b'\x00' * 4096, mimetype='image/jpeg')
+
+    @app.route('/export')
+    def export():
+        rows = (f"{i},car,{20 + i % 15}\n" for i in range(2000))
+        return Response(stream_with_context(rows), mimetype='text/csv')
+
+    app.compressor = compressor
+    return app.test_client()
+
+
+def test_negotiation_honours_q_values_and_wildcard(monkeypatch):
+    monkeypatch.setattr(response_compression, 'BROTLI_AVAILABLE', True)
+    assert negotiate_encoding('gzip, deflate, br') == 'br'
+    assert negotiate_encoding('gzip;q=1.0, br;q=0.5') == 'gzip'
+    assert negotiate_encoding('br;q=0, *') == 'gzip'
+    assert negotiate_encoding('identity') is None
+    assert negotiate_encoding('gzip;q=0') is None
+    assert negotiate_encoding('') is None
+
+    monkeypatch.setattr(response_compression, 'BROTLI_AVAILABLE', False)
+    assert negotiate_encoding('br, gzip') == 'gzip'
+    assert negotiate_encoding('br') is None
+
+
+def test_large_json_is_gzipped_with_weak_etag(client):
+    response = client.get('/large', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert json.loads(gzip.decompress(response.data)) == PAYLOAD
+    assert response.headers['ETag'] == 'W/"v1"'
+
+    # The weak ETag still revalidates, and a repeat is served from the compressed cache
+    assert client.get('/large', headers={'Accept-Encoding': 'gzip', 'If-None-Match': 'W/"v1"'}).status_code == 304
+    client.get('/large', headers={'Accept-Encoding': 'gzip'})
+    assert client.application.compressor.stats["cache_hits"] == 1
+
+    plain = client.get('/large')
+    assert 'Content-Encoding' not in plain.headers
+    assert plain.headers['ETag'] == '"v1"'
+
+
+def test_small_and_image_responses_are_not_compressed(client):
+    assert 'Content-Encoding' not in client.get('/small', headers={'Accept-Encoding': 'gzip'}).headers
+    image = client.get('/image', headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in image.headers
+    assert 'Vary' not in image.headers
+
+
+def test_streamed_export_is_compressed_incrementally(client):
+    response = client.get('/export', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Content-Length' not in response.headers
+    text = gzip.decompress(response.data).decode('utf-8')
+    assert text.count('\n') == 2000
+    assert text.startswith('0,car,20\n')
+
+
+@pytest.mark.skipif(not response_compression.BROTLI_AVAILABLE, reason="brotli not installed")
+def test_brotli_preferred_when_available(client):
+    import brotli
+    response = client.get('/large', headers={'Accept-Encoding': 'gzip, br'})
+    assert response.headers['Content-Encoding'] == 'br'
+    assert json.loads(brotli.decompress(response.data)) == PAYLOAD
@@ -0,0 +1,43 @@
+"""Unit tests for Socket.IO async mode and message queue selection"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from socketio_deployment import resolve_async_mode, socketio_options
+
+
+def test_auto_is_threading_for_a_single_process(monkeypatch):
+    monkeypatch.setenv('SOCKETIO_ASYNC_MODE', 'auto')
+    monkeypatch.delenv('SOCKETIO_MESSAGE_QUEUE', raising=False)
+    monkeypatch.setattr(importlib.util, 'find_spec', lambda name: object())
+    assert resolve_async_mode() == 'threading'
+
+
+def test_auto_prefers_installed_cooperative_mode_for_workers(monkeypatch):
+    monkeypatch.setenv('SOCKETIO_ASYNC_MODE', 'auto')
+    monkeypatch.setenv('SOCKETIO_MESSAGE_QUEUE', 'redis://redis:6379/0')
+    installed = [mode for mode in ('eventlet', 'gevent') if importlib.util.find_spec(mode)]
+    assert resolve_async_mode() == (installed[0] if installed else 'threading')
+
+
+def test_missing_mode_falls_back_to_threading(monkeypatch):
+    monkeypatch.setattr(importlib.util, 'find_spec', lambda name: None)
+    assert resolve_async_mode('eventlet') == 'threading'
+    assert resolve_async_mode('threading') == 'threading'
+    with pytest.raises(ValueError):
+        resolve_async_mode('asyncio')
+
+
+def test_message_queue_only_when_configured(monkeypatch):
+    monkeypatch.delenv('SOCKETIO_MESSAGE_QUEUE', raising=False)
+    assert socketio_options('threading') == {'async_mode': 'threading'}
+
+    monkeypatch.setenv('SOCKETIO_MESSAGE_QUEUE', 'redis://redis:6379/0')
+    assert socketio_options('eventlet') == {
+        'async_mode': 'eventlet', 'message_queue': 'redis://redis:6379/0', 'channel': 'flask-socketio'
+    }
@@ -0,0 +1,85 @@
+"""Unit tests for speed statistics aggregated in SQLite"""
+
+import sqlite3
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts" / "development"))
+
+from edge_api.data_access import SQLiteDataAccess
+from edge_api.sqlite_pool import close_all_pools
+from synthetic_traffic_db import create_synthetic_database
+
+START_TS = 1_700_000_000
+ROWS = 5000
+
+
+@pytest.fixture(scope="module")
+def db_path(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("speeds") / "traffic_data.db")
+    conn = create_synthetic_database(path, ROWS, start_ts=START_TS, span_seconds=86400)
+    # Approaching traffic is stored as negative speeds
+    conn.execute("UPDATE radar_detections SET speed_mph = -speed_mph WHERE detection_id % 7 = 0")
+    conn.commit()
+    conn.close()
+    yield path
+    close_all_pools()
+
+
+def _reference_statistics(db_path, start_ts, end_ts, limit_mph):
+    """The previous Python implementation: fetch every row, then sort and loop"""
+    conn = sqlite3.connect(db_path)
+    speeds = [abs(r[0]) for r in conn.execute(
+        "SELECT r.speed_mph FROM traffic_detections t JOIN radar_detections r ON t.id = r.detection_id "
+        "WHERE t.timestamp BETWEEN ? AND ?", (start_ts, end_ts))]
+    conn.close()
+
+    ordered = sorted(speeds)
+    distribution = {}
+    for s in speeds:
+        distribution[int(s // 10) * 10] = distribution.get(int(s // 10) * 10, 0) + 1
+    return {
+        'count': len(speeds),
+        'avg': sum(speeds) / len(speeds),
+        'min': min(speeds),
+        'max': max(speeds),
+        'violations': sum(1 for s in speeds if s > limit_mph),
+        'distribution': distribution,
+        'percentiles': {f"p{p}": ordered[int((p / 100) * (len(ordered) - 1))] for p in (25, 50, 75, 85, 95)}
+    }
+
+
+def test_sql_statistics_match_python_reference(db_path):
+    start, end = START_TS + 3600, START_TS + 7 * 3600
+    stats = SQLiteDataAccess(db_path).get_speed_statistics(
+        datetime.fromtimestamp(start), datetime.fromtimestamp(end), 25.0
+    )
+    expected = _reference_statistics(db_path, start, end, 25.0)
+
+    assert stats['count'] == expected['count'] > 0
+    assert stats['avg'] == pytest.approx(expected['avg'])
+    assert (stats['min'], stats['max'], stats['violations']) == (expected['min'], expected['max'], expected['violations'])
+    assert stats['distribution'] == expected['distribution']
+    assert stats['percentiles'] == expected['percentiles']
+
+
+def test_speed_range_filters_apply_to_absolute_speed(db_path):
+    stats = SQLiteDataAccess(db_path).get_speed_statistics(
+        datetime.fromtimestamp(START_TS), datetime.fromtimestamp(START_TS + 86400), 25.0,
+        min_speed=20, max_speed=30
+    )
+    assert stats['count'] > 0
+    assert 20 <= stats['min'] and stats['max'] <= 30
+    assert set(stats['distribution']) <= {20, 30}
+
+
+def test_empty_window_returns_zero_count(db_path):
+    stats = SQLiteDataAccess(db_path).get_speed_statistics(
+        datetime.fromtimestamp(START_TS - 7200), datetime.fromtimestamp(START_TS - 3600), 25.0
+    )
+    assert stats['count'] == 0
+    assert stats['percentiles'] == {} and stats['distribution'] == {}
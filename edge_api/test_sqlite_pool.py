@@ -0,0 +1,157 @@
+"""Unit tests for the bounded read-only SQLite pool"""
+
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlite_pool import SQLiteReadPool, get_sqlite_pool, close_all_pools
+
+
+@pytest.fixture
+def writer(tmp_path):
+    path = str(tmp_path / "traffic_data.db")
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE traffic_detections (id INTEGER PRIMARY KEY, timestamp REAL)")
+    conn.execute("INSERT INTO traffic_detections (timestamp) VALUES (1.0)")
+    yield path, conn
+    conn.close()
+    close_all_pools()
+
+
+def test_returned_connection_is_reused_by_other_threads(writer):
+    path, _ = writer
+    pool = SQLiteReadPool(path)
+
+    with pool.connection() as first:
+        pass
+
+    seen = []
+
+    def worker():
+        with pool.connection() as conn:
+            seen.append(conn)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    assert seen == [first]
+    assert pool.get_stats()["connections_opened"] == 1
+    assert pool.get_stats()["checkouts"] == 2
+
+
+def test_pool_never_opens_more_than_max_connections(writer):
+    path, _ = writer
+    pool = SQLiteReadPool(path, max_connections=2)
+    barrier = threading.Barrier(6)
+    errors = []
+
+    def request():
+        try:
+            barrier.wait()
+            for _ in range(20):
+                with pool.connection() as conn:
+                    conn.execute("SELECT COUNT(*) FROM traffic_detections").fetchone()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=request) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = pool.get_stats()
+    assert errors == []
+    assert stats["connections_opened"] == 2
+    assert stats["open_connections"] == stats["idle_connections"] == 2
+    assert stats["checkouts"] == 120
+
+
+def test_checkout_times_out_when_every_connection_is_in_use(writer):
+    path, _ = writer
+    pool = SQLiteReadPool(path, max_connections=1, timeout=0.05)
+
+    with pool.connection():
+        with pytest.raises(sqlite3.OperationalError):
+            with pool.connection():
+                pass
+
+    with pool.connection() as conn:
+        assert conn.execute("SELECT 1").fetchone()[0] == 1
+
+
+def test_pooled_connection_is_read_only_and_sees_new_writes(writer):
+    path, conn = writer
+    pool = SQLiteReadPool(path)
+
+    with pool.connection() as reader:
+        row = reader.execute("SELECT COUNT(*) AS n FROM traffic_detections").fetchone()
+        assert row["n"] == 1
+
+        with pytest.raises(sqlite3.OperationalError):
+            reader.execute("INSERT INTO traffic_detections (timestamp) VALUES (2.0)")
+
+    conn.execute("INSERT INTO traffic_detections (timestamp) VALUES (3.0)")
+    with pool.connection() as reader:
+        assert reader.execute("SELECT COUNT(*) FROM traffic_detections").fetchone()[0] == 2
+
+
+def test_iterate_holds_the_connection_until_the_stream_ends_or_closes(writer):
+    path, conn = writer
+    conn.execute("INSERT INTO traffic_detections (timestamp) VALUES (2.0)")
+    pool = SQLiteReadPool(path, max_connections=1)
+
+    def timestamps(reader):
+        for row in reader.execute("SELECT timestamp FROM traffic_detections ORDER BY id"):
+            yield row[0]
+
+    stream = pool.iterate(timestamps)
+    assert pool.get_stats()["idle_connections"] == 0
+    assert list(stream) == [1.0, 2.0]
+    assert pool.get_stats()["idle_connections"] == 1
+
+    abandoned = pool.iterate(timestamps)
+    assert next(abandoned) == 1.0
+    abandoned.close()
+    assert pool.get_stats()["idle_connections"] == 1
+
+    with pytest.raises(sqlite3.OperationalError):
+        pool.iterate(lambda reader: reader.execute("SELECT * FROM missing_table"))
+    assert pool.get_stats()["idle_connections"] == 1
+
+
+def test_close_all_closes_checked_out_connections_on_return(writer):
+    path, _ = writer
+    pool = SQLiteReadPool(path)
+
+    with pool.connection() as busy:
+        with pool.connection() as idle:
+            pass
+        pool.close_all()
+        assert pool.get_stats()["open_connections"] == 1
+        assert busy.execute("SELECT 1").fetchone()[0] == 1
+
+    for closed in (idle, busy):
+        with pytest.raises(sqlite3.ProgrammingError):
+            closed.execute("SELECT 1")
+    with pool.connection() as reopened:
+        assert reopened not in (idle, busy)
+    assert pool.get_stats()["open_connections"] == 1
+
+
+def test_registry_shares_pool_per_path(writer, tmp_path):
+    path, _ = writer
+    assert get_sqlite_pool(path) is get_sqlite_pool(path)
+
+    missing = get_sqlite_pool(str(tmp_path / "missing.db"))
+    with pytest.raises(sqlite3.OperationalError):
+        with missing.connection():
+            pass
+    assert missing.get_stats()["open_connections"] == 0
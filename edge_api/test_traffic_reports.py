@@ -0,0 +1,129 @@
+"""Unit tests for streamed violation CSVs and cached rendered reports"""
+
+import csv
+import io
+import sqlite3
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "edge_processing"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts" / "development"))
+
+from local_time import LocalTimeConverter
+from synthetic_traffic_db import create_synthetic_database
+from traffic_reports import (VIOLATION_COLUMNS, RenderedReportCache,
+                             iter_violations_csv, month_period)
+
+zoneinfo = pytest.importorskip("zoneinfo")
+CENTRAL = zoneinfo.ZoneInfo('America/Chicago')
+START_TS = 1_709_272_800  # 2024-03-01 00:00 Central
+ROWS = 6000
+
+
+@pytest.fixture(scope="module")
+def conn(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("reports") / "traffic_data.db")
+    create_synthetic_database(path, ROWS, start_ts=START_TS, span_seconds=31 * 86400).close()
+    connection = sqlite3.connect(path)
+    yield connection
+    connection.close()
+
+
+def test_violations_csv_streams_every_violation_without_a_cap(conn):
+    period = month_period('2024-03', CENTRAL)
+    pieces = list(iter_violations_csv(conn, period.start_ts, period.end_ts, CENTRAL, fetch_size=500))
+    rows = list(csv.reader(io.StringIO(b''.join(pieces).decode('utf-8'))))
+
+    expected = conn.execute(
+        "SELECT COUNT(*) FROM radar_detections rd JOIN traffic_detections td ON td.id = rd.detection_id "
+        "WHERE rd.speed_mph > 25 AND td.timestamp >= ? AND td.timestamp < ?",
+        (period.start_ts, period.end_ts)
+    ).fetchone()[0]
+    assert expected > 1000
+    assert rows[0] == VIOLATION_COLUMNS
+    assert len(rows) - 1 == expected
+    assert len(pieces) == 1 + -(-expected // 500)
+
+    stamps = [f"{r[0]} {r[1]}" for r in rows[1:]]
+    assert stamps == sorted(stamps, reverse=True)
+    assert all(r[0].startswith('2024-03') for r in rows[1:])
+    assert all(float(r[5]) == pytest.approx(float(r[3]) - 25, abs=0.11) for r in rows[1:])
+
+
+def test_violations_query_errors_raise_before_streaming(tmp_path):
+    empty = sqlite3.connect(str(tmp_path / "empty.db"))
+    with pytest.raises(sqlite3.OperationalError):
+        iter_violations_csv(empty, 0, 86400, CENTRAL)
+    empty.close()
+
+
+def test_local_times_match_zoneinfo_across_daylight_saving_changes():
+    converter = LocalTimeConverter(CENTRAL)
+    for transition in (1_710_057_600, 1_730_620_800):  # 2024-03-10 and 2024-11-03 08:00 UTC
+        timestamps = range(transition - 7200, transition + 7200, 397)
+        dates, times = converter.dates_and_times([timestamp + 0.25 for timestamp in timestamps])
+        for timestamp, day, clock in zip(timestamps, dates, times):
+            local = datetime.fromtimestamp(timestamp, tz=timezone.utc).astimezone(CENTRAL)
+            assert (day, clock) == (local.strftime('%Y-%m-%d'), local.strftime('%H:%M:%S'))
+
+
+def test_month_periods():
+    now = datetime(2024, 4, 15, 12, 0, tzinfo=CENTRAL)
+    march = month_period('2024-03', CENTRAL, now=now)
+    assert march.closed and march.label == 'March 2024'
+    assert march.end_ts - march.start_ts == 31 * 86400 - 3600  # spring forward
+
+    current = month_period(None, CENTRAL, now=now)
+    assert current.key == '2024-04' and not current.closed
+    assert current.end_ts == now.timestamp()
+
+    for bad in ('2024-05', 'March'):
+        with pytest.raises(ValueError):
+            month_period(bad, CENTRAL, now=now)
+
+
+def test_closed_periods_render_once_and_open_ones_per_data_version(tmp_path):
+    cache = RenderedReportCache(str(tmp_path))
+    now = datetime(2024, 4, 15, tzinfo=CENTRAL)
+    renders = []
+
+    def render():
+        renders.append(1)
+        return f"<html>render {len(renders)}</html>"
+
+    march = month_period('2024-03', CENTRAL, now=now)
+    first = cache.get('monthly_summary', march, {}, 'v1', render)
+    assert cache.get('monthly_summary', march, {}, 'v2', render) == first
+    assert len(renders) == 1
+
+    april = month_period(None, CENTRAL, now=now)
+    body, etag = cache.get('monthly_summary', april, {}, 'v1', render)
+    assert cache.get('monthly_summary', april, {}, 'v1', render) == (body, etag)
+    assert len(renders) == 2
+
+    new_body, new_etag = cache.get('monthly_summary', april, {}, 'v2', render)
+    assert new_body != body and new_etag != etag
+    assert len(renders) == 3
+    # Only the latest rendering of the open month is kept, next to the closed one
+    assert len(list(tmp_path.glob('monthly_summary-2024-04-*'))) == 1
+    assert len(list(tmp_path.glob('monthly_summary-2024-03-*'))) == 1
+    assert cache.get_stats()['hits'] == 2
+
+
+def test_failed_renders_are_not_cached(tmp_path):
+    cache = RenderedReportCache(str(tmp_path))
+    march = month_period('2024-03', CENTRAL, now=datetime(2024, 4, 15, tzinfo=CENTRAL))
+
+    def failing_render():
+        raise sqlite3.OperationalError("database is locked")
+
+    with pytest.raises(sqlite3.OperationalError):
+        cache.get('monthly_summary', march, {}, 'v1', failing_render)
+    assert list(tmp_path.iterdir()) == []
+
+    body, _ = cache.get('monthly_summary', march, {}, 'v1', lambda: "<html>ok</html>")
+    assert body == b"<html>ok</html>"
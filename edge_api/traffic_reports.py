@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Traffic Report Downloads
+Streamed violation CSVs and cached rendered monthly summaries
+
+The violations CSV is written straight from the database cursor, a few thousand rows at a
+time, so a month of violations never has to fit in memory and is no longer cut off at an
+arbitrary row count. Local (report timezone) dates and times are converted a fetch batch at
+a time with local_time.LocalTimeConverter instead of a ZoneInfo conversion per row.
+
+Rendered summary documents are cached on disk. A closed period (a past month) can no
+longer change, so it is rendered once and served from the cache from then on. The current
+period is keyed by the database's data version as well, so it is only re-rendered after new
+detections arrive; superseded renderings of the same period are removed.
+
+Environment:
+    REPORT_CACHE_DIR  rendered report directory (default /tmp/report_cache)
+"""
+
+import csv
+import hashlib
+import io
+import json
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta, tzinfo
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, NamedTuple, Optional, Tuple
+
+from local_time import LocalTimeConverter
+from traffic_rollups import DEFAULT_SPEED_LIMIT_MPH
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = '/tmp/report_cache'
+FETCH_SIZE = 2000
+
+VIOLATION_COLUMNS = ['Date', 'Time', 'Vehicle Type', 'Speed (MPH)', 'Speed Limit',
+                     'Violation Amount', 'Location', 'Confidence']
+
+VIOLATIONS_SQL = """
+    SELECT td.timestamp, cd.vehicle_types, rd.speed_mph, td.location_id, rd.confidence
+    FROM traffic_detections td
+    JOIN radar_detections rd ON td.id = rd.detection_id
+    LEFT JOIN camera_detections cd ON td.id = cd.detection_id
+    WHERE rd.speed_mph > ?
+    AND td.timestamp >= ? AND td.timestamp < ?
+    ORDER BY td.timestamp DESC
+"""
+
+
+class ReportPeriod(NamedTuple):
+    key: str         # e.g. '2024-03'
+    label: str       # e.g. 'March 2024'
+    start_ts: float
+    end_ts: float    # exclusive; 'now' for the current month
+    closed: bool     # True once the period has ended and its data can no longer change
+
+
+def month_period(month: Optional[str], tz: tzinfo, now: Optional[datetime] = None) -> ReportPeriod:
+    """Period for a 'YYYY-MM' month in the report timezone (default: the current month)
+
+    Raises:
+        ValueError: For a malformed or future month
+    """
+    now = now or datetime.now(tz)
+    if month:
+        start = datetime.strptime(month, '%Y-%m').replace(tzinfo=tz)
+    else:
+        start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    if start > now:
+        raise ValueError(f"Month {month} has not started yet")
+
+    next_month = (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    closed = next_month <= now
+    return ReportPeriod(
+        key=start.strftime('%Y-%m'),
+        label=start.strftime('%B %Y'),
+        start_ts=start.timestamp(),
+        end_ts=next_month.timestamp() if closed else now.timestamp(),
+        closed=closed
+    )
+
+
+def _vehicle_type(raw: Any, cache: Dict[Any, str]) -> str:
+    """First detected class from the camera's JSON vehicle_types column"""
+    if not raw:
+        return "Vehicle"
+    label = cache.get(raw)
+    if label is None:
+        try:
+            types = json.loads(raw) if isinstance(raw, str) else raw
+            label = types[0] if isinstance(types, list) and types else str(types)
+        except (ValueError, TypeError):
+            label = str(raw)
+        cache[raw] = label
+    return label
+
+
+def iter_violations_csv(conn: sqlite3.Connection, start_ts: float, end_ts: float, tz: tzinfo,
+                        speed_limit: float = DEFAULT_SPEED_LIMIT_MPH,
+                        fetch_size: int = FETCH_SIZE) -> Iterator[bytes]:
+    """CSV of speed violations in [start_ts, end_ts), newest first, streamed from the cursor
+
+    The query runs before the first chunk is produced, so its errors are raised here
+    rather than after a header-only response has started.
+    """
+    cursor = conn.execute(VIOLATIONS_SQL, (speed_limit, start_ts, end_ts))
+
+    def chunks():
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(VIOLATION_COLUMNS)
+        yield buffer.getvalue().encode('utf-8')
+
+        converter = LocalTimeConverter(tz)
+        vehicle_types: Dict[Any, str] = {}
+        limit_text = f"{speed_limit:g}"
+        try:
+            while True:
+                rows = cursor.fetchmany(fetch_size)
+                if not rows:
+                    break
+                buffer.seek(0)
+                buffer.truncate()
+                # One vectorized conversion per batch instead of one per row
+                days, clocks = converter.dates_and_times([row[0] for row in rows])
+                for (_, raw_types, speed_mph, location, confidence), day, clock in zip(rows, days, clocks):
+                    writer.writerow((
+                        day, clock,
+                        _vehicle_type(raw_types, vehicle_types),
+                        f"{speed_mph:.1f}",
+                        limit_text,
+                        f"{speed_mph - speed_limit:.1f}",
+                        location or "Main Street",
+                        f"{confidence * 100:.1f}%" if confidence else "N/A"
+                    ))
+                yield buffer.getvalue().encode('utf-8')
+        finally:
+            cursor.close()
+
+    return chunks()
+
+
+class RenderedReportCache:
+    """Rendered report documents on disk, keyed by report, period, parameters and data version"""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = Path(cache_dir or os.environ.get('REPORT_CACHE_DIR', DEFAULT_CACHE_DIR))
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "renders": 0}
+
+    def get(self, report: str, period: ReportPeriod, params: Dict[str, Any],
+            version: Optional[str], render: Callable[[], str]) -> Tuple[bytes, str]:
+        """(document bytes, ETag), rendering only when no cached copy matches
+
+        Args:
+            version: Data version for an open period; None when it cannot be determined,
+                in which case an open period is always rendered fresh
+            render: Returns the document; exceptions propagate and nothing is cached
+        """
+        if not period.closed and version is None:
+            with self._lock:
+                self.stats["renders"] += 1
+            body = render().encode('utf-8')
+            return body, hashlib.sha1(body).hexdigest()[:20]
+
+        params_digest = hashlib.sha1(json.dumps(params, sort_keys=True, default=str).encode('utf-8')).hexdigest()[:10]
+        digest = f"{params_digest}-{'final' if period.closed else hashlib.sha1(version.encode('utf-8')).hexdigest()[:10]}"
+        prefix = f"{report}-{period.key}-{params_digest}-"
+        path = self.cache_dir / f"{report}-{period.key}-{digest}.html"
+
+        try:
+            body = path.read_bytes()
+            with self._lock:
+                self.stats["hits"] += 1
+            return body, f"{report}-{period.key}-{digest}"
+        except FileNotFoundError:
+            pass
+
+        body = render().encode('utf-8')
+        with self._lock:
+            self.stats["renders"] += 1
+        temp_path = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+        try:
+            temp_path.write_bytes(body)
+            os.replace(temp_path, path)
+            if not period.closed:
+                # Earlier renderings of this still-open period are superseded
+                for stale in self.cache_dir.glob(f"{prefix}*.html"):
+                    if stale != path:
+                        stale.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Could not cache rendered report {path.name}: {e}")
+            temp_path.unlink(missing_ok=True)
+        return body, f"{report}-{period.key}-{digest}"
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self.stats, cache_dir=str(self.cache_dir))
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+WSGI Entry Point for the Enhanced API Gateway
+Serves the gateway from a production WSGI server instead of the development server
+
+    cd edge_api
+    gunicorn --worker-class eventlet --workers 1 --bind 0.0.0.0:5000 wsgi:app
+
+Run one gunicorn worker per process: gunicorn's load balancing is not sticky, which the
+Socket.IO polling transport requires. Scale out by starting more processes on their own
+ports behind nginx (ip_hash) with SOCKETIO_MESSAGE_QUEUE set, as docker-compose.workers.yml
+does. The worker class should match SOCKETIO_ASYNC_MODE (see socketio_deployment).
+"""
+
+import os
+
+from socketio_deployment import resolve_async_mode, monkey_patch
+
+monkey_patch(resolve_async_mode())
+
+from edge_api_gateway_enhanced import EnhancedSwaggerAPIGateway  # noqa: E402
+
+gateway = EnhancedSwaggerAPIGateway(
+    host=os.environ.get('API_HOST', '0.0.0.0'),
+    port=int(os.environ.get('API_PORT', 5000))
+)
+gateway.is_running = True
+app = gateway.app
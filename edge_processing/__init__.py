@@ -1,39 +1,44 @@
 """
 Edge Processing Package
 Core edge processing services for the Raspberry Pi 5 Traffic Monitoring System
+
+The service classes below are loaded on first access (PEP 562), not when the package is
+imported. Most services only need `edge_processing.shared_logging` or another small
+module, and importing the package used to pull in OpenCV and TensorFlow for all of them.
 """
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "Traffic Monitoring Team"
 
-# Import main services with conditional imports to handle missing dependencies
-try:
-    from .vehicle_detection.vehicle_detection_service import VehicleDetectionService
-except ImportError:
-    VehicleDetectionService = None
-
-# Optional imports - fail gracefully if dependencies missing
-try:
-    from .speed_analysis.speed_analysis_service import SpeedAnalysisService, OPS243CRadar
-except ImportError:
-    SpeedAnalysisService = None
-    OPS243CRadar = None
-
-try:
-    from .data_fusion.data_fusion_engine import DataFusionEngine
-except ImportError:
-    DataFusionEngine = None
-
-try:
-    from .system_health.system_health_monitor import SystemHealthMonitor
-except ImportError:
-    SystemHealthMonitor = None
+# Exported name -> (module, attribute); resolved lazily by __getattr__
+_LAZY_EXPORTS = {
+    'VehicleDetectionService': ('.vehicle_detection.vehicle_detection_service', 'VehicleDetectionService'),
+    'SpeedAnalysisService': ('.speed_analysis.speed_analysis_service', 'SpeedAnalysisService'),
+    'OPS243CRadar': ('.speed_analysis.speed_analysis_service', 'OPS243CRadar'),
+    'DataFusionEngine': ('.data_fusion.data_fusion_engine', 'DataFusionEngine'),
+    'SystemHealthMonitor': ('.system_health.system_health_monitor', 'SystemHealthMonitor'),
+}
 
 # Define available exports
-__all__ = [
-    'VehicleDetectionService',
-    'SpeedAnalysisService', 
-    'OPS243CRadar',
-    'DataFusionEngine',
-    'SystemHealthMonitor'
-]
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    target = _LAZY_EXPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, attribute = target
+    # Optional services resolve to None when their dependencies are missing
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), attribute)
+    except ImportError:
+        value = None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -40,6 +40,12 @@ import sys
 current_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(current_dir))
 from shared_logging import ServiceLogger, CorrelationContext
+from service_metrics import MetricsRegistry, RedisMetricsPublisher, observe_stream_lag
+import serialization
+from traffic_rollups import (
+    RollupBatch, ensure_rollup_schema, seed_row_counts, backfill_hourly_rollups, backfill_speed_histogram,
+    backfill_speed_sketches, read_row_counts, count_detections_since
+)
 
 # Redis for consuming consolidated data with logging
 try:
@@ -72,7 +78,7 @@ class TrafficDetection:
             'timestamp': self.timestamp,
             'trigger_source': self.trigger_source,
             'location_id': self.location_id,
-            'processing_metadata': json.dumps(self.processing_metadata) if self.processing_metadata else None
+            'processing_metadata': serialization.dumps(self.processing_metadata) if self.processing_metadata else None
         }
 
 @dataclass  
@@ -115,10 +121,10 @@ class CameraDetection:
         return {
             'detection_id': self.detection_id,
             'vehicle_count': self.vehicle_count,
-            'vehicle_types': json.dumps(self.vehicle_types) if self.vehicle_types else None,
+            'vehicle_types': serialization.dumps(self.vehicle_types) if self.vehicle_types else None,
             'detection_confidence': self.detection_confidence,
             'image_path': self.image_path,
-            'roi_data': json.dumps(self.roi_data) if self.roi_data else None,
+            'roi_data': serialization.dumps(self.roi_data) if self.roi_data else None,
             'inference_time_ms': self.inference_time_ms,
             'camera_source': self.camera_source
         }
@@ -149,7 +155,7 @@ class WeatherCondition:
             'wind_direction': self.wind_direction,
             'pressure': self.pressure,
             'visibility': self.visibility,
-            'raw_data': json.dumps(self.raw_data) if self.raw_data else None
+            'raw_data': serialization.dumps(self.raw_data) if self.raw_data else None
         }
 
 # Legacy TrafficRecord for backwards compatibility during migration
@@ -184,7 +190,8 @@ class SimplifiedEnhancedDatabasePersistenceService:
                  redis_port: int = 6379,
                  batch_size: int = 100,
                  commit_interval_seconds: int = 30,
-                 retention_days: int = 90):
+                 retention_days: int = 90,
+                 speed_limit_mph: float = 25.0):
         
         self.database_path = Path(database_path)
         self.redis_host = redis_host
@@ -192,6 +199,7 @@ class SimplifiedEnhancedDatabasePersistenceService:
         self.batch_size = batch_size
         self.commit_interval_seconds = commit_interval_seconds
         self.retention_days = retention_days
+        self.speed_limit_mph = speed_limit_mph
         
         # Service state
         self.running = False
@@ -217,7 +225,8 @@ class SimplifiedEnhancedDatabasePersistenceService:
             "startup_time": None,
             "database_size_mb": 0.0,
             "total_records": 0,
-            "avg_processing_time_ms": 0.0
+            "avg_processing_time_ms": 0.0,
+            "duplicates_skipped": 0
         }
         
         # Processing queues and batching
@@ -226,6 +235,21 @@ class SimplifiedEnhancedDatabasePersistenceService:
         self.last_commit_time = time.time()
         self.processing_times = []
         
+        # Metrics (published to Redis for the gateway's /metrics)
+        self.metrics = MetricsRegistry("database-persistence")
+        self.batch_commit_seconds = self.metrics.histogram(
+            "persistence_batch_commit_seconds", "Time to commit one batch to SQLite", ("schema",))
+        self.batch_commit_failures = self.metrics.counter(
+            "persistence_batch_commit_failures", "Batch commits rolled back", ("schema",))
+        self.records_stored_total = self.metrics.counter(
+            "persistence_records_stored", "Records committed to SQLite")
+        self.stream_lag_seconds = self.metrics.histogram(
+            "persistence_stream_lag_seconds", "Age of consolidated stream entries when read")
+        self.metrics.gauge(
+            "persistence_pending_records", "Records waiting for the next batch commit"
+        ).set_function(lambda: len(self.normalized_batch) + len(self.record_batch))
+        self.metrics_publisher = None
+        
         logger.info("Simplified Enhanced Database Persistence Service initialized", extra={
             "business_event": "service_initialization",
             "database_path": str(self.database_path),
@@ -342,6 +366,8 @@ class SimplifiedEnhancedDatabasePersistenceService:
                         consolidation_id TEXT PRIMARY KEY,
                         event_json TEXT NOT NULL,
                         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        event_seq INTEGER, -- Monotonic insert sequence for cursor-based API polling
+                        api_json TEXT, -- Serialized API record, served by the gateway without re-encoding
                         FOREIGN KEY (consolidation_id) REFERENCES traffic_detections(consolidation_id) ON DELETE CASCADE
                     )
                 """)
@@ -378,6 +404,17 @@ class SimplifiedEnhancedDatabasePersistenceService:
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_consolidated_created_at ON consolidated_events(created_at)")
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_consolidated_id_time ON consolidated_events(consolidation_id, created_at)")
                 
+                # Databases created before event_seq existed: add it and number rows in insert order
+                consolidated_columns = {row[1] for row in cursor.execute("PRAGMA table_info(consolidated_events)")}
+                if 'event_seq' not in consolidated_columns:
+                    cursor.execute("ALTER TABLE consolidated_events ADD COLUMN event_seq INTEGER")
+                    cursor.execute("UPDATE consolidated_events SET event_seq = rowid")
+                cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_consolidated_event_seq ON consolidated_events(event_seq)")
+                
+                # Existing rows keep a NULL api_json; the gateway re-encodes those from event_json
+                if 'api_json' not in consolidated_columns:
+                    cursor.execute("ALTER TABLE consolidated_events ADD COLUMN api_json TEXT")
+                
                 # Daily summaries table for reporting
                 cursor.execute("""
                     CREATE TABLE IF NOT EXISTS daily_summaries (
@@ -452,6 +489,19 @@ class SimplifiedEnhancedDatabasePersistenceService:
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_weather_traffic_events_weather_id ON weather_traffic_events(weather_id)")
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_weather_summaries_period ON weather_summaries(period_start, period_type)")
                 
+                # Incremental row counters and hourly rollups (replace periodic COUNT(*) scans)
+                ensure_rollup_schema(cursor)
+                seed_row_counts(cursor)
+                backfilled_buckets = backfill_hourly_rollups(cursor, self.speed_limit_mph)
+                if backfilled_buckets:
+                    logger.info("Hourly rollups backfilled from existing detections", extra={
+                        "business_event": "rollup_backfill_completed",
+                        "correlation_id": correlation_id,
+                        "bucket_count": backfilled_buckets
+                    })
+                backfill_speed_histogram(cursor)
+                backfill_speed_sketches(cursor)
+                
                 self.db_connection.commit()
                 cursor.close()
                 
@@ -586,8 +636,8 @@ class SimplifiedEnhancedDatabasePersistenceService:
                 # ============================================================
                 
                 # Store original consolidated JSON for API efficiency
-                original_json = json.dumps(record_data, ensure_ascii=False)
-                self._store_consolidated_json(record_id, original_json)
+                original_json = serialization.dumps(record_data)
+                self._store_consolidated_json(record_id, original_json, record_data)
                 
                 # ============================================================ 
                 # CREATE NORMALIZED ENTITIES
@@ -623,7 +673,7 @@ class SimplifiedEnhancedDatabasePersistenceService:
                     vehicle_types = camera_data.get('vehicle_types')
                     if isinstance(vehicle_types, str):
                         try:
-                            vehicle_types = json.loads(vehicle_types)
+                            vehicle_types = serialization.loads(vehicle_types)
                         except:
                             vehicle_types = [vehicle_types] if vehicle_types else None
                     
@@ -771,6 +821,8 @@ class SimplifiedEnhancedDatabasePersistenceService:
                 self.stats["records_stored"] += batch_size
                 self.last_commit_time = time.time()
                 self.stats["last_record_time"] = datetime.now().isoformat()
+                self.batch_commit_seconds.labels("legacy").observe(commit_time_ms / 1000)
+                self.records_stored_total.inc(batch_size)
                 
                 # Track processing times
                 self.processing_times.append(commit_time_ms)
@@ -799,6 +851,7 @@ class SimplifiedEnhancedDatabasePersistenceService:
                 "error": str(e)
             })
             self.stats["database_errors"] += 1
+            self.batch_commit_failures.labels("legacy").inc()
             # Don't clear batch on error - will retry
             return False
     
@@ -820,6 +873,8 @@ class SimplifiedEnhancedDatabasePersistenceService:
                 cursor.execute("BEGIN")
                 
                 weather_id_cache = {}  # Cache weather IDs to avoid duplicates
+                rollup = RollupBatch(self.speed_limit_mph)  # Row counters and hourly aggregates for this batch
+                duplicates = 0  # Redelivered detections already stored
                 
                 for record in self.normalized_batch:
                     traffic_detection = record['traffic_detection']
@@ -840,22 +895,34 @@ class SimplifiedEnhancedDatabasePersistenceService:
                     }
                     print(f"DEBUG TRAFFIC DETECTION DATA TYPES: {debug_data}")
                     
-                    # Insert traffic detection with auto-increment id and separate consolidation_id
+                    # Insert traffic detection with auto-increment id and separate consolidation_id;
+                    # a redelivered consolidation_id is left as stored
                     cursor.execute("""
-                        INSERT OR REPLACE INTO traffic_detections 
+                        INSERT INTO traffic_detections 
                         (consolidation_id, correlation_id, timestamp, trigger_source, location_id, processing_metadata)
                         VALUES (?, ?, ?, ?, ?, ?)
+                        ON CONFLICT(consolidation_id) DO NOTHING
                     """, (
                         str(traffic_detection.id),  # This is actually the consolidation_id
                         str(traffic_detection.correlation_id),
                         float(traffic_detection.timestamp) if traffic_detection.timestamp else None,
                         str(traffic_detection.trigger_source),
                         str(traffic_detection.location_id) if traffic_detection.location_id else 'default',
-                        json.dumps(traffic_detection.processing_metadata) if traffic_detection.processing_metadata else None
+                        serialization.dumps(traffic_detection.processing_metadata) if traffic_detection.processing_metadata else None
                     ))
                     
+                    # Already stored: its rows, counters and rollups were written the first time
+                    if cursor.rowcount == 0:
+                        duplicates += 1
+                        continue
+                    
                     # Get the auto-generated database ID for foreign key relationships
                     db_detection_id = cursor.lastrowid
+                    rollup.count_rows('traffic_detections')
+                    rollup.add_detection(
+                        traffic_detection.timestamp,
+                        radar_detection.speed_mph if radar_detection else None
+                    )
                     
                     # 2. Insert radar detection (if present)
                     if radar_detection:
@@ -873,6 +940,7 @@ class SimplifiedEnhancedDatabasePersistenceService:
                             radar_detection.distance,
                             radar_detection.detection_source_id
                         ))
+                        rollup.count_rows('radar_detections')
                     
                     # 3. Insert camera detection (if present)
                     if camera_detection:
@@ -884,15 +952,16 @@ class SimplifiedEnhancedDatabasePersistenceService:
                         """, (
                             db_detection_id,  # Use the auto-generated database ID
                             camera_detection.vehicle_count,
-                            json.dumps(camera_detection.vehicle_types) if camera_detection.vehicle_types else None,
+                            serialization.dumps(camera_detection.vehicle_types) if camera_detection.vehicle_types else None,
                             camera_detection.detection_confidence,
                             camera_detection.inference_time_ms if hasattr(camera_detection, 'inference_time_ms') else None,
-                            json.dumps({
+                            serialization.dumps({
                                 'image_path': getattr(camera_detection, 'image_path', None),
                                 'roi_data': getattr(camera_detection, 'roi_data', None),
                                 'camera_source': getattr(camera_detection, 'camera_source', None)
                             })
                         ))
+                        rollup.count_rows('camera_detections')
                     
                     # 4. Insert weather conditions (time-bucketed to reduce redundancy)
                     for weather_condition in weather_conditions:
@@ -926,6 +995,7 @@ class SimplifiedEnhancedDatabasePersistenceService:
                                     weather_condition.weather_source if hasattr(weather_condition, 'weather_source') else 'dht22'
                                 ))
                                 weather_id_cache[cache_key] = cursor.lastrowid
+                                rollup.count_rows('weather_conditions')
                         
                         # 5. Create traffic-weather correlation
                         cursor.execute("""
@@ -938,15 +1008,21 @@ class SimplifiedEnhancedDatabasePersistenceService:
                             1.0  # Full correlation for concurrent readings
                         ))
                 
+                # Update row counters and rollups in the same transaction
+                rollup.apply(cursor)
+                
                 # Commit transaction
                 cursor.execute("COMMIT")
                 cursor.close()
                 
                 # Update statistics
                 commit_time_ms = (time.time() - start_time) * 1000
-                self.stats["records_stored"] += batch_size
+                self.stats["records_stored"] += batch_size - duplicates
+                self.stats["duplicates_skipped"] += duplicates
                 self.last_commit_time = time.time()
                 self.stats["last_record_time"] = datetime.now().isoformat()
+                self.batch_commit_seconds.labels("normalized").observe(commit_time_ms / 1000)
+                self.records_stored_total.inc(batch_size - duplicates)
                 
                 # Track processing times
                 self.processing_times.append(commit_time_ms)
@@ -958,6 +1034,7 @@ class SimplifiedEnhancedDatabasePersistenceService:
                     "business_event": "normalized_batch_commit_success",
                     "correlation_id": correlation_id,
                     "batch_size": batch_size,
+                    "duplicates_skipped": duplicates,
                     "commit_time_ms": round(commit_time_ms, 2),
                     "total_records_stored": self.stats["records_stored"],
                     "weather_buckets_cached": len(weather_id_cache),
@@ -994,21 +1071,34 @@ class SimplifiedEnhancedDatabasePersistenceService:
             print(f"Full traceback: {traceback.format_exc()}")
             print(f"Batch size: {batch_size}, Correlation ID: {correlation_id}")
             self.stats["database_errors"] += 1
+            self.batch_commit_failures.labels("normalized").inc()
             # Don't clear batch on error - will retry
             return False
     
-    def _store_consolidated_json(self, consolidation_id: str, event_json: str):
-        """Store original consolidated JSON for API efficiency"""
+    def _store_consolidated_json(self, consolidation_id: str, event_json: str,
+                                 record_data: Optional[Dict[str, Any]] = None):
+        """Store original consolidated JSON for API efficiency
+        
+        With record_data, also stores the record exactly as /api/vehicles/consolidated
+        serves it (consolidation_id and created_at merged with the event), so the gateway
+        can splice it into responses without parsing and re-encoding the event.
+        """
         try:
+            # Same format as SQLite's CURRENT_TIMESTAMP (UTC), known here so api_json can include it
+            created_at = time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime())
+            api_json = None
+            if record_data is not None:
+                api_json = serialization.dumps({"consolidation_id": consolidation_id, "created_at": created_at, **record_data})
+            
             # Use the connection's autocommit behavior (isolation_level=None)
             # This executes immediately without explicit transaction management
             cursor = self.db_connection.cursor()
             
             cursor.execute("""
                 INSERT OR REPLACE INTO consolidated_events 
-                (consolidation_id, event_json)
-                VALUES (?, ?)
-            """, (consolidation_id, event_json))
+                (consolidation_id, event_json, created_at, api_json, event_seq)
+                VALUES (?, ?, ?, ?, (SELECT COALESCE(MAX(event_seq), 0) + 1 FROM consolidated_events))
+            """, (consolidation_id, event_json, created_at, api_json))
             
             cursor.close()
             
@@ -1035,35 +1125,22 @@ class SimplifiedEnhancedDatabasePersistenceService:
             has_normalized_schema = cursor.fetchone() is not None
             
             if has_normalized_schema:
-                # Get normalized schema stats
-                cursor.execute("SELECT COUNT(*) FROM traffic_detections")
-                total_detections = cursor.fetchone()[0] or 0
-                
-                cursor.execute("SELECT COUNT(*) FROM radar_detections")
-                total_radar = cursor.fetchone()[0] or 0
-                
-                cursor.execute("SELECT COUNT(*) FROM camera_detections")
-                total_camera = cursor.fetchone()[0] or 0
-                
-                cursor.execute("SELECT COUNT(*) FROM weather_conditions")
-                total_weather = cursor.fetchone()[0] or 0
+                # O(1) stats: incremental row counters plus hourly rollups (no COUNT(*) scans)
+                row_counts = read_row_counts(self.db_connection)
+                total_detections = row_counts.get('traffic_detections', 0)
                 
                 # Get recent activity (last 24 hours)
-                current_time = time.time()
-                yesterday = current_time - (24 * 60 * 60)
-                cursor.execute("""
-                    SELECT COUNT(*) FROM traffic_detections 
-                    WHERE timestamp > ?
-                """, (yesterday,))
-                recent_records = cursor.fetchone()[0] or 0
+                yesterday = time.time() - (24 * 60 * 60)
+                recent_records = count_detections_since(self.db_connection, yesterday)
                 
                 stats = {
                     "total_detections": total_detections,
                     "total_records": total_detections,  # Add this for backward compatibility
-                    "total_radar_records": total_radar,
-                    "total_camera_records": total_camera,
-                    "total_weather_records": total_weather,
+                    "total_radar_records": row_counts.get('radar_detections', 0),
+                    "total_camera_records": row_counts.get('camera_detections', 0),
+                    "total_weather_records": row_counts.get('weather_conditions', 0),
                     "recent_24h_records": recent_records,
+                    "counts_approximate": True,
                     "schema_type": "3NF_normalized"
                 }
                 self.stats["total_records"] = total_detections
@@ -1133,6 +1210,9 @@ class SimplifiedEnhancedDatabasePersistenceService:
                 logger.error("Cannot start without Redis connection")
                 return False
             
+            self.metrics_publisher = RedisMetricsPublisher(self.metrics, self.redis_client)
+            self.metrics_publisher.start()
+            
             self.running = True
             self.stats["startup_time"] = time.time()
             
@@ -1187,10 +1267,11 @@ class SimplifiedEnhancedDatabasePersistenceService:
                     
                     for stream_name, stream_messages in messages:
                         for message_id, fields in stream_messages:
+                            observe_stream_lag(self.stream_lag_seconds, message_id)
                             try:
                                 # Parse consolidated data from stream
                                 consolidated_data_str = fields.get('data', '{}')
-                                consolidated_data = json.loads(consolidated_data_str)
+                                consolidated_data = serialization.loads(consolidated_data_str)
                                 
                                 # Extract correlation_id for tracking
                                 correlation_id = fields.get('correlation_id') or consolidated_data.get('correlation_id')
@@ -1357,6 +1438,9 @@ class SimplifiedEnhancedDatabasePersistenceService:
         if self.record_batch:
             self._commit_batch()
         
+        if self.metrics_publisher:
+            self.metrics_publisher.stop()
+        
         # Close connections
         if self.pubsub:
             self.pubsub.close()
@@ -1380,7 +1464,8 @@ def main():
             redis_port=int(os.environ.get('REDIS_PORT', 6379)),
             batch_size=int(os.environ.get('BATCH_SIZE', 100)),
             commit_interval_seconds=int(os.environ.get('COMMIT_INTERVAL_SEC', 30)),
-            retention_days=int(os.environ.get('RETENTION_DAYS', 90))
+            retention_days=int(os.environ.get('RETENTION_DAYS', 90)),
+            speed_limit_mph=float(os.environ.get('SPEED_LIMIT', 25.0))
         )
         
         # Start service
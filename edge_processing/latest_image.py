@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Latest Capture Pointer
+Constant-time lookup of the newest camera image on the shared volume
+
+Capture writers repoint a `latest` symlink in the live directory at each new image once
+it is fully written (a temporary link renamed over the old one, so readers never see a
+missing or half-updated pointer) and record the filename in Redis under
+LATEST_IMAGE_KEY. Readers resolve the symlink with a single readlink, fall back to the
+Redis record, and only scan the directory when neither is available, e.g. before the
+writer has been upgraded. The pointer holds a bare filename so it resolves the same way
+on the host (/mnt/storage/camera_capture) and inside containers (/app/camera_capture).
+
+The host capture scripts are deployed standalone, so they carry their own copy of
+publish_latest_image; keep the two in step.
+"""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+LATEST_LINK = 'latest'
+LATEST_IMAGE_KEY = 'camera:latest_image'
+IMAGE_SUFFIXES = ('.jpg', '.jpeg', '.png')
+
+
+def publish_latest_image(live_dir: Union[str, Path], image_path: Union[str, Path],
+                         redis_client=None, capture_time: Optional[float] = None):
+    """Atomically point live_dir/latest at a fully written image and record it in Redis"""
+    live_dir, image_path = Path(live_dir), Path(image_path)
+    temp_link = live_dir / f".{LATEST_LINK}.{os.getpid()}.tmp"
+    try:
+        temp_link.unlink(missing_ok=True)
+        os.symlink(image_path.name, temp_link)
+        os.replace(temp_link, live_dir / LATEST_LINK)
+    except OSError as e:
+        logger.warning(f"Could not update latest image link in {live_dir}: {e}")
+
+    if redis_client is not None:
+        try:
+            redis_client.set(LATEST_IMAGE_KEY, json.dumps({
+                'filename': image_path.name,
+                'capture_time': capture_time if capture_time is not None else time.time()
+            }))
+        except Exception as e:
+            logger.warning(f"Could not publish latest image to Redis: {e}")
+
+
+def _existing(live_dir: Path, filename: Optional[str]) -> Optional[Path]:
+    if not filename or '/' in filename or filename.startswith('.'):
+        return None
+    path = live_dir / filename
+    return path if path.is_file() else None
+
+
+def resolve_latest_image(live_dir: Union[str, Path], redis_client=None,
+                         suffixes: Iterable[str] = IMAGE_SUFFIXES) -> Optional[Path]:
+    """Newest image in live_dir: the `latest` link, then Redis, then a directory scan"""
+    live_dir = Path(live_dir)
+
+    try:
+        latest = _existing(live_dir, os.readlink(live_dir / LATEST_LINK))
+        if latest:
+            return latest
+    except OSError:
+        pass
+
+    if redis_client is not None:
+        try:
+            record = redis_client.get(LATEST_IMAGE_KEY)
+            latest = _existing(live_dir, json.loads(record)['filename']) if record else None
+            if latest:
+                return latest
+        except Exception as e:
+            logger.debug(f"Latest image lookup in Redis failed: {e}")
+
+    return newest_image_by_scan(live_dir, suffixes)
+
+
+def newest_image_by_scan(live_dir: Union[str, Path],
+                         suffixes: Iterable[str] = IMAGE_SUFFIXES) -> Optional[Path]:
+    """Fallback for directories without a pointer: one scandir pass, newest mtime wins"""
+    suffixes = tuple(s.lower() for s in suffixes)
+    newest, newest_mtime = None, -1.0
+    try:
+        with os.scandir(live_dir) as entries:
+            for entry in entries:
+                if not entry.name.lower().endswith(suffixes) or entry.name.startswith('.'):
+                    continue
+                try:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    mtime = entry.stat(follow_symlinks=False).st_mtime
+                except OSError:
+                    continue  # removed by cleanup while scanning
+                if mtime > newest_mtime:
+                    newest, newest_mtime = entry.path, mtime
+    except FileNotFoundError:
+        return None
+    return Path(newest) if newest else None
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Batch Local Time Conversion
+Epoch timestamps to report-timezone (Central by default) ISO strings, dates and times
+
+Converting record by record builds timezone-aware datetimes and asks the zone for its
+offset every time. Within a DST segment the UTC offset is constant, so LocalTimeConverter
+finds the segments covering the requested range once (the zone is probed a day at a time
+and transitions are located to the second by bisection) and then only adds an offset per
+timestamp. With NumPy the offset lookup (searchsorted) and formatting (datetime_as_string)
+run over the whole batch; without it a plain Python loop does the same arithmetic.
+
+Results are identical to `datetime.fromtimestamp(ts, tz).isoformat()` including across
+DST transitions: microseconds are rounded the way datetime.fromtimestamp rounds them
+(half-even on the fractional part) and omitted when zero.
+"""
+
+import threading
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import List, Sequence, Tuple
+
+# NumPy is optional for the lightweight API image
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+DAY_SECONDS = 86400
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _offset_suffix(offset: int) -> str:
+    """'+HH:MM' (or '+HH:MM:SS') as datetime.isoformat() writes it"""
+    return datetime(2000, 1, 1, tzinfo=timezone(timedelta(seconds=offset))).isoformat()[19:]
+
+
+class LocalTimeConverter:
+    """Converts batches of epoch seconds to local wall-clock time in one timezone"""
+
+    def __init__(self, tz: tzinfo):
+        self.tz = tz
+        self._lock = threading.Lock()
+        # Segment i covers [transitions[i-1], transitions[i]) with offsets[i]
+        self._transitions: List[int] = []
+        self._offsets: List[int] = []
+        self._covered: Tuple[int, int] = (0, 0)
+
+    def _offset_at(self, timestamp: int) -> int:
+        return int(datetime.fromtimestamp(timestamp, timezone.utc).astimezone(self.tz).utcoffset().total_seconds())
+
+    def _segments(self, start_ts: float, end_ts: float) -> Tuple[List[int], List[int]]:
+        """(transitions, offsets) covering [start_ts, end_ts], computed once per range"""
+        start = int(start_ts // DAY_SECONDS) * DAY_SECONDS
+        end = (int(end_ts // DAY_SECONDS) + 1) * DAY_SECONDS
+        with self._lock:
+            covered_start, covered_end = self._covered
+            if self._offsets and covered_start <= start and end <= covered_end:
+                return self._transitions, self._offsets
+            if self._offsets:
+                start, end = min(start, covered_start), max(end, covered_end)
+
+            transitions: List[int] = []
+            offsets = [self._offset_at(start)]
+            day = start
+            while day < end:
+                next_day = day + DAY_SECONDS
+                offset = self._offset_at(next_day)
+                if offset != offsets[-1]:
+                    # Bisect to the first second with the new offset
+                    low, high = day, next_day
+                    while high - low > 1:
+                        middle = (low + high) // 2
+                        if self._offset_at(middle) == offsets[-1]:
+                            low = middle
+                        else:
+                            high = middle
+                    transitions.append(high)
+                    offsets.append(offset)
+                day = next_day
+
+            self._transitions, self._offsets, self._covered = transitions, offsets, (start, end)
+            return transitions, offsets
+
+    def isoformat(self, timestamps: Sequence[float]) -> List[str]:
+        """ISO 8601 local time with UTC offset for each epoch timestamp"""
+        if len(timestamps) == 0:
+            return []
+        if NUMPY_AVAILABLE and len(timestamps) >= 64:
+            return self._isoformat_numpy(timestamps)
+        return self.isoformat_reference(timestamps)
+
+    def isoformat_reference(self, timestamps: Sequence[float]) -> List[str]:
+        """Plain Python version of isoformat()"""
+        transitions, offsets = self._segments(min(timestamps), max(timestamps))
+        deltas = [timedelta(seconds=offset) for offset in offsets]
+        suffixes = [_offset_suffix(offset) for offset in offsets]
+        results = []
+        for timestamp in timestamps:
+            segment = bisect_right(transitions, timestamp)
+            results.append((_EPOCH + timedelta(seconds=timestamp) + deltas[segment]).isoformat() + suffixes[segment])
+        return results
+
+    def _local_microseconds(self, timestamps: Sequence[float]):
+        values = np.asarray(timestamps, dtype=np.float64)
+        transitions, offsets = self._segments(float(values.min()), float(values.max()))
+        segments = np.searchsorted(np.asarray(transitions, dtype=np.float64), values, side='right')
+        # Split off whole seconds first so microseconds round exactly like datetime.fromtimestamp
+        seconds = np.floor(values)
+        micros = np.round((values - seconds) * 1e6).astype(np.int64)
+        local = (seconds.astype(np.int64) + np.asarray(offsets, dtype=np.int64)[segments]) * 1_000_000 + micros
+        return local, segments, offsets
+
+    def _isoformat_numpy(self, timestamps: Sequence[float]) -> List[str]:
+        local, segments, offsets = self._local_microseconds(timestamps)
+        texts = np.datetime_as_string(local.astype('datetime64[us]'), unit='us').tolist()
+        suffixes = [_offset_suffix(offset) for offset in offsets]
+        whole = (local % 1_000_000 == 0).tolist()
+        return [(text[:-7] if is_whole else text) + suffixes[segment]
+                for text, is_whole, segment in zip(texts, whole, segments.tolist())]
+
+    def dates_and_times(self, timestamps: Sequence[float]) -> Tuple[List[str], List[str]]:
+        """('YYYY-MM-DD', 'HH:MM:SS') lists of local dates and times, seconds truncated"""
+        if len(timestamps) == 0:
+            return [], []
+        if NUMPY_AVAILABLE:
+            local, _, _ = self._local_microseconds(timestamps)
+            texts = np.datetime_as_string((local // 1_000_000).astype('datetime64[s]'), unit='s').tolist()
+        else:
+            texts = [text[:19] for text in self.isoformat_reference(timestamps)]
+        return [text[:10] for text in texts], [text[11:19] for text in texts]
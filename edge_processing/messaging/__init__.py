@@ -1,26 +1,32 @@
 """
 Messaging module for Traffic Monitoring System
 Provides Redis-based real-time messaging between services
+
+The broker and its helpers are loaded on first access (PEP 562), so importing the
+package does not import the Redis client until it is used.
 """
 
-from .redis_broker import (
-    RedisMessageBroker,
-    publish_camera_capture,
-    publish_vehicle_detection,
-    publish_system_health,
-    publish_alert,
-    get_broker,
-    initialize_broker,
-    close_broker
-)
+import importlib
 
 __all__ = [
     'RedisMessageBroker',
     'publish_camera_capture',
-    'publish_vehicle_detection', 
+    'publish_vehicle_detection',
     'publish_system_health',
     'publish_alert',
     'get_broker',
     'initialize_broker',
     'close_broker'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module('.redis_broker', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
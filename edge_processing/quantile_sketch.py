@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Mergeable Quantile Sketch (DDSketch)
+Compact, relative-error percentile summaries for speed distributions
+
+Values are counted in logarithmic bins whose width grows with the value, so any quantile
+is answered within a fixed relative error (1% by default) of the exact value at that rank.
+Bin counts simply add, so sketches for hourly buckets merge into a sketch for any time
+range without revisiting the raw measurements.
+
+Reference: Masson, Rim and Lee, "DDSketch: A Fast and Fully-Mergeable Quantile Sketch
+with Relative-Error Guarantees", VLDB 2019.
+"""
+
+import math
+import struct
+from array import array
+from typing import Dict, Iterable, List, Optional
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+
+# Values at or below this are counted as zero (a stationary target or a radar dropout)
+MIN_INDEXABLE_VALUE = 1e-6
+
+_FORMAT_VERSION = 1
+# version, relative accuracy, zero count, sum, min, max, first bin index, bin count
+_HEADER = struct.Struct('<BdQdddiI')
+
+
+class DDSketch:
+    """Quantile sketch over non-negative values with relative-error guarantees"""
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+
+        self.bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _index(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _bin_value(self, index: int) -> float:
+        # Midpoint (in relative terms) of (gamma^(i-1), gamma^i]
+        return 2 * self.gamma ** index / (self.gamma + 1)
+
+    def add(self, value: float, count: int = 1):
+        """Record `count` occurrences of a non-negative value"""
+        if value < 0:
+            raise ValueError("DDSketch only accepts non-negative values")
+        if value <= MIN_INDEXABLE_VALUE:
+            self.zero_count += count
+        else:
+            index = self._index(value)
+            self.bins[index] = self.bins.get(index, 0) + count
+
+        self.count += count
+        self.sum += value * count
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: 'DDSketch'):
+        """Add another sketch's counts into this one (both must share the same accuracy)"""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        if not other.count:
+            return
+        for index, count in other.bins.items():
+            self.bins[index] = self.bins.get(index, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def avg(self) -> Optional[float]:
+        return self.sum / self.count if self.count else None
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Approximate value at rank q * (count - 1), None when empty"""
+        return self.quantiles([q])[0]
+
+    def quantiles(self, qs: Iterable[float]) -> List[Optional[float]]:
+        """Several quantiles in one pass over the bins, in the order requested"""
+        qs = list(qs)
+        if not self.count:
+            return [None] * len(qs)
+        if any(not 0 <= q <= 1 for q in qs):
+            raise ValueError("Quantiles must be between 0 and 1")
+
+        # The extremes are tracked exactly
+        results: List[Optional[float]] = [self.min if q == 0 else self.max if q == 1 else None for q in qs]
+        pending = sorted((q * (self.count - 1), i) for i, q in enumerate(qs) if 0 < q < 1)
+
+        seen = self.zero_count
+        while pending and pending[0][0] < seen:
+            results[pending.pop(0)[1]] = 0.0
+        for index in sorted(self.bins):
+            seen += self.bins[index]
+            while pending and pending[0][0] < seen:
+                # Clamp to the observed range
+                value = min(max(self._bin_value(index), self.min), self.max)
+                results[pending.pop(0)[1]] = value
+        for _, i in pending:
+            results[i] = self.max
+        return results
+
+    def to_bytes(self) -> bytes:
+        """Compact binary form: fixed header plus one uint32 count per bin in the used range"""
+        if self.bins:
+            first = min(self.bins)
+            counts = array('I', (self.bins.get(i, 0) for i in range(first, max(self.bins) + 1)))
+        else:
+            first, counts = 0, array('I')
+        header = _HEADER.pack(_FORMAT_VERSION, self.relative_accuracy, self.zero_count, self.sum,
+                              self.min if self.count else 0.0, self.max if self.count else 0.0,
+                              first, len(counts))
+        return header + counts.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'DDSketch':
+        version, accuracy, zero_count, total, minimum, maximum, first, length = _HEADER.unpack_from(data)
+        if version != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported sketch format version {version}")
+
+        sketch = cls(accuracy)
+        counts = array('I')
+        counts.frombytes(data[_HEADER.size:_HEADER.size + length * counts.itemsize])
+        sketch.bins = {first + offset: count for offset, count in enumerate(counts) if count}
+        sketch.zero_count = zero_count
+        sketch.count = zero_count + sum(counts)
+        sketch.sum = total
+        if sketch.count:
+            sketch.min, sketch.max = minimum, maximum
+        return sketch
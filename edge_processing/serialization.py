@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+JSON Serialization
+One JSON encoder/decoder for the API gateway and the edge services
+
+Uses orjson when it is installed and the standard library json module otherwise. Both
+backends produce the same compact UTF-8 output (no spaces, non-ASCII characters written
+as-is) and encode the same extra types:
+
+    datetime, date, time   ISO 8601 (isoformat())
+    NumPy arrays/scalars   lists and Python numbers
+    UUID                   its string form
+    Decimal                its string form
+    set, frozenset         lists
+    dataclasses            objects
+
+NaN and infinity are the one difference: orjson writes null, the json module NaN/Infinity.
+Set JSON_BACKEND=json to force the standard library (e.g. to compare the two).
+"""
+
+import dataclasses
+import json
+import os
+import uuid
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Union
+
+# orjson is optional: several times faster, but a compiled wheel
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+BACKENDS = ('orjson', 'json')
+
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+_json_encoder = None
+_backend = None
+
+
+def default(obj: Any) -> Any:
+    """JSON-compatible form of the extra types both backends support"""
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if type(obj).__module__ == 'numpy' and hasattr(obj, 'tolist'):
+        # Arrays and scalars alike, without importing NumPy into services that never use it
+        return obj.tolist()
+    if isinstance(obj, (uuid.UUID, Decimal)):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def set_backend(name: str):
+    """Select 'orjson' or 'json'; asking for orjson without it installed raises ValueError"""
+    global _backend, _json_encoder
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown JSON backend {name!r}, expected one of {BACKENDS}")
+    if name == 'orjson' and not ORJSON_AVAILABLE:
+        raise ValueError("orjson is not installed")
+    _json_encoder = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False, default=default)
+    _backend = name
+
+
+def backend() -> str:
+    """Name of the backend in use"""
+    return _backend
+
+
+def dumpb(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes"""
+    if _backend == 'orjson':
+        return orjson.dumps(obj, default=default, option=_ORJSON_OPTIONS)
+    return _json_encoder.encode(obj).encode('utf-8')
+
+
+def dumps(obj: Any) -> str:
+    """Serialize to a JSON string"""
+    if _backend == 'orjson':
+        return orjson.dumps(obj, default=default, option=_ORJSON_OPTIONS).decode('utf-8')
+    return _json_encoder.encode(obj)
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """Parse JSON text or UTF-8 bytes
+
+    Invalid input raises json.JSONDecodeError with either backend.
+    """
+    if _backend == 'orjson':
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+set_backend('json' if not ORJSON_AVAILABLE or os.environ.get('JSON_BACKEND', '').lower() == 'json' else 'orjson')
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Service Metrics
+Counters, gauges and fixed-bucket histograms in the Prometheus text exposition format
+
+Each service keeps a MetricsRegistry labelled with its service name. Recording is a lock
+and an addition (histograms add a bisect over the fixed buckets), cheap enough for the
+radar and stream loops. Rendering happens only on scrape or publish.
+
+Services without an HTTP server publish their rendered metrics to a Redis hash
+(`metrics:<service>`) every few seconds with RedisMetricsPublisher; the hash expires when
+a service stops publishing. The API gateway serves its own metrics plus every published
+service's at /metrics, merged into one exposition with each family listed once.
+"""
+
+import logging
+import math
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+REDIS_KEY_PREFIX = 'metrics:'
+DEFAULT_PUBLISH_INTERVAL = 15.0
+
+# Seconds; spans sub-millisecond radar parsing to multi-second camera handshakes
+DEFAULT_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+    if value == -math.inf:
+        return '-Inf'
+    if value != value:
+        return 'NaN'
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _label_text(labels: Sequence[Tuple[str, str]]) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels) + '}'
+
+
+class _CounterValue:
+    __slots__ = ('_lock', 'value')
+
+    def __init__(self, family):
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+    def samples(self, name: str, labels):
+        yield name + '_total', labels, self.value
+
+
+class _GaugeValue:
+    __slots__ = ('_lock', 'value', '_function')
+
+    def __init__(self, family):
+        self._lock = threading.Lock()
+        self.value = 0.0
+        self._function: Optional[Callable[[], float]] = None
+
+    def set(self, value: float):
+        self.value = value
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        with self._lock:
+            self.value -= amount
+
+    def set_function(self, function: Callable[[], float]):
+        """Read the value from `function` at render time instead of storing it"""
+        self._function = function
+
+    def samples(self, name: str, labels):
+        value = self.value
+        if self._function is not None:
+            try:
+                value = float(self._function())
+            except Exception:
+                value = math.nan
+        yield name, labels, value
+
+
+class _HistogramValue:
+    __slots__ = ('_lock', '_bounds', '_counts', 'sum', 'count')
+
+    def __init__(self, family):
+        self._lock = threading.Lock()
+        self._bounds = family.buckets
+        # One slot per bucket plus the +Inf overflow; cumulated at render time
+        self._counts = [0] * (len(self._bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        index = bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    @contextmanager
+    def time(self):
+        """Observe the duration of the with-block in seconds"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+    def samples(self, name: str, labels):
+        with self._lock:
+            counts, total, count = list(self._counts), self.sum, self.count
+        cumulative = 0
+        for bound, bucket_count in zip(self._bounds + (math.inf,), counts):
+            cumulative += bucket_count
+            yield name + '_bucket', labels + (('le', _format_value(bound)),), cumulative
+        yield name + '_sum', labels, total
+        yield name + '_count', labels, count
+
+
+class _MetricFamily:
+    """A named metric with optional label dimensions; unlabelled families record directly"""
+
+    metric_type = ''
+    _value_class = None
+    _methods: Tuple[str, ...] = ()
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            child = self.labels()
+            # Bind the recording methods so the hot path skips a delegation call
+            for method in self._methods:
+                setattr(self, method, getattr(child, method))
+
+    def labels(self, *values):
+        """Child metric for one combination of label values"""
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._value_class(self))
+        return child
+
+    def clear(self):
+        """Drop every labelled child, e.g. series for sources that have gone away"""
+        if self.labelnames:
+            with self._lock:
+                self._children.clear()
+
+    def render(self, const_labels: Tuple[Tuple[str, str], ...]) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+        for key, child in list(self._children.items()):
+            labels = const_labels + tuple(zip(self.labelnames, key))
+            for sample_name, sample_labels, value in child.samples(self.name, labels):
+                lines.append(f"{sample_name}{_label_text(sample_labels)} {_format_value(value)}")
+        return lines
+
+
+class Counter(_MetricFamily):
+    metric_type = 'counter'
+    _value_class = _CounterValue
+    _methods = ('inc',)
+
+
+class Gauge(_MetricFamily):
+    metric_type = 'gauge'
+    _value_class = _GaugeValue
+    _methods = ('set', 'inc', 'dec', 'set_function')
+
+
+class Histogram(_MetricFamily):
+    metric_type = 'histogram'
+    _value_class = _HistogramValue
+    _methods = ('observe', 'time')
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(float(bound) for bound in buckets if bound != math.inf))
+        super().__init__(name, documentation, labelnames)
+
+    @property
+    def count(self) -> int:
+        return sum(child.count for child in list(self._children.values()))
+
+    @property
+    def sum(self) -> float:
+        return sum(child.sum for child in list(self._children.values()))
+
+
+class MetricsRegistry:
+    """The metrics of one service, rendered with a constant `service` label"""
+
+    def __init__(self, service: str):
+        self.service = service
+        self._const_labels = (('service', service),)
+        self._families: Dict[str, _MetricFamily] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, family_class, name: str, *args, **kwargs):
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = self._families[name] = family_class(name, *args, **kwargs)
+            elif not isinstance(family, family_class):
+                raise ValueError(f"Metric {name} is already registered as a {family.metric_type}")
+            return family
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def render(self) -> str:
+        """Text exposition of every metric in the registry"""
+        lines: List[str] = []
+        for family in list(self._families.values()):
+            lines.extend(family.render(self._const_labels))
+        return '\n'.join(lines) + '\n' if lines else ''
+
+
+def observe_stream_lag(histogram: Histogram, message_id, now: Optional[float] = None):
+    """Record how long a Redis stream entry waited, from the millisecond time in its ID"""
+    try:
+        if isinstance(message_id, bytes):
+            message_id = message_id.decode()
+        enqueued_at = int(message_id.split('-', 1)[0]) / 1000.0
+    except (ValueError, AttributeError):
+        return
+    histogram.observe(max(0.0, (time.time() if now is None else now) - enqueued_at))
+
+
+def merge_expositions(texts: Iterable[str]) -> str:
+    """Combine expositions from several services, listing each metric family once"""
+    families: Dict[str, Dict[str, List[str]]] = {}
+    for text in texts:
+        current = None
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+            if line.startswith('# '):
+                parts = line.split(None, 3)
+                if len(parts) >= 3 and parts[1] in ('HELP', 'TYPE'):
+                    current = families.setdefault(parts[2], {'HELP': [], 'TYPE': [], 'samples': []})
+                    if not current[parts[1]]:
+                        current[parts[1]].append(line)
+                continue
+            if current is None:
+                current = families.setdefault(line.split('{', 1)[0].split(' ', 1)[0],
+                                              {'HELP': [], 'TYPE': [], 'samples': []})
+            current['samples'].append(line)
+
+    lines: List[str] = []
+    for family in families.values():
+        lines.extend(family['HELP'] + family['TYPE'] + family['samples'])
+    return '\n'.join(lines) + '\n' if lines else ''
+
+
+class RedisMetricsPublisher:
+    """Publishes a registry's exposition to the `metrics:<service>` Redis hash on a timer"""
+
+    def __init__(self, registry: MetricsRegistry, redis_client,
+                 interval: float = DEFAULT_PUBLISH_INTERVAL):
+        self.registry = registry
+        self.redis_client = redis_client
+        self.interval = interval
+        self.key = REDIS_KEY_PREFIX + registry.service
+        self._stop = threading.Event()
+        self._thread = None
+
+    def publish(self) -> bool:
+        try:
+            self.redis_client.hset(self.key, mapping={
+                'exposition': self.registry.render(),
+                'updated_at': time.time()
+            })
+            # Expire the hash if this service stops publishing
+            self.redis_client.expire(self.key, max(1, int(self.interval * 4)))
+            return True
+        except Exception as e:
+            logger.debug(f"Could not publish metrics to {self.key}: {e}")
+            return False
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=f"metrics-{self.registry.service}", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.publish()
+
+    def stop(self):
+        self._stop.set()
+        self.publish()
+
+
+def read_published_metrics(redis_client) -> Dict[str, Tuple[str, float]]:
+    """service -> (exposition, updated_at) for every service publishing to Redis"""
+    published = {}
+    for key in redis_client.scan_iter(match=REDIS_KEY_PREFIX + '*', count=100):
+        if isinstance(key, bytes):
+            key = key.decode('utf-8')
+        fields = redis_client.hgetall(key)
+        fields = {(k.decode('utf-8') if isinstance(k, bytes) else k):
+                  (v.decode('utf-8') if isinstance(v, bytes) else v) for k, v in fields.items()}
+        if 'exposition' not in fields:
+            continue
+        try:
+            updated_at = float(fields.get('updated_at', 0))
+        except ValueError:
+            updated_at = 0.0
+        published[key[len(REDIS_KEY_PREFIX):]] = (fields['exposition'], updated_at)
+    return published
@@ -6,7 +6,6 @@ Provides consistent logging setup across all services
 
 import logging
 import logging.handlers
-import json
 import os
 import sys
 from datetime import datetime
@@ -14,6 +13,12 @@ from pathlib import Path
 from typing import Dict, Optional, Any
 import traceback
 
+# Imported as edge_processing.shared_logging by services, as shared_logging by the API gateway
+try:
+    from . import serialization
+except ImportError:
+    import serialization
+
 
 class ServiceLogger:
     """Centralized logging configuration for all services"""
@@ -276,7 +281,7 @@ class StructuredFormatter(logging.Formatter):
         # For file output (JSON structured)
         if any(isinstance(h, logging.handlers.RotatingFileHandler) 
                for h in logging.getLogger(self.service_name).handlers):
-            return json.dumps(log_entry)
+            return serialization.dumps(log_entry)
         
         return console_format
 
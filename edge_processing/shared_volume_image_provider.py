@@ -26,6 +26,11 @@ try:
 except ImportError:
     REDIS_AVAILABLE = False
 
+try:
+    from .latest_image import resolve_latest_image
+except ImportError:
+    from latest_image import resolve_latest_image
+
 logger = logging.getLogger(__name__)
 
 class SharedVolumeImageProvider:
@@ -328,31 +333,23 @@ class SharedVolumeImageProvider:
                 time.sleep(5)
     
     def _update_image_cache(self):
-        """Update the image cache with recent images (file polling mode)"""
+        """Update the image cache with the newest image (file polling mode)"""
         try:
-            # Get recent image files
-            image_files = list(self.live_dir.glob("*.jpg"))
-            if not image_files:
+            # Resolved from the capture service's latest pointer, not a directory scan
+            latest_file = resolve_latest_image(self.live_dir, self.redis_client, ('.jpg',))
+            if latest_file is None:
                 return
             
-            # Sort by modification time (newest first)
-            image_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-            
-            # Process new images using the unified method
             with self.cache_lock:
-                cached_paths = {cached['path'] for cached in self.image_cache}
-                
-                for image_file in image_files[:self.image_cache_size]:
-                    # Skip if already in cache
-                    if image_file in cached_paths:
-                        continue
-                    
-                    # Load metadata and process the new image
-                    try:
-                        metadata = self._load_image_metadata(image_file)
-                        self._process_new_image(image_file, metadata)
-                    except Exception as e:
-                        logger.warning(f"Failed to process image {image_file}: {e}")
+                if any(cached['path'] == latest_file for cached in self.image_cache):
+                    return
+            
+            # Load metadata and process the new image (takes cache_lock itself)
+            try:
+                metadata = self._load_image_metadata(latest_file)
+                self._process_new_image(latest_file, metadata)
+            except Exception as e:
+                logger.warning(f"Failed to process image {latest_file}: {e}")
         
         except Exception as e:
             logger.error(f"Cache update error: {e}")
@@ -410,8 +407,8 @@ class SharedVolumeImageProvider:
                 }
             
             try:
-                # Get all image files with proper error handling
-                image_files = list(self.live_dir.glob("*.jpg"))
+                # Newest image from the latest pointer, scanning the directory only as a fallback
+                newest_file = resolve_latest_image(self.live_dir, self.redis_client, ('.jpg',))
             except PermissionError:
                 logger.error(f"Permission denied accessing directory: {self.live_dir}")
                 return False, None, {
@@ -428,7 +425,7 @@ class SharedVolumeImageProvider:
                     "details": str(e)
                 }
             
-            if not image_files:
+            if newest_file is None:
                 self._rate_limited_log("warning", f"No images found in capture directory: {self.live_dir}", "no_images_found")
                 return False, None, {
                     "error": "shared_volume_failed",
@@ -437,19 +434,7 @@ class SharedVolumeImageProvider:
                     "checked_pattern": "*.jpg"
                 }
             
-            # Sort by modification time (newest first) with error handling
-            try:
-                image_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-            except Exception as e:
-                logger.error(f"Error sorting image files: {e}")
-                return False, None, {
-                    "error": "shared_volume_failed",
-                    "reason": "file_stat_error",
-                    "details": str(e)
-                }
-            
             # Check age of newest image (relaxed for maintenance mode)
-            newest_file = image_files[0]
             try:
                 image_age = time.time() - newest_file.stat().st_mtime
             except Exception as e:
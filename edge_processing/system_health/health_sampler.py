@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Background Health Sampler
+Samples system and service metrics on a background thread into a fixed-size ring buffer
+
+Health endpoints read the latest sample and short-window averages instead of measuring on
+request, so a health check never waits on psutil.cpu_percent(interval=...) or a slow probe.
+CPU usage is measured non-blocking as the utilisation since the previous sample.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SAMPLE_INTERVAL = 5.0
+DEFAULT_CAPACITY = 720  # 1 hour at 5s intervals
+THERMAL_ZONE_PATH = '/sys/class/thermal/thermal_zone0/temp'
+
+
+@dataclass
+class HealthSample:
+    """One point-in-time health sample"""
+    timestamp: float
+    cpu_percent: float
+    memory_percent: float
+    disk_percent: float
+    temperature: Optional[float] = None
+    load_average: Optional[float] = None
+    services: Dict[str, Any] = field(default_factory=dict)
+
+
+def read_cpu_temperature() -> Optional[float]:
+    """CPU temperature in Celsius (Raspberry Pi thermal zone), None when unavailable"""
+    try:
+        with open(THERMAL_ZONE_PATH, 'r') as f:
+            return float(f.read().strip()) / 1000.0
+    except (OSError, ValueError):
+        return None
+
+
+class HealthSampler:
+    """Background sampler keeping the most recent health samples in a ring buffer"""
+
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL, capacity: int = DEFAULT_CAPACITY,
+                 disk_path: str = '/', collectors: Optional[Dict[str, Callable[[], Any]]] = None):
+        self.interval = interval
+        self.disk_path = disk_path
+        self.collectors: Dict[str, Callable[[], Any]] = dict(collectors or {})
+        self.samples: deque = deque(maxlen=capacity)
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # Prime the CPU counter so the first real sample covers a full interval
+        psutil.cpu_percent(interval=None)
+
+    def add_collector(self, name: str, collector: Callable[[], Any]):
+        """Register a per-service probe; it runs on the sampler thread, never on a request"""
+        self.collectors[name] = collector
+
+    def start(self):
+        """Take an initial sample and start the background thread (idempotent)"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        if not self.samples:
+            self.sample_now()
+        self._thread = threading.Thread(target=self._sampling_loop, name="health-sampler", daemon=True)
+        self._thread.start()
+        logger.info(f"Health sampler started (interval {self.interval}s, capacity {self.samples.maxlen})")
+
+    def stop(self, timeout: float = 2.0):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _sampling_loop(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.sample_now()
+            except Exception as e:
+                logger.error(f"Health sampling error: {e}")
+
+    def sample_now(self) -> HealthSample:
+        """Collect one sample and append it to the ring buffer"""
+        services = {}
+        for name, collector in self.collectors.items():
+            try:
+                services[name] = collector()
+            except Exception as e:
+                services[name] = {"healthy": False, "error": str(e)}
+
+        try:
+            disk_percent = psutil.disk_usage(self.disk_path).percent
+        except OSError:
+            disk_percent = 0.0
+
+        try:
+            load_average = os.getloadavg()[0]
+        except (AttributeError, OSError):
+            load_average = None
+
+        sample = HealthSample(
+            timestamp=time.time(),
+            cpu_percent=psutil.cpu_percent(interval=None),
+            memory_percent=psutil.virtual_memory().percent,
+            disk_percent=disk_percent,
+            temperature=read_cpu_temperature(),
+            load_average=load_average,
+            services=services
+        )
+        self.samples.append(sample)
+        return sample
+
+    def latest(self) -> Optional[HealthSample]:
+        """Most recent sample, or None before the first one"""
+        try:
+            return self.samples[-1]
+        except IndexError:
+            return None
+
+    def window(self, seconds: float) -> List[HealthSample]:
+        """Samples taken within the last `seconds`, oldest first"""
+        cutoff = time.time() - seconds
+        recent = []
+        # list() copies atomically; iterating the deque itself fails if the sampler appends mid-loop
+        for sample in reversed(list(self.samples)):
+            if sample.timestamp < cutoff:
+                break
+            recent.append(sample)
+        recent.reverse()
+        return recent
+
+    def averages(self, seconds: float) -> Dict[str, Any]:
+        """Mean CPU, memory and temperature over the last `seconds`"""
+        recent = self.window(seconds)
+        if not recent:
+            return {"sample_count": 0}
+
+        temperatures = [s.temperature for s in recent if s.temperature is not None]
+        return {
+            "sample_count": len(recent),
+            "cpu_percent": round(sum(s.cpu_percent for s in recent) / len(recent), 1),
+            "memory_percent": round(sum(s.memory_percent for s in recent) / len(recent), 1),
+            "temperature": round(sum(temperatures) / len(temperatures), 1) if temperatures else None
+        }
@@ -39,6 +39,7 @@ class SystemMetrics:
     network_bytes_recv: int = 0
     gpu_usage: Optional[float] = None  # GPU utilization percentage
     gpu_memory: Optional[float] = None  # GPU memory usage percentage
+    disk_info: Dict = field(default_factory=dict)  # Per-mountpoint usage, sampled with the metrics
 
 @dataclass
 class ServiceStatus:
@@ -75,6 +76,7 @@ class SystemHealthMonitor:
     def start_monitoring(self):
         """Start system health monitoring"""
         self.is_running = True
+        psutil.cpu_percent(interval=None)  # Prime the counter; samples measure usage since the previous one
         monitor_thread = threading.Thread(target=self._monitoring_loop)
         monitor_thread.daemon = True
         monitor_thread.start()
@@ -104,8 +106,8 @@ class SystemHealthMonitor:
     def _collect_system_metrics(self):
         """Collect current system metrics including GPU when available"""
         try:
-            # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # CPU usage since the previous sample (non-blocking)
+            cpu_percent = psutil.cpu_percent(interval=None)
             
             # Memory usage
             memory = psutil.virtual_memory()
@@ -136,7 +138,8 @@ class SystemHealthMonitor:
                 network_bytes_sent=network.bytes_sent,
                 network_bytes_recv=network.bytes_recv,
                 gpu_usage=gpu_usage,
-                gpu_memory=gpu_memory
+                gpu_memory=gpu_memory,
+                disk_info=disk_info
             )
             
         except Exception as e:
@@ -322,7 +325,7 @@ class SystemHealthMonitor:
             'gpu_temperature': latest.gpu_temp,
             'timestamp': latest.timestamp,
             'uptime_seconds': time.time() - (self.metrics_history[0].timestamp if self.metrics_history else time.time()),
-            'disk_info': self._get_all_disk_info()  # Add detailed disk information
+            'disk_info': latest.disk_info  # Detailed disk information from the latest sample
         }
     
     def get_service_statuses(self):
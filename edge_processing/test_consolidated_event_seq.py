@@ -0,0 +1,55 @@
+"""Unit tests for the consolidated_events sequence used by cursor-based API polling"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent / "data_persistence"))
+
+from database_persistence_service_simplified import SimplifiedEnhancedDatabasePersistenceService
+
+
+def _service(db_path):
+    service = SimplifiedEnhancedDatabasePersistenceService(database_path=str(db_path), batch_size=1)
+    assert service.initialize_database()
+    return service
+
+
+def test_existing_events_are_numbered_in_insert_order(tmp_path):
+    db_path = tmp_path / "traffic_data.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE consolidated_events (
+            consolidation_id TEXT PRIMARY KEY,
+            event_json TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    conn.executemany("INSERT INTO consolidated_events (consolidation_id, event_json) VALUES (?, '{}')",
+                     [("b",), ("a",), ("c",)])
+    conn.commit()
+    conn.close()
+
+    service = _service(db_path)
+    rows = service.db_connection.execute(
+        "SELECT consolidation_id FROM consolidated_events ORDER BY event_seq"
+    ).fetchall()
+    assert [r[0] for r in rows] == ["b", "a", "c"]
+
+    indexes = {r[1] for r in service.db_connection.execute("PRAGMA index_list(consolidated_events)")}
+    assert "idx_consolidated_event_seq" in indexes
+
+
+def test_sequence_increases_on_insert_and_replace(tmp_path):
+    service = _service(tmp_path / "traffic_data.db")
+
+    service._store_consolidated_json("first", "{}")
+    service._store_consolidated_json("second", "{}")
+    service._store_consolidated_json("first", '{"updated": true}')
+
+    rows = service.db_connection.execute(
+        "SELECT consolidation_id, event_seq FROM consolidated_events ORDER BY event_seq"
+    ).fetchall()
+    # A replaced event moves past everything a polling client has already seen
+    assert rows == [("second", 2), ("first", 3)]
@@ -0,0 +1,58 @@
+"""Unit tests for the background health sampler"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from system_health.health_sampler import HealthSampler, HealthSample
+
+
+def test_ring_buffer_keeps_latest_samples():
+    sampler = HealthSampler(capacity=3)
+    for _ in range(5):
+        sampler.sample_now()
+
+    assert len(sampler.samples) == 3
+    assert sampler.latest() is sampler.samples[-1]
+    assert 0 <= sampler.latest().cpu_percent <= 100
+
+
+def test_collectors_run_on_sample_and_errors_are_contained():
+    calls = []
+    sampler = HealthSampler(collectors={"redis": lambda: calls.append(1) or {"healthy": True}})
+    sampler.add_collector("broken", lambda: 1 / 0)
+
+    sample = sampler.sample_now()
+    assert sample.services["redis"] == {"healthy": True}
+    assert sample.services["broken"]["healthy"] is False
+    assert calls == [1]
+
+
+def test_window_averages_only_recent_samples():
+    sampler = HealthSampler()
+    now = time.time()
+    sampler.samples.extend([
+        HealthSample(now - 600, 90.0, 90.0, 50.0, temperature=70.0),
+        HealthSample(now - 30, 20.0, 40.0, 50.0, temperature=50.0),
+        HealthSample(now - 10, 40.0, 60.0, 50.0, temperature=None),
+    ])
+
+    averages = sampler.averages(60)
+    assert averages == {"sample_count": 2, "cpu_percent": 30.0, "memory_percent": 50.0, "temperature": 50.0}
+    assert sampler.averages(1)["sample_count"] == 0
+
+
+def test_background_thread_samples_at_interval():
+    sampler = HealthSampler(interval=0.05)
+    sampler.start()
+    try:
+        time.sleep(0.3)
+    finally:
+        sampler.stop()
+
+    assert len(sampler.samples) >= 3
+    count = len(sampler.samples)
+    time.sleep(0.15)
+    assert len(sampler.samples) == count
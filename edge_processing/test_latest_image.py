@@ -0,0 +1,86 @@
+"""Unit tests for the latest capture pointer"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from latest_image import (LATEST_IMAGE_KEY, LATEST_LINK, newest_image_by_scan,
+                          publish_latest_image, resolve_latest_image)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    def set(self, key, value):
+        self.values[key] = value
+
+    def get(self, key):
+        return self.values.get(key)
+
+
+def write_image(directory, name, mtime):
+    path = directory / name
+    path.write_bytes(b'\xff\xd8jpeg')
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_published_image_is_resolved_through_the_link(tmp_path):
+    write_image(tmp_path, "capture_1.jpg", 1000)
+    newer = write_image(tmp_path, "capture_2.jpg", 2000)
+    older = write_image(tmp_path, "capture_0.jpg", 500)
+    redis = FakeRedis()
+
+    publish_latest_image(tmp_path, older, redis, capture_time=123.0)
+    assert os.readlink(tmp_path / LATEST_LINK) == "capture_0.jpg"
+    assert json.loads(redis.values[LATEST_IMAGE_KEY]) == {'filename': "capture_0.jpg", 'capture_time': 123.0}
+    # The pointer wins over modification times
+    assert resolve_latest_image(tmp_path) == older
+
+    publish_latest_image(tmp_path, newer)
+    assert resolve_latest_image(tmp_path) == newer
+    assert not [p for p in tmp_path.iterdir() if p.name.startswith('.')]
+
+
+def test_redis_record_is_used_without_a_link(tmp_path):
+    write_image(tmp_path, "capture_2.jpg", 2000)
+    recorded = write_image(tmp_path, "capture_1.jpg", 1000)
+    redis = FakeRedis()
+    redis.set(LATEST_IMAGE_KEY, json.dumps({'filename': recorded.name, 'capture_time': 1000}))
+
+    assert resolve_latest_image(tmp_path, redis) == recorded
+
+
+def test_scan_fallback_ignores_pointer_and_hidden_files(tmp_path):
+    newest = write_image(tmp_path, "capture_2.jpg", 2000)
+    write_image(tmp_path, "capture_1.jpg", 1000)
+    write_image(tmp_path, ".partial.jpg", 3000)
+    write_image(tmp_path, "capture_2.json", 4000)
+
+    assert newest_image_by_scan(tmp_path) == newest
+    assert newest_image_by_scan(tmp_path / "missing") is None
+    assert resolve_latest_image(tmp_path, FakeRedis()) == newest
+
+
+def test_stale_pointers_fall_back_to_the_scan(tmp_path):
+    newest = write_image(tmp_path, "capture_2.jpg", 2000)
+    removed = write_image(tmp_path, "capture_3.jpg", 3000)
+    redis = FakeRedis()
+    publish_latest_image(tmp_path, removed, redis)
+    removed.unlink()  # cleaned up after being published
+
+    assert resolve_latest_image(tmp_path, redis) == newest
+
+
+def test_redis_record_cannot_escape_the_directory(tmp_path):
+    live = tmp_path / "live"
+    live.mkdir()
+    write_image(tmp_path, "outside.jpg", 1000)
+    redis = FakeRedis()
+    redis.set(LATEST_IMAGE_KEY, json.dumps({'filename': "../outside.jpg"}))
+
+    assert resolve_latest_image(live, redis) is None
@@ -0,0 +1,62 @@
+"""Import-time regression tests: lightweight services must not load OpenCV or TensorFlow"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+HEAVY_MODULES = {'cv2', 'tensorflow'}
+
+# Import statements as each lightweight service (or its entry point) performs them
+LIGHTWEIGHT_IMPORTS = {
+    'shared_logging': "import edge_processing.shared_logging",
+    'package': "import edge_processing",
+    'messaging': "import edge_processing.messaging",
+    'consolidator': "import edge_processing.vehicle_detection.vehicle_consolidator_service",
+    'persistence': "import edge_processing.data_persistence.database_persistence_service_simplified",
+    'maintenance': "import sys; sys.path.insert(0, 'edge_processing'); import data_maintenance_service_enhanced",
+}
+
+
+def imported_modules(code):
+    """Top-level modules imported by `code`, from `python -X importtime`"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            cwd=REPO_ROOT, capture_output=True, text=True, timeout=120)
+    if result.returncode != 0:
+        missing = [line for line in result.stderr.splitlines() if 'ModuleNotFoundError' in line]
+        if missing:
+            pytest.skip(missing[-1])
+        pytest.fail(result.stderr[-2000:])
+
+    modules = set()
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:') and line.count('|') == 2:
+            name = line.rsplit('|', 1)[1].strip()
+            modules.add(name.split('.')[0])
+    return modules
+
+
+@pytest.mark.parametrize('service', sorted(LIGHTWEIGHT_IMPORTS))
+def test_lightweight_services_skip_heavy_imports(service):
+    modules = imported_modules(LIGHTWEIGHT_IMPORTS[service])
+    assert 'edge_processing' in modules or service == 'maintenance'
+    assert not modules & HEAVY_MODULES
+
+
+def test_package_exports_resolve_on_access():
+    modules = imported_modules(
+        "import edge_processing\n"
+        "assert 'SystemHealthMonitor' in dir(edge_processing)\n"
+        "monitor = edge_processing.SystemHealthMonitor\n"
+        "assert monitor is None or monitor.__name__ == 'SystemHealthMonitor'\n"
+        "try:\n"
+        "    edge_processing.NoSuchService\n"
+        "except AttributeError:\n"
+        "    pass\n"
+        "else:\n"
+        "    raise AssertionError('unknown attribute resolved')\n"
+    )
+    assert 'psutil' in modules
+    assert not modules & HEAVY_MODULES
@@ -0,0 +1,68 @@
+"""Unit tests for batch local time conversion"""
+
+import random
+import sys
+from datetime import datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import local_time
+from local_time import LocalTimeConverter
+
+CENTRAL = ZoneInfo('America/Chicago')
+
+# 2025-03-09 02:00 CST -> CDT and 2025-11-02 02:00 CDT -> CST, in UTC epoch seconds
+SPRING_FORWARD = 1741507200
+FALL_BACK = 1762066800
+
+
+def dst_timestamps():
+    rng = random.Random(48)
+    timestamps = []
+    for transition in (SPRING_FORWARD, FALL_BACK):
+        timestamps += [transition + delta for delta in (-3601, -1, -0.5, 0, 0.5, 1, 3599, 3600)]
+        timestamps += [transition + rng.uniform(-86400, 86400) for _ in range(500)]
+    timestamps += [rng.uniform(SPRING_FORWARD - 90 * 86400, FALL_BACK + 90 * 86400) for _ in range(2000)]
+    timestamps += [1741500000.0000005, 1741500000.9999996, 1741500000.25]
+    return timestamps
+
+
+def test_isoformat_matches_fromtimestamp_across_dst():
+    timestamps = dst_timestamps()
+    expected = [datetime.fromtimestamp(ts, CENTRAL).isoformat() for ts in timestamps]
+    converter = LocalTimeConverter(CENTRAL)
+
+    assert converter.isoformat_reference(timestamps) == expected
+    assert converter.isoformat(timestamps) == expected
+
+
+def test_isoformat_without_numpy(monkeypatch):
+    monkeypatch.setattr(local_time, 'NUMPY_AVAILABLE', False)
+    timestamps = dst_timestamps()
+    expected = [datetime.fromtimestamp(ts, CENTRAL).isoformat() for ts in timestamps]
+    assert LocalTimeConverter(CENTRAL).isoformat(timestamps) == expected
+
+
+@pytest.mark.parametrize('numpy_available', [True, False])
+def test_dates_and_times_match_strftime(monkeypatch, numpy_available):
+    if numpy_available and not local_time.NUMPY_AVAILABLE:
+        pytest.skip('NumPy not installed')
+    monkeypatch.setattr(local_time, 'NUMPY_AVAILABLE', numpy_available)
+    timestamps = dst_timestamps()
+    local = [datetime.fromtimestamp(ts, CENTRAL) for ts in timestamps]
+
+    dates, times = LocalTimeConverter(CENTRAL).dates_and_times(timestamps)
+    assert dates == [value.strftime('%Y-%m-%d') for value in local]
+    assert times == [value.strftime('%H:%M:%S') for value in local]
+
+
+def test_segments_extend_to_later_ranges():
+    converter = LocalTimeConverter(CENTRAL)
+    assert converter.isoformat([SPRING_FORWARD - 1]) == ['2025-03-09T01:59:59-06:00']
+    assert converter.isoformat([FALL_BACK]) == ['2025-11-02T01:00:00-06:00']
+    assert converter.isoformat([SPRING_FORWARD]) == ['2025-03-09T03:00:00-05:00']
+    assert converter.isoformat([]) == []
@@ -0,0 +1,89 @@
+"""Unit tests for the mergeable DDSketch quantile sketch"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from quantile_sketch import DDSketch
+
+QUANTILES = (0.01, 0.25, 0.5, 0.75, 0.85, 0.95, 0.99)
+
+
+def _exact(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+def _speeds(n, seed):
+    rng = random.Random(seed)
+    # Mixture: residential traffic around 27 mph plus a long tail of fast vehicles
+    return [max(0.5, rng.gauss(27, 6)) if rng.random() < 0.9 else rng.uniform(35, 90) for _ in range(n)]
+
+
+@pytest.mark.parametrize("accuracy", [0.01, 0.02])
+def test_quantiles_within_relative_error_of_exact(accuracy):
+    values = _speeds(50_000, seed=1)
+    sketch = DDSketch(accuracy)
+    for v in values:
+        sketch.add(v)
+
+    for q, estimate in zip(QUANTILES, sketch.quantiles(QUANTILES)):
+        exact = _exact(values, q)
+        assert abs(estimate - exact) <= accuracy * exact + 1e-9, (q, estimate, exact)
+
+    assert sketch.count == len(values)
+    assert sketch.avg == pytest.approx(sum(values) / len(values))
+    assert sketch.quantile(0) == min(values) and sketch.quantile(1) == max(values)
+
+
+def test_merged_hourly_sketches_equal_one_sketch_over_the_range():
+    hours = [_speeds(2000, seed=h) for h in range(24)]
+    merged, whole = DDSketch(), DDSketch()
+    for values in hours:
+        hourly = DDSketch()
+        for v in values:
+            hourly.add(v)
+            whole.add(v)
+        merged.merge(DDSketch.from_bytes(hourly.to_bytes()))
+
+    assert merged.bins == whole.bins
+    assert merged.quantiles(QUANTILES) == whole.quantiles(QUANTILES)
+
+    all_values = [v for values in hours for v in values]
+    p85 = merged.quantile(0.85)
+    assert abs(p85 - _exact(all_values, 0.85)) <= 0.01 * _exact(all_values, 0.85)
+
+
+def test_serialized_sketch_is_compact_and_round_trips():
+    sketch = DDSketch()
+    for v in _speeds(10_000, seed=7) + [0.0, 0.0]:
+        sketch.add(v)
+
+    blob = sketch.to_bytes()
+    assert len(blob) < 1500
+    restored = DDSketch.from_bytes(blob)
+    assert (restored.count, restored.zero_count, restored.min, restored.max) == \
+        (sketch.count, 2, 0.0, sketch.max)
+    assert restored.quantiles(QUANTILES) == sketch.quantiles(QUANTILES)
+
+    empty = DDSketch.from_bytes(DDSketch().to_bytes())
+    assert empty.count == 0 and empty.quantile(0.5) is None
+
+
+def test_invalid_inputs_are_rejected():
+    with pytest.raises(ValueError):
+        DDSketch().add(-1.0)
+    with pytest.raises(ValueError):
+        DDSketch(0.01).merge(_one(0.02))
+    with pytest.raises(ValueError):
+        _one(0.01).quantile(1.5)
+
+
+def _one(accuracy):
+    sketch = DDSketch(accuracy)
+    sketch.add(10.0)
+    return sketch
@@ -0,0 +1,63 @@
+"""Unit tests for the shared JSON serialization module"""
+
+import json
+import sys
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import serialization
+
+BACKENDS = [name for name in serialization.BACKENDS if name != 'orjson' or serialization.ORJSON_AVAILABLE]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    previous = serialization.backend()
+    serialization.set_backend(request.param)
+    yield request.param
+    serialization.set_backend(previous)
+
+
+def test_extra_types_encode_the_same_with_every_backend(backend):
+    record = {
+        "naive": datetime(2024, 3, 10, 8, 0, 0, 250000),
+        "aware": datetime(2024, 3, 10, 8, 0, tzinfo=timezone.utc),
+        "day": date(2024, 3, 10),
+        "id": uuid.UUID(int=1),
+        "amount": Decimal("1.10"),
+        "tags": {"radar"},
+        "location": "Préfecture",
+        1: "integer key",
+    }
+    assert serialization.dumps(record) == (
+        '{"naive":"2024-03-10T08:00:00.250000","aware":"2024-03-10T08:00:00+00:00","day":"2024-03-10",'
+        '"id":"00000000-0000-0000-0000-000000000001","amount":"1.10","tags":["radar"],'
+        '"location":"Préfecture","1":"integer key"}'
+    )
+    assert serialization.dumpb(record) == serialization.dumps(record).encode('utf-8')
+
+
+def test_numpy_values_encode_as_plain_numbers(backend):
+    np = pytest.importorskip("numpy")
+    values = {"speeds": np.array([[25.5, 31.0]])[:, ::-1], "count": np.int64(3), "mean": np.float32(28.25)}
+    assert serialization.dumps(values) == '{"speeds":[[31.0,25.5]],"count":3,"mean":28.25}'
+
+
+def test_loads_and_errors_match_the_json_module(backend):
+    assert serialization.loads(b'{"speed": 31.5, "types": ["car"]}') == {"speed": 31.5, "types": ["car"]}
+    assert serialization.loads('"\\u00e9"') == "é"
+    with pytest.raises(json.JSONDecodeError):
+        serialization.loads('{"speed": ')
+    with pytest.raises(TypeError):
+        serialization.dumps({"handle": object()})
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        serialization.set_backend("ujson")
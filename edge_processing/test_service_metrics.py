@@ -0,0 +1,100 @@
+"""Unit tests for service metrics and their Prometheus text exposition"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from service_metrics import (MetricsRegistry, RedisMetricsPublisher, merge_expositions, observe_stream_lag,
+                             read_published_metrics)
+
+
+class DictRedis:
+    """The handful of Redis hash commands the publisher and reader use"""
+
+    def __init__(self):
+        self.hashes = {}
+        self.ttls = {}
+
+    def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update({k: str(v) for k, v in mapping.items()})
+
+    def expire(self, key, seconds):
+        self.ttls[key] = seconds
+
+    def scan_iter(self, match, count=None):
+        prefix = match.rstrip('*')
+        return [key for key in self.hashes if key.startswith(prefix)]
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+
+def test_counter_gauge_and_histogram_exposition():
+    registry = MetricsRegistry("radar-service")
+    registry.counter("radar_detections", "Detections", ("alert_level",)).labels("high").inc(2)
+    queue = []
+    registry.gauge("queue_depth", "Queued items").set_function(lambda: len(queue))
+    histogram = registry.histogram("radar_processing_seconds", "Processing time", buckets=(0.01, 0.1))
+    for value in (0.005, 0.01, 0.05, 3.0):
+        histogram.observe(value)
+    queue.extend([1, 2, 3])
+
+    lines = registry.render().splitlines()
+    assert '# TYPE radar_detections counter' in lines
+    assert 'radar_detections_total{service="radar-service",alert_level="high"} 2' in lines
+    assert 'queue_depth{service="radar-service"} 3' in lines
+    assert 'radar_processing_seconds_bucket{service="radar-service",le="0.01"} 2' in lines
+    assert 'radar_processing_seconds_bucket{service="radar-service",le="0.1"} 3' in lines
+    assert 'radar_processing_seconds_bucket{service="radar-service",le="+Inf"} 4' in lines
+    assert 'radar_processing_seconds_count{service="radar-service"} 4' in lines
+    assert histogram.count == 4 and histogram.sum == pytest.approx(3.065)
+
+
+def test_label_values_are_escaped_and_checked():
+    registry = MetricsRegistry("api-gateway")
+    family = registry.counter("requests", "Requests", ("route",))
+    family.labels('/a"b\\c').inc()
+    assert 'requests_total{service="api-gateway",route="/a\\"b\\\\c"} 1' in registry.render()
+    with pytest.raises(ValueError):
+        family.labels()
+    with pytest.raises(ValueError):
+        registry.gauge("requests", "Same name, different type")
+
+
+def test_merged_expositions_list_each_family_once():
+    radar = MetricsRegistry("radar-service")
+    consolidator = MetricsRegistry("vehicle-consolidator")
+    radar.histogram("stream_lag_seconds", "Lag", buckets=(1.0,)).observe(0.5)
+    consolidator.histogram("stream_lag_seconds", "Lag", buckets=(1.0,)).observe(2.0)
+
+    merged = merge_expositions([radar.render(), consolidator.render()]).splitlines()
+    assert merged.count('# TYPE stream_lag_seconds histogram') == 1
+    assert 'stream_lag_seconds_bucket{service="radar-service",le="1"} 1' in merged
+    assert 'stream_lag_seconds_bucket{service="vehicle-consolidator",le="1"} 0' in merged
+
+
+def test_stream_lag_is_read_from_the_entry_id():
+    histogram = MetricsRegistry("vehicle-consolidator").histogram("stream_lag_seconds", "Lag")
+    observe_stream_lag(histogram, b"1700000000000-0", now=1700000002.5)
+    observe_stream_lag(histogram, "1700000005000-3", now=1700000002.5)
+    observe_stream_lag(histogram, "not-an-id", now=1700000002.5)
+    observe_stream_lag(histogram, None)
+    assert histogram.count == 2
+    assert histogram.sum == pytest.approx(2.5)
+
+
+def test_publisher_round_trips_through_redis_hash():
+    redis_client = DictRedis()
+    registry = MetricsRegistry("database-persistence")
+    registry.counter("persistence_records_stored", "Stored").inc(5)
+
+    assert RedisMetricsPublisher(registry, redis_client, interval=15).publish()
+    assert redis_client.ttls["metrics:database-persistence"] == 60
+
+    published = read_published_metrics(redis_client)
+    text, updated_at = published["database-persistence"]
+    assert 'persistence_records_stored_total{service="database-persistence"} 5' in text
+    assert updated_at > 0
@@ -0,0 +1,128 @@
+"""Unit tests for rollup-based traffic analytics against synthetic data with known answers"""
+
+import sqlite3
+import sys
+from datetime import timezone
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from traffic_rollups import RollupBatch, ensure_rollup_schema
+from traffic_analytics import (
+    load_hourly_buckets, load_speed_histogram, summarize_buckets, hourly_totals, peak_hour,
+    load_speed_sketch, speed_percentiles, violation_categories, safety_rating, percent_change, traffic_patterns
+)
+
+# Monday 2024-01-01 00:00 UTC
+WEEK_START = 1_704_067_200
+DAY = 86400
+UTC = timezone.utc
+
+
+@pytest.fixture
+def week_db():
+    """One week: day d has 10*(d+1) vehicles at 08:00 and 5 at 17:00; speeds only on Monday"""
+    conn = sqlite3.connect(":memory:")
+    cursor = conn.cursor()
+    ensure_rollup_schema(cursor)
+
+    batch = RollupBatch(speed_limit_mph=25)
+    for day in range(7):
+        for i in range(10 * (day + 1)):
+            batch.add_detection(WEEK_START + day * DAY + 8 * 3600 + i)
+        for i in range(5):
+            batch.add_detection(WEEK_START + day * DAY + 17 * 3600 + i)
+
+    # 6 compliant, 3 minor, 2 moderate, 1 severe
+    for i, speed in enumerate([20] * 6 + [27] * 3 + [33] * 2 + [40]):
+        batch.add_detection(WEEK_START + 12 * 3600 + i, speed)
+    batch.apply(cursor)
+    return conn
+
+
+def test_weekly_patterns_have_known_totals_and_peaks(week_db):
+    buckets = load_hourly_buckets(week_db, WEEK_START, WEEK_START + 7 * DAY)
+    patterns = traffic_patterns(buckets, WEEK_START, WEEK_START + 7 * DAY, UTC)
+
+    daily = patterns['daily_patterns']
+    assert daily['Monday'] == {'total': 27, 'days_observed': 1, 'avg_count': 27.0, 'peak_hour': 12}
+    assert daily['Sunday'] == {'total': 75, 'days_observed': 1, 'avg_count': 75.0, 'peak_hour': 8}
+    assert patterns['weekly_summary'] == {
+        'total_detections': 327, 'avg_daily_traffic': 46.7, 'peak_day': 'Sunday', 'lowest_day': 'Tuesday'
+    }
+    assert patterns['hourly_distribution']['8'] == 280
+    assert patterns['hourly_distribution']['17'] == 35
+    assert patterns['peak_hours'][0] == {'hour': 8, 'count': 280}
+    assert patterns['data_period_days'] == 7
+
+
+def test_weekday_averages_divide_by_days_in_window(week_db):
+    # Two weeks requested, one week of data: each weekday observed twice
+    buckets = load_hourly_buckets(week_db, WEEK_START, WEEK_START + 14 * DAY)
+    patterns = traffic_patterns(buckets, WEEK_START, WEEK_START + 14 * DAY, UTC)
+    assert patterns['daily_patterns']['Sunday']['days_observed'] == 2
+    assert patterns['daily_patterns']['Sunday']['avg_count'] == 37.5
+
+
+def test_local_timezone_shifts_hours(week_db):
+    from traffic_analytics import report_timezone
+
+    central = report_timezone('America/Chicago')
+    buckets = load_hourly_buckets(week_db, WEEK_START, WEEK_START + 7 * DAY)
+    assert peak_hour(hourly_totals(buckets, central)) == 2  # 08:00 UTC is 02:00 CST
+
+
+def test_speed_statistics_and_violation_categories(week_db):
+    buckets = load_hourly_buckets(week_db, WEEK_START, WEEK_START + DAY)
+    summary = summarize_buckets(buckets)
+    assert summary['total_vehicles'] == 27
+    assert summary['radar_measurements'] == 12
+    assert summary['violations'] == 6
+    assert summary['avg_speed'] == round((20 * 6 + 27 * 3 + 33 * 2 + 40) / 12, 1)
+    assert (summary['min_speed'], summary['max_speed']) == (20.0, 40.0)
+    assert summary['compliance_rate'] == 50.0
+    assert safety_rating(summary['compliance_rate']) == (60.0, 'High')
+
+    histogram = load_speed_histogram(week_db, WEEK_START, WEEK_START + DAY)
+    categories = violation_categories(histogram, 25)
+    assert {name: c['count'] for name, c in categories.items()} == {'minor': 3, 'moderate': 2, 'severe': 1}
+    assert categories['minor']['range'] == '26-30 mph'
+    assert categories['minor']['percentage'] == 50.0
+
+    # Nearest-rank over [20]*6 + [27]*3 + [33]*2 + [40], within the sketch's 1%
+    percentiles = speed_percentiles(load_speed_sketch(week_db, WEEK_START, WEEK_START + DAY))
+    assert percentiles['p50'] == pytest.approx(20, rel=0.01)
+    assert percentiles['p85'] == pytest.approx(33, rel=0.01)
+    assert percentiles['p95'] == pytest.approx(33, rel=0.01)
+
+
+def test_empty_or_missing_rollups_return_zeroes():
+    conn = sqlite3.connect(":memory:")
+    assert load_hourly_buckets(conn, 0, DAY) == []
+    with pytest.raises(sqlite3.OperationalError):
+        load_hourly_buckets(conn, 0, DAY, missing_ok=False)
+    assert sum(load_speed_histogram(conn, 0, DAY)) == 0
+    assert summarize_buckets([])['compliance_rate'] == 100.0
+    assert load_speed_sketch(conn, 0, DAY).count == 0
+    assert speed_percentiles(load_speed_sketch(conn, 0, DAY))['p85'] is None
+    assert percent_change(10, 0) == 'N/A'
+    assert percent_change(11, 10) == '+10.0%'
+
+    patterns = traffic_patterns([], 0, DAY, UTC)
+    assert patterns['weekly_summary']['peak_day'] is None
+
+
+def test_window_queries_are_primary_key_range_searches(week_db):
+    statements = []
+    week_db.set_trace_callback(statements.append)
+    load_hourly_buckets(week_db, WEEK_START, WEEK_START + DAY)
+    load_speed_histogram(week_db, WEEK_START, WEEK_START + DAY)
+    load_speed_sketch(week_db, WEEK_START, WEEK_START + DAY)
+    week_db.set_trace_callback(None)
+
+    for statement in statements:
+        plan = " | ".join(row[3] for row in week_db.execute(f"EXPLAIN QUERY PLAN {statement}"))
+        # Range search on the hour key: rows visited grow with the window, not the table
+        assert "SEARCH" in plan and "PRIMARY KEY" in plan and "SCAN" not in plan, plan
@@ -0,0 +1,191 @@
+"""Unit tests for incremental row counters and hourly rollups"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent / "data_persistence"))
+
+from traffic_rollups import (
+    RollupBatch, ensure_rollup_schema, seed_row_counts, backfill_hourly_rollups, backfill_speed_histogram,
+    backfill_speed_sketches, read_row_counts, count_detections_since, speed_bin
+)
+
+
+def _record(i, timestamp, speed=None):
+    record = {
+        'consolidation_id': f"consolidated_{i}",
+        'correlation_id': f"corr{i}",
+        'timestamp': timestamp,
+        'trigger_source': 'radar',
+        'camera_data': {'vehicle_count': 1, 'vehicle_types': ['car']},
+        'weather_data': {}
+    }
+    if speed is not None:
+        record['radar_data'] = {'speed': speed, 'speed_mps': speed * 0.44704, 'confidence': 0.9}
+    return record
+
+
+def test_rollup_batch_accumulates_per_hour():
+    conn = sqlite3.connect(":memory:")
+    cursor = conn.cursor()
+    ensure_rollup_schema(cursor)
+
+    batch = RollupBatch(speed_limit_mph=25)
+    batch.add_detection(3600 * 10 + 5, 20)
+    batch.add_detection(3600 * 10 + 600, -30)
+    batch.add_detection(3600 * 11 + 1)
+    batch.count_rows('traffic_detections', 3)
+    batch.apply(cursor)
+    batch.clear()
+
+    batch.add_detection(3600 * 10 + 900, 40)
+    batch.count_rows('traffic_detections')
+    batch.apply(cursor)
+
+    rows = {r[0]: r[1:] for r in cursor.execute(
+        "SELECT bucket_start, detection_count, radar_count, speed_sum, speed_min, speed_max, violation_count "
+        "FROM traffic_hourly_rollups")}
+    assert rows[36000] == (3, 3, 90.0, 20.0, 40.0, 2)
+    assert rows[39600] == (1, 0, 0.0, None, None, 0)
+    assert read_row_counts(conn) == {'traffic_detections': 4}
+    assert count_detections_since(conn, 36000 + 1800) == 4
+    assert count_detections_since(conn, 39600) == 1
+
+
+def test_seed_and_backfill_from_existing_rows():
+    conn = sqlite3.connect(":memory:")
+    cursor = conn.cursor()
+    cursor.execute("CREATE TABLE traffic_detections (id INTEGER PRIMARY KEY, timestamp REAL)")
+    cursor.execute("CREATE TABLE radar_detections (detection_id INTEGER PRIMARY KEY, speed_mph REAL)")
+    cursor.executemany("INSERT INTO traffic_detections VALUES (?, ?)", [(i, 7200 + i * 60) for i in range(1, 91)])
+    cursor.executemany("INSERT INTO radar_detections VALUES (?, ?)", [(i, 20 + i % 10) for i in range(1, 91)])
+
+    ensure_rollup_schema(cursor)
+    seed_row_counts(cursor, ('traffic_detections', 'radar_detections'))
+    assert backfill_hourly_rollups(cursor, 25) == 2
+    assert backfill_hourly_rollups(cursor, 25) == 0
+
+    assert read_row_counts(conn) == {'traffic_detections': 90, 'radar_detections': 90}
+    assert count_detections_since(conn, 0) == 90
+
+
+def test_histogram_backfill_bins_like_the_batch_writer():
+    speeds = [0.0, 0.4, 5.0, 5.01, 24.99, 25.0, 25.5, -30.0, 104.9, 105.0, 140.0]
+    conn = sqlite3.connect(":memory:")
+    cursor = conn.cursor()
+    cursor.execute("CREATE TABLE traffic_detections (id INTEGER PRIMARY KEY, timestamp REAL)")
+    cursor.execute("CREATE TABLE radar_detections (detection_id INTEGER PRIMARY KEY, speed_mph REAL)")
+    cursor.executemany("INSERT INTO traffic_detections VALUES (?, ?)", [(i, 7200 + i) for i in range(len(speeds))])
+    cursor.executemany("INSERT INTO radar_detections VALUES (?, ?)", list(enumerate(speeds)))
+    ensure_rollup_schema(cursor)
+
+    assert backfill_speed_histogram(cursor) > 0
+    assert backfill_speed_histogram(cursor) == 0
+    backfilled = dict(cursor.execute("SELECT speed_bin, count FROM traffic_speed_histogram"))
+
+    expected = {}
+    for speed in speeds:
+        expected[speed_bin(speed)] = expected.get(speed_bin(speed), 0) + 1
+    assert backfilled == expected
+    assert [speed_bin(s) for s in (0.0, 5.0, 5.01, 25.0, 25.5, 140.0)] == [0, 1, 2, 5, 6, 21]
+
+
+def test_sketches_merge_across_batches_and_match_backfill():
+    conn = sqlite3.connect(":memory:")
+    cursor = conn.cursor()
+    cursor.execute("CREATE TABLE traffic_detections (id INTEGER PRIMARY KEY, timestamp REAL)")
+    cursor.execute("CREATE TABLE radar_detections (detection_id INTEGER PRIMARY KEY, speed_mph REAL)")
+    speeds = [(i, 7200 + i * 30, 15 + (i * 7) % 30) for i in range(1, 241)]
+    cursor.executemany("INSERT INTO traffic_detections VALUES (?, ?)", [(i, ts) for i, ts, _ in speeds])
+    cursor.executemany("INSERT INTO radar_detections VALUES (?, ?)", [(i, -s if i % 3 else s) for i, _, s in speeds])
+    ensure_rollup_schema(cursor)
+    assert backfill_speed_sketches(cursor) == 3
+    assert backfill_speed_sketches(cursor) == 0
+    backfilled = dict(cursor.execute("SELECT bucket_start, sketch FROM traffic_speed_sketches"))
+
+    cursor.execute("DELETE FROM traffic_speed_sketches")
+    for chunk in (speeds[:100], speeds[100:]):
+        batch = RollupBatch()
+        for _, ts, speed in chunk:
+            batch.add_detection(ts, speed)
+        batch.apply(cursor)
+    incremental = dict(cursor.execute("SELECT bucket_start, sketch FROM traffic_speed_sketches"))
+
+    from quantile_sketch import DDSketch
+    assert set(incremental) == set(backfilled) == {7200, 10800, 14400}
+    for bucket_start, blob in incremental.items():
+        a, b = DDSketch.from_bytes(blob), DDSketch.from_bytes(backfilled[bucket_start])
+        assert a.bins == b.bins and a.count == b.count
+
+
+def test_persistence_service_maintains_stats_in_batch_transaction(tmp_path):
+    from database_persistence_service_simplified import SimplifiedEnhancedDatabasePersistenceService
+
+    service = SimplifiedEnhancedDatabasePersistenceService(
+        database_path=str(tmp_path / "traffic_data.db"), batch_size=3, commit_interval_seconds=3600
+    )
+    assert service.initialize_database()
+
+    base = 1_700_000_000 - (1_700_000_000 % 3600)
+    assert service.process_traffic_record(_record(1, base + 10, 22.0))
+    assert service.process_traffic_record(_record(2, base + 20, 31.0))
+    assert service.process_traffic_record(_record(3, base + 3700))
+    assert not service.normalized_batch
+
+    counts = read_row_counts(service.db_connection)
+    assert counts['traffic_detections'] == 3
+    assert counts['radar_detections'] == 2
+    assert counts['camera_detections'] == 3
+
+    rollups = service.db_connection.execute(
+        "SELECT bucket_start, detection_count, violation_count FROM traffic_hourly_rollups ORDER BY bucket_start"
+    ).fetchall()
+    assert rollups == [(base, 2, 1), (base + 3600, 1, 0)]
+
+    histogram = service.db_connection.execute(
+        "SELECT bucket_start, speed_bin, count FROM traffic_speed_histogram ORDER BY bucket_start, speed_bin"
+    ).fetchall()
+    assert histogram == [(base, 5, 1), (base, 7, 1)]
+
+    from quantile_sketch import DDSketch
+    (blob,) = service.db_connection.execute(
+        "SELECT sketch FROM traffic_speed_sketches WHERE bucket_start = ?", (base,)
+    ).fetchone()
+    sketch = DDSketch.from_bytes(blob)
+    assert (sketch.count, sketch.min, sketch.max) == (2, 22.0, 31.0)
+
+    stats = service._get_database_stats()
+    assert stats['total_detections'] == 3
+    assert stats['total_radar_records'] == 2
+
+
+def test_redelivered_detection_is_not_counted_twice(tmp_path):
+    from database_persistence_service_simplified import SimplifiedEnhancedDatabasePersistenceService
+
+    service = SimplifiedEnhancedDatabasePersistenceService(
+        database_path=str(tmp_path / "traffic_data.db"), batch_size=2, commit_interval_seconds=3600
+    )
+    assert service.initialize_database()
+
+    base = 1_700_000_000 - (1_700_000_000 % 3600)
+    assert service.process_traffic_record(_record(1, base + 10, 31.0))
+    assert service.process_traffic_record(_record(2, base + 20, 22.0))
+    assert service.process_traffic_record(_record(1, base + 10, 31.0))
+    assert service.process_traffic_record(_record(3, base + 30, 24.0))
+
+    conn = service.db_connection
+    counts = read_row_counts(conn)
+    assert counts['traffic_detections'] == 3
+    assert counts['radar_detections'] == 3
+    assert conn.execute("SELECT COUNT(*) FROM radar_detections").fetchone()[0] == 3
+    assert conn.execute(
+        "SELECT detection_count, violation_count FROM traffic_hourly_rollups WHERE bucket_start = ?", (base,)
+    ).fetchone() == (3, 1)
+    assert sum(row[0] for row in conn.execute("SELECT count FROM traffic_speed_histogram")) == 3
+
+    from quantile_sketch import DDSketch
+    (blob,) = conn.execute("SELECT sketch FROM traffic_speed_sketches WHERE bucket_start = ?", (base,)).fetchone()
+    assert DDSketch.from_bytes(blob).count == 3
+    assert service.stats["duplicates_skipped"] == 1
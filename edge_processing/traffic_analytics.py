@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Traffic Analytics from Hourly Rollups
+Volume profiles, day-of-week patterns, speed distributions and violation statistics
+
+Everything here reads traffic_hourly_rollups and traffic_speed_histogram (maintained by the
+persistence service, see traffic_rollups), never the detection tables. Each query is a
+primary-key range scan over the requested window, so cost depends on the number of hours
+asked for (at most 24 rows per day, 22 histogram bins per hour) and not on how much
+detection history the database holds.
+
+Violation categories come from the 5 mph speed histogram and are accurate to the bin
+width; percentiles come from merged hourly DDSketches (1% relative error); counts,
+averages, minima, maxima and violation totals are exact.
+"""
+
+import os
+import sqlite3
+from datetime import datetime, date, timedelta, timezone, tzinfo
+from typing import Any, Dict, List, Optional, Tuple
+
+from quantile_sketch import DDSketch
+from traffic_rollups import (
+    ROLLUP_BUCKET_SECONDS, DEFAULT_SPEED_LIMIT_MPH, SPEED_BIN_WIDTH_MPH, SPEED_BIN_COUNT
+)
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # Python < 3.9
+    ZoneInfo = None
+
+DEFAULT_TIMEZONE = 'America/Chicago'
+DAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+# Upper bound on any analytics window; keeps the worst case at ~9k rollup rows
+MAX_WINDOW_DAYS = 366
+
+
+def report_timezone(name: Optional[str] = None) -> tzinfo:
+    """Local timezone for hour-of-day and day-of-week grouping (REPORT_TIMEZONE, default Central)"""
+    name = name or os.environ.get('REPORT_TIMEZONE', DEFAULT_TIMEZONE)
+    if ZoneInfo is not None:
+        try:
+            return ZoneInfo(name)
+        except Exception:
+            pass
+    return timezone.utc
+
+
+def clamp_days(days: float) -> float:
+    """Window length in days, limited to (0, MAX_WINDOW_DAYS]"""
+    return min(max(float(days), 1.0 / 24), MAX_WINDOW_DAYS)
+
+
+def _bucket_floor(timestamp: float) -> int:
+    return int(timestamp // ROLLUP_BUCKET_SECONDS) * ROLLUP_BUCKET_SECONDS
+
+
+def _missing_table(error: sqlite3.OperationalError) -> bool:
+    """True for a database the persistence service has not added rollup tables to yet"""
+    return str(error).startswith('no such table')
+
+
+def load_hourly_buckets(conn: sqlite3.Connection, start_ts: float, end_ts: float,
+                        missing_ok: bool = True) -> List[Dict[str, Any]]:
+    """Rollup rows for hours overlapping [start_ts, end_ts), oldest first
+
+    The partial first hour is included, as in count_detections_since(). A database
+    without the rollup table reads as no data unless missing_ok is False; other query
+    errors (a locked database) propagate so a failed read is not mistaken for an empty one.
+    """
+    try:
+        rows = conn.execute("""
+            SELECT bucket_start, detection_count, radar_count, speed_sum, speed_min, speed_max, violation_count
+            FROM traffic_hourly_rollups
+            WHERE bucket_start >= ? AND bucket_start < ?
+            ORDER BY bucket_start
+        """, (_bucket_floor(start_ts), end_ts)).fetchall()
+    except sqlite3.OperationalError as e:
+        if not (missing_ok and _missing_table(e)):
+            raise
+        return []
+
+    return [{
+        'bucket_start': row[0],
+        'detection_count': row[1],
+        'radar_count': row[2],
+        'speed_sum': row[3],
+        'speed_min': row[4],
+        'speed_max': row[5],
+        'violation_count': row[6]
+    } for row in rows]
+
+
+def load_speed_histogram(conn: sqlite3.Connection, start_ts: float, end_ts: float) -> List[int]:
+    """Speed bin counts (see traffic_rollups.speed_bin) summed over the window"""
+    histogram = [0] * SPEED_BIN_COUNT
+    try:
+        rows = conn.execute("""
+            SELECT speed_bin, SUM(count)
+            FROM traffic_speed_histogram
+            WHERE bucket_start >= ? AND bucket_start < ?
+            GROUP BY speed_bin
+        """, (_bucket_floor(start_ts), end_ts)).fetchall()
+    except sqlite3.OperationalError as e:
+        if not _missing_table(e):
+            raise
+        return histogram
+
+    for bin_index, count in rows:
+        if 0 <= bin_index < SPEED_BIN_COUNT:
+            histogram[bin_index] += count
+    return histogram
+
+
+def load_speed_sketch(conn: sqlite3.Connection, start_ts: float, end_ts: float) -> DDSketch:
+    """Hourly speed sketches for the window merged into one (O(hours), independent of volume)"""
+    sketch = DDSketch()
+    try:
+        rows = conn.execute("""
+            SELECT sketch FROM traffic_speed_sketches
+            WHERE bucket_start >= ? AND bucket_start < ?
+        """, (_bucket_floor(start_ts), end_ts))
+        for (blob,) in rows:
+            sketch.merge(DDSketch.from_bytes(blob))
+    except sqlite3.OperationalError as e:
+        if not _missing_table(e):
+            raise
+    return sketch
+
+
+def speed_percentiles(sketch: DDSketch, percentiles=(50, 85, 95)) -> Dict[str, Optional[float]]:
+    """Rounded percentile speeds keyed "p50", "p85", ... (None without measurements)"""
+    values = sketch.quantiles([p / 100 for p in percentiles])
+    return {f"p{p}": round(v, 1) if v is not None else None for p, v in zip(percentiles, values)}
+
+
+def summarize_buckets(buckets: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Volume, speed and violation totals across rollup buckets"""
+    total = sum(b['detection_count'] for b in buckets)
+    measured = sum(b['radar_count'] for b in buckets)
+    violations = sum(b['violation_count'] for b in buckets)
+    speed_sum = sum(b['speed_sum'] for b in buckets)
+    minima = [b['speed_min'] for b in buckets if b['speed_min'] is not None]
+    maxima = [b['speed_max'] for b in buckets if b['speed_max'] is not None]
+
+    return {
+        'total_vehicles': total,
+        'radar_measurements': measured,
+        'avg_speed': round(speed_sum / measured, 1) if measured else 0.0,
+        'min_speed': round(min(minima), 1) if minima else 0.0,
+        'max_speed': round(max(maxima), 1) if maxima else 0.0,
+        'violations': violations,
+        'violation_rate': round(violations / measured * 100, 1) if measured else 0.0,
+        'compliance_rate': round((measured - violations) / measured * 100, 1) if measured else 100.0
+    }
+
+
+def hourly_totals(buckets: List[Dict[str, Any]], tz: tzinfo, field: str = 'detection_count') -> List[int]:
+    """Totals of `field` by local hour of day (index 0-23)"""
+    totals = [0] * 24
+    for b in buckets:
+        totals[datetime.fromtimestamp(b['bucket_start'], tz).hour] += b[field]
+    return totals
+
+
+def daily_totals(buckets: List[Dict[str, Any]], tz: tzinfo,
+                 field: str = 'detection_count') -> Dict[date, int]:
+    """Totals of `field` by local calendar date, oldest first (dates without data omitted)"""
+    totals: Dict[date, int] = {}
+    for b in buckets:
+        day = datetime.fromtimestamp(b['bucket_start'], tz).date()
+        totals[day] = totals.get(day, 0) + b[field]
+    return totals
+
+
+def peak_hour(totals: List[int]) -> Optional[int]:
+    """Busiest hour of a 24-entry profile (earliest on ties), None without traffic"""
+    if not any(totals):
+        return None
+    return max(range(len(totals)), key=lambda hour: (totals[hour], -hour))
+
+
+def peak_hours(totals: List[int], top: int = 3) -> List[Dict[str, int]]:
+    """The `top` busiest hours with traffic, busiest first"""
+    ranked = sorted((hour for hour in range(len(totals)) if totals[hour]), key=lambda hour: (-totals[hour], hour))
+    return [{'hour': hour, 'count': totals[hour]} for hour in ranked[:top]]
+
+
+def local_dates(start_ts: float, end_ts: float, tz: tzinfo) -> List[date]:
+    """Every local calendar date touched by [start_ts, end_ts)"""
+    first = datetime.fromtimestamp(start_ts, tz).date()
+    last = datetime.fromtimestamp(max(start_ts, end_ts - 1), tz).date()
+    return [first + timedelta(days=i) for i in range((last - first).days + 1)]
+
+
+def day_of_week_patterns(buckets: List[Dict[str, Any]], tz: tzinfo,
+                         start_ts: float, end_ts: float) -> Dict[str, Dict[str, Any]]:
+    """Per-weekday totals, averages over the weekdays in the window, and peak hours"""
+    weekdays_in_window = [0] * 7
+    for day in local_dates(start_ts, end_ts, tz):
+        weekdays_in_window[day.weekday()] += 1
+
+    by_weekday = [[0] * 24 for _ in range(7)]
+    for b in buckets:
+        local = datetime.fromtimestamp(b['bucket_start'], tz)
+        by_weekday[local.weekday()][local.hour] += b['detection_count']
+
+    patterns = {}
+    for weekday, name in enumerate(DAY_NAMES):
+        total = sum(by_weekday[weekday])
+        observed = weekdays_in_window[weekday]
+        patterns[name] = {
+            'total': total,
+            'days_observed': observed,
+            'avg_count': round(total / observed, 1) if observed else 0.0,
+            'peak_hour': peak_hour(by_weekday[weekday])
+        }
+    return patterns
+
+
+def speed_bin_range(bin_index: int) -> Tuple[float, Optional[float]]:
+    """(lower, upper) mph bounds of a histogram bin; the last bin has no upper bound"""
+    if bin_index == 0:
+        return 0.0, 0.0
+    lower = float((bin_index - 1) * SPEED_BIN_WIDTH_MPH)
+    upper = None if bin_index == SPEED_BIN_COUNT - 1 else float(bin_index * SPEED_BIN_WIDTH_MPH)
+    return lower, upper
+
+
+def speed_distribution(histogram: List[int]) -> List[Dict[str, Any]]:
+    """Non-empty histogram bins with their mph ranges and share of measurements"""
+    total = sum(histogram)
+    distribution = []
+    for bin_index, count in enumerate(histogram):
+        if not count:
+            continue
+        lower, upper = speed_bin_range(bin_index)
+        distribution.append({
+            'min_mph': lower,
+            'max_mph': upper,
+            'count': count,
+            'percentage': round(count / total * 100, 1)
+        })
+    return distribution
+
+
+def violation_categories(histogram: List[int],
+                         speed_limit: float = DEFAULT_SPEED_LIMIT_MPH) -> Dict[str, Dict[str, Any]]:
+    """Minor (up to 5 mph over), moderate (5-10 over) and severe (more than 10 over) violations
+
+    A bin counts toward a category by its lower edge, so categories are exact when the speed
+    limit is a multiple of the bin width and otherwise rounded to the nearest bin.
+    """
+    counts = {'minor': 0, 'moderate': 0, 'severe': 0}
+    for bin_index, count in enumerate(histogram):
+        lower, _ = speed_bin_range(bin_index)
+        if bin_index == 0 or lower < speed_limit:
+            continue
+        if lower >= speed_limit + 10:
+            counts['severe'] += count
+        elif lower >= speed_limit + 5:
+            counts['moderate'] += count
+        else:
+            counts['minor'] += count
+
+    total = sum(counts.values())
+    ranges = {
+        'minor': f"{speed_limit + 1:g}-{speed_limit + 5:g} mph",
+        'moderate': f"{speed_limit + 6:g}-{speed_limit + 10:g} mph",
+        'severe': f"{speed_limit + 11:g}+ mph"
+    }
+    return {
+        name: {
+            'count': count,
+            'range': ranges[name],
+            'percentage': round(count / total * 100, 1) if total else 0
+        } for name, count in counts.items()
+    }
+
+
+def safety_rating(compliance_rate: float) -> Tuple[float, str]:
+    """Overall safety score and risk level for a speed compliance rate (percent)"""
+    if compliance_rate >= 95:
+        return 95.0, 'Very Low'
+    if compliance_rate >= 85:
+        return 85.0, 'Low'
+    if compliance_rate >= 70:
+        return 75.0, 'Medium'
+    return 60.0, 'High'
+
+
+def percent_change(current: float, previous: float) -> str:
+    """Signed percentage change for report text, 'N/A' without a baseline"""
+    if not previous:
+        return 'N/A'
+    return f"{(current - previous) / previous * 100:+.1f}%"
+
+
+def traffic_patterns(buckets: List[Dict[str, Any]], start_ts: float, end_ts: float,
+                     tz: Optional[tzinfo] = None) -> Dict[str, Any]:
+    """Weekly summary, day-of-week patterns and hourly distribution for the window's buckets"""
+    tz = tz or report_timezone()
+    daily = day_of_week_patterns(buckets, tz, start_ts, end_ts)
+    hourly = hourly_totals(buckets, tz)
+    days = len(local_dates(start_ts, end_ts, tz))
+    total = sum(hourly)
+
+    observed = {name: p for name, p in daily.items() if p['days_observed']}
+    return {
+        'weekly_summary': {
+            'total_detections': total,
+            'avg_daily_traffic': round(total / days, 1) if days else 0.0,
+            'peak_day': max(observed, key=lambda name: observed[name]['avg_count']) if total else None,
+            'lowest_day': min(observed, key=lambda name: observed[name]['avg_count']) if total else None
+        },
+        'daily_patterns': daily,
+        'hourly_distribution': {str(hour): count for hour, count in enumerate(hourly)},
+        'peak_hours': peak_hours(hourly),
+        'data_period_days': days
+    }
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Incremental Table Statistics and Hourly Traffic Rollups
+Shared by the database persistence service (writer) and the API gateway (reader)
+
+Row counters and hourly aggregates are updated inside the persistence service's batch
+transaction, so reading totals or a 24-hour count never has to scan the detection tables.
+"""
+
+import math
+import sqlite3
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from quantile_sketch import DDSketch
+
+ROLLUP_BUCKET_SECONDS = 3600
+DEFAULT_SPEED_LIMIT_MPH = 25.0
+
+# Speed histogram: bin i holds speeds in ((i - 1) * width, i * width] mph, bin 0 holds 0 mph,
+# and the last bin collects everything faster
+SPEED_BIN_WIDTH_MPH = 5
+SPEED_BIN_COUNT = 22
+
+# Tables whose row counts are tracked in table_row_counts
+COUNTED_TABLES = (
+    'traffic_detections',
+    'radar_detections',
+    'camera_detections',
+    'weather_conditions'
+)
+
+
+def ensure_rollup_schema(cursor: sqlite3.Cursor):
+    """Create the row counter and hourly rollup tables if they do not exist"""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS table_row_counts (
+            table_name TEXT PRIMARY KEY,
+            row_count INTEGER NOT NULL DEFAULT 0,
+            updated_at REAL
+        )
+    """)
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS traffic_hourly_rollups (
+            bucket_start INTEGER PRIMARY KEY, -- Unix epoch, aligned to the hour (UTC)
+            detection_count INTEGER NOT NULL DEFAULT 0,
+            radar_count INTEGER NOT NULL DEFAULT 0,
+            speed_sum REAL NOT NULL DEFAULT 0,
+            speed_min REAL,
+            speed_max REAL,
+            violation_count INTEGER NOT NULL DEFAULT 0,
+            updated_at REAL
+        )
+    """)
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS traffic_speed_histogram (
+            bucket_start INTEGER NOT NULL, -- Same hourly buckets as traffic_hourly_rollups
+            speed_bin INTEGER NOT NULL,    -- See speed_bin()
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (bucket_start, speed_bin)
+        ) WITHOUT ROWID
+    """)
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS traffic_speed_sketches (
+            bucket_start INTEGER PRIMARY KEY, -- Same hourly buckets as traffic_hourly_rollups
+            sketch BLOB NOT NULL              -- quantile_sketch.DDSketch.to_bytes() of |speed_mph|
+        )
+    """)
+
+
+def speed_bin(speed_mph: float) -> int:
+    """Histogram bin for an absolute speed"""
+    return min(SPEED_BIN_COUNT - 1, math.ceil(abs(speed_mph) / SPEED_BIN_WIDTH_MPH))
+
+
+def seed_row_counts(cursor: sqlite3.Cursor, tables: Iterable[str] = COUNTED_TABLES):
+    """Seed missing counters from MAX(rowid), an O(log n) approximation of the row count"""
+    existing = {row[0] for row in cursor.execute("SELECT table_name FROM table_row_counts")}
+    for table in tables:
+        if table in existing:
+            continue
+        approx = cursor.execute(f"SELECT MAX(rowid) FROM {table}").fetchone()[0] or 0
+        cursor.execute(
+            "INSERT INTO table_row_counts (table_name, row_count, updated_at) VALUES (?, ?, ?)",
+            (table, approx, time.time())
+        )
+
+
+def backfill_hourly_rollups(cursor: sqlite3.Cursor, speed_limit_mph: float = DEFAULT_SPEED_LIMIT_MPH) -> int:
+    """Build rollups from existing detections once, when the rollup table is still empty
+
+    Returns the number of buckets written (0 when rollups already exist).
+    """
+    if cursor.execute("SELECT 1 FROM traffic_hourly_rollups LIMIT 1").fetchone():
+        return 0
+
+    cursor.execute(f"""
+        INSERT INTO traffic_hourly_rollups
+            (bucket_start, detection_count, radar_count, speed_sum, speed_min, speed_max, violation_count, updated_at)
+        SELECT
+            CAST(td.timestamp / {ROLLUP_BUCKET_SECONDS} AS INTEGER) * {ROLLUP_BUCKET_SECONDS},
+            COUNT(*),
+            COUNT(rd.speed_mph),
+            COALESCE(SUM(ABS(rd.speed_mph)), 0),
+            MIN(ABS(rd.speed_mph)),
+            MAX(ABS(rd.speed_mph)),
+            COUNT(CASE WHEN ABS(rd.speed_mph) > ? THEN 1 END),
+            ?
+        FROM traffic_detections td
+        LEFT JOIN radar_detections rd ON rd.detection_id = td.id
+        GROUP BY 1
+    """, (speed_limit_mph, time.time()))
+    return cursor.rowcount
+
+
+def backfill_speed_histogram(cursor: sqlite3.Cursor) -> int:
+    """Build the speed histogram from existing radar detections once, when it is still empty
+
+    Returns the number of (bucket, bin) rows written.
+    """
+    if cursor.execute("SELECT 1 FROM traffic_speed_histogram LIMIT 1").fetchone():
+        return 0
+
+    # Same binning as speed_bin(): ceil(|speed| / width), capped at the last bin
+    cursor.execute(f"""
+        INSERT INTO traffic_speed_histogram (bucket_start, speed_bin, count)
+        SELECT
+            CAST(td.timestamp / {ROLLUP_BUCKET_SECONDS} AS INTEGER) * {ROLLUP_BUCKET_SECONDS},
+            MIN({SPEED_BIN_COUNT - 1},
+                CAST(ABS(rd.speed_mph) / {SPEED_BIN_WIDTH_MPH}.0 AS INTEGER)
+                + (ABS(rd.speed_mph) / {SPEED_BIN_WIDTH_MPH}.0 > CAST(ABS(rd.speed_mph) / {SPEED_BIN_WIDTH_MPH}.0 AS INTEGER))),
+            COUNT(*)
+        FROM traffic_detections td
+        JOIN radar_detections rd ON rd.detection_id = td.id
+        GROUP BY 1, 2
+    """)
+    return cursor.rowcount
+
+
+def backfill_speed_sketches(cursor: sqlite3.Cursor) -> int:
+    """Build hourly speed sketches from existing radar detections once, when none exist yet
+
+    Streams detections in timestamp order, holding one bucket's sketch at a time.
+    Returns the number of buckets written.
+    """
+    if cursor.execute("SELECT 1 FROM traffic_speed_sketches LIMIT 1").fetchone():
+        return 0
+
+    rows = cursor.connection.execute("""
+        SELECT td.timestamp, ABS(rd.speed_mph)
+        FROM traffic_detections td
+        JOIN radar_detections rd ON rd.detection_id = td.id
+        WHERE rd.speed_mph IS NOT NULL
+        ORDER BY td.timestamp
+    """)
+
+    written = 0
+    current_bucket, sketch = None, None
+    for timestamp, speed in rows:
+        bucket_start = int(timestamp // ROLLUP_BUCKET_SECONDS) * ROLLUP_BUCKET_SECONDS
+        if bucket_start != current_bucket:
+            if sketch is not None:
+                cursor.execute("INSERT INTO traffic_speed_sketches (bucket_start, sketch) VALUES (?, ?)",
+                               (current_bucket, sketch.to_bytes()))
+                written += 1
+            current_bucket, sketch = bucket_start, DDSketch()
+        sketch.add(speed)
+    if sketch is not None:
+        cursor.execute("INSERT INTO traffic_speed_sketches (bucket_start, sketch) VALUES (?, ?)",
+                       (current_bucket, sketch.to_bytes()))
+        written += 1
+    return written
+
+
+class RollupBatch:
+    """Accumulates counter deltas and per-hour aggregates for one batch transaction"""
+
+    def __init__(self, speed_limit_mph: float = DEFAULT_SPEED_LIMIT_MPH):
+        self.speed_limit_mph = speed_limit_mph
+        self.row_deltas: Dict[str, int] = {}
+        self.buckets: Dict[int, Dict[str, Any]] = {}
+        self.histogram: Dict[Tuple[int, int], int] = {}
+        self.sketches: Dict[int, DDSketch] = {}
+
+    def count_rows(self, table: str, delta: int = 1):
+        """Record rows inserted into (or deleted from, with a negative delta) a counted table"""
+        self.row_deltas[table] = self.row_deltas.get(table, 0) + delta
+
+    def add_detection(self, timestamp: float, speed_mph: Optional[float] = None):
+        """Record one detection in its hourly bucket"""
+        bucket_start = int(timestamp // ROLLUP_BUCKET_SECONDS) * ROLLUP_BUCKET_SECONDS
+        bucket = self.buckets.get(bucket_start)
+        if bucket is None:
+            bucket = self.buckets[bucket_start] = {
+                'detection_count': 0, 'radar_count': 0, 'speed_sum': 0.0,
+                'speed_min': None, 'speed_max': None, 'violation_count': 0
+            }
+
+        bucket['detection_count'] += 1
+        if speed_mph is not None:
+            speed = abs(float(speed_mph))
+            bucket['radar_count'] += 1
+            bucket['speed_sum'] += speed
+            bucket['speed_min'] = speed if bucket['speed_min'] is None else min(bucket['speed_min'], speed)
+            bucket['speed_max'] = speed if bucket['speed_max'] is None else max(bucket['speed_max'], speed)
+            if speed > self.speed_limit_mph:
+                bucket['violation_count'] += 1
+            key = (bucket_start, speed_bin(speed))
+            self.histogram[key] = self.histogram.get(key, 0) + 1
+            sketch = self.sketches.get(bucket_start)
+            if sketch is None:
+                sketch = self.sketches[bucket_start] = DDSketch()
+            sketch.add(speed)
+
+    def apply(self, cursor: sqlite3.Cursor):
+        """Write accumulated deltas; must run inside the caller's transaction"""
+        now = time.time()
+
+        for table, delta in self.row_deltas.items():
+            if delta:
+                cursor.execute("""
+                    INSERT INTO table_row_counts (table_name, row_count, updated_at) VALUES (?, ?, ?)
+                    ON CONFLICT(table_name) DO UPDATE SET
+                        row_count = MAX(0, row_count + excluded.row_count),
+                        updated_at = excluded.updated_at
+                """, (table, delta, now))
+
+        for bucket_start, b in self.buckets.items():
+            cursor.execute("""
+                INSERT INTO traffic_hourly_rollups
+                    (bucket_start, detection_count, radar_count, speed_sum, speed_min, speed_max, violation_count, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(bucket_start) DO UPDATE SET
+                    detection_count = detection_count + excluded.detection_count,
+                    radar_count = radar_count + excluded.radar_count,
+                    speed_sum = speed_sum + excluded.speed_sum,
+                    speed_min = MIN(COALESCE(speed_min, excluded.speed_min), COALESCE(excluded.speed_min, speed_min)),
+                    speed_max = MAX(COALESCE(speed_max, excluded.speed_max), COALESCE(excluded.speed_max, speed_max)),
+                    violation_count = violation_count + excluded.violation_count,
+                    updated_at = excluded.updated_at
+            """, (bucket_start, b['detection_count'], b['radar_count'], b['speed_sum'],
+                  b['speed_min'], b['speed_max'], b['violation_count'], now))
+
+        if self.histogram:
+            cursor.executemany("""
+                INSERT INTO traffic_speed_histogram (bucket_start, speed_bin, count) VALUES (?, ?, ?)
+                ON CONFLICT(bucket_start, speed_bin) DO UPDATE SET count = count + excluded.count
+            """, [(bucket_start, bin_index, count) for (bucket_start, bin_index), count in self.histogram.items()])
+
+        # Sketches merge by adding bin counts: fold this batch into the stored hour
+        for bucket_start, sketch in self.sketches.items():
+            row = cursor.execute(
+                "SELECT sketch FROM traffic_speed_sketches WHERE bucket_start = ?", (bucket_start,)
+            ).fetchone()
+            if row:
+                merged = DDSketch.from_bytes(row[0])
+                merged.merge(sketch)
+                sketch = merged
+            cursor.execute(
+                "INSERT OR REPLACE INTO traffic_speed_sketches (bucket_start, sketch) VALUES (?, ?)",
+                (bucket_start, sketch.to_bytes())
+            )
+
+    def clear(self):
+        self.row_deltas.clear()
+        self.buckets.clear()
+        self.histogram.clear()
+        self.sketches.clear()
+
+
+def read_row_counts(conn: sqlite3.Connection) -> Dict[str, int]:
+    """Current row counters keyed by table name (empty if the stats table does not exist)"""
+    try:
+        return {row[0]: row[1] for row in conn.execute("SELECT table_name, row_count FROM table_row_counts")}
+    except sqlite3.OperationalError:
+        return {}
+
+
+def count_detections_since(conn: sqlite3.Connection, since_ts: float) -> int:
+    """Detections since a timestamp, from rollups (hour granularity: the partial first hour is included)"""
+    bucket_start = int(since_ts // ROLLUP_BUCKET_SECONDS) * ROLLUP_BUCKET_SECONDS
+    try:
+        row = conn.execute(
+            "SELECT COALESCE(SUM(detection_count), 0) FROM traffic_hourly_rollups WHERE bucket_start >= ?",
+            (bucket_start,)
+        ).fetchone()
+    except sqlite3.OperationalError:
+        return 0
+    return row[0] or 0
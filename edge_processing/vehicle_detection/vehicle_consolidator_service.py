@@ -28,6 +28,8 @@ from typing import Dict, List, Optional, Any
 
 # Import centralized logging infrastructure
 from edge_processing.shared_logging import ServiceLogger, CorrelationContext, performance_monitor
+from edge_processing.service_metrics import MetricsRegistry, RedisMetricsPublisher, observe_stream_lag
+from edge_processing import serialization
 
 # Redis for consuming IMX500 AI results
 try:
@@ -144,10 +146,19 @@ class VehicleDetectionConsolidatorEnhanced:
         self.grouped_vehicles_count = 0  # Statistics tracking
         self.single_detections_count = 0
         
-        # Performance tracking
-        self.processing_times = []
+        # Performance tracking (published to Redis for the gateway's /metrics)
         self.event_count = 0
         self.startup_time = None
+        self.metrics = MetricsRegistry("vehicle-consolidator")
+        self.stream_lag_seconds = self.metrics.histogram(
+            "consolidator_stream_lag_seconds", "Age of radar stream entries when the consolidator reads them")
+        self.processing_seconds = self.metrics.histogram(
+            "consolidator_processing_seconds", "Time to consolidate one radar stream entry")
+        self.camera_handshake_seconds = self.metrics.histogram(
+            "camera_handshake_seconds", "Camera request to response time", ("outcome",))
+        self.stream_events_total = self.metrics.counter(
+            "consolidator_stream_events", "Radar stream entries handled", ("result",))
+        self.metrics_publisher = None
         
         self.logger.log_service_event(
             event_type="consolidator_initialized",
@@ -191,6 +202,9 @@ class VehicleDetectionConsolidatorEnhanced:
                     # Setup camera detections subscription
                     self._setup_camera_subscription()
                 
+                self.metrics_publisher = RedisMetricsPublisher(self.metrics, self.redis_client)
+                self.metrics_publisher.start()
+                
                 self.logger.log_service_event(
                     event_type="redis_connection_success",
                     message=f"✅ Connected to Redis successfully at {self.redis_host}:{self.redis_port}",
@@ -337,8 +351,6 @@ class VehicleDetectionConsolidatorEnhanced:
             
             while self.running:
                 try:
-                    processing_start = time.time()
-                    
                     # Read from radar stream using consumer group (FIFO with acknowledgment)
                     messages = self.redis_client.xreadgroup(
                         self.consumer_group,
@@ -351,6 +363,8 @@ class VehicleDetectionConsolidatorEnhanced:
                     if messages:
                         for stream_name, stream_messages in messages:
                             for message_id, fields in stream_messages:
+                                processing_start = time.time()
+                                observe_stream_lag(self.stream_lag_seconds, message_id, processing_start)
                                 try:
                                     # Safety check for valid message data
                                     if not fields:
@@ -361,6 +375,7 @@ class VehicleDetectionConsolidatorEnhanced:
                                         )
                                         # Acknowledge and skip invalid message
                                         self.redis_client.xack(self.radar_stream, self.consumer_group, message_id)
+                                        self.stream_events_total.labels("invalid").inc()
                                         continue
                                     
                                     # Process radar data and create consolidated event
@@ -371,6 +386,8 @@ class VehicleDetectionConsolidatorEnhanced:
                                     
                                     events_processed += 1
                                     self.event_count += 1
+                                    self.stream_events_total.labels("processed").inc()
+                                    self.processing_seconds.observe(time.time() - processing_start)
                                     
                                 except Exception as e:
                                     self.logger.log_error(
@@ -381,6 +398,7 @@ class VehicleDetectionConsolidatorEnhanced:
                                     )
                                     # Still acknowledge to prevent reprocessing
                                     self.redis_client.xack(self.radar_stream, self.consumer_group, message_id)
+                                    self.stream_events_total.labels("error").inc()
                     
                     # Log periodic statistics (every 5 minutes)
                     if time.time() - last_stats_log > 300:
@@ -388,14 +406,6 @@ class VehicleDetectionConsolidatorEnhanced:
                         last_stats_log = time.time()
                         events_processed = 0
                     
-                    # Track processing performance
-                    processing_time = time.time() - processing_start
-                    self.processing_times.append(processing_time)
-                    
-                    # Keep only last 1000 processing times
-                    if len(self.processing_times) > 1000:
-                        self.processing_times = self.processing_times[-1000:]
-                    
                 except Exception as e:
                     self.logger.log_error(
                         message=f"Error in radar stream processing loop: {str(e)}",
@@ -545,7 +555,7 @@ class VehicleDetectionConsolidatorEnhanced:
                         
                         if message and message['type'] == 'message':
                             # Parse camera detection data
-                            camera_data = json.loads(message['data'])
+                            camera_data = serialization.loads(message['data'])
                             
                             # Add to recent detections cache with timestamp
                             camera_entry = {
@@ -1190,7 +1200,7 @@ class VehicleDetectionConsolidatorEnhanced:
             # Add to standardized FIFO stream for database persistence
             stream_name = "traffic:consolidated"
             message_data = {
-                'data': json.dumps(consolidated_data),
+                'data': serialization.dumps(consolidated_data),
                 'correlation_id': correlation_id,
                 'timestamp': time.time()
             }
@@ -1242,7 +1252,7 @@ class VehicleDetectionConsolidatorEnhanced:
             try:
                 airport_json = self.redis_client.get("weather:airport:latest")
                 if airport_json:
-                    airport_data = json.loads(airport_json)
+                    airport_data = serialization.loads(airport_json)
                     # Convert temperature from Celsius to Fahrenheit for consistency
                     if "temperature" in airport_data and airport_data["temperature"] is not None:
                         temp_c = float(airport_data["temperature"])
@@ -1347,9 +1357,7 @@ class VehicleDetectionConsolidatorEnhanced:
             uptime = current_time - self.startup_time if self.startup_time else 0
             
             # Calculate performance metrics
-            avg_processing_time = 0
-            if self.processing_times:
-                avg_processing_time = sum(self.processing_times) / len(self.processing_times)
+            avg_processing_time = self._avg_processing_time()
             
             recent_detection_count = len(self.recent_detections)
             
@@ -1402,11 +1410,16 @@ class VehicleDetectionConsolidatorEnhanced:
             )
             return 0
     
+    def _avg_processing_time(self) -> float:
+        """Mean consolidation time per stream entry in seconds since startup"""
+        count = self.processing_seconds.count
+        return self.processing_seconds.sum / count if count else 0
+    
     def _log_processing_stats(self, events_processed: int, correlation_id: str):
         """Log periodic processing statistics"""
         
         uptime = time.time() - self.startup_time if self.startup_time else 0
-        avg_processing = sum(self.processing_times) / len(self.processing_times) if self.processing_times else 0
+        avg_processing = self._avg_processing_time()
         
         # Calculate vehicle grouping efficiency
         total_vehicle_detections = self.grouped_vehicles_count + self.single_detections_count
@@ -1479,6 +1492,9 @@ class VehicleDetectionConsolidatorEnhanced:
                         error=str(e)
                     )
             
+            if self.metrics_publisher:
+                self.metrics_publisher.stop()
+            
             # Close Redis connections
             if self.redis_client:
                 try:
@@ -1494,7 +1510,7 @@ class VehicleDetectionConsolidatorEnhanced:
             # Log final statistics
             if self.startup_time:
                 uptime = time.time() - self.startup_time
-                avg_processing = sum(self.processing_times) / len(self.processing_times) if self.processing_times else 0
+                avg_processing = self._avg_processing_time()
                 
                 self.logger.log_service_event(
                     event_type="service_shutdown_complete",
@@ -1537,7 +1553,8 @@ class VehicleDetectionConsolidatorEnhanced:
             }
             
             # Send request to camera
-            self.redis_client.publish("camera_requests", json.dumps(camera_request))
+            handshake_start = time.time()
+            self.redis_client.publish("camera_requests", serialization.dumps(camera_request))
             consolidated_data["camera_request_sent"] = True
             
             self.logger.log_service_event(
@@ -1549,6 +1566,9 @@ class VehicleDetectionConsolidatorEnhanced:
             # Wait for camera response (blocking with timeout)
             camera_response = self._wait_for_camera_response(correlation_id, timeout=5.0)
             
+            self.camera_handshake_seconds.labels("success" if camera_response else "timeout").observe(
+                time.time() - handshake_start)
+            
             if camera_response:
                 consolidated_data["camera_data"] = camera_response
                 self.logger.log_service_event(
@@ -1660,7 +1680,7 @@ class VehicleDetectionConsolidatorEnhanced:
                 
                 if message and message['type'] == 'message':
                     try:
-                        response_data = json.loads(message['data'])
+                        response_data = serialization.loads(message['data'])
                         correlation_id = response_data.get('correlation_id')
                         
                         if correlation_id:
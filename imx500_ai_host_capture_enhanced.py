@@ -243,6 +243,7 @@ class IMX500AIHostCapture:
             cv2.imwrite(str(image_path), image_bgr, [cv2.IMWRITE_JPEG_QUALITY, 95])
             
             file_size = image_path.stat().st_size
+            self._publish_latest_image(image_path, timestamp.timestamp())
             
             # Create comprehensive result package
             result_package = {
@@ -451,6 +452,29 @@ class IMX500AIHostCapture:
         
         return max(detections, key=lambda d: d["confidence"] * d["area_pixels"])
     
+    def _publish_latest_image(self, image_path: Path, capture_time: float):
+        """Atomically repoint live/latest at a fully written image and record it in Redis
+        
+        Readers (API gateway, SharedVolumeImageProvider) resolve the newest image from this
+        pointer instead of scanning the directory. Mirrors edge_processing/latest_image.py.
+        """
+        temp_link = self.live_dir / f".latest.{os.getpid()}.tmp"
+        try:
+            temp_link.unlink(missing_ok=True)
+            os.symlink(image_path.name, temp_link)
+            os.replace(temp_link, self.live_dir / "latest")
+        except OSError as e:
+            logger.warning(f"Could not update latest image link: {e}")
+        
+        if self.redis_client:
+            try:
+                self.redis_client.set("camera:latest_image", json.dumps({
+                    "filename": image_path.name,
+                    "capture_time": capture_time
+                }))
+            except Exception as e:
+                logger.warning(f"Could not publish latest image to Redis: {e}")
+    
     def _publish_ai_results(self, result_package: Dict[str, Any]):
         """Publish AI results to Redis for Docker container consumption"""
         if not self.redis_client:
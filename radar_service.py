@@ -19,6 +19,8 @@ from typing import Callable, Optional, Dict
 
 # Import centralized logging infrastructure
 from edge_processing.shared_logging import ServiceLogger, CorrelationContext, performance_monitor
+from edge_processing.service_metrics import MetricsRegistry, RedisMetricsPublisher
+from edge_processing import serialization
 
 class RadarServiceEnhanced:
     """Enhanced OPS243-C Radar Service with centralized logging and correlation tracking"""
@@ -56,9 +58,14 @@ class RadarServiceEnhanced:
         self.detection_count = 0
         self.startup_time = None
         
-        # Performance tracking
+        # Performance tracking (published to Redis for the gateway's /metrics)
         self.last_detection_time = None
-        self.processing_times = []
+        self.metrics = MetricsRegistry("radar-service")
+        self.processing_seconds = self.metrics.histogram(
+            "radar_processing_seconds", "Time to process one radar reading")
+        self.detections_total = self.metrics.counter(
+            "radar_detections", "Significant vehicle detections", ("alert_level",))
+        self.metrics_publisher = None
 
     def start(self) -> bool:
         """Start the radar service with full correlation tracking"""
@@ -95,6 +102,9 @@ class RadarServiceEnhanced:
                     message="✅ Connected to Redis successfully"
                 )
                 
+                self.metrics_publisher = RedisMetricsPublisher(self.metrics, self.redis_client)
+                self.metrics_publisher.start()
+                
                 # Connect to UART with performance monitoring
                 with performance_monitor("uart_connection"):
                     self.ser = serial.Serial(self.uart_port, self.baudrate, timeout=2)
@@ -312,6 +322,7 @@ class RadarServiceEnhanced:
                             
                             # Log vehicle detection with correlation
                             alert_level = self._determine_alert_level(speed)
+                            self.detections_total.labels(alert_level).inc()
                             
                             self.logger.log_business_event(
                                 event_name="vehicle_detected",
@@ -402,15 +413,11 @@ class RadarServiceEnhanced:
                 
                 # Track processing performance
                 processing_time = time.time() - processing_start
-                self.processing_times.append(processing_time)
-                
-                # Keep only last 1000 processing times for statistics
-                if len(self.processing_times) > 1000:
-                    self.processing_times = self.processing_times[-1000:]
+                self.processing_seconds.observe(processing_time)
                 
                 # Log performance metrics for significant detections
                 if is_significant:
-                    avg_processing = sum(self.processing_times) / len(self.processing_times)
+                    avg_processing = self._avg_processing_time()
                     self.logger.debug(
                         f"Detection processed in {processing_time*1000:.2f}ms (avg: {avg_processing*1000:.2f}ms)"
                     )
@@ -465,7 +472,7 @@ class RadarServiceEnhanced:
             # Try JSON format
             if line.startswith('{') and line.endswith('}'):
                 try:
-                    data = json.loads(line)
+                    data = serialization.loads(line)
                     self.logger.debug(f"Parsed JSON data: {data}")
                     
                     if 'speed' in data:
@@ -629,7 +636,7 @@ class RadarServiceEnhanced:
             }
             
             # Publish to traffic_events channel for consolidator notification
-            self.redis_client.publish('traffic_events', json.dumps(event_data))
+            self.redis_client.publish('traffic_events', serialization.dumps(event_data))
             
             self.logger.debug(
                 f"🔔 Published traffic event: {speed:.1f} mph detection",
@@ -655,14 +662,16 @@ class RadarServiceEnhanced:
                 }
             )
 
+    def _avg_processing_time(self) -> float:
+        """Mean processing time per reading in seconds since startup"""
+        count = self.processing_seconds.count
+        return self.processing_seconds.sum / count if count else 0
+
     def _log_periodic_stats(self, loop_iterations: int):
         """Log periodic service statistics"""
         
         uptime = time.time() - self.startup_time if self.startup_time else 0
-        avg_processing_time = 0
-        
-        if self.processing_times:
-            avg_processing_time = sum(self.processing_times) / len(self.processing_times)
+        avg_processing_time = self._avg_processing_time()
         
         self.logger.log_service_event(
             event_type="periodic_stats",
@@ -693,6 +702,9 @@ class RadarServiceEnhanced:
                 self.thread.join(timeout=5)
                 self.logger.debug("Radar monitoring thread stopped")
             
+            if self.metrics_publisher:
+                self.metrics_publisher.stop()
+            
             # Close UART connection
             if self.ser:
                 try:
@@ -708,7 +720,7 @@ class RadarServiceEnhanced:
             # Log final statistics
             if self.startup_time:
                 uptime = time.time() - self.startup_time
-                avg_processing = sum(self.processing_times) / len(self.processing_times) if self.processing_times else 0
+                avg_processing = self._avg_processing_time()
                 
                 self.logger.log_service_event(
                     event_type="service_shutdown_complete",
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Response Compression Benchmark
+Reports compression CPU time against bytes saved for payloads shaped like the gateway's
+consolidated events, analytics and violations CSV responses, at several gzip levels and
+brotli qualities, plus the transfer time saved on a slow remote link.
+
+Usage:
+    python3 benchmark_compression.py [--events 500] [--rows 20000] [--link-mbps 2]
+"""
+
+import argparse
+import gzip
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "edge_api"))
+
+from response_compression import BROTLI_AVAILABLE
+
+if BROTLI_AVAILABLE:
+    import brotli
+
+VEHICLE_TYPES = ['car', 'truck', 'motorcycle', 'bus', 'bicycle']
+
+
+def consolidated_events(count, rng):
+    events = []
+    for i in range(count):
+        speed = round(rng.uniform(12, 42), 1)
+        events.append({
+            "consolidation_id": f"consolidated_{1700000000 + i * 37}_{i:04d}",
+            "timestamp": 1700000000 + i * 37.25,
+            "trigger_source": "radar",
+            "radar_data": {"speed_mph": speed, "speed_mps": round(speed * 0.44704, 2), "magnitude": "unknown",
+                           "direction": rng.choice(["approaching", "receding"]), "alert_level": "normal"},
+            "weather_data": {"dht22": {"temperature_c": 21.4, "humidity": 48.2, "timestamp": "2023-11-14T22:13:20"},
+                             "airport": {"textDescription": "Clear", "temperature": 19.0, "windSpeed": 9.3}},
+            "camera_data": {"vehicle_count": 1, "detection_confidence": round(rng.uniform(0.5, 0.99), 3),
+                            "vehicle_types": [rng.choice(VEHICLE_TYPES)]},
+            "processing_notes": "Radar-triggered consolidation"
+        })
+    return json.dumps({"events": events, "count": count}).encode('utf-8')
+
+
+def analytics(rng):
+    hourly = [{"hour": h, "count": rng.randint(0, 400), "avg_speed": round(rng.uniform(18, 30), 2)} for h in range(24 * 7)]
+    return json.dumps({"period": "7d", "hourly": hourly,
+                       "speed_distribution": {str(b): rng.randint(0, 900) for b in range(0, 60, 5)}}).encode('utf-8')
+
+
+def violations_csv(rows, rng):
+    lines = ["Date,Time,Vehicle Type,Speed (MPH),Speed Limit,Violation Amount,Location,Confidence"]
+    for i in range(rows):
+        speed = rng.uniform(25.1, 45)
+        lines.append(f"2024-03-{1 + i % 28:02d},{i % 24:02d}:{i % 60:02d}:{(i * 7) % 60:02d},"
+                     f"{rng.choice(VEHICLE_TYPES)},{speed:.1f},25,{speed - 25:.1f},Main Street,{rng.uniform(50, 99):.1f}%")
+    return "\n".join(lines).encode('utf-8')
+
+
+def codecs():
+    yield "gzip 1", lambda data: gzip.compress(data, 1, mtime=0)
+    yield "gzip 5", lambda data: gzip.compress(data, 5, mtime=0)
+    yield "gzip 9", lambda data: gzip.compress(data, 9, mtime=0)
+    if BROTLI_AVAILABLE:
+        for quality in (1, 4, 11):
+            yield f"br {quality}", lambda data, q=quality: brotli.compress(data, quality=q)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark response compression CPU cost against bytes saved")
+    parser.add_argument('--events', type=int, default=500, help="consolidated events in the JSON payload")
+    parser.add_argument('--rows', type=int, default=20000, help="rows in the violations CSV")
+    parser.add_argument('--link-mbps', type=float, default=2.0, help="remote link throughput for transfer time")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    payloads = [("consolidated events", consolidated_events(args.events, rng)),
+                ("analytics", analytics(rng)),
+                ("violations csv", violations_csv(args.rows, rng))]
+    if not BROTLI_AVAILABLE:
+        print("brotli not installed: gzip only\n")
+
+    print(f"{'payload':<22}{'codec':<9}{'KB in':>9}{'KB out':>9}{'saved':>8}{'cpu ms':>9}"
+          f"{'link ms':>10}{'ms saved per cpu ms':>22}")
+    for name, data in payloads:
+        raw_link_ms = len(data) * 8 / (args.link_mbps * 1e6) * 1000
+        print(f"{name:<22}{'none':<9}{len(data) / 1024:>9.1f}{len(data) / 1024:>9.1f}{'':>8}{'':>9}{raw_link_ms:>10.0f}")
+        for label, compress in codecs():
+            started = time.process_time()
+            for _ in range(args.repeat):
+                out = compress(data)
+            cpu_ms = (time.process_time() - started) / args.repeat * 1000
+            link_ms = len(out) * 8 / (args.link_mbps * 1e6) * 1000
+            print(f"{'':<22}{label:<9}{len(data) / 1024:>9.1f}{len(out) / 1024:>9.1f}"
+                  f"{1 - len(out) / len(data):>8.0%}{cpu_ms:>9.2f}{link_ms:>10.0f}"
+                  f"{(raw_link_ms - link_ms) / max(cpu_ms, 1e-3):>22.0f}")
+
+
+if __name__ == "__main__":
+    main()
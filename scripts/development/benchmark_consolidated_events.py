@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Consolidated Events Benchmark
+Serializes /api/vehicles/consolidated responses at limit=1000 from a synthetic database:
+the previous approach (json.loads each event_json, merge, json.dumps the whole response),
+splicing the stored api_json strings in unparsed, and the parsing path still used when
+?fields= projects a subset of each event.
+
+Usage:
+    python3 benchmark_consolidated_events.py [--rows 20000] [--limit 1000] [--repeat 50]
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "edge_api"))
+sys.path.insert(0, str(ROOT / "edge_processing"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from event_stream import (consolidated_event_json, consolidated_event_record, consolidated_events_query,
+                          has_api_json, json_object_with_array, project_record)
+from synthetic_traffic_db import create_synthetic_database
+
+
+def parsed_response(conn, limit):
+    """The previous implementation: json.loads every event, json.dumps the whole response"""
+    rows = conn.execute(*consolidated_events_query(limit)).fetchall()
+    events = [{"consolidation_id": row['consolidation_id'], "created_at": row['created_at'],
+               **json.loads(row['event_json'])} for row in rows]
+    return json.dumps({"events": events, "total_count": len(events)}).encode('utf-8')
+
+
+def spliced_response(conn, limit):
+    """Stored api_json spliced in as it is"""
+    api_json = has_api_json(conn)
+    rows = conn.execute(*consolidated_events_query(limit, api_json=api_json)).fetchall()
+    events = [text for text in (consolidated_event_json(row, api_json) for row in rows) if text is not None]
+    return json_object_with_array("events", events, {"total_count": len(events)})
+
+
+def projected_response(conn, limit, fields=('consolidation_id', 'radar_data')):
+    rows = conn.execute(*consolidated_events_query(limit)).fetchall()
+    events = [json.dumps(project_record(record, fields))
+              for record in map(consolidated_event_record, rows) if record is not None]
+    return json_object_with_array("events", events, {"total_count": len(events)})
+
+
+def measure(label, repeat, run):
+    run()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        body = run()
+    elapsed = (time.perf_counter() - started) / repeat
+    print(f"{label:<28}{elapsed * 1000:>10.2f}{len(body) / 1024:>12.0f}")
+    return elapsed, body
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark consolidated event responses")
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--limit', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "traffic_data.db")
+        create_synthetic_database(db_path, args.rows, with_events=True).close()
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = sqlite3.Row
+
+        print(f"limit={args.limit}, {args.rows} stored events\n")
+        print(f"{'response':<28}{'ms':>10}{'KiB':>12}")
+        parsed, parsed_body = measure("parse + re-serialize", args.repeat, lambda: parsed_response(conn, args.limit))
+        spliced, spliced_body = measure("spliced api_json", args.repeat, lambda: spliced_response(conn, args.limit))
+        measure("?fields= projection", args.repeat, lambda: projected_response(conn, args.limit))
+
+        same = json.loads(parsed_body) == json.loads(spliced_body)
+        print(f"\nspliced is {parsed / spliced:.1f}x faster; same JSON: {same}")
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
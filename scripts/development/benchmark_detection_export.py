@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Detection Export Benchmark
+Exports 1M synthetic detections in every available format and reports throughput and peak memory.
+Peak RSS should stay flat as the row count grows because rows are streamed in chunks.
+
+Usage:
+    python3 benchmark_detection_export.py [--rows 1000000] [--chunk-size 5000]
+"""
+
+import argparse
+import os
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "edge_api"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from data_export import DetectionExporter, available_formats
+from synthetic_traffic_db import create_synthetic_database
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (Linux reports KB)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark streaming detection export")
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--chunk-size', type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'traffic_data.db')
+
+        print(f"Building synthetic database with {args.rows:,} detections...")
+        started = time.time()
+        create_synthetic_database(db_path, args.rows).close()
+        print(f"  built in {time.time() - started:.1f}s, {os.path.getsize(db_path) / 1e6:.0f} MB on disk")
+        print(f"  baseline peak RSS: {peak_rss_mb():.1f} MB\n")
+
+        exporter = DetectionExporter(db_path=db_path, chunk_size=args.chunk_size)
+
+        print(f"{'format':<10}{'rows/s':>12}{'MB out':>10}{'seconds':>10}{'peak RSS MB':>14}")
+        for fmt in available_formats():
+            started = time.time()
+            total_bytes = 0
+            for piece in exporter.stream(fmt, 0, time.time() + 86400):
+                total_bytes += len(piece)
+            elapsed = time.time() - started
+            print(f"{fmt:<10}{args.rows / elapsed:>12,.0f}{total_bytes / 1e6:>10.1f}"
+                  f"{elapsed:>10.1f}{peak_rss_mb():>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
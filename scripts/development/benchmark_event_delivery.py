@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+WebSocket Event Delivery Benchmark
+Measures the server-side cost of pushing a burst of real-time events to many simulated
+Socket.IO clients: one emit per event to every client (the previous behaviour) against
+subscription-filtered batches from event_delivery.EventCoalescer.
+
+Clients are registered with the Socket.IO manager directly and the transport is replaced
+by a counter, so the numbers cover encoding and fan-out without network I/O.
+
+Usage:
+    python3 benchmark_event_delivery.py [--clients 500] [--events 1000] [--windows 10]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "edge_api"))
+
+from flask import Flask
+from flask_socketio import SocketIO
+
+from event_delivery import EventCoalescer, classify_event
+
+# Share of published events per type, and share of clients subscribed to each channel
+EVENT_MIX = [('radar_reading', 0.6), ('system_log', 0.3), ('vehicle_detected', 0.09), ('radar_alert', 0.01)]
+SUBSCRIBERS = {'alerts': 1.0, 'consolidated': 1.0, 'radar': 0.2, 'logs': 0.1}
+
+
+class CountingTransport:
+    """Stands in for the client sockets: counts packets and encoded bytes"""
+
+    def __init__(self):
+        self.packets = 0
+        self.bytes = 0
+
+    def __call__(self, eio_sid, eio_packet):
+        self.packets += 1
+        self.bytes += len(eio_packet.encode())
+
+
+def build_server(clients, rng):
+    socketio = SocketIO(Flask(__name__), async_mode='threading')
+    transport = CountingTransport()
+    socketio.server._send_eio_packet = transport
+    delivery = EventCoalescer(socketio)
+    for i in range(clients):
+        sid = socketio.server.manager.connect(f"eio-{i}", '/')
+        delivery.subscribe(sid, [channel for channel, share in SUBSCRIBERS.items() if rng.random() < share])
+    return socketio, delivery, transport
+
+
+def make_events(count, rng):
+    names, weights = zip(*EVENT_MIX)
+    events = []
+    for i in range(count):
+        business_event = rng.choices(names, weights)[0]
+        event = {'event_id': i, 'business_event': business_event, 'timestamp': time.time(),
+                 'service_name': 'radar_service' if business_event.startswith('radar') else 'api_gateway_service',
+                 'speed_mph': round(rng.uniform(5, 45), 1), 'message': f'{business_event} #{i}'}
+        events.append(event)
+    return events
+
+
+def run_per_event(socketio, events):
+    for event in events:
+        name = 'system_log' if event['business_event'] == 'system_log' else 'real_time_event'
+        socketio.emit(name, event)
+
+
+def run_coalesced(delivery, events, windows):
+    per_window = max(1, len(events) // windows)
+    for start in range(0, len(events), per_window):
+        for event in events[start:start + per_window]:
+            channel = 'logs' if event['business_event'] == 'system_log' else classify_event(event)
+            delivery.publish(channel, event)
+        delivery.flush()
+
+
+def measure(label, events, transport, run):
+    started = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<22}{elapsed * 1000:>10.1f}{transport.packets:>12}{transport.bytes / 1e6:>10.1f}"
+          f"{elapsed * 1e6 / len(events):>14.1f}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark WebSocket event fan-out")
+    parser.add_argument('--clients', type=int, default=500)
+    parser.add_argument('--events', type=int, default=1000)
+    parser.add_argument('--windows', type=int, default=10, help="flush windows the burst spans (100 ms each)")
+    args = parser.parse_args()
+
+    events = make_events(args.events, random.Random(1))
+    print(f"{args.clients} clients, {args.events} events over {args.windows} windows\n")
+    print(f"{'delivery':<22}{'emit ms':>10}{'packets':>12}{'MB':>10}{'us/event':>14}")
+
+    socketio, _, transport = build_server(args.clients, random.Random(2))
+    before = measure("per event, everyone", events, transport, lambda: run_per_event(socketio, events))
+
+    _, delivery, transport = build_server(args.clients, random.Random(2))
+    after = measure("batched, subscribed", events, transport,
+                    lambda: run_coalesced(delivery, events, args.windows))
+    print(f"\nEmit cost reduced {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Latest Image Lookup Benchmark
+Compares finding the newest capture by globbing the live directory against resolving
+the `latest` pointer maintained by the capture service.
+
+Usage:
+    python3 benchmark_latest_image.py [--files 1000 10000 100000] [--repeat 20]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "edge_processing"))
+
+from latest_image import newest_image_by_scan, publish_latest_image, resolve_latest_image
+
+
+def glob_newest(live_dir):
+    """What the gateway and image provider used to do on every request"""
+    images = list(Path(live_dir).glob("*.jpg"))
+    return max(images, key=lambda p: p.stat().st_mtime) if images else None
+
+
+def time_call(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def populate(live_dir, count):
+    base = time.time() - count
+    for i in range(count):
+        path = live_dir / f"capture_{i:07d}.jpg"
+        path.touch()
+        os.utime(path, (base + i, base + i))
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark latest-image lookup strategies")
+    parser.add_argument('--files', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'files':>8}{'glob ms':>12}{'scandir ms':>12}{'pointer ms':>12}{'speedup':>10}")
+    for count in args.files:
+        with tempfile.TemporaryDirectory() as tmp:
+            live_dir = Path(tmp)
+            newest = populate(live_dir, count)
+            publish_latest_image(live_dir, newest)
+            assert glob_newest(live_dir) == newest_image_by_scan(live_dir) == resolve_latest_image(live_dir) == newest
+
+            glob_ms = time_call(lambda: glob_newest(live_dir), args.repeat)
+            scan_ms = time_call(lambda: newest_image_by_scan(live_dir), args.repeat)
+            pointer_ms = time_call(lambda: resolve_latest_image(live_dir), args.repeat * 50)
+            print(f"{count:>8}{glob_ms:>12.2f}{scan_ms:>12.2f}{pointer_ms:>12.4f}{glob_ms / pointer_ms:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
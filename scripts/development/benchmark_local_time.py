@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Local Time Conversion Benchmark
+Converting epoch timestamps spanning both 2025 DST transitions to Central Time ISO strings:
+per record with ZoneInfo (as the gateway did), LocalTimeConverter's pure Python path, and
+its NumPy path. Every method's output is checked against the per-record result.
+
+Usage:
+    python3 benchmark_local_time.py [--count 100000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "edge_processing"))
+
+import local_time
+from local_time import LocalTimeConverter
+
+CENTRAL = ZoneInfo('America/Chicago')
+YEAR_START = 1735711200  # 2025-01-01 00:00 Central
+
+
+def per_record(timestamps):
+    return [datetime.fromtimestamp(timestamp, CENTRAL).isoformat() for timestamp in timestamps]
+
+
+def measure(label, run, expected):
+    started = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - started
+    status = "identical" if result == expected else "MISMATCH"
+    print(f"{label:<30}{elapsed * 1000:>10.1f} ms  {status}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batch Central Time conversion")
+    parser.add_argument('--count', type=int, default=100000)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    timestamps = sorted(rng.uniform(YEAR_START, YEAR_START + 365 * 86400) for _ in range(args.count))
+    expected = per_record(timestamps)
+
+    print(f"{args.count} timestamps across 2025\n")
+    baseline = measure("per record (ZoneInfo)", lambda: per_record(timestamps), expected)
+    python_time = measure("LocalTimeConverter (Python)",
+                          lambda: LocalTimeConverter(CENTRAL).isoformat_reference(timestamps), expected)
+    print(f"{'':<30}{baseline / python_time:>10.1f}x")
+    if local_time.NUMPY_AVAILABLE:
+        numpy_time = measure("LocalTimeConverter (NumPy)",
+                             lambda: LocalTimeConverter(CENTRAL).isoformat(timestamps), expected)
+        print(f"{'':<30}{baseline / numpy_time:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
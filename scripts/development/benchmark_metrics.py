@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Service Metrics Benchmark
+Per-call cost of recording a latency in the radar and consolidator hot paths: the previous
+capped processing_times list (append, trim, recompute the mean) against a fixed-bucket
+histogram from service_metrics, plus the cost of rendering a registry for a scrape.
+
+Usage:
+    python3 benchmark_metrics.py [--calls 200000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "edge_processing"))
+
+from service_metrics import MetricsRegistry
+
+
+def record_in_list(values):
+    """radar_service.py before: keep the last 1000 times and average them on each detection"""
+    processing_times = []
+    for value in values:
+        processing_times.append(value)
+        if len(processing_times) > 1000:
+            processing_times = processing_times[-1000:]
+        sum(processing_times) / len(processing_times)
+
+
+def record_in_histogram(values, histogram):
+    observe = histogram.observe
+    for value in values:
+        observe(value)
+
+
+def measure(label, calls, run):
+    started = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<34}{elapsed * 1e9 / calls:>12.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark metric recording overhead")
+    parser.add_argument('--calls', type=int, default=200000)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    values = [rng.lognormvariate(-6, 1) for _ in range(args.calls)]
+    registry = MetricsRegistry("benchmark")
+    histogram = registry.histogram("radar_processing_seconds", "Processing time")
+    counter = registry.counter("radar_detections", "Detections", ("alert_level",))
+
+    print(f"{'recording':<34}{'ns/call':>12}")
+    measure("capped list + running mean", args.calls, lambda: record_in_list(values))
+    measure("histogram.observe", args.calls, lambda: record_in_histogram(values, histogram))
+    measure("counter.labels(...).inc", args.calls,
+            lambda: [counter.labels("normal").inc() for _ in range(args.calls)])
+
+    for i in range(50):
+        registry.histogram("api_request_duration_seconds", "Latency", ("route",)).labels(f"/api/route/{i}").observe(0.01)
+    started = time.perf_counter()
+    text = registry.render()
+    print(f"\nrender {len(text.splitlines())} lines: {(time.perf_counter() - started) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Radar Grouping Benchmark
+Compares the plain Python radar ping grouping (group_radar_pings_reference) against the
+NumPy implementation used by RedisDataAccess.group_radar_detections on synthetic traffic:
+bursts of 20 Hz pings per vehicle with varying gaps, as read from the radar stream.
+
+Usage:
+    python3 benchmark_radar_grouping.py [--samples 100000] [--repeat 5]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from edge_api.radar_grouping import NUMPY_AVAILABLE, group_radar_pings, group_radar_pings_reference
+
+PARAMS = dict(window_seconds=5, min_pings=3, speed_jump_mph=10.0)
+
+
+def synthetic_pings(samples, seed=42):
+    rng = random.Random(seed)
+    pings, ms = [], int(time.time() * 1000) - samples * 100
+    while len(pings) < samples:
+        speed = rng.uniform(15, 45) * rng.choice([1, -1])
+        for _ in range(min(rng.randint(1, 40), samples - len(pings))):
+            pings.append({'timestamp_ms': ms, 'speed': round(speed + rng.gauss(0, 1.5), 1)})
+            ms += 50
+        ms += rng.choice([500, 2000, 6000, 30000])
+    return pings
+
+
+def best_of(repeat, func):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Python vs NumPy radar ping grouping")
+    parser.add_argument('--samples', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    if not NUMPY_AVAILABLE:
+        sys.exit("NumPy is not installed; both paths would run the reference implementation")
+
+    pings = synthetic_pings(args.samples)
+    python_time, expected = best_of(args.repeat, lambda: group_radar_pings_reference(pings, **PARAMS))
+    numpy_time, actual = best_of(args.repeat, lambda: group_radar_pings(pings, **PARAMS))
+
+    assert [(d['id'], d['ping_count']) for d in actual] == [(d['id'], d['ping_count']) for d in expected]
+
+    print(f"{args.samples:,} radar samples -> {len(actual):,} detections\n")
+    print(f"{'method':<22}{'best ms':>10}")
+    print(f"{'python reference':<22}{python_time * 1000:>10.1f}")
+    print(f"{'numpy reduceat':<22}{numpy_time * 1000:>10.1f}")
+    print(f"\nSpeedup: {python_time / numpy_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
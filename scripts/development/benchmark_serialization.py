@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Serialization Backend Benchmark
+Events per second through every JSON step one consolidated event takes, with each backend
+of edge_processing/serialization.py:
+
+    consolidator   serialize the record for the traffic:consolidated stream
+    persistence    parse the stream payload, serialize event_json and api_json
+    logging        one structured JSON log line per service
+    API            one /api/vehicles/consolidated?fields=... record (parse + serialize)
+
+Usage:
+    python3 benchmark_serialization.py [--events 20000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "edge_processing"))
+
+import serialization
+
+
+def consolidated_record(index):
+    """A record shaped like vehicle_consolidator_service's output"""
+    return {
+        "consolidation_id": f"consolidated_{index:012x}_{index}",
+        "correlation_id": f"{index:08x}",
+        "timestamp": 1_760_000_000 + index * 0.75,
+        "trigger_source": "radar",
+        "radar_data": {"speed": 31.4, "speed_mps": 14.04, "magnitude": 2104.5, "direction": "approaching",
+                       "alert_level": "low", "correlation_id": f"{index:08x}", "_raw": '{"speed": 31.4}'},
+        "camera_data": {"vehicle_count": 1, "vehicle_types": ["car"], "detection_confidence": 0.87,
+                        "bounding_boxes": [[412, 188, 640, 352]], "image_path": f"/mnt/storage/ai_camera_images/{index}.jpg"},
+        "weather_data": {"dht22": {"temperature_c": 21.5, "temperature_f": 70.7, "humidity": 48.0},
+                         "airport": {"temperature": 22.0, "textDescription": "Partly Cloudy", "windSpeed": 11.2}},
+        "processing_metadata": {"consolidator_version": "2.1", "processing_time_ms": 3.2,
+                                "data_sources": ["radar", "camera", "weather"]}
+    }
+
+
+def run_pipeline(records):
+    for record in records:
+        payload = serialization.dumps(record)
+        stored = serialization.loads(payload)
+        serialization.dumps(stored)
+        api_json = serialization.dumps({"consolidation_id": stored["consolidation_id"],
+                                        "created_at": "2025-10-09 08:53:20", **stored})
+        for service in ("vehicle-consolidator", "database-persistence"):
+            serialization.dumps({"timestamp": "2025-10-09T08:53:20.123456", "service": service, "level": "INFO",
+                                 "message": "Stored consolidated JSON", "module": "shared_logging",
+                                 "function": "info", "line": 111, "correlation_id": stored["correlation_id"]})
+        record_out = serialization.loads(api_json)
+        serialization.dumpb({key: record_out[key] for key in ("consolidation_id", "radar_data")})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON backends end to end")
+    parser.add_argument('--events', type=int, default=20000)
+    args = parser.parse_args()
+
+    records = [consolidated_record(i) for i in range(args.events)]
+    print(f"{args.events} consolidated events\n")
+    print(f"{'backend':<10}{'events/s':>12}{'us/event':>12}")
+    rates = {}
+    for name in serialization.BACKENDS:
+        try:
+            serialization.set_backend(name)
+        except ValueError as e:
+            print(f"{name:<10}{'skipped':>12}  ({e})")
+            continue
+        run_pipeline(records[:500])
+        started = time.perf_counter()
+        run_pipeline(records)
+        elapsed = time.perf_counter() - started
+        rates[name] = args.events / elapsed
+        print(f"{name:<10}{rates[name]:>12.0f}{elapsed * 1e6 / args.events:>12.1f}")
+
+    if len(rates) == 2:
+        print(f"\norjson is {rates['orjson'] / rates['json']:.1f}x the json module")
+
+
+if __name__ == "__main__":
+    main()
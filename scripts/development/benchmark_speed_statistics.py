@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Speed Statistics Benchmark
+Compares the previous Python-side speed statistics (fetch every row in the window, then
+average, sort and count in Python) against SQLiteDataAccess.get_speed_statistics, which
+aggregates inside SQLite and transfers only the results.
+
+Usage:
+    python3 benchmark_speed_statistics.py [--rows 100000] [--repeat 5]
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from edge_api.data_access import SQLiteDataAccess
+from edge_api.sqlite_pool import close_all_pools
+from synthetic_traffic_db import create_synthetic_database
+
+SPEED_LIMIT_MPH = 25.0
+SPAN_SECONDS = 86400
+
+
+def python_statistics(conn, start_ts, end_ts):
+    """The previous implementation: materialize every row, then compute in Python"""
+    rows = conn.execute("""
+        SELECT t.timestamp, t.correlation_id, r.speed_mph, r.speed_mps, r.confidence, r.alert_level, r.direction
+        FROM traffic_detections t
+        JOIN radar_detections r ON t.id = r.detection_id
+        WHERE t.timestamp BETWEEN ? AND ?
+    """, (start_ts, end_ts)).fetchall()
+    speeds = [abs(row['speed_mph']) for row in rows]
+
+    distribution = {}
+    for speed in speeds:
+        bucket = int(speed // 10) * 10
+        distribution[bucket] = distribution.get(bucket, 0) + 1
+    ordered = sorted(speeds)
+    return {
+        'count': len(speeds),
+        'avg': sum(speeds) / len(speeds),
+        'min': min(speeds),
+        'max': max(speeds),
+        'violations': sum(1 for s in speeds if s > SPEED_LIMIT_MPH),
+        'distribution': distribution,
+        'percentiles': {f"p{p}": ordered[int((p / 100) * (len(ordered) - 1))] for p in (25, 50, 75, 85, 95)}
+    }
+
+
+def best_of(repeat, func):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Python vs SQLite speed statistics")
+    parser.add_argument('--rows', type=int, default=100_000, help="detections inside the 24-hour window")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'traffic_data.db')
+        start_ts = time.time() - SPAN_SECONDS
+        print(f"Building synthetic database with {args.rows:,} detections in a 24-hour window...")
+        create_synthetic_database(db_path, args.rows, start_ts=start_ts, span_seconds=SPAN_SECONDS).close()
+        end_ts = start_ts + SPAN_SECONDS
+
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = sqlite3.Row
+        access = SQLiteDataAccess(db_path)
+
+        python_time, expected = best_of(args.repeat, lambda: python_statistics(conn, start_ts, end_ts))
+        sql_time, actual = best_of(args.repeat, lambda: access.get_speed_statistics(
+            datetime.fromtimestamp(start_ts), datetime.fromtimestamp(end_ts), SPEED_LIMIT_MPH))
+
+        assert actual['count'] == expected['count']
+        assert actual['violations'] == expected['violations']
+        assert actual['percentiles'] == expected['percentiles']
+
+        print(f"\n{'method':<22}{'best ms':>10}")
+        print(f"{'python (fetch all)':<22}{python_time * 1000:>10.1f}")
+        print(f"{'sqlite aggregates':<22}{sql_time * 1000:>10.1f}")
+        print(f"\nSpeedup: {python_time / sql_time:.1f}x over {actual['count']:,} measurements")
+
+        conn.close()
+        close_all_pools()
+
+
+if __name__ == "__main__":
+    main()
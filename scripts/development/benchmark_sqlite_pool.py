@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+SQLite Read Pool Benchmark
+Compares requests/s for the gateway's read queries with a new connection per request
+(the previous behaviour) against the bounded read-only pool.
+
+Usage:
+    python3 benchmark_sqlite_pool.py [--rows 100000] [--threads 4] [--requests 2000]
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "edge_api"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlite_pool import SQLiteReadPool
+from synthetic_traffic_db import create_synthetic_database
+
+# Same shape as the gateway's /vehicles/consolidated and /vehicles/detections queries
+QUERIES = {
+    "consolidated": (
+        "SELECT consolidation_id, event_json, created_at FROM consolidated_events "
+        "ORDER BY created_at DESC LIMIT ?", (20,)
+    ),
+    "detections": (
+        "SELECT td.id, td.timestamp, td.trigger_source, rd.speed_mph, rd.speed_mps, rd.alert_level "
+        "FROM traffic_detections td "
+        "LEFT JOIN radar_detections rd ON td.id = rd.detection_id "
+        "ORDER BY td.timestamp DESC LIMIT ?", (100,)
+    ),
+}
+
+
+def handle_request_unpooled(db_path, sql, params):
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        rows = conn.execute(sql, params).fetchall()
+        return json.dumps([dict(r) for r in rows])
+    finally:
+        conn.close()
+
+
+def handle_request_pooled(pool, sql, params):
+    with pool.connection() as conn:
+        rows = conn.execute(sql, params).fetchall()
+    return json.dumps([dict(r) for r in rows])
+
+
+def run(handler, threads, requests_per_thread):
+    def worker():
+        for _ in range(requests_per_thread):
+            handler()
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    started = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    return threads * requests_per_thread / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pooled vs per-request SQLite connections")
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--requests', type=int, default=2000, help="requests per thread")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'traffic_data.db')
+        print(f"Building synthetic database with {args.rows:,} detections...")
+        create_synthetic_database(db_path, args.rows, with_events=True).close()
+
+        pool = SQLiteReadPool(db_path)
+        print(f"\n{'query':<14}{'per-request req/s':>20}{'pooled req/s':>16}{'speedup':>10}")
+        for name, (sql, params) in QUERIES.items():
+            unpooled = run(lambda: handle_request_unpooled(db_path, sql, params), args.threads, args.requests)
+            pooled = run(lambda: handle_request_pooled(pool, sql, params), args.threads, args.requests)
+            print(f"{name:<14}{unpooled:>20,.0f}{pooled:>16,.0f}{pooled / unpooled:>9.1f}x")
+
+        print(f"\nPool stats: {pool.get_stats()}")
+        pool.close_all()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Thumbnail Benchmark
+Compares serving a full-resolution capture against a reduced-scale thumbnail: decode
+time (full decode + resize vs. reduced JPEG decode), cached lookup time, and bytes sent.
+
+Uses a real capture when given one, otherwise a synthetic IMX500-sized frame.
+
+Usage:
+    python3 benchmark_thumbnails.py [--image capture.jpg] [--widths 300 800] [--repeat 10]
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "edge_api"))
+
+import image_thumbnails
+from image_thumbnails import ThumbnailCache, render_thumbnail
+
+IMX500_SIZE = (4056, 3040)
+
+
+def median_ms(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def synthetic_capture(path):
+    import numpy as np
+    import cv2
+    width, height = IMX500_SIZE
+    rng = np.random.default_rng(0)
+    # Smooth scene plus sensor noise, so the JPEG compresses like a real frame
+    x = np.linspace(0, 4 * np.pi, width)
+    y = np.linspace(0, 3 * np.pi, height)[:, None]
+    scene = (127 + 60 * np.sin(x) * np.cos(y))[..., None] + rng.normal(0, 6, (height, width, 3))
+    cv2.imwrite(str(path), np.clip(scene, 0, 255).astype(np.uint8), [cv2.IMWRITE_JPEG_QUALITY, 90])
+    return path
+
+
+def full_decode_resize(path, width):
+    """The naive approach: decode every pixel, then shrink"""
+    import cv2
+    image = cv2.imread(str(path))
+    height = round(image.shape[0] * width / image.shape[1])
+    small = cv2.resize(image, (width, height), interpolation=cv2.INTER_AREA)
+    return cv2.imencode('.jpg', small, [cv2.IMWRITE_JPEG_QUALITY, image_thumbnails.JPEG_QUALITY])[1].tobytes()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark reduced-scale thumbnails")
+    parser.add_argument('--image', help="capture to test with (default: synthetic 4056x3040 frame)")
+    parser.add_argument('--widths', type=int, nargs='+', default=[300, 800])
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    if not image_thumbnails.CV2_AVAILABLE:
+        sys.exit("opencv-python is required for this benchmark")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(args.image) if args.image else synthetic_capture(Path(tmp) / "capture.jpg")
+        full_bytes = source.stat().st_size
+        full_decode_ms = median_ms(lambda: image_thumbnails.cv2.imread(str(source)), args.repeat)
+        print(f"Source: {source.name}, {full_bytes / 1024:.0f} KiB, full decode {full_decode_ms:.1f} ms\n")
+
+        cache = ThumbnailCache(cache_dir=str(Path(tmp) / "cache"))
+        print(f"{'width':>6}{'naive ms':>10}{'reduced ms':>12}{'cached ms':>11}{'bytes':>9}{'of full':>9}")
+        for width in args.widths:
+            naive_ms = median_ms(lambda: full_decode_resize(source, width), args.repeat)
+            reduced_ms = median_ms(lambda: render_thumbnail(str(source), width), args.repeat)
+            data, _ = cache.get(str(source), width)
+            cached_ms = median_ms(lambda: cache.get(str(source), width), args.repeat * 100)
+            print(f"{width:>6}{naive_ms:>10.1f}{reduced_ms:>12.1f}{cached_ms:>11.3f}"
+                  f"{len(data):>9}{len(data) / full_bytes:>8.1%}")
+
+
+if __name__ == "__main__":
+    main()
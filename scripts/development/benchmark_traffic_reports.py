@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Traffic Report Benchmark
+Builds a synthetic month of detections and compares the violations CSV built in memory
+with a ZoneInfo conversion per row (the previous approach, without its LIMIT 1000)
+against the streamed export, then times a monthly summary render against a cache hit.
+
+Usage:
+    python3 benchmark_traffic_reports.py [--rows 150000] [--db path/to/traffic_data.db]
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "edge_api"))
+sys.path.insert(0, str(ROOT / "edge_processing"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from synthetic_traffic_db import create_synthetic_database
+from traffic_analytics import load_hourly_buckets, summarize_buckets
+from traffic_reports import RenderedReportCache, VIOLATION_COLUMNS, iter_violations_csv, month_period
+from traffic_rollups import backfill_hourly_rollups, ensure_rollup_schema
+
+CENTRAL = ZoneInfo('America/Chicago')
+MONTH = '2024-03'
+
+
+def in_memory_csv(conn, start_ts, end_ts):
+    """The previous implementation: fetchall, ZoneInfo per row, whole file in one string"""
+    rows = conn.execute("""
+        SELECT td.timestamp, cd.vehicle_types, rd.speed_mph, 25, rd.speed_mph - 25, td.location_id, rd.confidence
+        FROM traffic_detections td
+        JOIN radar_detections rd ON td.id = rd.detection_id
+        LEFT JOIN camera_detections cd ON td.id = cd.detection_id
+        WHERE rd.speed_mph > 25 AND td.timestamp >= ? AND td.timestamp < ?
+        ORDER BY td.timestamp DESC
+    """, (start_ts, end_ts)).fetchall()
+    data = []
+    for timestamp, types, speed, limit, amount, location, confidence in rows:
+        central = datetime.fromtimestamp(timestamp, tz=timezone.utc).astimezone(ZoneInfo('America/Chicago'))
+        parsed = json.loads(types) if types else None
+        data.append([central.strftime("%Y-%m-%d"), central.strftime("%H:%M:%S"),
+                     parsed[0] if parsed else "Vehicle", f"{speed:.1f}", str(limit), f"{amount:.1f}",
+                     location or "Main Street", f"{confidence * 100:.1f}%" if confidence else "N/A"])
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(VIOLATION_COLUMNS)
+    writer.writerows(data)
+    return [output.getvalue().encode('utf-8')]
+
+
+def measure(func):
+    tracemalloc.start()
+    started = time.perf_counter()
+    first_byte = None
+    size = 0
+    for piece in func():
+        if first_byte is None:
+            first_byte = time.perf_counter() - started
+        size += len(piece)
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, first_byte, peak, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark report downloads on a synthetic month")
+    parser.add_argument('--rows', type=int, default=150000, help="detections in the month (~5k/day)")
+    parser.add_argument('--db', help="existing database to use instead of a synthetic one")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = args.db or os.path.join(tmp, "traffic_data.db")
+        period = month_period(MONTH, CENTRAL)
+        if not args.db:
+            create_synthetic_database(db_path, args.rows, start_ts=period.start_ts,
+                                      span_seconds=period.end_ts - period.start_ts).close()
+        conn = sqlite3.connect(db_path)
+        print(f"{args.rows} detections in {period.label}\n")
+
+        print(f"{'violations CSV':<18}{'total s':>9}{'first byte s':>14}{'peak MiB':>10}{'MiB out':>9}")
+        for label, func in (
+            ("in memory", lambda: in_memory_csv(conn, period.start_ts, period.end_ts)),
+            ("streamed", lambda: iter_violations_csv(conn, period.start_ts, period.end_ts, CENTRAL)),
+        ):
+            elapsed, first_byte, peak, size = measure(func)
+            print(f"{label:<18}{elapsed:>9.2f}{first_byte:>14.3f}{peak / 2**20:>10.1f}{size / 2**20:>9.1f}")
+
+        cursor = conn.cursor()
+        ensure_rollup_schema(cursor)
+        backfill_hourly_rollups(cursor)
+        conn.commit()
+
+        def render():
+            summary = summarize_buckets(load_hourly_buckets(conn, period.start_ts, period.end_ts))
+            return f"<html><body><h1>{period.label}</h1><pre>{json.dumps(summary)}</pre></body></html>"
+
+        cache = RenderedReportCache(os.path.join(tmp, "report_cache"))
+        started = time.perf_counter()
+        cache.get('monthly_summary', period, {}, None, render)
+        cold = time.perf_counter() - started
+        started = time.perf_counter()
+        for _ in range(100):
+            cache.get('monthly_summary', period, {}, None, render)
+        cached = (time.perf_counter() - started) / 100
+        print(f"\nMonthly summary for a closed month: first render {cold * 1000:.1f} ms, "
+              f"cached {cached * 1000:.3f} ms")
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
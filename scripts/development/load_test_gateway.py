@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+API Gateway Load Test
+Measures HTTP throughput as gateway workers are added, and checks that real-time events
+still reach every connected WebSocket client when the workers share a message queue.
+
+Start the workers first, each on its own port with the same SOCKETIO_MESSAGE_QUEUE, e.g.:
+
+    export SOCKETIO_MESSAGE_QUEUE=redis://localhost:6379/0
+    API_PORT=5001 python3 edge_api/edge_api_gateway_enhanced.py &
+    API_PORT=5002 python3 edge_api/edge_api_gateway_enhanced.py &
+
+Usage:
+    python3 load_test_gateway.py --workers http://localhost:5001 http://localhost:5002
+        [--path /api/analytics/summary] [--concurrency 16] [--duration 10] [--clients 8]
+"""
+
+import argparse
+import itertools
+import statistics
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+try:
+    import socketio
+    SOCKETIO_CLIENT_AVAILABLE = True
+except ImportError:
+    SOCKETIO_CLIENT_AVAILABLE = False
+
+
+def run_load(urls, path, concurrency, duration):
+    """Hammer `path` round-robin across `urls` for `duration` seconds"""
+    targets = itertools.cycle(urls)
+    targets_lock = threading.Lock()
+    deadline = time.monotonic() + duration
+    latencies, errors = [], [0]
+    results_lock = threading.Lock()
+
+    def worker():
+        session = requests.Session()
+        while time.monotonic() < deadline:
+            with targets_lock:
+                base = next(targets)
+            started = time.perf_counter()
+            try:
+                ok = session.get(base + path, timeout=30).status_code < 500
+            except requests.RequestException:
+                ok = False
+            elapsed = time.perf_counter() - started
+            with results_lock:
+                if ok:
+                    latencies.append(elapsed)
+                else:
+                    errors[0] += 1
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for _ in range(concurrency):
+            pool.submit(worker)
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors': errors[0],
+        'rps': len(latencies) / duration,
+        'p50_ms': statistics.median(latencies) * 1000 if latencies else 0.0,
+        'p95_ms': latencies[int(0.95 * (len(latencies) - 1))] * 1000 if latencies else 0.0,
+    }
+
+
+def check_fanout(urls, clients, timeout):
+    """Connect clients across all workers, broadcast through one, count who received it"""
+    marker = uuid.uuid4().hex
+    received = set()
+    received_lock = threading.Lock()
+    connected = []
+
+    for i in range(clients):
+        client = socketio.Client(reconnection=False)
+
+        def on_batch(batch, client_id=i):
+            if any(event.get('load_test_marker') == marker for event in batch.get('events', [])):
+                with received_lock:
+                    received.add(client_id)
+
+        client.on('event_batch', on_batch)
+        client.connect(urls[i % len(urls)], wait_timeout=10)
+        client.call('subscribe', {'channels': ['consolidated']}, timeout=10)
+        connected.append(client)
+
+    response = requests.post(urls[0] + '/api/events/broadcast', json={
+        'business_event': 'load_test', 'message': 'fan-out check', 'load_test_marker': marker
+    }, timeout=10)
+    response.raise_for_status()
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline and len(received) < clients:
+        time.sleep(0.05)
+
+    for client in connected:
+        client.disconnect()
+    return len(received)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test one or more API gateway workers")
+    parser.add_argument('--workers', nargs='+', default=['http://localhost:5000'], help="worker base URLs")
+    parser.add_argument('--path', default='/api/analytics/summary', help="endpoint to load")
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=10.0, help="seconds per measurement")
+    parser.add_argument('--clients', type=int, default=8, help="WebSocket clients for the fan-out check")
+    parser.add_argument('--event-timeout', type=float, default=5.0)
+    args = parser.parse_args()
+    urls = [url.rstrip('/') for url in args.workers]
+
+    print(f"Load: GET {args.path}, {args.concurrency} concurrent requests, {args.duration:.0f}s per step\n")
+    print(f"{'workers':>8}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'errors':>8}")
+    baseline = None
+    for n in range(1, len(urls) + 1):
+        result = run_load(urls[:n], args.path, args.concurrency, args.duration)
+        baseline = baseline or result['rps']
+        scaling = result['rps'] / baseline if baseline else 0.0
+        print(f"{n:>8}{result['rps']:>10.1f}{result['p50_ms']:>10.1f}{result['p95_ms']:>10.1f}"
+              f"{result['errors']:>8}   ({scaling:.2f}x)")
+
+    if not SOCKETIO_CLIENT_AVAILABLE:
+        print("\npython-socketio client not installed; skipping the WebSocket fan-out check")
+        return
+
+    delivered = check_fanout(urls, args.clients, args.event_timeout)
+    print(f"\nFan-out: broadcast via {urls[0]} reached {delivered}/{args.clients} clients "
+          f"spread over {len(urls)} worker(s)")
+    if delivered < args.clients:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
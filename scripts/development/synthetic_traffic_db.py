@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Synthetic Traffic Database Builder
+Creates a traffic_data.db with the normalized schema and realistic synthetic detections
+for benchmarks and local experiments
+"""
+
+import json
+import random
+import sqlite3
+import time
+import uuid
+
+SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS traffic_detections (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        consolidation_id TEXT UNIQUE NOT NULL,
+        correlation_id TEXT NOT NULL,
+        timestamp REAL NOT NULL,
+        trigger_source TEXT NOT NULL,
+        location_id TEXT DEFAULT 'default',
+        processing_metadata TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS radar_detections (
+        detection_id INTEGER PRIMARY KEY,
+        speed_mph REAL NOT NULL,
+        speed_mps REAL NOT NULL,
+        confidence REAL NOT NULL,
+        alert_level TEXT NOT NULL,
+        direction TEXT,
+        distance REAL,
+        detection_source_id TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS camera_detections (
+        detection_id INTEGER PRIMARY KEY,
+        vehicle_count INTEGER DEFAULT 0,
+        detection_confidence REAL,
+        vehicle_types TEXT,
+        processing_time REAL,
+        image_metadata TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS consolidated_events (
+        consolidation_id TEXT PRIMARY KEY,
+        event_json TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        event_seq INTEGER,
+        api_json TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_detections_timestamp ON traffic_detections(timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_radar_speed ON radar_detections(speed_mph)",
+    "CREATE INDEX IF NOT EXISTS idx_consolidated_created_at ON consolidated_events(created_at)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_consolidated_event_seq ON consolidated_events(event_seq)"
+]
+
+VEHICLE_TYPES = ['car', 'car', 'car', 'truck', 'motorcycle', 'bus']
+
+
+def create_synthetic_database(db_path: str, rows: int, start_ts: float = None,
+                              span_seconds: float = 30 * 86400, with_events: bool = False,
+                              seed: int = 590, batch_size: int = 20000) -> sqlite3.Connection:
+    """Create (or extend) a database at db_path with `rows` synthetic detections
+
+    Detections are spread uniformly over [start_ts, start_ts + span_seconds) with speeds
+    drawn from a normal distribution around 27 mph. Returns an open connection.
+    """
+    rng = random.Random(seed)
+    start_ts = start_ts if start_ts is not None else time.time() - span_seconds
+
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=OFF")
+    for statement in SCHEMA:
+        conn.execute(statement)
+
+    next_id = (conn.execute("SELECT MAX(id) FROM traffic_detections").fetchone()[0] or 0) + 1
+    timestamps = sorted(start_ts + rng.random() * span_seconds for _ in range(rows))
+
+    for offset in range(0, rows, batch_size):
+        traffic, radar, camera, events = [], [], [], []
+        for ts in timestamps[offset:offset + batch_size]:
+            detection_id = next_id
+            next_id += 1
+            consolidation_id = f"consolidated_{uuid.UUID(int=rng.getrandbits(128)).hex[:12]}_{detection_id}"
+            correlation_id = f"{detection_id:08x}"
+            speed = max(3.0, rng.gauss(27.0, 6.0))
+            vehicle_type = rng.choice(VEHICLE_TYPES)
+            alert_level = 'high' if speed > 35 else 'low' if speed > 25 else 'normal'
+
+            traffic.append((detection_id, consolidation_id, correlation_id, ts, 'radar', 'default'))
+            radar.append((detection_id, round(speed, 1), round(speed * 0.44704, 2),
+                          round(rng.uniform(0.6, 0.99), 2), alert_level, 'approaching'))
+            camera.append((detection_id, 1, round(rng.uniform(0.5, 0.95), 2), json.dumps([vehicle_type])))
+
+            if with_events:
+                event = {
+                    'consolidation_id': consolidation_id,
+                    'correlation_id': correlation_id,
+                    'timestamp': ts,
+                    'trigger_source': 'radar',
+                    'radar_data': {'speed': round(speed, 1), 'speed_mps': round(speed * 0.44704, 2),
+                                   'alert_level': alert_level, 'direction': 'approaching'},
+                    'camera_data': {'vehicle_count': 1, 'vehicle_types': [vehicle_type]},
+                    'weather_data': {'dht22': {'temperature_c': 21.5, 'humidity': 48.0}}
+                }
+                created_at = time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(ts))
+                # api_json as the persistence service stores it
+                events.append((consolidation_id, json.dumps(event), created_at, detection_id,
+                               json.dumps({'consolidation_id': consolidation_id, 'created_at': created_at, **event},
+                                          separators=(',', ':'), ensure_ascii=False)))
+
+        conn.execute("BEGIN")
+        conn.executemany("""
+            INSERT INTO traffic_detections (id, consolidation_id, correlation_id, timestamp, trigger_source, location_id)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, traffic)
+        conn.executemany("""
+            INSERT INTO radar_detections (detection_id, speed_mph, speed_mps, confidence, alert_level, direction)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, radar)
+        conn.executemany("""
+            INSERT INTO camera_detections (detection_id, vehicle_count, detection_confidence, vehicle_types)
+            VALUES (?, ?, ?, ?)
+        """, camera)
+        if events:
+            conn.executemany("""
+                INSERT INTO consolidated_events (consolidation_id, event_json, created_at, event_seq, api_json)
+                VALUES (?, ?, ?, ?, ?)
+            """, events)
+        conn.execute("COMMIT")
+
+    return conn
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build a synthetic traffic_data.db")
+    parser.add_argument('db_path')
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--days', type=float, default=30)
+    parser.add_argument('--with-events', action='store_true', help='Also populate consolidated_events JSON')
+    args = parser.parse_args()
+
+    started = time.time()
+    create_synthetic_database(args.db_path, args.rows, span_seconds=args.days * 86400,
+                              with_events=args.with_events).close()
+    print(f"Created {args.rows} synthetic detections in {time.time() - started:.1f}s -> {args.db_path}")
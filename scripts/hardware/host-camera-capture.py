@@ -234,6 +234,29 @@ class HostCameraCapture:
             self.redis_client = None
             self.redis_enabled = False
     
+    def _publish_latest_image(self, image_path: Path, capture_time: float):
+        """Atomically repoint live/latest at a fully written image and record it in Redis
+        
+        Readers (API gateway, SharedVolumeImageProvider) resolve the newest image from this
+        pointer instead of scanning the directory. Mirrors edge_processing/latest_image.py.
+        """
+        temp_link = self.live_dir / f".latest.{os.getpid()}.tmp"
+        try:
+            temp_link.unlink(missing_ok=True)
+            os.symlink(image_path.name, temp_link)
+            os.replace(temp_link, self.live_dir / "latest")
+        except OSError as e:
+            logger.warning(f"Could not update latest image link: {e}")
+        
+        if self.redis_enabled and self.redis_client:
+            try:
+                self.redis_client.set('camera:latest_image', json.dumps({
+                    'filename': image_path.name,
+                    'capture_time': capture_time
+                }))
+            except Exception as e:
+                logger.warning(f"Could not publish latest image to Redis: {e}")
+    
     def _publish_capture_event(self, image_path: Path, metadata: Dict[str, Any]):
         """Publish camera capture event to Redis"""
         if not self.redis_enabled or not self.redis_client:
@@ -421,6 +444,8 @@ class HostCameraCapture:
                 with open(metadata_path, 'w') as f:
                     json.dump(metadata, f, indent=2)
                 
+                self._publish_latest_image(image_path, timestamp.timestamp())
+                
                 # Publish Redis event for real-time processing
                 self._publish_capture_event(image_path, metadata)
                 
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Detection export command for offline analysis.
+Streams joined traffic/radar/camera detections over a time range in chunks.
+
+Usage:
+    python3 export_detections.py --start 2025-09-01 --end 2025-10-01 --format csv -o september.csv
+    python3 export_detections.py --start 1756684800 --format ndjson > last_day.ndjson
+    python3 export_detections.py --format parquet -o detections.parquet   # requires pyarrow
+"""
+
+import sys
+import os
+import time
+import argparse
+from pathlib import Path
+
+# Make edge_api importable both in the container (/app) and from a checkout
+sys.path.insert(0, '/app/edge_api')
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'edge_api'))
+
+from data_export import DetectionExporter, DEFAULT_CHUNK_SIZE, available_formats, parse_time_bound
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Export joined detection data over a time range")
+    parser.add_argument('--db', default=os.environ.get('DATABASE_PATH', '/app/data/traffic_data.db'),
+                        help='Path to traffic_data.db (default: $DATABASE_PATH)')
+    parser.add_argument('--start', help='Range start as epoch seconds or ISO 8601 (default: 24 hours before end)')
+    parser.add_argument('--end', help='Range end as epoch seconds or ISO 8601 (default: now)')
+    parser.add_argument('--format', default='csv', choices=available_formats(), help='Output format')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='Rows fetched per chunk')
+    parser.add_argument('-o', '--output', default='-', help="Output file ('-' for stdout)")
+    return parser.parse_args()
+
+
+def main():
+    """Main function"""
+    args = parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"Database not found: {args.db}", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        end_ts = parse_time_bound(args.end, time.time())
+        start_ts = parse_time_bound(args.start, end_ts - 86400)
+    except ValueError as e:
+        print(f"Invalid time range: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    exporter = DetectionExporter(db_path=args.db, chunk_size=args.chunk_size)
+    output = sys.stdout.buffer if args.output == '-' else open(args.output, 'wb')
+
+    bytes_written = 0
+    started = time.time()
+    try:
+        for piece in exporter.stream(args.format, start_ts, end_ts):
+            output.write(piece)
+            bytes_written += len(piece)
+    finally:
+        if output is not sys.stdout.buffer:
+            output.close()
+
+    print(f"Exported {bytes_written / (1024 * 1024):.1f} MB as {args.format} in {time.time() - started:.1f}s",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
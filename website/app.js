@@ -15,6 +15,11 @@ class TrafficDashboard {
         this.charts = {};
         this.refreshInterval = null;
         
+        // Rolling 24h window of consolidated events, kept current with cursor-based delta polls
+        this.recentEvents = [];
+        this.eventCursor = null;
+        this.eventCursorApi = null;
+        
         this.init();
     }
     
@@ -101,8 +106,9 @@ class TrafficDashboard {
     }
     
     switchTab(tabName) {
-        // Stop events manager if switching away from events tab
-        if (this.eventsManager && this.currentTab === 'events' && tabName !== 'events') {
+        // Stop events manager if switching away from the events and logs tabs (they share its socket)
+        const streamTabs = ['events', 'logs'];
+        if (this.eventsManager && streamTabs.includes(this.currentTab) && !streamTabs.includes(tabName)) {
             this.eventsManager.stop();
         }
         
@@ -326,14 +332,9 @@ class TrafficDashboard {
         try {
             // Load recent vehicle detections (last 24 hours using consolidated endpoint)
             try {
-                const since24HoursAgo = new Date();
-                since24HoursAgo.setHours(since24HoursAgo.getHours() - 24);
-                const sinceTimestamp = since24HoursAgo.toISOString();
-                
-                const detectionsResponse = await fetch(`${this.apiBaseUrl}/vehicles/consolidated?since=${sinceTimestamp}&limit=1000`);
+                const detectionsResponse = await this.refreshRecentEvents();
                 if (detectionsResponse.ok) {
-                    const detectionsData = await detectionsResponse.json();
-                    this.updateVehicleCountFrom24Hours(detectionsData);
+                    this.updateVehicleCountFrom24Hours({ events: this.recentEvents });
                     console.log('Vehicle detections (24h) loaded successfully');
                 } else {
                     console.error(`Detections API failed: ${detectionsResponse.status}`);
@@ -548,6 +549,51 @@ class TrafficDashboard {
         this.updateTrafficChartFromDetections(detections);
     }
     
+    async refreshRecentEvents() {
+        // First load (or API change): last 24h newest-first, which also returns the cursor
+        // for delta polls. Later loads only fetch events after the cursor, oldest first.
+        if (!this.eventCursor || this.eventCursorApi !== this.apiBaseUrl) {
+            const since24HoursAgo = new Date();
+            since24HoursAgo.setHours(since24HoursAgo.getHours() - 24);
+            const sinceTimestamp = since24HoursAgo.toISOString();
+            
+            const response = await fetch(`${this.apiBaseUrl}/vehicles/consolidated?since=${sinceTimestamp}&limit=1000`);
+            if (response.ok) {
+                const data = await response.json();
+                this.recentEvents = data.events || [];
+                this.eventCursor = data.next_cursor || null;
+                this.eventCursorApi = this.apiBaseUrl;
+            }
+            return response;
+        }
+        
+        let response;
+        let hasMore = true;
+        while (hasMore) {
+            response = await fetch(`${this.apiBaseUrl}/vehicles/consolidated?after=${encodeURIComponent(this.eventCursor)}&limit=1000`);
+            if (!response.ok) {
+                if (response.status === 400) {
+                    this.eventCursor = null; // Stale cursor: reload the window next time
+                }
+                return response;
+            }
+            const data = await response.json();
+            // A re-consolidated event comes back under a new cursor position: its latest copy replaces the old one
+            const latest = new Map();
+            (data.events || []).forEach(event => latest.set(event.consolidation_id, event));
+            const newEvents = Array.from(latest.values());
+            this.recentEvents = newEvents.reverse().concat(
+                this.recentEvents.filter(event => !latest.has(event.consolidation_id)));
+            this.eventCursor = data.next_cursor || this.eventCursor;
+            hasMore = data.has_more === true;
+        }
+        
+        // Drop events that have aged out of the 24h window
+        const cutoffSeconds = Date.now() / 1000 - 86400;
+        this.recentEvents = this.recentEvents.filter(event => !event.timestamp || event.timestamp >= cutoffSeconds);
+        return response;
+    }
+    
     updateVehicleCountFrom24Hours(consolidatedData) {
         if (!consolidatedData || !consolidatedData.events) {
             console.error('No consolidated data received for 24h vehicle count');
@@ -1075,7 +1121,7 @@ class TrafficDashboard {
         cameraStatus.className = 'camera-status';
 
         // Fetch latest camera snapshot
-        const cameraUrl = `${this.apiBaseUrl}/camera/latest?t=${Date.now()}`;
+        const cameraUrl = `${this.apiBaseUrl}/camera/latest?size=preview&t=${Date.now()}`;
         
         fetch(cameraUrl)
             .then(response => {
@@ -1555,8 +1601,12 @@ class TrafficDashboard {
                 this.eventsManager.start();
                 break;
             case 'logs':
-                // Initialize system logs tab
-                this.initializeLogsTab();
+                // System logs arrive over the events manager's socket
+                if (!this.eventsManager) {
+                    this.eventsManager = new VehicleEventsManager(this.apiBaseUrl);
+                }
+                this.eventsManager.start();
+                this.eventsManager.initializeLogsTab();
                 break;
             default:
                 // Overview tab - data already loaded in loadRealData
@@ -1983,8 +2033,9 @@ class VehicleEventsManager {
                 this.addSystemMessage('Connected to real-time event stream');
                 this.addSystemMessage('Subscribing to vehicle detection events...');
                 
-                // Subscribe to events
+                // Subscribe to events and system logs (re-sent on every reconnect)
                 this.socket.emit('subscribe_events');
+                this.socket.emit('subscribe', { channels: ['logs'] });
             });
 
             // Handle real-time events from Socket.IO
@@ -2001,6 +2052,30 @@ class VehicleEventsManager {
                 }
             });
 
+            // Batched events: one frame per channel every ~100 ms
+            this.socket.on('event_batch', (batch) => {
+                try {
+                    for (const data of batch.events || []) {
+                        if (batch.channel === 'logs') {
+                            // Repeated messages arrive once with a count
+                            this.addLogEntry(data.count > 1 ? { ...data, message: `${data.message} (x${data.count})` } : data);
+                        } else if (!this.isDuplicateEvent(data)) {
+                            this.handleRealtimeEvent(data);
+                        }
+                    }
+                    if (batch.dropped) {
+                        console.warn(`Server dropped ${batch.dropped} ${batch.channel} events under load`);
+                    }
+                } catch (error) {
+                    console.error('Error processing Socket.IO event batch:', error);
+                }
+            });
+
+            // Sent after this client fell behind and skipped low-priority batches
+            this.socket.on('event_summary', (summary) => {
+                console.warn('Missed events while connection was backed up:', summary.missed);
+            });
+
             // Handle connection status updates
             this.socket.on('events_status', (status) => {
                 console.log('Events subscription status:', status);
@@ -2362,10 +2437,9 @@ class VehicleEventsManager {
     }
 
     initializeLogsTab() {
-        // Subscribe to logs when tab is activated
-        if (this.socket) {
-            this.socket.emit('subscribe_logs');
-        }
+        // Log controls are bound once; the logs channel is subscribed on connect
+        if (this.logControlsInitialized) return;
+        this.logControlsInitialized = true;
 
         // Initialize log controls
         this.logsPaused = false;